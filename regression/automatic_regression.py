@@ -38,11 +38,19 @@ modules = [
     'scripts/weights/eVTOL_Weights_Buildup_Regression.py',
     'scripts/aerodynamics/aerodynamics.py',
     #'scripts/aerodynamics_super/aerodynamics_super.py',
+    'scripts/aerodynamics_super/volume_wave_drag_cache.py',
     #'scripts/regression/test_mission_AS2.py',
     'scripts/atmosphere/atmosphere.py',
     'scripts/atmosphere/constant_temperature.py',
+    'scripts/units/unit_conversion.py',
+    'scripts/import_time/import_time.py',
     'scripts/AVL/test_AVL.py',
+    'scripts/AVL/avl_training_cases.py',
     'scripts/B737/mission_B737.py',
+    'scripts/missions/jacobian.py',
+    'scripts/missions/evaluate_missions.py',
+    'scripts/missions/cached_discretization.py',
+    'scripts/missions/warm_start.py',
     'scripts/battery/battery.py',
     'scripts/cmalpha/cmalpha.py',
     'scripts/cnbeta/cnbeta.py',    
@@ -63,6 +71,7 @@ modules = [
     'scripts/landing_field_length/landing_field_length.py',
     'scripts/lifting_line/lifting_line.py',
     'scripts/noise_optimization/Noise_Test.py',
+    'scripts/noise_optimization/engine_noise_SAE.py',
     'scripts/payload_range/payload_range.py',
     'scripts/propeller/propeller.py',
     'scripts/propulsion_surrogate/propulsion_surrogate.py',
@@ -80,10 +89,14 @@ modules = [
     'scripts/take_off_field_length/take_off_field_length.py',
     'scripts/test_input_output/test_xml_read_write.py',
     'scripts/test_input_output/test_freemind_write.py',    
+    'scripts/test_input_output/test_history_read_write.py',
+    'scripts/test_input_output/test_training_cache.py',
     'scripts/variable_cruise_distance/variable_cruise_distance.py',
     'scripts/weights/weights.py', 
     'scripts/V_n_diagram/V_n_diagram_regression.py',
-    'scripts/CST/CST_regression.py'
+    'scripts/CST/CST_regression.py',
+    'scripts/data/data_benchmark.py',
+    'scripts/nexus/nexus_evaluation.py',
 ]
 
 # ----------------------------------------------------------------------
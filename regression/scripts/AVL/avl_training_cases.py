@@ -0,0 +1,149 @@
+# avl_training_cases.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" Checks that the AVL training cases run on a pool write the same input files
+    and give the same training data as the serial runs, with a stand-in AVL
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import os
+import sys
+import stat
+import copy
+import shutil
+import tempfile
+import numpy as np
+
+import SUAVE
+from SUAVE.Core import Units
+
+sys.path.append('../Vehicles')
+from Boeing_737 import vehicle_setup, configs_setup
+
+# ----------------------------------------------------------------------
+#   Stand-in AVL
+# ----------------------------------------------------------------------
+
+# an executable read by AVL_Inviscid like the AVL binary: it reads the command deck from the
+# standard input and writes the results of each case, with a lift coefficient of 0.1*alpha*(1+Mach)
+stand_in_avl = '''#!{python}
+import sys
+
+template = open({template!r}).readlines()
+
+# the commands up to QUIT, the deck is not closed
+commands = []
+for line in sys.stdin:
+    commands.append(line.strip())
+    if commands[-1] == 'QUIT':
+        break
+
+# the angle of attack and Mach number of each case of the run file
+cases = []
+for line in open(commands[0].split()[1]):
+    words = line.split()
+    if line.startswith(' Run case'):
+        cases.append(dict())
+    elif len(words) == 5 and words[0] == 'alpha' and words[1] == '->':
+        cases[-1]['alpha'] = float(words[-1])
+    elif len(words) == 3 and words[0] == 'Mach':
+        cases[-1]['mach'] = float(words[-1])
+
+for ii, command in enumerate(commands):
+    if command == 'st':
+        case = cases[int(commands[ii-2]) - 1]
+        lines = list(template)
+        lines[23] = '  CLtot = {{:10.5f}}\\n'.format(0.1*case['alpha']*(1. + case['mach']))
+        with open(commands[ii+1],'w') as results:
+            results.writelines(lines)
+'''
+
+# ----------------------------------------------------------------------
+#   The Test
+# ----------------------------------------------------------------------
+
+def main():
+
+    directory = tempfile.mkdtemp(prefix='avl_training_')
+
+    try:
+        avl_bin = write_stand_in_avl(directory)
+
+        serial  = sample_training(avl_bin,os.path.join(directory,'serial'),None)
+        pooled  = sample_training(avl_bin,os.path.join(directory,'pooled'),2)
+
+        # the same training data, merged in the order of the Mach numbers
+        assert np.all(pooled.training.coefficients == serial.training.coefficients)
+        assert np.all(pooled.training.grid_points  == serial.training.grid_points)
+
+        # which the stand-in computed from the conditions it was given
+        lift_coefficient = np.round(0.1*np.outer(1. + serial.training.Mach,serial.training.angle_of_attack/Units.deg),5)
+        assert np.allclose(serial.training.coefficients[:,0],lift_coefficient.ravel(),rtol=0.,atol=1e-12)
+
+        # each run wrote the same files as its serial run, in its own folder
+        run_count = len(serial.training.Mach)
+        for batch in range(1,run_count+1):
+            serial_folder = serial.settings.filenames.run_folder
+            pooled_folder = os.path.join(pooled.settings.filenames.run_folder,'training_{0:03d}'.format(batch))
+            names = [ serial.settings.filenames.features,
+                      serial.settings.filenames.batch_template.format(batch),
+                      serial.settings.filenames.deck_template.format(batch) ]
+            names = names + [ name for name in os.listdir(pooled_folder) if name.startswith('results_case_') ]
+            assert len(names) == 3 + len(serial.training.angle_of_attack)
+            for name in names:
+                assert read_file(os.path.join(pooled_folder,name)) == read_file(os.path.join(serial_folder,name)), name
+
+        # and the analysis is left as the serial runs leave it
+        assert pooled.current_status.batch_index == serial.current_status.batch_index == run_count
+        assert pooled.settings.filenames.features == serial.settings.filenames.features
+
+    finally:
+        shutil.rmtree(directory)
+
+    return
+
+def write_stand_in_avl(directory):
+    """Writes the stand-in AVL executable, with a results file of the AVL regression as template"""
+
+    template = os.path.abspath(os.path.join('avl_files','results_case_001_01.txt'))
+    avl_bin  = os.path.join(directory,'stand_in_avl')
+
+    with open(avl_bin,'w') as script:
+        script.write(stand_in_avl.format(python=sys.executable,template=template))
+    os.chmod(avl_bin,os.stat(avl_bin).st_mode | stat.S_IEXEC)
+
+    return avl_bin
+
+def sample_training(avl_bin,run_folder,training_processes):
+    """Runs the AVL training cases of the B737 cruise configuration"""
+
+    configs = configs_setup(vehicle_setup())
+
+    avl = SUAVE.Analyses.Aerodynamics.AVL_Inviscid()
+    avl.geometry   = copy.deepcopy(configs.cruise)
+    avl.keep_files = True
+    avl.settings.filenames.avl_bin_name = avl_bin
+    avl.settings.filenames.run_folder   = run_folder
+    avl.training.angle_of_attack        = np.array([-2.,0.,2.,4.]) * Units.deg
+    avl.training.Mach                   = np.array([0.3,0.5,0.7,0.8])
+    avl.training_processes              = training_processes
+
+    avl.sample_training()
+
+    return avl
+
+def read_file(filename):
+    with open(filename,'rb') as file:
+        return file.read()
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
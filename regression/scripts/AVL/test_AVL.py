@@ -1,7 +1,7 @@
 # test_AVL.py
 # 
 # Created:  May 2017, M. Clarke
-#
+# Modified: Oct 2026, SUAVE Team
 """ setup file for a mission with a 737 using AVL
 """
 
@@ -139,6 +139,18 @@ def main():
     print('CM difference')
     print(diff_CM)
     assert np.abs((moment_coefficient - moment_coefficient_true)/moment_coefficient_true) < 1e-6    
+    
+    # lookup tables of the surrogates agree with them at the mission points
+    tables = SUAVE.Surrogate.build_lookup_tables(stability.surrogates,stability.training.grid_points,[61,41])
+    conditions = results.segments.cruise.conditions
+    cond  = np.hstack([conditions.aerodynamics.angle_of_attack,conditions.freestream.mach_number])
+    table = tables.moment_coefficient
+    diff_table = np.max(np.abs(table.predict(cond) - stability.surrogates.moment_coefficient.predict(cond)))
+    print('CM table difference')
+    print(diff_table)
+    print('CM table difference at the cell centers')
+    print(table.center_error)
+    assert diff_table < 5e-4
  
     return
 
@@ -0,0 +1,134 @@
+# volume_wave_drag_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import os
+import sys
+import numpy as np
+
+import SUAVE
+from SUAVE.Core import Data
+from SUAVE.Methods.Aerodynamics.OpenVSP_Wave_Drag import wave_drag_volume, volume_drag_filename
+from SUAVE.Methods.Aerodynamics.OpenVSP_Wave_Drag.volume_drag_cache import volume_drag_caches
+from SUAVE.Input_Output.SUAVE import read_history
+
+sys.path.append('../Vehicles')
+from Concorde import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Stand-in Backend
+# ----------------------------------------------------------------------
+
+# the Mach numbers of each call to the stand-in backend
+backend_calls = []
+
+def standin_volume_drag(geometry,mach_numbers,num_slices=20,num_rots=10):
+    """Smooth volume wave drag in place of the OpenVSP analysis, recording its calls"""
+    backend_calls.append(np.array(mach_numbers))
+    return exact_volume_drag(mach_numbers)
+
+def exact_volume_drag(mach):
+    return 0.002 + 0.004/np.sqrt(mach**2 - 1.)
+
+# ----------------------------------------------------------------------
+#   The Test
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle      = vehicle_setup()
+    aerodynamics = SUAVE.Analyses.Aerodynamics.Supersonic_OpenVSP_Wave_Drag()
+    aerodynamics.geometry = vehicle
+    aerodynamics.settings.volume_drag_backend = standin_volume_drag
+    aerodynamics.initialize()
+
+    filename = volume_drag_filename(vehicle.tag)
+    assert not os.path.exists(filename)
+
+    exact_mach_numbers(aerodynamics)
+    binned_mach_numbers(aerodynamics)
+
+    # the values computed are saved in a single append, and recomputed afterwards
+    computed = np.concatenate(backend_calls)
+    aerodynamics.finalize()
+    rows = read_history(filename)
+    assert len(rows) == len(computed)
+    assert np.all(np.sort(rows[:,0]) == np.sort(computed))
+    assert np.all(rows[:,1] == exact_volume_drag(rows[:,0]))
+    assert vehicle.tag not in volume_drag_caches
+
+    # nothing new, nothing written
+    size = os.path.getsize(filename)
+    aerodynamics.finalize()
+    assert os.path.getsize(filename) == size
+
+    os.remove(filename)
+
+    return
+
+def exact_mach_numbers(aerodynamics):
+
+    settings   = aerodynamics.settings
+    geometry   = aerodynamics.geometry
+    mach       = np.array([[0.8],[1.2],[1.5],[1.2],[2.0],[1.05],[1.5]])
+    conditions = Data()
+    conditions.freestream = Data()
+    conditions.freestream.mach_number = mach
+
+    cd_w = wave_drag_volume(conditions,geometry,False,backend=settings.volume_drag_backend)
+
+    # one call for the distinct supersonic Mach numbers
+    assert len(backend_calls) == 1
+    assert np.all(backend_calls[0] == [1.05,1.2,1.5,2.0])
+    assert cd_w.shape == mach.shape and cd_w[0,0] == 0.
+    assert np.all(cd_w[1:] == exact_volume_drag(mach[1:]))
+
+    # the same Mach numbers are not computed again
+    cd_w_again = wave_drag_volume(conditions,geometry,False,backend=settings.volume_drag_backend)
+    cd_w_105   = wave_drag_volume(conditions,geometry,True,backend=settings.volume_drag_backend)
+    assert len(backend_calls) == 1
+    assert np.all(cd_w_again == cd_w)
+    assert cd_w_105 == cd_w[5,0]
+
+    return
+
+def binned_mach_numbers(aerodynamics):
+
+    settings   = aerodynamics.settings
+    geometry   = aerodynamics.geometry
+    settings.volume_drag_mach_bin_width = 0.05
+
+    mach       = np.linspace(1.3,1.8,101)[:,None]
+    conditions = Data()
+    conditions.freestream = Data()
+    conditions.freestream.mach_number = mach
+
+    calls = len(backend_calls)
+    cd_w  = wave_drag_volume(conditions,geometry,False,backend=settings.volume_drag_backend,
+                             mach_bin_width=settings.volume_drag_mach_bin_width)
+
+    # the bin edges, 1.3 to 1.85, are computed in one call, 1.5 was already known
+    assert len(backend_calls) == calls + 1
+    assert len(backend_calls[-1]) == 11 and 1.5 not in backend_calls[-1]
+
+    # within the linear interpolation error bound, h^2/8 max|f''|, the largest at the lowest Mach
+    width = settings.volume_drag_mach_bin_width
+    exact = exact_volume_drag(mach)
+    error = np.max(np.abs(cd_w - exact))
+    bound = width**2/8.*0.004*(2.*1.3**2 + 1.)/(1.3**2 - 1.)**2.5
+    print('binned volume wave drag error : ' + str(error) + ', bound : ' + str(bound))
+    assert error <= bound
+
+    return
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
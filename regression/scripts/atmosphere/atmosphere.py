@@ -2,6 +2,7 @@
 # 
 # Created:  Mike Colonno, Dec 2013
 # Modified: Trent Lukaczyk, Jun 2014
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -86,6 +87,12 @@ def main():
     assert( T_err   < 1e-5 )
     assert( rho_err < 1e-5 )
     assert( a_err   < 1e-5 )    
+    
+    # ------------------------------------------------------------------
+    #   Interpolation Table
+    # ------------------------------------------------------------------    
+    
+    check_table(atm)
  
     return
 
@@ -96,6 +103,32 @@ def main():
 #   Helper Function
 # ---------------------------------------------------------------------- 
 
+def check_table(atm):
+    """ the cached table must stay within its error bound of the layer model """
+    
+    table_atm = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    table_atm.table_altitude_step = 10. * Units.m
+    
+    z = np.linspace(-2,86,10001) * Units.km
+    z = np.append(z,table_atm.breaks.altitude / (1 - table_atm.breaks.altitude/table_atm.planet.mean_radius))
+    
+    exact  = atm.compute_values(z,10.)
+    tabled = table_atm.compute_values(z,10.)
+    
+    p_err   = np.max( np.abs( tabled.pressure    / exact.pressure    - 1. ) )
+    T_err   = np.max( np.abs( tabled.temperature / exact.temperature - 1. ) )
+    rho_err = np.max( np.abs( tabled.density     / exact.density     - 1. ) )
+    bound   = table_atm.interpolation_table().pressure_error
+    
+    print('Max Table Pressure Error      = %.4e' % p_err)
+    print('Table Pressure Error Bound    = %.4e' % bound)
+    
+    assert( p_err   <= bound )
+    assert( rho_err <= bound )
+    assert( T_err   < 1e-12 )
+    
+    return
+
 def get_truth():
     p_truth = np.array([  1.27774000e+05,   1.27774000e+05,   1.15542264e+05,
              1.03528639e+05,   9.25500085e+04,   8.25367165e+04,
@@ -0,0 +1,217 @@
+# data_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified: Oct 2026, SUAVE Team
+
+""" Micro-benchmark of Data() against Fast_Data() and the cached pack layout of
+    Conditions(), also checks that they give the same results for deep_get,
+    deep_set, pack_array and unpack_array
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, Fast_Data
+from SUAVE.Analyses.Mission.Segments.Conditions import Conditions
+
+import numpy as np
+import copy
+import pickle
+import timeit
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # ------------------------------------------------------------------
+    #   The Tests
+    # ------------------------------------------------------------------
+
+    slow = build_tree(Data)
+    fast = build_tree(Fast_Data)
+
+    # api compatibility
+    check_compatibility(slow,fast)
+    check_pack_plan(build_tree(Data),build_tree(Conditions))
+
+    # timings
+    print('{:<24}{:>12}{:>12}{:>10}'.format('operation [us]','Data','Fast_Data','ratio'))
+    for name, stmt in benchmarks():
+        t_slow = time_it(stmt,slow)
+        t_fast = time_it(stmt,fast)
+        print('{:<24}{:>12.3f}{:>12.3f}{:>10.2f}'.format(name,t_slow,t_fast,t_slow/t_fast))
+
+    planned = build_tree(Conditions)
+    packed  = planned.pack_array()
+    t_slow  = time_it(lambda tree: Data.pack_array(tree),planned)
+    t_fast  = time_it(lambda tree: tree.pack_array(),planned)
+    print('{:<24}{:>12.3f}{:>12.3f}{:>10.2f}'.format('planned pack_array',t_slow,t_fast,t_slow/t_fast))
+    t_slow  = time_it(lambda tree: Data.unpack_array(tree,packed),planned)
+    t_fast  = time_it(lambda tree: tree.unpack_array(packed),planned)
+    print('{:<24}{:>12.3f}{:>12.3f}{:>10.2f}'.format('planned unpack_array',t_slow,t_fast,t_slow/t_fast))
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def build_tree(klass):
+    """ builds a tree shaped like segment conditions """
+
+    N = 16
+
+    tree = klass()
+    tree.frames                          = klass()
+    tree.frames.inertial                 = klass()
+    tree.frames.inertial.position_vector = np.zeros([N,3])
+    tree.frames.inertial.velocity_vector = np.ones([N,3])
+    tree.frames.inertial.time            = np.linspace(0,1,N)[:,None]
+    tree.frames.body                     = klass()
+    tree.frames.body.inertial_rotations  = np.zeros([N,3])
+    tree.freestream                      = klass()
+    tree.freestream.velocity             = np.ones([N,1])
+    tree.freestream.mach_number          = np.ones([N,1]) * 0.5
+    tree.freestream.density              = np.ones([N,1]) * 1.2
+    tree.weights                         = klass()
+    tree.weights.total_mass              = np.ones([N,1]) * 1000.
+    tree.tag                             = 'conditions'
+
+    return tree
+
+def check_compatibility(slow,fast):
+    """ both classes must behave the same way """
+
+    keys = 'freestream.mach_number'
+    assert np.all(slow.deep_get(keys) == fast.deep_get(keys))
+
+    slow.deep_set(keys,np.ones([16,1])*0.8)
+    fast.deep_set(keys,np.ones([16,1])*0.8)
+    assert np.all(fast.freestream.mach_number == 0.8)
+
+    packed_slow = slow.pack_array()
+    packed_fast = fast.pack_array()
+    assert np.all(packed_slow == packed_fast)
+
+    fast.unpack_array(packed_fast * 2.)
+    slow.unpack_array(packed_slow * 2.)
+    assert np.all(slow.pack_array() == fast.pack_array())
+
+    # attribute and item access are the same thing
+    fast.new_key = 1.0
+    assert fast['new_key'] == 1.0
+    fast['new_key'] = 2.0
+    assert fast.new_key == 2.0
+    fast.pop('new_key')
+    assert not hasattr(fast,'new_key')
+
+    # copies keep the mirror consistent
+    for other in [copy.deepcopy(fast), pickle.loads(pickle.dumps(fast))]:
+        other.weights.total_mass = 5.
+        assert other['weights']['total_mass'] == 5.
+        assert np.all(fast.weights.total_mass == 2000.)
+
+    # keys come before methods, like Data
+    for tree in [slow,fast]:
+        tree['values'] = 3.
+        assert tree.values == 3.
+        del tree['values']
+        assert callable(tree.values)
+
+    return
+
+def check_pack_plan(slow,planned):
+    """ the cached layout must pack and unpack like Data """
+
+    packed = slow.pack_array()
+    assert np.all(planned.pack_array() == packed)
+
+    slow.unpack_array(packed * 2.)
+    planned.unpack_array(packed * 2.)
+    assert np.all(planned.pack_array() == slow.pack_array())
+
+    # replaced values are picked up
+    slow.freestream.velocity    = np.zeros([16,1])
+    planned.freestream.velocity = np.zeros([16,1])
+    assert np.all(planned.pack_array() == slow.pack_array())
+
+    # new keys and new shapes rebuild the layout
+    slow.freestream.pressure    = np.ones([16,1])
+    planned.freestream.pressure = np.ones([16,1])
+    assert np.all(planned.pack_array() == slow.pack_array())
+
+    # a key replaced by another of the same size, or deleted and added again at the end
+    del slow.freestream['pressure']
+    del planned.freestream['pressure']
+    slow.freestream.temperature_ratio    = np.ones([16,1]) * 3.
+    planned.freestream.temperature_ratio = np.ones([16,1]) * 3.
+    assert np.all(planned.pack_array() == slow.pack_array())
+
+    velocity = planned.freestream.velocity
+    del slow.freestream['velocity']
+    del planned.freestream['velocity']
+    slow.freestream.velocity    = velocity.copy()
+    planned.freestream.velocity = velocity.copy()
+    assert np.all(planned.pack_array() == slow.pack_array())
+    values = np.arange(len(slow.pack_array())) * 1.
+    planned.unpack_array(values)
+    slow.unpack_array(values)
+    assert np.all(planned.freestream.velocity == slow.freestream.velocity)
+
+    planned.expand_rows(4)
+    assert len(planned.pack_array()) == len(Data.pack_array(planned))
+
+    # copies get their own buffer
+    other = copy.deepcopy(planned)
+    other.unpack_array(np.zeros(len(other.pack_array())))
+    assert np.all(other.pack_array() == 0.)
+    assert np.any(planned.pack_array() != 0.)
+
+    return
+
+def benchmarks():
+    """ the operations to time """
+
+    def attribute_read(tree):
+        return tree.frames.inertial.velocity_vector
+
+    def attribute_write(tree):
+        tree.freestream.velocity = tree.weights.total_mass
+
+    def method_access(tree):
+        return tree.items
+
+    def deep_get(tree):
+        return tree.deep_get('frames.inertial.time')
+
+    def pack_array(tree):
+        return tree.pack_array()
+
+    def tree_copy(tree):
+        return copy.deepcopy(tree)
+
+    return [['attribute read'  , attribute_read ],
+            ['attribute write' , attribute_write],
+            ['method access'   , method_access  ],
+            ['deep_get'        , deep_get       ],
+            ['pack_array'      , pack_array     ],
+            ['deepcopy'        , tree_copy      ]]
+
+def time_it(function,tree):
+    """ best of several repeats, in microseconds per call """
+
+    number = 2000
+    times  = timeit.repeat(lambda: function(tree),number=number,repeat=5)
+
+    return min(times) / number * 1e6
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
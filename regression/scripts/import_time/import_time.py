@@ -0,0 +1,118 @@
+# import_time.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import os
+import re
+import sys
+import shutil
+import tempfile
+import subprocess
+
+# the optional packages only the surrogates and the plots need
+optional_packages = ['sklearn','matplotlib','pylab','mpl_toolkits']
+
+# the import statements timed
+imports = [('SUAVE'              , 'import SUAVE'),
+           ('SUAVE.Core'         , 'from SUAVE.Core import Data, Units'),
+           ('all SUAVE packages' , 'import SUAVE; [ getattr(SUAVE,package) for package in SUAVE.packages ]')]
+
+# ----------------------------------------------------------------------
+#   The Test
+# ----------------------------------------------------------------------
+
+def main():
+
+    times = {}
+    for name, statement in imports:
+        total, modules = import_time(statement)
+        times[name]    = total
+        print('import time, ' + name.ljust(20) + ': ' + str(round(total,3)) + ' s, ' + str(len(modules)) + ' modules')
+
+        # none of the imports load the optional packages
+        loaded = [ package for package in optional_packages if package in modules ]
+        assert not loaded, name + ' imported ' + str(loaded)
+
+    # the packages the vehicle class does not need are imported on first use
+    assert times['SUAVE'] < times['all SUAVE packages']
+    lazy_packages()
+    vehicle_class()
+
+    return
+
+def import_time(statement):
+    """Runs an import statement in a new interpreter with -X importtime, returns the total
+    time of the imports and the names of the modules imported"""
+
+    process = subprocess.run([sys.executable,'-X','importtime','-c',statement],
+                             stdout=subprocess.PIPE,stderr=subprocess.PIPE,universal_newlines=True)
+    assert process.returncode == 0, process.stderr
+
+    total   = 0.
+    modules = set()
+    for line in process.stderr.splitlines():
+        match = re.match(r'import time:\s+(\d+) \|\s+(\d+) \|\s*(\S+)',line)
+        if match:
+            total += int(match.group(1))*1e-6
+            modules.add(match.group(3).split('.')[0])
+
+    return total, modules
+
+def lazy_packages():
+
+    statement = '\n'.join(['import sys',
+                           'import SUAVE',
+                           'assert "SUAVE.Optimization" not in sys.modules',
+                           'assert "SUAVE.Sizing" not in sys.modules',
+                           'from SUAVE.Core import Data',
+                           'problem  = SUAVE.Optimization.Nexus()',
+                           'segments = SUAVE.Analyses.Mission.Segments',
+                           'assert "Sizing" in dir(SUAVE)'])
+
+    process = subprocess.run([sys.executable,'-c',statement],
+                             stdout=subprocess.PIPE,stderr=subprocess.PIPE,universal_newlines=True)
+    assert process.returncode == 0, process.stderr
+
+    return
+
+def vehicle_class():
+
+    directory = tempfile.mkdtemp(prefix='import_time_')
+    filename  = os.path.join(directory,'vehicle.pkl')
+
+    try:
+        # SUAVE.Vehicle stays the class after the SUAVE.Vehicle module is imported, as unpickling does
+        statements = [['import pickle, SUAVE',
+                       'pickle.dump(SUAVE.Vehicle(),open(' + repr(filename) + ',"wb"))'],
+                      ['import pickle',
+                       'vehicle = pickle.load(open(' + repr(filename) + ',"rb"))',
+                       'import SUAVE',
+                       'assert isinstance(vehicle,SUAVE.Vehicle)',
+                       'assert isinstance(SUAVE.Vehicle(),SUAVE.Vehicle)'],
+                      ['from SUAVE.Vehicle import Vehicle',
+                       'import SUAVE',
+                       'assert SUAVE.Vehicle is Vehicle',
+                       'assert isinstance(SUAVE.Vehicle(),Vehicle)'],
+                      ['import SUAVE.Vehicle',
+                       'assert isinstance(SUAVE.Vehicle(),SUAVE.Vehicle)']]
+
+        for statement in statements:
+            process = subprocess.run([sys.executable,'-c','\n'.join(statement)],
+                                     stdout=subprocess.PIPE,stderr=subprocess.PIPE,universal_newlines=True)
+            assert process.returncode == 0, process.stderr
+    finally:
+        shutil.rmtree(directory)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
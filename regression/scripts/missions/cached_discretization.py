@@ -0,0 +1,136 @@
+# cached_discretization.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import copy
+import numpy as np
+
+from SUAVE.Methods.Utilities.Chebyshev import chebyshev_data, linear_data, cached_discretization, \
+     integration_factors, factored_integrate
+
+import sys
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   The Test
+# ----------------------------------------------------------------------
+
+def main():
+
+    # the cached operators are the ones of the method, computed once
+    for N in [4, 16]:
+        x, D, I = chebyshev_data(N)
+        cached  = cached_discretization(chebyshev_data,N)
+        assert np.all(cached[0] == x)
+        assert np.all(cached[1] == D)
+        assert np.all(cached[2] == I)
+        assert all( cached_operator is operator for cached_operator, operator in \
+                    zip(cached_discretization(chebyshev_data,N),cached) )
+        check_read_only(cached)
+
+    # another method, number of points or option it takes is another entry
+    assert cached_discretization(chebyshev_data,16)[1] is not cached_discretization(chebyshev_data,4)[1]
+    assert cached_discretization(chebyshev_data,16)[1] is not cached_discretization(linear_data,16)[1]
+    assert cached_discretization(chebyshev_data,16,integration=False)[2] is None
+    assert cached_discretization(chebyshev_data,16)[2] is not None
+
+    # options the method does not name are not part of the key
+    assert cached_discretization(chebyshev_data,16,tag='cruise')[1] is cached_discretization(chebyshev_data,16)[1]
+
+    # the factored integration is the integration operator, without computing its inverse
+    for method in [chebyshev_data, linear_data]:
+        for N in [4, 16]:
+            x, D, I = method(N)
+            factors = integration_factors(method,N)
+            assert integration_factors(method,N) is factors
+            assert factors is integration_factors(method,N,tag='cruise')
+            check_read_only(factors)
+            f = np.cos(3.*x)
+            assert np.allclose(factored_integrate(factors,f),np.dot(I,f),rtol=0.,atol=1e-12)
+            assert np.allclose(factored_integrate(factors,f[:,None],5.),5.*np.dot(I,f[:,None]),rtol=0.,atol=1e-12)
+    assert cached_discretization(chebyshev_data,16,integration=False)[1] is not cached_discretization(chebyshev_data,16)[1]
+
+    # the segments of the B737 mission share them
+    configs, analyses = mission_B737.full_setup()
+    configs.finalize()
+    analyses.finalize()
+
+    mission  = analyses.missions.base
+    factored = copy.deepcopy(mission)
+    results  = mission.evaluate()
+
+    # the first segment with each number of control points
+    first = {}
+
+    for tag, segment in results.segments.items():
+        numerics = segment.state.numerics
+        N        = numerics.number_control_points
+        x, D, I  = chebyshev_data(N)
+        first.setdefault(N,numerics)
+        assert numerics.discretization_method is chebyshev_data, tag
+        assert numerics.dimensionless.differentiate is first[N].dimensionless.differentiate, tag
+        assert numerics.dimensionless.integrate     is first[N].dimensionless.integrate, tag
+        assert np.all(numerics.dimensionless.control_points[:,0] == x), tag
+        assert np.all(numerics.dimensionless.differentiate == D), tag
+        assert np.all(numerics.dimensionless.integrate == I), tag
+        check_read_only([numerics.dimensionless.control_points,
+                         numerics.dimensionless.differentiate,
+                         numerics.dimensionless.integrate])
+
+        # the operators scaled by the segment time are its own
+        assert numerics.time.differentiate.flags.writeable, tag
+        assert numerics.time.integrate.flags.writeable, tag
+
+    # the climbs and descents share one set, the cruise has fewer points
+    assert sorted(first.keys()) == [10, 16]
+
+    # the same mission integrated with the factors
+    for segment in factored.segments.values():
+        segment.state.numerics.factored_integration = True
+    factored_results = factored.evaluate()
+
+    for tag, segment in factored_results.segments.items():
+        numerics = segment.state.numerics
+        N        = numerics.number_control_points
+        assert numerics.dimensionless.integrate is None, tag
+        assert numerics.time.integrate is None, tag
+        assert numerics.dimensionless.integration_factors is integration_factors(chebyshev_data,N), tag
+
+        conditions      = segment.conditions
+        base_conditions = results.segments[tag].conditions
+        for factored_values, values in [(conditions.weights.total_mass,base_conditions.weights.total_mass),
+                                        (conditions.frames.inertial.position_vector,base_conditions.frames.inertial.position_vector),
+                                        (conditions.frames.inertial.time,base_conditions.frames.inertial.time),
+                                        (conditions.propulsion.throttle,base_conditions.propulsion.throttle)]:
+            assert np.allclose(factored_values,values,rtol=1e-6,atol=1e-6), tag
+
+    return
+
+def check_read_only(operators):
+    """The shared operators can not be changed in place"""
+
+    for operator in operators:
+        assert not operator.flags.writeable
+        try:
+            operator[0] = 1.
+        except ValueError:
+            pass
+        else:
+            raise AssertionError('a cached operator was changed in place')
+
+    return
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+# evaluate_missions.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import copy
+import numpy as np
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Methods.Missions import evaluate_missions
+
+import sys
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+
+import mission_B737
+
+# cruise distances of the missions in the batch
+cruise_distances = [3000., 4000., 2000.]
+
+# ----------------------------------------------------------------------
+#   The Test
+# ----------------------------------------------------------------------
+
+def main():
+
+    # the missions are evaluated in the order of the container, one after the other
+    missions = missions_setup()
+    serial   = copy.deepcopy(missions).evaluate()
+
+    # over a pool of two processes, from a container
+    pooled   = missions.evaluate(number_of_processes=2)
+
+    # in this process, from a list
+    single   = evaluate_missions(list(missions.values()),number_of_processes=1)
+
+    assert list(pooled.keys()) == list(serial.keys())
+    assert len(single) == len(serial)
+
+    for index, (tag, results) in enumerate(serial.items()):
+        check_results(results,pooled[tag],tag)
+        check_results(results,single[index],tag)
+
+    # the missions passed in are left as they were, with either number of processes
+    for index, mission in enumerate(missions.values()):
+        assert is_evaluated(serial[mission.tag]), mission.tag
+        assert not is_evaluated(mission), mission.tag
+        assert single[index] is not mission
+
+    return
+
+def missions_setup():
+    """Builds a container of B737 missions that differ in their cruise distance"""
+
+    configs, analyses = mission_B737.full_setup()
+    configs.finalize()
+    analyses.finalize()
+
+    base     = analyses.missions.base
+    missions = SUAVE.Analyses.Mission.Mission.Container()
+
+    for index, distance in enumerate(cruise_distances):
+        mission = copy.deepcopy(base)
+        mission.tag = 'mission_' + str(index)
+        mission.segments.cruise.distance = distance * Units.km
+        missions.append(mission)
+
+    return missions
+
+def check_results(results,other_results,tag):
+    """The same missions give the same results, wherever they are evaluated"""
+
+    distance       = results.segments[-1].conditions.frames.inertial.position_vector[-1,0]
+    other_distance = other_results.segments[-1].conditions.frames.inertial.position_vector[-1,0]
+    mass           = results.segments[-1].conditions.weights.total_mass[-1,0]
+    other_mass     = other_results.segments[-1].conditions.weights.total_mass[-1,0]
+
+    assert np.isclose(distance,other_distance,rtol=1e-12,atol=0.), tag
+    assert np.isclose(mass,other_mass,rtol=1e-12,atol=0.), tag
+
+    return
+
+def is_evaluated(mission):
+    """Checks if a mission has been evaluated, its conditions are expanded to the control points"""
+
+    for segment in mission.segments.values():
+        if segment.state.conditions.weights.total_mass.shape[0] > 1:
+            return True
+
+    return False
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+# jacobian.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified: Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from SUAVE.Methods.Missions.Segments.Common.Jacobian import pointwise_finite_difference
+
+import sys
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+sys.path.append('../Embraer_E190_constThr')
+
+import mission_B737
+import mission_Embraer_E190_constThr
+
+# ----------------------------------------------------------------------
+#   The Test
+# ----------------------------------------------------------------------
+
+def main():
+
+    # the B737 climbs at constant rates, the E190 at constant throttle with the body angle unknown
+    for name, setup in [('B737',b737_setup),('E190',e190_setup)]:
+
+        # the full finite difference Jacobian of the root finder
+        results, iterations = evaluate_mission(setup,None)
+
+        # the grouped finite difference Jacobian
+        grouped_results, grouped_iterations = evaluate_mission(setup,pointwise_finite_difference)
+
+        print(name + ' segment iterations, full jacobian    : ' + str(iterations))
+        print(name + ' segment iterations, grouped jacobian : ' + str(grouped_iterations))
+
+        # every segment converges, for fewer segment iterations, to the same solution
+        assert grouped_iterations < iterations, name
+        compare(results,grouped_results,name)
+
+        landing_mass = results.segments[-1].conditions.weights.total_mass[-1,0]
+        grouped_mass = grouped_results.segments[-1].conditions.weights.total_mass[-1,0]
+        print(name + ' landing mass difference : ' + str(abs(landing_mass - grouped_mass)) + ' kg')
+
+    # a Jacobian that does not lead the root finder to the solution falls back to full differences
+    wrong_results, wrong_iterations = evaluate_mission(b737_setup,wrong_jacobian)
+    results, iterations = evaluate_mission(b737_setup,None)
+    compare(results,wrong_results,'wrong jacobian')
+    assert wrong_iterations > iterations
+
+    return
+
+def b737_setup():
+    configs, analyses = mission_B737.full_setup()
+    configs.finalize()
+    analyses.finalize()
+
+    return analyses.missions.base
+
+def e190_setup():
+    configs, analyses = mission_Embraer_E190_constThr.full_setup()
+    configs.finalize()
+    analyses.finalize()
+
+    return analyses.missions
+
+def wrong_jacobian(unknowns, segment):
+    """A Jacobian with the wrong sign of every derivative"""
+
+    return -np.eye(len(unknowns))
+
+def evaluate_mission(setup, jacobian):
+    """Evaluates a mission with a Jacobian provider, returns the results and the number of
+    segment iterations"""
+
+    mission    = setup()
+    iterations = [0]
+
+    def count_iterations(segment):
+        iterations[0] += 1
+
+    for segment in mission.segments.values():
+        segment.settings.jacobian = jacobian
+        segment.process.iterate.count_iterations = count_iterations
+
+    results = mission.evaluate()
+
+    return results, iterations[0]
+
+def compare(results,other_results,name):
+    """Checks that every segment converged to the same solution, within the solver tolerance"""
+
+    for tag, segment in results.segments.items():
+        other = other_results.segments[tag]
+        tag   = name + ' ' + tag
+        assert segment.state.numerics.converged, tag
+        assert other.state.numerics.converged, tag
+        check(segment.conditions.weights.total_mass,other.conditions.weights.total_mass,1e-6,tag + ' total mass')
+        check(segment.conditions.frames.inertial.position_vector[:,0],
+              other.conditions.frames.inertial.position_vector[:,0],1e-6,tag + ' distance')
+        check(segment.conditions.propulsion.throttle,other.conditions.propulsion.throttle,1e-5,tag + ' throttle')
+        check(segment.conditions.aerodynamics.angle_of_attack,
+              other.conditions.aerodynamics.angle_of_attack,1e-5,tag + ' angle of attack')
+
+    return
+
+def check(values,grouped_values,tolerance,name):
+    error = np.max(np.abs(grouped_values - values)/np.maximum(np.abs(values),1.))
+    assert error < tolerance, name + ' error ' + str(error)
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+# warm_start.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import copy
+import numpy as np
+
+from SUAVE.Core import Units
+from SUAVE.Methods.Missions import evaluate_warm_started, clear_unknowns
+from SUAVE.Methods.Performance import size_mission_range_given_weights
+
+import sys
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   The Test
+# ----------------------------------------------------------------------
+
+def main():
+
+    configs, analyses = mission_B737.full_setup()
+    configs.finalize()
+    analyses.finalize()
+
+    fresh = analyses.missions.base
+
+    # the baseline, from the default unknowns
+    baseline        = copy.deepcopy(fresh)
+    iterations      = count_iterations(baseline)
+    base_summary    = summary(baseline.evaluate())
+    base_iterations = iterations[0]
+
+    # warm started solves of a longer cruise, the second starts from the first
+    mission    = copy.deepcopy(fresh)
+    iterations = count_iterations(mission)
+    mission.segments.cruise.distance += 50. * Units.km
+    evaluate_warm_started(mission)
+    first_iterations = iterations[0]
+
+    iterations[0] = 0
+    evaluate_warm_started(mission)
+    print('segment iterations, cold : ' + str(first_iterations) + ', warm : ' + str(iterations[0]))
+    assert iterations[0] < first_iterations
+
+    for segment in mission.segments.values():
+        assert segment.warm_start is not None, segment.tag
+        assert not segment.use_warm_start, segment.tag
+
+    # a plain evaluation ignores stored unknowns, even stale ones carried over to another mission
+    stale      = copy.deepcopy(fresh)
+    iterations = count_iterations(stale)
+    for tag, segment in stale.segments.items():
+        segment.warm_start = copy.deepcopy(mission.segments[tag].warm_start)
+    assert np.all(summary(stale.evaluate()) == base_summary)
+    assert iterations[0] == base_iterations
+
+    # and the warm started mission comes back to the baseline
+    mission.segments.cruise.distance -= 50. * Units.km
+    assert np.allclose(summary(mission.evaluate()),base_summary,rtol=1e-6,atol=0.)
+
+    clear_unknowns(mission)
+    for segment in mission.segments.values():
+        assert segment.warm_start is None, segment.tag
+
+    # the performance methods do not leave their stored unknowns on the mission
+    vehicle = configs.base
+    payload = vehicle.mass_properties.max_takeoff - vehicle.mass_properties.operating_empty - 15000.
+    size_mission_range_given_weights(vehicle,mission,'cruise',payload,vehicle.mass_properties.max_takeoff)
+    for segment in mission.segments.values():
+        assert segment.warm_start is None, segment.tag
+        assert not segment.use_warm_start, segment.tag
+
+    return
+
+def count_iterations(mission):
+    """Adds a counter of the segment iterations to the process of each segment"""
+
+    iterations = [0]
+
+    def count(segment):
+        iterations[0] += 1
+
+    for segment in mission.segments.values():
+        segment.process.iterate.count_iterations = count
+
+    return iterations
+
+def summary(results):
+    """The landing mass, distance and final throttle of a mission"""
+
+    conditions = results.segments[-1].conditions
+
+    return np.array([ conditions.weights.total_mass[-1,0],
+                      conditions.frames.inertial.position_vector[-1,0],
+                      conditions.propulsion.throttle[-1,0] ])
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,383 @@
+# nexus_evaluation.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified: Oct 2026, SUAVE Team
+
+""" Checks the alias paths, the evaluation cache, the finite differences and
+    the partial re-evaluation of the Nexus on a small analytic problem
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, Units
+from SUAVE.Analyses import Process
+from SUAVE.Optimization import Nexus
+from SUAVE.Optimization import helper_functions as help_fun
+
+import numpy as np
+import shutil
+import tempfile
+import time
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # ------------------------------------------------------------------
+    #   Alias Paths
+    # ------------------------------------------------------------------
+
+    check_aliases()
+
+    # ------------------------------------------------------------------
+    #   Units
+    # ------------------------------------------------------------------
+
+    check_units()
+
+    # ------------------------------------------------------------------
+    #   No Cache
+    # ------------------------------------------------------------------
+
+    nexus = setup()
+
+    obj_1 = nexus.objective([1.,1.])
+    obj_2 = nexus.objective([2.,1.])
+    obj_3 = nexus.objective([1.,1.])
+
+    assert nexus.evaluation_count == 3
+    assert obj_1 == obj_3
+
+    # ------------------------------------------------------------------
+    #   Memory Cache
+    # ------------------------------------------------------------------
+
+    nexus = setup()
+    nexus.evaluation_cache.size = 2
+
+    assert nexus.objective([1.,1.]) == obj_1
+    assert nexus.objective([2.,1.]) == obj_2
+    assert nexus.objective([1.,1.]) == obj_1
+    con = nexus.all_constraints([2.,1.])
+
+    assert nexus.evaluation_count == 2
+    stats = nexus.evaluation_cache.statistics()
+    assert stats.hits   == 2
+    assert stats.misses == 2
+
+    # the fidelity level is part of the key
+    nexus.fidelity_level = 2
+    nexus.objective([1.,1.])
+    assert nexus.evaluation_count == 3
+
+    # least recently used entries are dropped
+    nexus.fidelity_level = 1
+    nexus.objective([2.,1.])
+    assert nexus.evaluation_count == 3
+    nexus.objective([1.,1.])
+    assert nexus.evaluation_count == 4
+    assert len(nexus.evaluation_cache.entries) == 2
+
+    # a hit restores the summary and the entries the objective and constraint aliases read
+    nexus = setup()
+    nexus.evaluation_cache.size = 2
+    nexus.optimization_problem.constraints = np.array([
+        [ 'g' ,  '>' ,  0.  ,   1.    , 1. ],
+        [ 'p' ,  '>' ,  0.  ,   1.    , 1. ],
+    ],dtype=object)
+    nexus.optimization_problem.aliases.append([ 'p' , 'analyses.post_processing.product' ])
+    outside = np.array([[ 'p' , 1. , 1. ]],dtype=object)
+
+    nexus.objective([1.,1.])
+    nexus.objective([2.,3.])
+    nexus.objective([1.,1.])
+    assert nexus.evaluation_count == 2
+    assert help_fun.get_values(nexus,outside,nexus.optimization_problem.aliases)[0] == 1.
+    for entry in nexus.evaluation_cache.entries.values():
+        assert sorted(entry.state.keys()) == ['analyses','results','summary']
+
+    # other entries only if they are asked for
+    assert nexus.vehicle_configurations.base.x == 2.
+    nexus.evaluation_cache.state_keys.append('vehicle_configurations')
+    nexus.objective([3.,3.])
+    nexus.objective([1.,1.])
+    nexus.objective([3.,3.])
+    assert nexus.evaluation_count == 3
+    assert nexus.vehicle_configurations.base.x == 3.
+
+    # and the cached state is not changed by later evaluations
+    nexus.analyses.post_processing.product = -1.
+    nexus.objective([1.,1.])
+    nexus.objective([3.,3.])
+    nexus.objective([1.,1.])
+    assert nexus.evaluation_count == 3
+    assert help_fun.get_values(nexus,outside,nexus.optimization_problem.aliases)[0] == 1.
+
+    # ------------------------------------------------------------------
+    #   Cache Cost
+    # ------------------------------------------------------------------
+
+    # the store and hit times with a large vehicle, which the aliases do not read
+    store_time, hit_time           = cache_cost(['results','summary'])
+    full_store_time, full_hit_time = cache_cost(['vehicle_configurations','analyses','missions','results','summary'])
+
+    print('cache store, hit time            : ' + str(store_time) + ', ' + str(hit_time) + ' s')
+    print('cache store, hit time, all state : ' + str(full_store_time) + ', ' + str(full_hit_time) + ' s')
+    assert store_time + hit_time < full_store_time + full_hit_time
+
+    # ------------------------------------------------------------------
+    #   Disk Cache
+    # ------------------------------------------------------------------
+
+    directory = tempfile.mkdtemp()
+
+    try:
+        nexus = setup()
+        nexus.evaluation_cache.directory = directory
+        nexus.objective([1.,1.])
+        nexus.objective([2.,1.])
+
+        # a new nexus finds the evaluations of the first one
+        nexus = setup()
+        nexus.evaluation_cache.directory = directory
+        assert nexus.objective([2.,1.]) == obj_2
+        assert np.all(nexus.all_constraints([2.,1.]) == con)
+        assert nexus.objective([1.,1.]) == obj_1
+        assert nexus.evaluation_count == 0
+    finally:
+        shutil.rmtree(directory)
+
+    # ------------------------------------------------------------------
+    #   Finite Differences
+    # ------------------------------------------------------------------
+
+    x = np.array([1.5,0.5])
+    grad_true = np.array([2.*(x[0]-1.) - 40.*x[0]*(x[1]-x[0]**2), 20.*(x[1]-x[0]**2)])
+    jac_true  = np.array([[x[1], x[0]]])
+
+    nexus = setup()
+    grad_fwd, jac_fwd = nexus.finite_difference(x)
+    assert nexus.evaluation_count == 3
+    assert np.all(np.abs(grad_fwd - grad_true) < 1e-5)
+    assert np.all(np.abs(jac_fwd  - jac_true ) < 1e-5)
+
+    nexus = setup()
+    grad_cen, jac_cen = nexus.finite_difference(x,diff_interval=1e-6,method='central',step_type='relative')
+    assert nexus.evaluation_count == 4
+    assert np.all(np.abs(grad_cen - grad_true) < 1e-7)
+    assert np.all(np.abs(jac_cen  - jac_true ) < 1e-7)
+
+    # a pool of workers gives the same answer
+    nexus = setup()
+    grad_par, jac_par = nexus.finite_difference(x,diff_interval=1e-6,method='central',step_type='relative',
+                                                number_of_processes=2)
+    assert nexus.evaluation_count == 4
+    assert np.all(grad_par == grad_cen)
+    assert np.all(jac_par  == jac_cen)
+
+    # ------------------------------------------------------------------
+    #   Partial Re-evaluation
+    # ------------------------------------------------------------------
+
+    full    = setup(split=True)
+    partial = setup(split=True)
+    partial.procedure_dependencies.geometry = Data()
+    partial.procedure_dependencies.geometry.reads  = ['missions.x']
+    partial.procedure_dependencies.geometry.writes = ['summary.x_squared']
+    partial.procedure_dependencies.mission  = Data()
+    partial.procedure_dependencies.mission.reads   = ['missions.*','summary.x_squared']
+    partial.procedure_dependencies.mission.writes  = ['summary.f','summary.g']
+
+    for point in [[1.,1.],[1.,2.],[3.,2.],[3.,2.5]]:
+        assert full.objective(point) == partial.objective(point)
+        assert np.all(full.all_constraints(point) == partial.all_constraints(point))
+
+    # only y changed in the last point
+    assert full.last_evaluated_steps    == ['geometry','mission']
+    assert partial.last_evaluated_steps == ['mission']
+
+    print('forward gradient error  :', np.max(np.abs(grad_fwd - grad_true)))
+    print('central gradient error  :', np.max(np.abs(grad_cen - grad_true)))
+
+    return
+
+def cache_cost(state_keys):
+    """ times one store and one hit of the evaluation cache """
+
+    nexus = setup()
+    nexus.evaluation_cache.size       = 2
+    nexus.evaluation_cache.state_keys = state_keys
+    nexus.vehicle_configurations.cruise = Data()
+    nexus.vehicle_configurations.cruise.sections = [ Data(chord=np.ones(10)*ii) for ii in range(5000) ]
+    nexus.objective([1.,1.])
+
+    cache = nexus.evaluation_cache
+    key   = cache.key(nexus)
+
+    start = time.time()
+    cache.store(key,nexus)
+    store_time = time.time() - start
+
+    start = time.time()
+    assert cache.load(key,nexus)
+    hit_time = time.time() - start
+
+    return store_time, hit_time
+
+def check_aliases():
+    """ wildcards and lists of paths are set, outputs are read back """
+
+    data = Data()
+    data.configs = Data()
+    for tag in ['base','cruise','takeoff']:
+        data.configs[tag] = Data()
+        data.configs[tag].wing = Data()
+        data.configs[tag].wing.area = 0.
+    data.summary = Data()
+    data.summary.areas = np.array([1.,2.,3.])
+
+    aliases = [
+        [ 'area'  , 'configs.*.wing.area'                     ],
+        [ 'span'  , ['summary.span','configs.base.wing.span'] ],
+        [ 'third' , 'summary.areas[2]'                        ],
+    ]
+
+    inputs = np.array([
+        [ 'area' , 1. , (0.,1.) , 1. , 1. ],
+        [ 'span' , 1. , (0.,1.) , 1. , 1. ],
+    ],dtype=object)
+
+    for values in [[10.,20.],[30.,40.]]:
+        help_fun.set_values(data,inputs,np.array(values),aliases)
+        for tag in ['base','cruise','takeoff']:
+            assert data.configs[tag].wing.area == values[0]
+        assert data.summary.span == values[1]
+        assert data.configs.base.wing.span == values[1]
+
+    outputs = np.array([
+        [ 'span'  , 1. , 1. ],
+        [ 'third' , 1. , 1. ],
+    ],dtype=object)
+    aliases[1][1] = 'summary.span'
+    assert np.all(help_fun.get_values(data,outputs,aliases) == [40.,3.])
+
+    return
+
+def check_units():
+    """ problems written with Units in plain arrays, as the optimization scripts do """
+
+    nexus   = setup()
+    problem = nexus.optimization_problem
+
+    problem.objective = np.array([
+        [ 'f' , 10. , Units.kg ],
+    ])
+
+    problem.constraints = np.array([
+        [ 'g' , '>' , 0. , 1E-1 , Units.less ],
+        [ 'h' , '<' , 2. , 1.   , Units.lb   ],
+    ])
+    problem.aliases.append([ 'h' , 'summary.g' ])
+
+    # the columns of numbers are strings in such arrays
+    assert problem.objective.dtype.kind == 'U'
+
+    x = np.array([1.5,0.5])
+    f = (x[0] - 1.) ** 2 + 10. * (x[1] - x[0] ** 2) ** 2 + nexus.fidelity_level
+    g = x[0] * x[1] - 1.
+
+    assert np.isclose(nexus.objective(x),f/(10. * Units.kg),rtol=1e-12,atol=0.)
+    assert np.allclose(nexus.all_constraints(x),[g/1E-1,g],rtol=1e-12,atol=0.)
+    assert np.allclose(nexus.inequality_constraint(x),[g/1E-1,-g],rtol=1e-12,atol=0.)
+    assert np.allclose(help_fun.scale_const_bnds(problem.constraints),[0.,2.*Units.lb],rtol=1e-12,atol=0.)
+    assert np.allclose(help_fun.unscale_const_values(problem.constraints,np.array([1.,1.])),
+                       [1E-1,1./Units.lb],rtol=1e-12,atol=0.)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Problem Setup
+# ----------------------------------------------------------------------
+
+def setup(split=False):
+
+    nexus = Nexus()
+    problem = Data()
+    nexus.optimization_problem = problem
+
+    #   [ tag , initial, (lb,ub)      , scaling , units ]
+    problem.inputs = np.array([
+        [ 'x' ,  1.    , (  -5., 5. ) ,   1.    , 1. ],
+        [ 'y' ,  1.    , (  -5., 5. ) ,   1.    , 1. ],
+    ],dtype=object)
+
+    #   [ tag , scaling , units ]
+    problem.objective = np.array([
+        [ 'f' ,   1.    , 1. ],
+    ],dtype=object)
+
+    #   [ tag , sense, edge , scaling , units ]
+    problem.constraints = np.array([
+        [ 'g' ,  '>' ,  0.  ,   1.    , 1. ],
+    ],dtype=object)
+
+    #   [ 'alias' , ['data.path1.name','data.path2.name'] ]
+    problem.aliases = [
+        [ 'x' , 'missions.x'  ],
+        [ 'y' , 'missions.y'  ],
+        [ 'f' , 'summary.f'   ],
+        [ 'g' , 'summary.g'   ],
+    ]
+
+    nexus.missions = Data()
+    nexus.procedure = Process()
+    if split:
+        nexus.procedure.geometry = geometry
+        nexus.procedure.mission  = mission
+    else:
+        nexus.procedure.analytic = analytic
+
+    return nexus
+
+def analytic(nexus):
+
+    x = nexus.missions.x
+    y = nexus.missions.y
+
+    nexus.summary.f = (x - 1.) ** 2 + 10. * (y - x ** 2) ** 2 + nexus.fidelity_level
+    nexus.summary.g = x * y - 1.
+
+    # outputs outside the summary
+    nexus.vehicle_configurations.base      = Data()
+    nexus.vehicle_configurations.base.x    = x
+    nexus.analyses.post_processing         = Data()
+    nexus.analyses.post_processing.product = x * y
+
+    return nexus
+
+def geometry(nexus):
+
+    x = nexus.missions.x
+
+    nexus.summary.x_squared = x ** 2
+
+    return nexus
+
+def mission(nexus):
+
+    x  = nexus.missions.x
+    y  = nexus.missions.y
+    x2 = nexus.summary.x_squared
+
+    nexus.summary.f = (x - 1.) ** 2 + 10. * (y - x2) ** 2 + nexus.fidelity_level
+    nexus.summary.g = x * y - 1.
+
+    return nexus
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+# engine_noise_SAE.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified: Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import time
+import numpy as np
+
+import SUAVE
+from SUAVE.Core import Data
+
+from SUAVE.Methods.Noise.Fidelity_One.Engine import noise_SAE
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_geometric
+
+import sys
+sys.path.append('../Vehicles')
+
+from Boeing_737 import vehicle_setup, configs_setup
+
+# engine sizes of the test, as fractions of the design thrust
+thrust_ratios = Data()
+thrust_ratios.low_thrust    = 0.6
+thrust_ratios.design_thrust = 1.0
+thrust_ratios.high_thrust   = 1.3
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    turbofan, noise_segment, config, analyses = setup()
+
+    # the engine noise of the stored sideline climb, for several engine sizes
+    design_thrust = turbofan.design_thrust
+    repeats       = 3
+
+    results  = Data()
+    time_new = 0.
+    for tag, thrust_ratio in thrust_ratios.items():
+        turbofan.design_thrust = thrust_ratio*design_thrust
+
+        t0 = time.time()
+        for i in range(repeats):
+            EPNL, SPL_total_history, SENEL = noise_SAE(turbofan,noise_segment,config,analyses)
+        time_new += time.time() - t0
+
+        results[tag] = Data()
+        results[tag].thrust_ratio      = thrust_ratio
+        results[tag].EPNL              = float(EPNL)
+        results[tag].SENEL             = float(SENEL)
+        results[tag].SPL_total_history = np.array(SPL_total_history)
+
+    turbofan.design_thrust = design_thrust
+
+    print('SAE engine noise time : ' + str(time_new/(repeats*len(thrust_ratios))) + ' s per call')
+
+    # save_results(results)
+    old_results = load_results()
+
+    # the levels of the position by position calculation, stored before it was written over all
+    # the positions at once
+    check_results(results,old_results)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def setup():
+
+    vehicle  = vehicle_setup()
+    configs  = configs_setup(vehicle)
+    config   = configs.takeoff
+    turbofan = config.propulsors['turbofan']
+
+    analyses = Data()
+    analyses.atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    analyses.noise = Data()
+    analyses.noise.settings = Data()
+    analyses.noise.settings.sideline = 0
+    analyses.noise.settings.flyover  = 0
+    analyses.noise.settings.approach = 1
+    analyses.noise.settings.mic_x_position = 0.
+
+    results       = SUAVE.Input_Output.SUAVE.load('sideline.res')
+    noise_segment = results.segments.climb
+
+    # the microphone geometry of an approach, which does not need the takeoff field length
+    noise_geometric(noise_segment,analyses,config)
+
+    return turbofan, noise_segment, config, analyses
+
+# ----------------------------------------------------------------------
+#   Check Results
+# ----------------------------------------------------------------------
+
+def check_results(new_results,old_results):
+
+    for tag in thrust_ratios.keys():
+        new = new_results[tag]
+        old = old_results[tag]
+
+        error = Data()
+        error.EPNL              = np.abs(new.EPNL  - old.EPNL)/old.EPNL
+        error.SENEL             = np.abs(new.SENEL - old.SENEL)/old.SENEL
+        error.SPL_total_history = np.max(np.abs(new.SPL_total_history - old.SPL_total_history))
+
+        print(tag + ' EPNL = ' + str(new.EPNL) + ', SENEL = ' + str(new.SENEL))
+        print(error)
+        for k,v in list(error.items()):
+            assert(np.abs(v)<1e-10)
+
+    return
+
+def load_results():
+    return SUAVE.Input_Output.SUAVE.load('engine_noise_SAE.res')
+
+def save_results(results):
+    SUAVE.Input_Output.SUAVE.archive(results,'engine_noise_SAE.res')
+    return
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
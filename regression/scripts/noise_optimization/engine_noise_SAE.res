@@ -0,0 +1 @@
+{"low_thrust": {"thrust_ratio": 0.6, "EPNL": 75.42227759169505, "SENEL": 46.019677605129836, "SPL_total_history": [[41.687819645085675, 41.67225782139533, 41.5872436613812, 41.46284025061486, 41.26376401641409, 41.001290118993516, 40.71336044389058, 40.38295443426967, 40.02772184464049, 39.64164028743933, 39.28179656127962, 38.93197073771731, 38.56282685583216, 38.20820897846234, 37.77463590367225, 37.15955566939658, 36.34032860788721, 35.20286569937207, 33.508845082815924, 31.016657828575696, 29.89973136587196, 26.175190719996525, 19.765007755164714, 9.904960777990116], [41.88177258527733, 41.86341527089614, 41.77417736273675, 41.64431061684368, 41.438771598160315, 41.16668570567739, 40.867564315872144, 40.52297736285916, 40.14895007829422, 39.739217751825805, 39.35367666466729, 38.97433076485844, 38.573760325930394, 38.190238842606995, 37.73019857920494, 37.08955653830263, 36.25293344727873, 35.10428466356403, 33.40823656158189, 30.92744757440164, 29.796142828480455, 26.105679506412585, 19.779331414659854, 10.070084000098273], [42.07927291442899, 42.05825457037712, 41.965018392701516, 41.829988811913, 41.618392444177054, 41.337288402343844, 41.02766746030041, 40.66975499925233, 40.27798911392453, 39.8458501543901, 39.43585991068741, 39.02831212557783, 38.597667156866855, 38.18650195480616, 37.70129261953856, 37.03662345525125, 36.184119247129914, 35.0259354405919, 33.329719093490375, 30.86240994772945, 29.71872458604594, 26.06462621643102, 19.82469869813642, 10.265860372204163], [42.28081506914115, 42.25714354788788, 42.15994187418717, 42.01981209510444, 41.802259776022424, 41.51229875141525, 41.19236544014524, 40.821341079307444, 40.41205682508979, 39.957688177364645, 39.52331287287769, 39.08748431885734, 38.62652652801093, 38.18739570263563, 37.67666634347279, 36.9876162127437, 36.11897564886718, 34.95106708951826, 33.254544214730565, 30.800617495237105, 29.64446782105076, 26.026684008083723, 19.873155140424025, 10.464861750971666], [42.48666849826768, 42.46032009995905, 42.359139183778105, 42.213916027623924, 41.99043955403017, 41.69168557331833, 41.361514962446925, 40.97745023660088, 40.550682023538684, 40.07402027715877, 39.61505126464614, 39.15053109418721, 38.65863041792261, 38.1908102690891, 37.65378365725026, 36.93950895381662, 36.05402161026707, 34.87573133488112, 33.1782631342407, 30.737081200135332, 29.56786942527996, 25.985776416432603, 19.917987874316022, 10.660423546584763], [42.697022227766666, 42.66795040246812, 42.56274353715512, 42.41239518278348, 42.18297903567042, 41.87543100287321, 41.53502328596151, 41.13789437872597, 40.69355039429125, 40.19436552882172, 39.710399992500996, 39.21653362563649, 38.69276305977076, 38.19521772866448, 37.63078084857624, 36.89005101591667, 35.986648719069706, 34.79695570719302, 33.097516551211825, 30.668026550722118, 29.48476378228094, 25.937298987258078, 19.95410246023168, 10.847403548654047], [42.91234572925475, 42.88042773309619, 42.7710375040182, 42.615400937060606, 42.37986752246585, 42.06329889875001, 41.71239305305767, 41.30184168254985, 40.839385913162225, 40.31686328611582, 39.806825203714006, 39.282131469650075, 38.72458672830024, 38.19528151942121, 37.60126756841578, 36.83164809220295, 35.908148629710844, 34.704891497262075, 33.00123664399205, 30.581072140824904, 29.38151623018669, 25.866225916080886, 19.964935033626002, 11.009186864491763], [43.132654770186875, 43.09782481172368, 42.98418044698272, 42.82319999261864, 42.58150938388162, 42.25589037207201, 41.89445592266041, 41.47041821440563, 40.98970009691336, 40.44351857896647, 39.906877124749855, 39.35050793498552, 38.757984463787366, 38.19555668752508, 37.570479651473676, 36.77030427659836, 35.8252464606058, 34.607021282363924, 32.89773805479611, 30.48544928690086, 29.26824282333021, 25.783666440208293, 19.962700447737348, 11.15779267259892], [43.35833530365502, 43.32045827640117, 43.202389948517414, 43.03589457901262, 42.78786635163769, 42.45297378425008, 42.080756832009946, 41.64288176783572, 41.14336609520028, 40.57269146111316, 40.00831487622722, 39.41866963293817, 38.78905384052104, 38.19119421613513, 37.53255692951783, 36.69899838195609, 35.72984889421656, 34.49416070740321, 32.776677602469725, 30.36957257026583, 29.132181636537332, 25.675549416729755, 19.93187589101126, 11.27758753643828], [43.58948227251907, 43.548470939499964, 43.42588217777148, 43.25379238979131, 42.99936424678628, 42.65514459034816, 42.27209069113605, 41.82028259369973, 41.301769250757935, 40.70619715814492, 40.113428489017096, 39.489455107609366, 38.821231672887414, 38.186193749353905, 37.492057063052535, 36.622908247168134, 35.62771417413496, 34.37268159764762, 32.64510783482669, 30.241251724555593, 28.98187644161519, 25.55124834441316, 19.88276278114664, 11.378767885889722], [43.826493990210516, 43.78219962972018, 43.65490825560969, 43.477047357554035, 43.216041433801074, 42.86228496098758, 42.46816040121297, 42.00209237989684, 41.46406816212864, 40.84276934998403, 40.22044280276572, 39.56043474316121, 38.851273300824325, 38.17643766742488, 37.4439106366375, 36.53585998064211, 35.51164911768071, 34.23436172435649, 32.49372542201046, 30.09003652955613, 28.80579869300768, 25.39804071948298, 19.80131850214064, 11.44719919861727], [44.069460076306335, 44.02179457932709, 43.88971015994301, 43.70601471569823, 43.43839816397918, 43.075102396811445, 42.66991708945716, 42.18957543463728, 41.63194160634881, 40.98462548499077, 40.33217994636976, 39.635141470339676, 38.88349889781271, 38.16699219812588, 37.393921136729745, 36.44446695199025, 35.38901547182166, 34.08734777758684, 32.331545069460766, 29.925907012013585, 28.614865007533616, 25.227903219230846, 19.70070640667711, 11.496032713844874], [44.31909154977131, 44.26784932774516, 44.13071793214539, 43.94093924990013, 43.666459166473075, 43.29332411496389, 42.87674620399012, 42.381675770548966, 41.80373488456951, 41.129297947379165, 40.44520029310016, 39.708889844653484, 38.91167842233649, 38.14997788662153, 37.332411660566684, 36.3369631839586, 35.24611556400045, 33.915989752888, 32.14086616655443, 29.72899015471849, 28.387155700517077, 25.01666139778406, 19.554269463164967, 11.498616325064813], [44.57533210044623, 44.52040034484292, 44.378106432443545, 44.182164456309934, 43.90078152537278, 43.51781030658412, 43.0898634470701, 42.58006720762054, 41.981732227180125, 41.27987334986125, 40.56350513538115, 39.78677647799192, 38.942145508009666, 38.13291781395049, 37.2680857970776, 36.223340261796274, 35.09411550849403, 33.73267135633964, 31.935408121242705, 29.514484144822678, 28.13930682128833, 24.782571084967294, 19.38207027495254, 11.4751125721952], [44.83857685498484, 44.77979984052992, 44.632172779266774, 44.42993105790839, 44.14154560483554, 43.74866697194453, 43.30929300658098, 42.78466783467161, 42.165703114186535, 41.43590818412055, 40.68637729930954, 39.86769911257801, 38.973261675808445, 38.11353014619972, 37.197890264981396, 36.09958747986357, 34.928096678865316, 33.53156453231897, 31.708415003684756, 29.274684802094573, 27.86275215082665, 24.516132094309235, 19.17358910467528, 11.415159985114078], [45.109076465522136, 45.04631537340491, 44.89321507111721, 44.68458083066274, 44.38915522307656, 43.986392813965224, 43.535648355579696, 42.99623937001886, 42.35660448007192, 41.59860998614974, 40.815298410133636, 39.95344202340536, 39.007099175158345, 38.09408510901792, 37.12419788422094, 35.96809434686146, 34.750422111427234, 33.31501486952461, 31.4622571939155, 29.01204691394712, 27.5600721171267, 24.22010000182377, 18.931799134364425, 11.321976821601755], [45.38706195270416, 45.320211405246546, 45.16155093728027, 44.94650032152702, 44.64408855855354, 44.2316005057625, 43.769702498214386, 43.215762855549265, 42.55569634548772, 41.76960880682812, 40.95232364077434, 40.046566739878386, 39.04676785018858, 38.078166311336695, 37.05098096231718, 35.8331558366375, 34.56562037823744, 33.08778342825331, 31.201980421938305, 28.731981564315046, 27.237074676837878, 23.900766285113136, 18.663556837822664, 11.202666778230457], [45.6737415749016, 45.60252240209719, 45.43798488282202, 45.216248386336744, 44.90662926685678, 44.48421858032809, 44.010983403590565, 43.442245161050565, 42.76126310047089, 41.94617754692718, 41.093473447616645, 40.141422160582216, 39.08443773442781, 38.05548230114587, 36.96511341840474, 35.678190730434466, 34.353828936220964, 32.82668173190364, 30.900954097296346, 28.40429875601833, 26.860281897910422, 23.521108657495322, 18.327996282442157, 11.017501059202717], [45.96881825542531, 45.893098990296295, 45.722581093727264, 45.494142089057625, 45.17740690487795, 44.74531245374638, 44.26106479394414, 43.67791935876235, 42.97643302118867, 42.132659600561986, 41.24453800920114, 40.24562363280648, 39.129900878827016, 38.03800073036193, 36.880734178311485, 35.51962356025165, 34.1334326848086, 32.55202543024611, 30.581556589545997, 28.05365286026516, 26.456587823268745, 23.110561710019443, 17.957401633136413, 10.799135329458737], [46.2726113726677, 46.192265136976175, 46.01567914721702, 45.78055097105572, 45.45684001686247, 45.01538100587936, 44.52054456855274, 43.92351131173755, 43.2021017410975, 42.330175274560666, 41.40689848175736, 40.36086492632461, 39.185173047000234, 38.027954411046316, 36.800119509691484, 35.35951861218317, 33.906103442265234, 32.2649989136601, 30.24447123383499, 27.680284798054373, 26.025920722416117, 22.668801448924786, 17.55124164338017, 10.547874146462053], [46.585810348664154, 46.50065669410608, 46.31785505725623, 46.07600237782401, 45.74541909683166, 45.294886272490544, 44.78986137502095, 44.17942679877242, 43.43861855173116, 42.538977812582345, 41.580669905727476, 40.487043960316655, 39.24979352364594, 38.02433995241769, 36.721429004834064, 35.19471216635223, 33.667173257722936, 31.95926767589809, 29.88160949730633, 27.274363311481995, 25.55694528589765, 22.182984708542985, 17.095132827146358, 10.251051400518103], [46.90953919706841, 46.81932403056818, 46.63007903230698, 46.38140434389089, 46.04401007401944, 45.58466895904808, 45.069840469878116, 44.44646604362876, 43.68672924932696, 42.75970601275063, 41.76632405974104, 40.62435853751588, 39.32350077295963, 38.02619845183791, 36.642619770915836, 35.0214153306564, 33.410822031892344, 31.62671463277997, 29.482403346751468, 26.82287507642858, 25.03452574596522, 21.635891008136486, 16.56977302330691, 9.89242423183742], [47.24339624046085, 47.14799866505871, 46.95227313305533, 46.69690293483163, 46.353032968213704, 45.88552685747629, 45.36171549347464, 44.72642604348981, 43.949002205227295, 42.9960011422439, 41.968833838974184, 40.779561977422034, 39.41532896881511, 38.04500029922528, 36.57767481746754, 34.856156349669114, 33.155476536639334, 31.287300816363892, 29.06820435076231, 26.34863521969431, 24.48300018612382, 21.053698065969655, 16.003519985702347, 9.50133498917449], [47.587800742491766, 47.48712463425572, 47.28492805376753, 47.02305831131123, 46.673147740707115, 46.19827039112035, 45.66647335723235, 45.020516376898605, 44.22694234551763, 43.24977260554408, 42.19061708235791, 40.95577584575133, 39.529336976120746, 38.08581612430014, 36.53263891795361, 34.7057126973432, 32.90804692011176, 30.94755398928715, 28.64479603171865, 25.856574873006807, 23.90663335791619, 20.44019385076739, 15.399898475995553, 9.083480193010514], [47.94500798530323, 47.838710433779966, 47.62976678644052, 47.361344188440995, 47.00561288319837, 46.52394536100342, 45.98494345939328, 45.329262736552955, 44.520593194150706, 43.52029838107532, 42.42991252251664, 41.14975306097985, 39.660207360606954, 38.14078378749546, 36.49634106611985, 34.554123180963906, 32.647100931758686, 30.579619786030868, 28.17705486187798, 25.30388721813756, 23.255699619481195, 19.738686251835258, 14.695190852531967, 8.585770377341674], [48.31397591238863, 48.201980866204686, 47.98637263709835, 47.71173622559938, 47.350851747280124, 46.86355642814509, 46.31877913852542, 45.65515149845748, 44.83359486049248, 43.81286334451758, 42.69411867876602, 41.371860105148826, 39.82240013183535, 38.22920300748826, 36.49374957379094, 34.43304098287042, 32.410009012445386, 30.225754256914513, 27.711341683069833, 24.740535137080457, 22.583368257325837, 19.00601193438257, 13.950590523748165, 8.068793703626238], [48.695169805148055, 48.57745436837941, 48.355349015103954, 48.074949893215226, 47.709727009425826, 47.21817157993929, 46.66927418508248, 45.999747889764976, 45.16786171039337, 44.12985800342231, 42.986242717861955, 41.626020638886, 40.0212260677888, 38.358199640838976, 36.534296610092596, 34.35469611294261, 32.211158087030334, 29.90154678292091, 27.26323265930705, 24.181029235719578, 21.90275169962684, 18.25395055221685, 13.17693007419492, 7.546234440091806], [49.09146548793359, 48.96767425915109, 48.73888636210249, 48.45291797165051, 48.084016457977945, 47.58949744146097, 47.038088403557836, 46.36458426542419, 45.524600868972705, 44.471827339847756, 43.305812494861854, 41.910217080421496, 40.252469729487885, 38.520898169737734, 36.60775663298101, 34.304048486656356, 32.029637367530455, 29.57824080135631, 26.793588387243222, 23.57361960167249, 21.14970420975048, 17.405489976269614, 12.284417813674594, 6.9530827581827594], [49.50138059159435, 49.37154903178513, 49.136386887538, 48.8455412724786, 48.47413898144503, 47.97856208595246, 47.426884915185425, 46.752121759790825, 45.90739129207297, 44.84399341830983, 43.66024395122715, 42.23509404047425, 40.53153449939465, 38.7388740262528, 36.74389258727877, 34.322286857325096, 31.918432069489807, 29.320639715094494, 26.377862802309437, 23.002103244600857, 20.413546553416204, 16.554672553564398, 11.372110369029635, 6.377958104501058], [49.9257627469482, 49.78995543772172, 49.548792387061226, 49.25386955310802, 48.881300912705115, 48.386789277239764, 47.83730275938693, 47.16421430342518, 46.3183018294858, 45.24864975487334, 44.05207910793074, 42.603572436398935, 40.86203274639097, 39.016925068665756, 36.94955615113426, 34.419905967980064, 31.892490868671885, 29.14841490231502, 26.0393093265772, 22.490420531168233, 19.715753669725235, 15.718147710945193, 10.450836156598003, 5.8322881304471], [50.367343880935664, 50.22534628536108, 49.97832326572457, 49.68006511621142, 49.30780260898074, 48.81682993890151, 48.272391173096835, 47.60426955773349, 46.76095421819055, 45.689359271182155, 44.48448772029284, 43.0180135494372, 41.2450429939042, 39.354589130613064, 37.22258447536089, 34.59297306756842, 31.94647929213447, 29.054510972307025, 25.76723728550903, 22.01993393851602, 19.025442938057154, 14.847739416361582, 9.451955728615621, 5.275585126994081], [50.82454396817178, 50.67663284018552, 50.424461826736284, 50.1241167936312, 49.754065653922844, 49.26948673312385, 48.73325342559112, 48.07373299360119, 47.237308657401876, 46.16894415136731, 44.96157454413545, 43.484569223159156, 41.68996461174959, 39.76583599854983, 37.58371651528942, 34.87342061733098, 32.12690674342408, 29.104754809091876, 25.651435792893654, 21.705952821067015, 18.477981413471806, 14.093054937305055, 8.532969796113077, 4.806978122520414], [51.29874305411997, 51.14517665439586, 50.88861556205905, 50.58758279232186, 50.221908806599956, 49.74695081926516, 49.222419634110956, 48.57540443531094, 47.75031307366739, 46.690314604817345, 45.486003634555615, 44.00540817356023, 42.198198388281995, 40.25119549468045, 38.03270322697272, 35.26089759777785, 32.435041790860055, 29.304909710635375, 25.706153556345825, 21.574462077059042, 18.109486520551435, 13.494579301382892, 7.729047565893989, 4.427621160809642], [51.79158328697011, 51.63259092534298, 51.372496983292564, 51.07247944034124, 50.7138731699185, 50.2525325078023, 49.743945289984, 49.11401727290894, 48.305244029897594, 47.259068610337486, 46.06340647924575, 44.58588473802443, 42.774441321864636, 40.81441763638068, 38.57213079390942, 35.75686195529859, 32.87228725199568, 29.6586097560688, 25.941522958519577, 21.647912497076423, 17.957616114496386, 13.103472020575897, 7.094908935318632, 4.141357846570188], [52.301868532547886, 52.13824388730244, 51.87605116106907, 51.57914284923318, 51.23044778091242, 50.78656680722237, 50.29777621126965, 49.68898541141057, 48.9009311552082, 47.87351856123457, 46.69177981864563, 45.2239101885661, 43.416857298710596, 41.454324821446875, 39.2020990234655, 36.364061895900434, 33.44585424838212, 30.18116653859073, 26.387918768759732, 21.98341818319571, 18.117449135032327, 13.066748417957854, 6.836354001448855, 4.017090058384527], [52.830867634766854, 52.66344715744036, 52.40080154679952, 52.10955379077678, 51.774319342422004, 51.35269712067423, 50.8884145876327, 50.305523681147044, 49.54307280202428, 48.53950362241139, 47.37669121590636, 45.9242660819659, 44.12872673652181, 42.1719863829619, 39.92046772510116, 37.07539445324591, 34.142758291567915, 30.852661110009624, 27.01827046845107, 22.54945328185152, 18.560797335708177, 13.371874244747708, 6.972114571591445, 4.044523402141107], [53.378402963421166, 53.20847200213447, 52.94759307051005, 52.66516697524314, 52.3475455346664, 51.95352034051336, 51.51874638445336, 50.96659797716629, 50.23451959634456, 49.25957228768191, 48.12024646038587, 46.688410835732775, 44.91056509683374, 42.96668023242703, 40.724787864518824, 37.88572362168431, 34.95455141619273, 31.66045767511981, 27.815068701220472, 23.32442739953195, 19.266552180586462, 14.008543001778149, 7.523001703939923, 4.246149485005882], [53.9441779394874, 53.77366868400038, 53.51731714930759, 53.24704126960091, 52.95087463669241, 52.58883754168407, 52.18727493714794, 51.66916601186182, 50.97053348509628, 50.02725436691533, 48.914416097388056, 47.506737374009745, 45.751100703225916, 43.8254283760175, 41.60006916675226, 38.7772068889153, 35.85993959247195, 32.57862416760603, 28.745999668304126, 24.26769580737952, 20.185272481521892, 14.920516332976481, 8.435272784716561, 4.643150847655415], [54.52650977569079, 54.35796588833334, 54.109894201568196, 53.856481265731524, 53.58735970801935, 53.26381990722894, 52.9009942601072, 52.42179281039072, 51.76096346524912, 50.85330530605123, 49.77038094372847, 48.39038841237836, 46.66082051198501, 44.75741146482506, 42.55331172752632, 39.753085102326345, 36.85708481289112, 33.598063605403496, 29.791285168247214, 25.34384862350543, 21.262210098582827, 16.02575630219096, 9.591032406702029, 5.229413310390689], [55.124021727462605, 54.96103550351995, 54.72589760092671, 54.494426634039044, 54.25763009840261, 53.97793351874717, 53.65776794441997, 53.22048314264858, 52.599849546083064, 51.729840174900524, 50.678600364607234, 49.328236379698794, 47.62703631365732, 45.74847238582631, 43.56877311878135, 40.79554967401701, 37.92581242294994, 34.69546148416282, 30.923105742463413, 26.51838358964102, 22.4537238171908, 17.267329253274177, 10.914072449624628, 6.012902253773], [55.737498118244496, 55.58454063092975, 55.36758371983485, 55.163071321979515, 54.963046609055226, 54.73080470946356, 54.45521335370451, 54.06073065463427, 53.4805723190654, 52.6482459634979, 51.628776552924556, 50.3083742077764, 48.63625555370497, 46.78362857276338, 44.62988513871012, 41.886028360136734, 39.04535547913503, 35.847271456445604, 32.11410411839576, 27.758495153598464, 23.719601725090648, 18.594371101678334, 12.337679113716455, 6.984278154025709], [56.3552372856868, 56.219229382398126, 56.02866372506711, 55.859209134053316, 55.7035035575364, 55.52549189591992, 55.29884926667045, 54.95011415920789, 54.41246531676317, 53.619281407603545, 52.632659832639526, 51.34324189820204, 49.701233219819954, 47.87554340839754, 45.748772469383454, 43.03545047179273, 40.2248520145944, 37.06001360692427, 33.36692707816658, 29.06118280260759, 25.051027380471822, 19.988260092989442, 13.828300512096225, 8.124119843214737], [56.9785545158946, 56.86763402161158, 56.712040751171244, 56.58465675466405, 56.47819735137527, 56.35697174343032, 56.17936598625552, 55.87515376027159, 55.37814825868126, 54.62208371397459, 53.666613272113764, 52.406749410869445, 50.79373195931428, 48.99426949947212, 46.894031249101396, 44.21104829390971, 41.430513385197386, 38.299040571842376, 34.64619113156546, 30.39041832835204, 26.41071892843253, 21.41079799951282, 15.346826149271045, 9.399297479328297], [57.60830022942683, 57.53200308533692, 57.42076464823252, 57.342235088323264, 57.28874537281045, 57.22480714800135, 57.094295052335504, 56.8314791257394, 56.37151772133765, 55.648999113412145, 54.72170680134809, 53.488768823664486, 51.90247817777686, 50.127518630582216, 48.05239361502392, 45.39848895114886, 42.647046335200116, 39.5480792551661, 35.93456514395032, 31.727693094590535, 27.77881258263504, 22.840602097151375, 16.870032298168447, 10.772704430847956], [58.21250790820408, 58.18559751314372, 58.13323626572198, 58.11440507668679, 58.12063117505308, 58.11675017095531, 58.032709822021154, 57.80900789697027, 57.3830167019691, 56.6906885209007, 55.78854185767591, 54.579600111095196, 53.01717206447983, 51.26417400178738, 49.211616451154114, 46.5838971715349, 43.85861104893447, 40.78879616470538, 37.210376658267535, 33.04685748316915, 29.126159181479032, 24.242304943784767, 18.352966860396926, 12.17087640903454], [58.800713669327905, 58.837379562541585, 58.85618858637539, 58.90408202742667, 58.97179260597068, 59.024866264076685, 58.981734004563435, 58.790517785147294, 58.391517789481185, 57.722520384907874, 56.83959479755793, 55.64902722943947, 54.10510703766625, 52.36943855317144, 50.33505703666868, 47.72887429315283, 45.02554807763498, 41.9806079484571, 38.43254020552471, 34.30689927902354, 30.41116100390987, 25.57540872795517, 19.757962092891024, 13.5401420737389], [59.37019798142575, 59.48549848183945, 59.58756435239287, 59.70810464589964, 59.83755191718999, 59.94284241703825, 59.93377699276506, 59.76727118093389, 59.38712394289439, 58.733347897327626, 57.86247044512709, 56.683271293264696, 55.15098024431819, 53.42650720990345, 51.40433852769121, 48.8132304462913, 46.12596507689011, 43.09986192953045, 39.57551886597674, 35.48026720988196, 31.604345540428106, 26.808364524169363, 21.051228692917135, 14.826743906238484], [59.866557987589324, 60.07775786434535, 60.27607966788005, 60.475082039142976, 60.66596545908488, 60.81804914982086, 60.83552637305801, 60.68975448508189, 60.319166295953565, 59.67093357392234, 58.803136215936235, 57.626134016245096, 56.09599704323506, 54.37384634338015, 52.35482219883128, 49.7684431975804, 47.08727406147513, 44.06931399448591, 40.556413721820974, 36.477102190915, 32.61072361481133, 27.83747748600082, 22.116683280559744, 15.888358217768104], [60.306127319861616, 60.625360508585366, 60.926764928661214, 61.20456954949244, 61.45229648196042, 61.64253857867892, 61.67713490145566, 61.53272970960454, 61.161165399347475, 60.50761608985223, 59.63279331020702, 58.44754832516192, 56.90869283278023, 55.1786066488965, 53.152240155210755, 50.55865867755021, 47.87225785301064, 44.85048944621048, 41.33567170389617, 37.25709523097496, 33.392087942622396, 28.624313380426806, 22.91719261694359, 16.679511485916215], [60.69416834552105, 61.12609158887426, 61.529384213472724, 61.88007206004813, 62.17898615446358, 62.39621555585421, 62.437368739027185, 62.28834000715574, 61.90468096793975, 61.23416033059673, 60.341246268513245, 59.136097747771814, 57.57616238699345, 55.82629633175303, 53.78034203764167, 51.16549282311952, 48.46045451932252, 45.42071726800114, 41.88821867999324, 37.792588730147834, 33.906925635910284, 29.12499827127823, 23.406547016254162, 17.145755026497284], [60.837249820056684, 61.41797649522002, 61.9542532708951, 62.397849072938016, 62.752451228329775, 63.00000670618658, 63.04531275549245, 62.88581698260111, 62.484859612463154, 61.78682514509603, 60.86487902745873, 59.62765710050011, 58.03321606488193, 56.250322046541214, 54.17074447636128, 51.518145407404575, 48.77842502030682, 45.703464013124666, 42.133739510795145, 37.99863683907547, 34.077582705603184, 29.2557655983014, 23.49287702319765, 17.184067016504873], [60.91929147828205, 61.6341813793763, 62.28126882313251, 62.795120821307364, 63.187715138608205, 63.44634566621362, 63.48136572017084, 63.29878482365544, 62.86215667453714, 62.12748325875335, 61.16507710390226, 59.883531837632724, 58.24122725439051, 56.41210950160349, 54.28483331130553, 51.5777995994176, 48.786992561171814, 45.65900810584139, 42.03173369483725, 37.83368636914805, 33.85770199010937, 28.968887859055883, 23.126647880433858, 16.744423835992848], [61.030326489302205, 61.83873942115768, 62.554400756973585, 63.10382772585307, 63.50653869504059, 63.752990033511104, 63.76171960209078, 63.54296211149814, 63.06432992925248, 62.27548839422003, 61.26173253968179, 59.92425434367238, 58.22145203119855, 56.33361947285582, 54.14532726598879, 51.36808136154728, 48.51074593901963, 45.313071021542214, 41.609390656184154, 37.326883613358255, 33.27734539776018, 28.297075792342845, 22.345005625409023, 15.87510852285332], [61.15249321051525, 62.00860223372972, 62.75001429998284, 63.30229248075538, 63.68991156819281, 63.90362014481848, 63.874498053296264, 63.60770429534657, 63.071289203580506, 62.2208654318267, 61.14598813131714, 59.74205315835608, 57.967177487013835, 56.00907375978995, 53.74733329599511, 50.88501977551479, 47.946498856388395, 44.66320551721137, 40.864984423855674, 36.47720514717328, 32.33605430752667, 27.240465066512076, 21.148704588034597, 14.591465676029774], [61.246427008715266, 62.107074342676604, 62.83659704725734, 63.3671612911843, 63.71918311576834, 63.883804516246656, 63.80087538555907, 63.477838067179555, 62.87866883631517, 61.958922281857525, 60.8155231769789, 59.33702446362286, 57.48098635494668, 55.443383147003814, 53.098102230920674, 50.13847410021076, 47.1064850688398, 43.724035717914084, 39.81562703314541, 35.30434251897966, 31.055994113870334, 25.823733955360225, 19.564973013011763, 12.950256645582293], [61.27410942690516, 62.107190163248724, 62.796171032406455, 63.27972808800951, 63.582681566296834, 63.68851222643117, 63.548460529886285, 63.16452096055034, 62.498475446868184, 61.505257504511675, 60.289220783210226, 58.731468720612305, 56.78878260115336, 54.665911295221576, 52.23056766952942, 49.1654693780649, 46.031569407694306, 42.54040701125401, 38.51044660586963, 33.86203349075278, 29.483656131290566, 24.097047106224917, 17.648034027811693, 11.05934536431404], [61.2429435278374, 62.01795779305436, 62.64596764013891, 63.071945576066746, 63.316832570693606, 63.35757851424248, 63.156596837200695, 62.70875388315769, 61.97293881250548, 60.90306082299473, 59.61103633094962, 57.9660468855723, 55.931085754416344, 53.717116529304114, 51.18524831905113, 48.00676029298743, 44.762946571070685, 41.15420142246397, 36.9923909338297, 32.1948042030057, 27.699327024573282, 22.146439919833213, 15.491413418224116, 9.097388525329258], [61.13013287772836, 61.83237013415643, 62.386947637321654, 62.74829780620696, 62.931430278506284, 62.905380825752616, 62.6419682437529, 62.12892081753533, 61.32175162838681, 60.173127270782885, 58.80271147301852, 57.075669118670156, 54.94683676323444, 52.6398505559754, 50.00907107500897, 46.71398680924007, 43.356720456173896, 39.62618851886179, 35.32729443776066, 30.3739938242768, 25.744510215413584, 20.01585023730093, 13.141944294635827, 7.229045687844163], [60.926408516765285, 61.54697304883254, 62.023476991940925, 62.31972399413393, 62.44170494564503, 62.350372741342426, 62.02750837302936, 61.45158177105303, 60.57489080201216, 59.34885036272256, 57.90086941529172, 56.08819477251109, 53.86470397770687, 51.46365993992053, 48.73258714250197, 45.31895721598674, 41.845978572895, 37.990873459435186, 33.5512947634897, 28.437623326740145, 23.670734305596483, 17.760122774083165, 10.658349222073578, 5.636343227818015], [60.62896365769156, 61.16574696104648, 61.56578995540844, 61.80010271826515, 61.86675573127783, 61.716120762478866, 61.3372955635539, 60.70107333909096, 59.75674796434337, 58.4546736983327, 56.93009271158334, 55.032598153507536, 52.71506493166982, 50.22036850285417, 47.38919707941229, 43.85696350504925, 40.267867158883206, 36.28739854638247, 31.705771801688293, 26.429590574092636, 21.52412599459202, 15.428189642251064, 8.092898039081572, 4.437726509216415], [60.23990038969983, 60.69688215031013, 61.02806122074777, 61.20924634136187, 61.22788659725926, 61.02427852643207, 60.593559005588475, 59.89993436349973, 58.89024501194115, 57.51408889576906, 55.914577313925875, 53.93393373400183, 51.524024301421804, 48.93717277205472, 46.00729132018579, 42.35783134214596, 38.65362387740595, 34.54852788485639, 29.82521062505181, 24.38633034353593, 19.34288737743746, 13.060452600350093, 5.488640963114709, 3.63758423492778], [59.77271295800012, 60.15705990450981, 60.42930227499476, 60.56671503001602, 60.54504025172956, 60.294490726741834, 59.815524439732066, 59.06713177227851, 57.99433412976469, 56.5462835984478, 54.873904489156544, 52.81231431888155, 50.31234408355821, 47.635514704266164, 44.60906144204846, 40.84466296124099, 37.02726144486323, 32.79927472582227, 27.935775399868128, 22.335339918259397, 17.155687259834544, 10.687132085545061, 2.8777439359328993, 3.1500815202119137], [59.24277012978831, 59.56350163364195, 59.78768829489454, 59.89049211712781, 59.83530480224502, 59.54269135629765, 59.01834498385742, 58.21740183534472, 57.08364651544396, 55.56601877181961, 53.82308771278066, 51.68309268971746, 49.095785506264974, 46.33157993228333, 43.2111620678169, 39.33468757394277, 35.40659166378157, 31.058099998761946, 26.056685494206945, 20.296731350639643, 14.98340756529641, 8.330171422048238, 0.28351362789554935, 2.867131391807702], [58.66661836668557, 58.93323230203954, 59.11970742976383, 59.19571895398693, 59.112209949397744, 58.7809359838072, 58.21324003675179, 57.36154200847912, 56.16882686370591, 54.58394404107832, 52.7728500008442, 50.55709869987786, 47.88531130027348, 45.036474628844665, 41.824868637279984, 37.83940362888756, 33.80335918390496, 29.337042826389975, 24.2003502763298, 18.28338139105927, 12.83928941240664, 6.003416374246518, -2.279351023597957, 2.703099543071119], [58.060077428290896, 58.281725501744134, 58.43945060740366, 58.49466816134613, 58.38636443849937, 58.01862995733458, 57.409110883664624, 56.5083253561754, 55.25872517540212, 53.60908479756948, 51.73241188013875, 49.4437676223264, 46.690592995684064, 43.76010805418307, 40.46035188306088, 36.369303819364596, 32.22838588048871, 27.647294470443185, 22.378395519343414, 16.307430371931627, 10.735913323451125, 3.7200636490685506, -4.796854969125758, 2.603736864279097], [57.43815983518509, 57.62312623195676, 57.75927024854668, 57.79787639001556, 57.666995422176875, 57.26435745769489, 56.614518129978286, 55.666581861463655, 54.362586134129735, 52.6511661261614, 50.711965143861725, 48.35378983826275, 45.522859583487694, 42.51423951898245, 39.12993326519442, 34.937372106611555, 30.695295747641488, 26.003160067610132, 20.605879711925958, 14.384771381837345, 8.68995566883463, 1.4977000435886758, -7.250369010535648, 2.5382501156645527], [56.811130507823066, 56.96585928706241, 57.085399140446356, 57.10977823801289, 56.95729118560113, 56.52048727334453, 55.831354611003604, 54.8377925105066, 53.481434288743955, 51.71067969243312, 49.7114507988361, 47.286493594242984, 44.3807747234057, 41.29689010691748, 37.83097820680475, 33.54023740816385, 29.200051761240434, 24.39994078568663, 18.877435312473995, 12.5093766280858, 6.694663483514278, -0.6710149668439115, -9.647679786596031, 2.4898627345756323], [56.1877671250504, 56.31730794347865, 56.423565784590075, 56.434936997877614, 56.26124194525589, 55.79089125139919, 55.06360325034716, 54.02610191104482, 52.619569007091435, 50.792059127456746, 48.73541265932707, 46.24653241934708, 43.26911036008751, 40.11295163034216, 36.56851106423433, 32.18308734916426, 27.748007701790446, 22.843175715354636, 17.198817771873635, 10.687255806373738, 4.756265241509478, -2.7795517065399227, -11.981871152077783, 2.4500611328554016]]}, "design_thrust": {"thrust_ratio": 1.0, "EPNL": 90.25320519879809, "SENEL": 64.23349919146753, "SPL_total_history": [[47.85948362437971, 48.05383635634052, 48.17983094741054, 48.23641230662422, 48.192700072333196, 48.05863314762455, 47.83172525386246, 47.49077460683678, 47.02527023101961, 46.391467788201794, 45.656126410077036, 44.75965227630159, 43.66221022063147, 42.49840887958026, 41.16132490821592, 39.473976598224745, 37.646245879583404, 35.47744027470478, 32.6954976646143, 29.05478113641368, 26.837283194599028, 21.93842628138619, 14.272090727640878, 4.618946442305062], [48.06595782687537, 48.26454651555471, 48.39337903930868, 48.45112715517739, 48.40801497900059, 48.27331384043332, 48.04506446039058, 47.70203819891806, 47.2330598247618, 46.59438364216554, 45.852924305497424, 44.9479651078746, 43.83989276294484, 42.66440425437931, 41.31541910756382, 39.616007877790686, 37.78179660708068, 35.6126412044152, 32.84068848759822, 29.225109531733988, 27.007329566543028, 22.158274408992366, 14.592991671318, 4.984809700735381], [48.275762127859004, 48.478457619497235, 48.61006561872423, 48.668983759591555, 48.626535581454675, 48.4913440594491, 48.2619590792709, 47.91714891138153, 47.44510690445381, 46.80212080379299, 46.05521716686, 45.14262958225066, 44.02497480732245, 42.838895583155704, 41.479175433835415, 39.76902004652141, 37.92952648308167, 35.761235066118495, 33.000583893895424, 29.41160281330573, 27.194940937067695, 22.39735705062904, 14.93508035350763, 5.374344236340396], [48.48983732982214, 48.696636358978616, 48.831018692547666, 48.89111131906108, 48.84934223032013, 48.7136960855258, 48.483232005100376, 48.13672325479455, 47.66174056399911, 47.01461024605659, 46.26244818078483, 45.34244230198865, 44.21541239485205, 43.01888838270479, 41.648494372631156, 39.92753528615186, 38.08259783017326, 35.91494300584197, 33.16534157592105, 29.602730155608263, 27.38700687013626, 22.640786465428235, 15.281477516595317, 5.775314347013515], [48.70857514443273, 48.91950442455172, 49.05667399464076, 49.11794504826144, 49.07685778361721, 48.94076678306164, 48.70924524133862, 48.361076089087675, 47.88321098419068, 47.23201334891293, 46.47467027654806, 45.547312227916656, 44.41092606068767, 43.2038872996835, 41.822624523985496, 40.09047384355118, 38.23959728262768, 36.07198980642577, 33.33278850632843, 29.795888186455088, 27.580522085790772, 22.88511215276731, 15.6282408696876, 6.184445800616681], [48.93226728616919, 49.14737578873492, 49.28735598983828, 49.34980928848438, 49.309397972413436, 49.17285388039832, 48.94027263196925, 48.59044926424586, 48.10971641127115, 47.45446851195533, 46.69194844915928, 45.75720610093668, 44.611352153484354, 43.39357649498669, 42.001065302639866, 40.25709159743434, 38.399526534397275, 36.2310958587335, 33.501331864362406, 29.989143662342343, 27.77323859892921, 23.12773663616881, 15.972386584013629, 6.5988846758002975], [49.1616985334838, 49.38110796321307, 49.523956386568955, 49.58759501352438, 49.54782521232054, 49.410759801642044, 49.17703669518792, 48.82545776010992, 48.34172435213631, 47.68223980365046, 46.91429587018851, 45.97179939020023, 44.81591671388923, 43.586658534407185, 42.18189041043089, 40.42464944729496, 38.558819670101066, 36.38780147740592, 33.665535162508164, 30.176010284062116, 27.957690010746287, 23.360116890394586, 16.304189876635498, 7.009768630817126], [49.39670028048901, 49.62047912327144, 49.7662283409661, 49.83105651424928, 49.79191676880512, 49.654311003646264, 49.419431165991824, 49.066087848084344, 48.579349788097545, 47.91562063241138, 47.142225320581275, 46.191897310214486, 45.0258073727749, 43.784754807639594, 42.367223475456655, 40.5958883687455, 38.72081186520947, 36.546054606252376, 33.82999566054872, 30.361777340521115, 28.13981482813925, 23.588923310377364, 16.631145291938317, 7.4225528239300225], [49.63797312125412, 49.86625687288076, 50.01497101212028, 50.08099267122694, 50.042446224689286, 49.90422831403804, 49.668107279630235, 49.312897857865956, 48.82302431382168, 48.154867796862355, 47.37577725658688, 46.41724724174764, 45.240377594901766, 43.98675425812981, 42.55538701377945, 40.76838563646673, 38.88230833670478, 36.70181328754304, 33.989735528664376, 30.540455990854444, 28.31268501839515, 23.806195351964572, 16.944159854070428, 7.828512122155905], [49.88546420608767, 50.11834385180285, 50.2700661178822, 50.337286212573034, 50.299315783904376, 50.16045574168382, 49.92306645707201, 49.56596845581466, 49.072939104091795, 48.40032598522509, 47.61548544829975, 46.64863550572469, 45.46074471960135, 44.19415029632573, 42.748309667944454, 40.94460219812962, 39.04627683250486, 36.85856013461462, 34.14877468376487, 30.716633095905735, 28.481416083675203, 24.017649387208362, 17.249633243260927, 8.232406769013771], [50.13988059886789, 50.37750722287164, 50.53230911573357, 50.60073267596569, 50.563299426530016, 50.42372286195899, 50.18498068441647, 49.82589584851379, 49.329587953845504, 48.65234802811449, 47.861527562980086, 46.886000518229764, 45.68652157127899, 44.40616569526236, 42.94472939288484, 41.12262283704837, 39.210108365765876, 37.01290834672053, 34.30285331595649, 30.88509843754, 28.639914314487672, 24.21622746667802, 17.53945962083858, 8.626102358632595], [50.40111158130646, 50.64357979378994, 50.801506290033096, 50.87113945676749, 50.834228630898046, 50.69391256819921, 50.45380301842176, 50.09272948606282, 49.59315441456134, 48.91130389837279, 48.114504019771545, 47.13025248069219, 45.9190283674687, 44.62459234463094, 43.14699179292032, 41.30548084596498, 39.37749907460754, 37.169231134983995, 34.45704963651001, 31.05166801176619, 28.794677457114698, 24.40919692761694, 17.821778515467784, 9.016232900330472], [50.67045289870582, 50.91797149115716, 51.079121229069486, 51.149970133308216, 51.11352600897587, 50.97236320996213, 50.73076273424973, 50.36755528457101, 49.864530634125394, 49.17781884669439, 48.37470788531838, 47.38122976456736, 46.15748362589575, 44.84790563177035, 43.352649608182816, 41.48948946043583, 39.543450572466114, 37.32106368510863, 34.60325545864648, 31.206445395415614, 28.934139376745446, 24.583176999694466, 18.081245230325138, 9.387723663262097], [50.947521670394345, 51.20021294596726, 51.36464400032214, 51.43671627412725, 51.400718980223196, 51.25867827124965, 51.015566236602616, 50.650220114456694, 50.14375818854896, 49.452204945533595, 48.64278642362423, 47.64003257158496, 46.40359193471789, 45.07851316298485, 43.564946938337535, 41.6789486398701, 39.71329606964096, 37.47480517916924, 34.74898222740581, 31.358098618231544, 29.06803223243689, 24.749082314267827, 18.330099171391623, 9.751196683218247], [51.233000471935824, 51.49103069810053, 51.6588218647847, 51.73212593946377, 51.6965422150976, 51.55356608295463, 51.308889942320775, 50.941360988239, 50.43142325237432, 49.73497944551417, 48.919170447655176, 47.90697088519431, 46.65749301589735, 45.316341622108176, 43.78353035918635, 41.87309778350155, 39.88580241207795, 37.62864555555938, 34.891722879028165, 31.503322514464394, 29.192293031434545, 24.902027469437012, 18.56258014142503, 10.100482356326966], [51.52716389620582, 51.79068618109205, 51.961910173619174, 52.03645564913677, 52.001260578897686, 51.85731039364362, 51.61104536911413, 51.2413298115252, 50.72793599333701, 50.02663464164147, 49.20445384624906, 48.18277453948394, 46.92009511882467, 45.56250164971789, 44.00974075527013, 42.073543144668086, 40.0627949337731, 37.78458040837339, 35.03358405538861, 31.644280226374818, 29.309108675814002, 25.044233454922722, 18.780977723041282, 10.437071095525631], [51.83018212174283, 52.09932053278681, 52.274036555375936, 52.34983416344279, 52.31501667499443, 52.17008383207609, 51.92224712635581, 51.55040004026819, 51.033652913499566, 50.32764342649639, 49.49925437162747, 48.46825798793799, 47.19247716933218, 45.81838261093695, 44.24533843393273, 42.28250763637356, 40.24692897308307, 37.94567203494312, 35.177994721329746, 31.784719831915602, 29.422481773389727, 25.17998012279303, 18.98990210889884, 10.764848583099226], [52.14429500829421, 52.419346387975764, 52.59769479897579, 52.674756859634215, 52.64024979182335, 52.49421342361678, 52.244682719821526, 51.87058238084833, 51.35035145961322, 50.639463952844075, 49.804629382074395, 48.763920470575485, 47.47435981108918, 46.08274693557601, 44.48786063121265, 42.49582135512875, 40.43215072275157, 38.10366704267853, 35.314131051526225, 31.910926137819033, 29.51593585033768, 25.289802416833908, 19.166704404156214, 11.06086873421112], [52.46861936523659, 52.74974301458586, 52.93179990910399, 53.01014044850767, 52.97593030594306, 52.82878160151819, 52.57758319333565, 52.20130749054512, 51.67773640331213, 50.962181316971204, 50.12113855153817, 49.07097244729237, 47.767842481285705, 46.35876128682198, 44.74179335334903, 42.719712851493135, 40.62646699667339, 38.26845513449649, 35.4538503940501, 32.036748743349875, 29.605091345977947, 25.39120500173705, 19.330944941171424, 11.343579078014404], [52.80361608464756, 53.090972920021954, 53.27681546142381, 53.35645028383949, 53.32252784889127, 53.174268869866495, 52.92144728256502, 52.543102923987625, 52.01637880004826, 51.29642864917052, 50.449491794549026, 49.39022700382832, 48.07387612308658, 46.64753918293791, 45.008444918750584, 42.955727530499495, 40.83161986852333, 38.44190456653838, 35.59902292622547, 32.163898026436634, 29.69139726906729, 25.485290869835012, 19.48335545135514, 11.613062736822446], [53.150485290289396, 53.44429638045507, 53.63403033570342, 53.71497780221243, 53.681319936299445, 53.53192751534168, 53.27750141236541, 52.89716893573133, 52.36745052232402, 51.64334150427855, 50.79077702114618, 49.72270006971389, 48.39336748575477, 46.94984343899922, 45.28837987361054, 43.20412106770551, 41.04746353627852, 38.62329985567265, 35.748115315625554, 32.28973662592746, 29.77102051953606, 25.566844716234787, 19.617231319887477, 11.861845795581296], [53.51107033532777, 53.81163929314261, 54.00540966277022, 54.08769176246747, 54.054257328083565, 53.903676305226604, 53.647633411288346, 53.26536470812773, 52.732782491004066, 52.0047160090649, 51.14674277884113, 50.07006329396299, 48.72786422707677, 47.26704998290457, 45.582729063971065, 43.46563267679238, 41.274222154733025, 38.812129723284954, 35.89955304743731, 32.411238780819374, 29.839322295528, 25.629364087582225, 19.72406852949886, 12.080369107872519], [53.884475181222484, 54.191986107153454, 54.389882684038426, 54.47352365352682, 54.440318023177454, 54.28858918729149, 54.03104296900736, 53.64705714556785, 53.11196960519862, 52.38046186330504, 51.51769198153086, 50.433163522944, 49.078969733680836, 47.60169709272799, 45.895232151358314, 43.74567191139613, 41.5191022843532, 39.017581333986314, 36.06461271932038, 32.541704474224986, 29.911255049098596, 25.689329916214675, 19.821840767981303, 12.285727041497413], [54.271260152995794, 54.58588533737939, 54.78799345125683, 54.87302084212775, 54.84006118065597, 54.68725123958619, 54.42835361776663, 54.04292601498731, 53.505772378665455, 52.771451832048484, 51.90463498276674, 50.813197070119855, 49.44813552387019, 47.95555364248524, 46.2280749326986, 44.04702188600167, 41.785540227778235, 39.24379166044928, 36.248083746277906, 32.68635953343188, 29.992144861174246, 25.75186571707175, 19.91525642310202, 12.481633221864971], [54.67585282089991, 54.99803441759576, 55.20456754405956, 55.29101878457474, 55.258256095778535, 55.10430861790951, 54.844079048301154, 54.45734157033638, 53.9183932199854, 53.18166500142823, 52.31125708916741, 51.21340845338728, 49.837941755654356, 48.33032746014951, 46.581787056859945, 44.3684776034556, 42.070293373123405, 39.48494746470594, 36.44082066573146, 32.83180412343172, 30.063973747316986, 25.793477621207785, 19.97469157380847, 12.635945972238067], [55.09588560987555, 55.425818441984276, 55.63687616111999, 55.72479057289232, 55.692261794641425, 55.53729069770412, 55.27596076972519, 54.888314771021086, 54.34819836834561, 53.6099511883302, 52.737013190112435, 51.63409929968039, 50.24989034221781, 48.72904012438092, 46.961406485531825, 44.71801568275826, 42.384715343074745, 39.75644283550549, 36.66292553871197, 33.003204747200684, 30.15637978514208, 25.8480375643695, 20.037953604172337, 12.785685861022781], [55.531915757173806, 55.86976471030235, 56.085435332167776, 56.17485810598902, 56.14262131483325, 55.986782755819924, 55.72464170160782, 55.33656774643152, 54.79601842771707, 54.057286753719175, 53.183054432928316, 52.07665448274581, 50.6856878732585, 49.15380649745118, 47.36960819792096, 45.09918053590721, 42.73342730673801, 40.06427412768585, 36.9220532924639, 33.20993549224285, 30.28002406641837, 25.926945729184187, 20.116511402502447, 12.940810921693156], [55.99045085101417, 56.33677640651981, 56.55733895819122, 56.64833784135897, 56.61637161679883, 56.45967971517077, 56.19688205910563, 55.808739610032546, 55.268374859073845, 54.53004017817018, 53.65552301255113, 52.54682891016118, 51.15044078807927, 49.608821073016045, 47.809298992761065, 45.51292984369443, 43.115068011589834, 40.40415051624666, 37.21010193049003, 33.43890171620208, 30.41610468473172, 26.00396951456076, 20.17495532253802, 13.060578683243838], [56.46767630461496, 56.822672300980884, 57.04823886480103, 57.1408833805163, 57.10928375847939, 56.95197340385228, 56.68893087236881, 56.30138508981638, 55.76220401218734, 55.02565299674268, 54.15249139257096, 53.04359014772725, 51.64441472128771, 50.09603683549746, 48.284742356126095, 45.96704514050825, 43.54171307424081, 40.79370325886448, 37.55186986470788, 33.72360739826231, 30.606770263210358, 26.13011671824261, 20.272560920733778, 13.20452762551282], [56.96514683521299, 57.32903257121297, 57.55973487360641, 57.65411044041774, 57.6229922006986, 57.465331789218865, 57.20250546501614, 56.81629341912014, 56.27939366190053, 55.54613624759736, 54.676100879013596, 53.56922820153911, 52.17007335054363, 50.61811556102243, 48.79886820908577, 46.464913856032446, 44.01742323162626, 41.2380601094126, 37.954145342008765, 34.07316403421053, 30.86361848926372, 26.319214395212324, 20.424296833661547, 13.385844584772908], [57.49035854047838, 57.8637777946932, 58.09996244484597, 58.19620085523955, 58.16563359856106, 58.0078166452056, 57.745634321021726, 57.361522232924315, 56.828095606474335, 56.09976649369831, 55.23471333615616, 54.13209467557839, 52.73557370053914, 51.182797887587284, 49.35871163335727, 47.0124010505777, 44.54662318094609, 41.73985600358715, 38.417369012218295, 34.48535782960205, 31.181605904128435, 26.562000279558386, 20.614345982177753, 13.582256161817332], [58.03827470194226, 58.42141405738559, 58.663225181180266, 58.76146398849052, 58.731655812637854, 58.5741126488825, 58.313245935432796, 57.93225012592352, 57.40375772732237, 56.6823180026494, 55.82450758408488, 54.72896562072088, 53.33860821379009, 51.789028953494984, 49.96501082064273, 47.61310442903253, 45.13660063381133, 42.311507620824855, 38.96128654622593, 34.99020306935897, 31.602881090711197, 26.915710845696587, 20.916870753005107, 13.875411418626397], [58.61289969244162, 59.006126051517285, 59.25381674710293, 59.35424430166929, 59.32542821523262, 59.16862310973964, 58.90980540865654, 58.533045663662044, 58.011095287261405, 57.298675152430725, 56.45051141766271, 55.364969579394334, 53.98432290705052, 52.44186607227932, 50.622613958314, 48.271503501926, 45.79141693922212, 42.95669423514119, 39.58945689566079, 35.59184558275821, 32.13336146199423, 27.389371718620843, 21.345053135179004, 14.281747289796996], [59.22073167331794, 59.62473495477348, 59.87875311334845, 59.98164971276385, 59.95410827130233, 59.798580211351286, 59.54268001384503, 59.171501303356926, 58.658025805601035, 57.957151417631174, 57.121415207852515, 56.04914368552897, 54.68201281721104, 53.15071431999681, 51.3408748329616, 48.996686458786776, 46.51973118147522, 43.68353003810959, 40.309470763417885, 36.29773724492294, 32.78145870112492, 27.993663545256307, 21.913484707488546, 14.820677999400933], [59.85601253244312, 60.27099379632716, 60.531587724074086, 60.637259649111606, 60.611430644893844, 60.457937649619936, 60.205989871083425, 59.84182848739585, 59.33876268159068, 58.651889441268395, 57.83127542536497, 56.77549676593769, 55.42576131842318, 53.909913900635445, 52.11465628579562, 49.78452346660576, 47.318875689933854, 44.491561879488096, 41.12435548354974, 37.1164578015538, 33.56346047731328, 28.757121113285983, 22.669341850977705, 15.56168063559037], [60.526863919882466, 60.95349335540334, 61.22121519058563, 61.3301344708546, 61.306562082815354, 61.1559975259782, 60.90923398126799, 60.55382141646263, 60.063499250945526, 59.393538224315854, 58.59113908592459, 57.555389045510964, 56.22706625282379, 54.730853947854484, 52.95493306499928, 50.64508188566834, 48.19758301319895, 45.38760899228848, 42.03826446783757, 38.04871141220785, 34.47681514091661, 29.67387538104375, 23.604747403740692, 16.503464452145103], [61.235647193591774, 61.67468050792178, 61.95022721643886, 62.063044840903565, 62.04248460708071, 61.89600802380647, 61.655921444713385, 61.31125662172953, 60.836277131030116, 60.18637525973527, 59.4054511648228, 58.39337477514132, 57.090517793913456, 55.618081585493655, 53.86612183918452, 51.58251062810272, 49.15961734144424, 46.3748914131649, 43.053678805518096, 39.09609839636871, 35.522537157219546, 30.74493877479272, 24.72258754109965, 17.658870003319063], [61.97667936542637, 62.42846280687849, 62.71241735602163, 62.829882468346554, 62.81328987785534, 62.67226103744576, 62.44039627169295, 62.10833486646014, 61.650914409900565, 61.023598456496586, 60.26667643179276, 59.281065322242696, 58.00680822805692, 56.561432300352436, 54.837223467844716, 52.58490734046998, 50.19226575330546, 47.43985676839172, 44.15611863037328, 40.24310605294386, 36.683884100758405, 31.952720051599194, 26.0054911070469, 19.018065705576937], [62.76257591231983, 63.228412677172905, 63.522090408511545, 63.64547577832586, 63.63425476493178, 63.500578089291935, 63.27909918101913, 62.96227037842147, 62.525567097195534, 61.924395207463746, 61.19492359772571, 60.2393916892285, 58.99747940165703, 57.582730636942394, 55.889979309050304, 53.67339273303814, 51.31545569182396, 48.60047973446717, 45.36048072296202, 41.49997833146771, 37.96577621081599, 33.293881951965616, 27.438361636551836, 20.55417100570194], [63.587648647446144, 64.06863106742826, 64.37345908939912, 64.50435664007296, 64.50032246341294, 64.37629493795602, 64.16752072415827, 63.86842168959003, 63.455120632531845, 62.88284101824625, 62.18329345259094, 61.26031093156341, 60.05324396710396, 58.67151508907382, 57.01276292428034, 54.83505295387387, 52.51508507134049, 49.841392924494116, 46.64993063002712, 42.848076559874826, 39.347312919024404, 34.74468318755095, 28.993723550061524, 22.236176872720446], [64.44704400086698, 64.94415134119042, 65.26171055708107, 65.4020229504913, 65.40735098986897, 65.29554855999037, 65.1017913829587, 64.82256969283357, 64.43460996722749, 63.89285237246143, 63.2244347890626, 62.335028901503506, 61.16375737713655, 59.815973742445394, 58.19228575309077, 56.05492952405021, 53.77461661655065, 51.14434785126061, 48.0042215480744, 44.26470751886768, 40.80274669618937, 36.2755864333772, 30.637026698629715, 24.022864124218], [65.35206758569849, 65.86808613541878, 66.2016399430526, 66.35473390520778, 66.37299717763736, 66.27755754365225, 66.10256988738173, 65.8468227805912, 65.48761835887751, 64.97942583461314, 64.34450883677417, 63.49071918497815, 62.35697268486867, 61.044518239014295, 59.457092574254915, 57.361283141454315, 55.1215355816439, 52.535469356778115, 49.44725535208147, 45.77035827484414, 42.349533353419176, 37.898175438879456, 32.37066912787539, 25.901603966860996], [66.28679595371489, 66.82415237783604, 67.17707658506552, 67.34670688760856, 67.3819198782991, 67.30717369251806, 67.15432460288145, 66.92456941584749, 66.59568470292878, 66.12159220054083, 65.51988458784061, 64.70087890934572, 63.603466641949126, 62.325122536122386, 60.77272477069326, 58.71716981646231, 56.51685735863559, 53.973913603304354, 50.93646552932719, 47.320896750115395, 43.94158178169924, 39.564970814669934, 34.14621731082256, 27.822524012557153], [67.24611521086518, 67.80782009200279, 68.18423317590339, 68.37490459124288, 68.43177337415808, 68.38256160837534, 68.25528834763497, 68.05364985303571, 67.75577720276995, 67.31504234662368, 66.74485272286279, 65.95825270577453, 64.89436049207582, 63.64739811246462, 62.12729752365787, 60.109053417627734, 57.94554363089099, 55.44310885232147, 52.45363728700207, 48.89631821529028, 45.55696314154498, 41.25195815146135, 35.937290364844245, 29.755351176719405], [68.2199562590358, 68.81213054047774, 69.2193149807649, 69.4384224068701, 69.52437564417798, 69.50827534587101, 69.41208376799065, 69.24226983171567, 68.97722241503098, 68.56972460661075, 68.02952209122034, 67.27276555788737, 66.23902349173459, 65.01988946610608, 63.52818485473911, 61.542590135093356, 59.41117701348016, 56.94400501553423, 53.99620505960258, 50.48936112956121, 47.185176757392526, 42.94213247247944, 37.71696051982894, 31.657527585939768], [69.18605963779122, 69.81455702741363, 70.25960361331374, 70.5143079673271, 70.6363366113205, 70.65994608955239, 70.59886249231455, 70.46250819941667, 70.22942468499201, 69.85193313776034, 69.33714714669448, 68.60451479110696, 67.59438247364334, 66.39667623188362, 64.92677053122355, 62.9663650465983, 60.860044338187784, 58.42083192646501, 55.50661566432608, 52.04109972890648, 48.7652428543893, 44.57396678026452, 39.42468673189632, 33.47128740527784], [70.13155732491614, 70.80365261983711, 71.29481651500572, 71.5930523457794, 71.7585866205718, 71.82858644718267, 71.80637153970842, 71.70458317732437, 71.50184793662203, 71.15018347084093, 70.65521932368996, 69.9397869873339, 68.94531465739416, 67.76116313879912, 66.30483444744938, 64.36018514805477, 62.270012716052705, 59.84937065718208, 56.95833574781777, 53.52244224250016, 50.26554811476544, 46.11305387156528, 41.02297387356937, 35.1554528727578], [71.00243493360195, 71.72812245221098, 72.27583297966437, 72.62889925424362, 72.84668907156407, 72.97063087831957, 72.99134416135828, 72.92513796902402, 72.75070789065494, 72.41986544687423, 71.93797440872221, 71.23120780853401, 70.24226741299938, 69.06128913426136, 67.60728494633624, 65.6649826693296, 63.57771648052228, 61.161234510192614, 58.276813869782025, 54.851215325937474, 51.598051534020335, 47.4617639355551, 42.400763866141624, 36.58035521444922], [71.78309098600178, 72.57155703318419, 73.18469448687846, 73.5960147711842, 73.87077000497888, 74.05142337255546, 74.11500019496464, 74.08183834210354, 73.93660958123814, 73.61962909135312, 73.14261489413796, 72.43466431782728, 71.43982471568751, 70.25037435848965, 68.78611831776432, 66.83120572713509, 64.7321982532456, 62.30408784243033, 59.408426574650676, 55.97273319093375, 52.70609715406435, 48.562861858502295, 43.50166404018388, 37.69273640987168], [72.47189023231441, 73.33059622762109, 74.016342170537, 74.49166284339726, 74.8255531481173, 75.06275044905699, 75.16672012993608, 75.1621153300602, 75.02789111692591, 74.71580603436631, 74.23418457148374, 73.51418834128613, 72.50108478263401, 71.29059934390922, 69.80894445931823, 67.82479328654362, 65.6976806912356, 63.240242085636964, 60.31332045880617, 56.84473022836532, 53.54477690671891, 49.36877117903969, 44.275391263412146, 38.43992915160899], [72.8921320153523, 73.83006890303798, 74.59838529552914, 75.15166136974543, 75.56261640228814, 75.87297768415485, 76.02969367591315, 76.06207220521802, 75.94877235666205, 75.64108669552863, 75.15029534042361, 74.41011672410959, 73.36731988314733, 72.1228733979955, 70.59597657406563, 68.56470906269881, 66.39138049950263, 63.884617157724605, 60.90340005179475, 57.37523523186926, 54.018960193853175, 49.77928962142418, 44.61469891480958, 38.70697985108664], [73.21447998624056, 74.23010462199774, 75.07676035316095, 75.69989241313883, 76.17455454119647, 76.54215728582443, 76.73557863741792, 76.78861290675454, 76.67994050044037, 76.36075162593593, 75.84657664325705, 75.07172733046744, 73.98393265393526, 72.69058084383418, 71.10900695121795, 69.01125012103402, 66.77250878340826, 64.19544361168371, 61.13588989472998, 57.5203691818729, 54.08378404576921, 49.74828327792872, 44.47187134154145, 38.43898123348485], [73.5672560749507, 74.64418647099622, 75.54615087743939, 76.21467925424733, 76.72683399061776, 77.12140944850124, 77.32494295892646, 77.374301477389, 77.248140255213, 76.89763825547774, 76.34367382518487, 75.51844297311949, 74.36987922938246, 73.0127492431087, 71.3609868578539, 69.17853453731618, 66.85657926971143, 64.18994364634601, 61.03019929419578, 57.30235327411349, 53.763266368485354, 49.303427297215535, 43.880148557519604, 37.68271837557776], [73.99569608986779, 75.10409700598684, 76.02460766426127, 76.70672692430797, 77.22052021764144, 77.60590368360346, 77.78921439418374, 77.80814781850034, 77.64098231196046, 77.23878326062959, 76.62865447472984, 75.73775811365836, 74.51337560637344, 73.07843940610054, 71.3419503823028, 69.05773187310473, 66.63584428742071, 63.861028665828165, 60.57944353713748, 56.714531898683504, 53.05092790529504, 48.43848600525713, 42.83360316922911, 36.43102738034433], [74.50830470165907, 75.61018069421115, 76.50343614287011, 77.1541580363329, 77.6374481619479, 77.97633992391414, 78.10898072668094, 78.0713838919385, 77.84104411261633, 77.36873416520123, 76.68829684919993, 75.71902796618974, 74.40891135469334, 72.88401544235002, 71.05017730408858, 68.64930125762629, 66.11279538861478, 63.21471713186263, 59.79493952070164, 55.77388655641366, 51.969280702829025, 47.18183520298582, 41.36682831237498, 34.72466920059474], [75.07867181808956, 76.12990656300916, 76.949279033305, 77.5331025752932, 77.954865932375, 78.2146711519906, 78.27056575896401, 78.15478040736087, 77.84754370517415, 77.2910049367618, 76.5300018119589, 75.47352789541753, 74.06475561742175, 72.44395784956299, 70.5064572274998, 67.98120608772545, 65.32211887564284, 62.29124876520177, 58.72147908730642, 54.53022632547034, 50.57300667597616, 45.59362689606158, 39.54607365535732, 32.63667015225198], [75.70475591642227, 76.67033205573165, 77.37418118444299, 77.85773738098305, 78.1917949891414, 78.34832156125644, 78.3057158732829, 78.0940300014856, 77.68860052998741, 77.0389176227271, 76.19173515132708, 75.0436345112208, 73.53429044815911, 71.8124863874269, 69.76558171152698, 67.10876403825948, 64.31969628420289, 61.14777456160918, 57.41836068560864, 53.04558806740432, 48.92614959675835, 43.74150343587001, 37.44422214663499, 30.248410302183146], [76.32718341618416, 77.17961316969094, 77.7366763298162, 78.09696942910978, 78.32417727476032, 78.35181862087076, 78.19703997711309, 77.88029650831176, 77.37553035409383, 76.63044305482047, 75.69636799020313, 74.4560104405564, 72.84474967519782, 71.01981314571012, 68.86050758305767, 66.06796262749643, 63.144398945215585, 59.8262421703315, 55.93099338848357, 51.369266857438305, 47.08170914251677, 41.68277582739657, 35.12352001980015, 27.629673893707075], [76.87798419705499, 77.6014877106562, 77.99371011058749, 78.21136917858836, 78.31952957357397, 78.21210216091755, 77.94133027498974, 77.52022740552431, 76.92031199330754, 76.08553762296691, 75.06929033312863, 73.73996037571646, 72.02833063334639, 70.10033744574199, 67.82775928138913, 64.89783253027235, 61.83776932998303, 58.37096157458365, 54.30683438334238, 49.55227577428856, 45.094040919954566, 39.47575213250188, 32.646854382761205, 24.852890078184288], [77.30293483348746, 77.88798132852762, 78.10868336000625, 78.1793240047554, 78.16303884601182, 77.92055761905704, 77.53983572364415, 77.02494924912588, 76.34271771211549, 75.43015969601826, 74.3398613642717, 72.92679036112244, 71.11763584769726, 69.0878193079942, 66.70248901095312, 63.6354105854261, 60.43885369366622, 56.82323543812024, 52.58976371800042, 47.64140757382975, 43.01262772357645, 37.173150253874844, 30.07074214148949, 21.987775414920577], [77.57051474269689, 78.01699057520666, 78.06854153991443, 77.99297237792845, 77.85244085743918, 77.48301652175203, 77.00660830543207, 76.4159312217238, 75.66943534540894, 74.69339896074825, 73.53757510856448, 72.04577419147802, 70.14190226200016, 68.01195053521721, 65.51531833362424, 62.31275416858654, 58.98127296392921, 55.21842749010324, 50.817115135602435, 45.67620814164441, 40.87902637129691, 34.81897877398911, 27.442103755868857, 19.101721671878895], [77.67781937702031, 77.98860702252087, 77.87852828349853, 77.66232968496575, 77.40227571744082, 76.92015522089925, 76.36769582167383, 75.72263922625842, 74.93049104364357, 73.90357254170648, 72.68863618474091, 71.12152509742859, 69.12507470666503, 66.89680958082684, 64.29093563310234, 60.955527858282366, 57.49172962376042, 53.58437276235625, 49.01799435370847, 43.68721855309764, 38.725028999832034, 32.44665268275853, 24.796366030476168, 16.264083988763435], [77.63754842498639, 77.81768705617137, 77.55622529376103, 77.2081659565957, 76.83712117932912, 76.26087461940797, 75.65438595741942, 74.97582953868427, 74.15337762214635, 73.0840087869669, 71.81340614291229, 70.17276482167715, 68.08539861651039, 65.76085745033451, 63.048318016081865, 59.583413518420954, 55.99059387281222, 51.94216374012784, 47.21429487453322, 41.697242011507186, 36.57420718131497, 30.08079091918813, 22.159486834159793, 13.55634861400909], [77.47185815641379, 77.5274178395285, 77.12588496210023, 76.65664338893042, 76.18600269551445, 75.53642084831027, 74.8973026537549, 74.20239731976912, 73.35960282069775, 72.25155408253863, 70.92619506585223, 69.21273347343129, 67.0359554399853, 64.6173861951928, 61.801057961037046, 58.21033249247233, 54.49207177012453, 50.3062935972666, 45.420836875385845, 39.72149449631398, 34.44205612867832, 27.73739009677351, 19.548195007496812, 11.078263623072665], [77.20490642449307, 77.14281318973795, 76.613112796348, 76.0347421100147, 75.47801590194696, 74.77619241352316, 74.12282890948242, 73.42328610257825, 72.56461764895741, 71.41814650433676, 70.0376594677425, 68.25196850955238, 65.98768173989443, 63.47780581148966, 60.56101000066633, 56.848582914987276, 53.00884383849314, 48.68983138255264, 43.65112163243733, 37.77397464782257, 32.3429890650836, 25.43144527300175, 16.978240932236044, 8.946559159055724], [76.86057628237498, 76.68883660599009, 76.04345499385431, 75.36903429032157, 74.74093229810015, 74.0063086978504, 73.35238501124627, 72.65422208688895, 71.77995726947174, 70.5936376324992, 69.1577129653424, 67.30114361770399, 64.95219869541688, 62.35457883471865, 59.34141739397753, 55.51223880519322, 51.55573985927019, 47.10838870240488, 41.9216130128628, 35.87208296789694, 30.295287088899656, 23.18225168820306, 14.470072936085279, 7.260050343112216], [76.46305305792987, 76.18853489990896, 75.43808455913633, 74.6793060374927, 73.99332179107981, 73.24173046501684, 72.59590800830993, 71.9006084946408, 71.00841355609384, 69.77995088891076, 68.28813468564807, 66.36189819278276, 63.9307766832455, 61.24842048321703, 58.14229678751857, 54.20043823644397, 50.131048521476984, 45.55937176549577, 40.228787475242946, 34.01133414929154, 28.293430042974318, 20.983352710294277, 12.016397602523028, 6.032202750951385], [76.0303215442687, 75.65994290516761, 74.81440562306386, 73.98231227911654, 73.25082024733524, 72.49438303357161, 71.8609311709144, 71.16693276713521, 70.2535014060574, 68.98097916122546, 67.4334975530127, 65.4394031979074, 62.92901069332488, 60.16519175153124, 56.96971027854409, 52.91943759936796, 48.741200735581536, 44.049395477178464, 38.57946835647678, 32.198792043782205, 26.344683119567065, 18.8422921277484, 9.62511701195105, 5.206987980578351]]}, "high_thrust": {"thrust_ratio": 1.3, "EPNL": 100.00894635052757, "SENEL": 74.3262890122264, "SPL_total_history": [[51.78386746920818, 52.093181447274176, 52.34070672452604, 52.511151248960275, 52.578691583467844, 52.5602630163669, 52.42632077465792, 52.16175651864809, 51.750820855136325, 51.1378347371888, 50.37929557976945, 49.40441585130731, 48.15672142690266, 46.781749052411854, 45.163385139979184, 43.08953053935585, 40.85690552980688, 38.24569583124213, 34.980407043059294, 30.823683893142608, 28.113068976286364, 22.691592268248144, 14.469159736430772, 4.414570596070085], [51.9916338137959, 52.30722503146451, 52.559731775173574, 52.73336163647774, 52.8035620623875, 52.78691667151634, 52.65407940834878, 52.390307845315114, 51.97952258976485, 51.366341286310025, 50.60708684959026, 49.6304427541785, 48.380133892561624, 47.001551820425234, 45.379315362971695, 43.301396967748246, 41.06819509191183, 38.46122063388285, 35.209691180923016, 31.081657302722093, 28.374348118785043, 23.00702483033048, 14.890941234030564, 4.8535075112962875], [52.2027751378642, 52.524443309197466, 52.781792397658165, 52.95853515759005, 53.0313771738362, 53.01655458853715, 52.88491633349442, 52.622094368547465, 52.211700221967654, 51.59867626537888, 50.839151971911406, 49.86134451804068, 48.609211341619954, 47.22791603274567, 45.602842487044896, 43.52212286524629, 41.28954178528823, 38.68801150340583, 35.45149500584512, 31.35347184402395, 28.65067526719493, 23.3389340814092, 15.330885049576569, 5.317049582079287], [52.41827900552749, 52.746023211264266, 53.008214159792296, 53.18807159324307, 53.263562603366964, 53.250582354543816, 53.12017690915235, 52.85835954065186, 52.44844148158111, 51.83569854893865, 51.07605640537624, 50.097280279623334, 48.84355716818763, 47.45978064244062, 45.832085626028665, 43.74873711565791, 41.51683293570707, 38.92068946031889, 35.69902229029482, 31.630777807485448, 28.932252166591027, 23.67589913709232, 15.775765229337303, 5.795703991525838], [52.638553306163686, 52.972420723374555, 53.23948605482386, 53.422477130458724, 53.50063000956459, 53.48950615287734, 53.360352819531805, 53.09957143603782, 52.6901792424729, 52.07779010241999, 51.31811739862627, 50.338477974462975, 49.08327713379811, 47.697104821412594, 46.06682164197338, 43.98077041160746, 41.749335420943126, 39.15822037997749, 35.95089201883922, 31.911804823931224, 29.216938763141293, 24.015367743623308, 16.22257631763236, 6.286846541423085], [52.86390745318193, 53.20398103136122, 53.475977841722, 53.66213443380117, 53.74296636738399, 53.73370952535641, 53.60581789238835, 53.34608805182782, 52.93724804693135, 52.325251605992506, 51.56559251772506, 50.58513541711782, 49.32848663974411, 47.939904026710416, 46.30693980765551, 44.2179380153921, 41.98657292635293, 39.399903150093536, 36.2061368313995, 32.19528001495171, 29.503170924880614, 24.355447224150538, 16.66906303015828, 6.788102227171116], [53.095172676812766, 53.44165240062737, 53.71871818217309, 53.908114303172496, 53.99165668274965, 53.9842661735106, 53.857613824164225, 53.59889876148897, 53.190559265567515, 52.57888136299489, 51.81913537705541, 50.83770434178014, 49.579357040538206, 48.188007090574985, 46.551834959363205, 44.45903785605261, 42.226695059964456, 39.64314297754524, 36.461304333490794, 32.476793483567505, 29.78563083729673, 24.689819286947635, 17.107817422425, 7.292333940720975], [53.332165216529425, 53.68516606353904, 53.96737988704644, 54.16005913819074, 54.24633395364779, 54.24081996640642, 54.11541261805781, 53.85772185399303, 53.44990107548998, 52.838569571518676, 52.07876672343357, 51.096386688080855, 49.83633948587217, 48.44216551923906, 46.802631942111944, 44.70569309171441, 42.471843898804664, 39.890648335388285, 36.71972039572677, 32.76032735522725, 30.068900860333557, 25.023727451560575, 17.544815461528522, 7.803700868398305], [53.575639365228525, 53.93538435553542, 54.222899503813196, 54.418944533038804, 54.50798728657176, 54.5043507893097, 54.38016677199566, 54.12346511355306, 53.71611497603129, 53.1050618122527, 52.34510919900555, 51.36163286197059, 50.09964347107829, 48.70229197683634, 47.0588632314982, 44.95690594763646, 42.72043581670453, 40.14015069349373, 36.978312628764755, 33.04189679654543, 30.348125926765004, 25.35134887466669, 17.9731770275438, 8.315119745722884], [53.82553224076609, 54.192173346196846, 54.48509427632261, 54.6845623247028, 54.77640076094935, 54.77465208703873, 54.65169379292185, 54.395985701438356, 53.98911812122791, 53.37836296241484, 52.61828005453755, 51.63371623897664, 50.36975746753392, 48.96913478485664, 47.32160103165604, 45.214181888897, 42.974427319922256, 40.39409642915704, 37.24005561820652, 33.325029047377164, 30.627329110424498, 25.67724961208821, 18.398070682403688, 8.830261724747952], [54.08261004151864, 54.45639647684403, 54.75489441118565, 54.957877960249846, 55.0525524609591, 55.05269508527416, 54.930942918060026, 54.67619711894014, 54.26977154658604, 53.65925846495266, 52.898967681917824, 51.91318841167976, 50.64703985201984, 49.24281149662731, 47.590650183365746, 45.476881814158325, 43.23267809091795, 40.65074524778503, 37.50248712699897, 33.6064236051108, 30.90239694486181, 25.996406724318796, 18.813481859305405, 9.342549331372652], [54.34674444979753, 54.72783501687385, 55.03201906971434, 55.23857820598305, 55.33611896549566, 55.33816734702479, 55.217630647769084, 54.96386352820488, 54.5579113459133, 53.9476895315743, 53.18724816196875, 52.20031353076856, 50.932015497501986, 49.524164630508174, 47.86725346836203, 45.74679168732211, 43.49754887321069, 40.913091811687664, 37.76929365334314, 33.890494580986754, 31.178394924924042, 26.314592258717248, 19.2259588997206, 9.857236188918554], [54.61934112965474, 55.00807958511273, 55.31818582179056, 55.52844758070315, 55.62890891639398, 55.63286468934053, 55.51351145783565, 55.26067228195355, 54.85512633477954, 54.24510301259445, 53.484385843277025, 52.496098055300834, 51.22532558396186, 49.813378663372305, 48.15100105739476, 46.0226572907854, 43.76683378478003, 41.17779493731546, 38.03577381006857, 34.170967007555014, 31.44751764697261, 26.622296578838874, 19.624140268495506, 10.362350669744716], [54.899983514968476, 55.29657468067701, 55.61274375704357, 55.82678532513007, 55.93020534209216, 55.936085474572465, 55.81792533973484, 55.56603182799606, 55.16092795283627, 54.551160597817486, 53.790235373305904, 52.80066658439313, 51.527470900015146, 50.1114160181199, 48.44344242115098, 46.306834912380594, 44.043755942584696, 41.44904916820454, 38.30719793112818, 34.45425318262426, 31.717207676653267, 26.928064942178857, 20.017763499110927, 10.86641348886333], [55.189424068674654, 55.59414445979313, 55.916566201757576, 56.134490931687324, 56.24091791399682, 56.24873706881488, 56.13176863253521, 55.88082105897716, 55.476170772214445, 54.8666827104809, 54.10557318334745, 53.114732161741934, 51.83907187801688, 50.41877766788527, 48.744917461349004, 46.599424638310545, 44.32812704866349, 41.72629370130735, 38.58251503789299, 34.738678357164495, 31.98513978846862, 27.2288075639717, 20.402888893793182, 11.364638509145449], [55.48796452627983, 55.901070055635664, 56.2299201251283, 56.45182423623921, 56.56130511886215, 56.571083450189484, 56.455317517474946, 56.205336663958356, 55.8011834780601, 55.19204553898778, 54.43083646338032, 53.438816455987855, 52.16076608352596, 50.736241355848335, 49.05637939380016, 46.9016150532061, 44.62137680136475, 42.01120556462301, 38.86363383390032, 35.02633285692261, 32.25350506095511, 27.526769510541463, 20.781794235652985, 11.85844065978197], [55.79578588929978, 56.2174859630887, 56.55290810893231, 56.7788712970712, 56.89144816807654, 56.903212715691566, 56.78867736443731, 56.53971274016492, 56.13614411081297, 55.52749179342121, 54.766351125069626, 53.77336170298744, 52.49315797027619, 51.06461174372249, 49.37889006467343, 47.21482606427229, 44.92531244821217, 42.306021517301815, 39.15324595425119, 35.320345909169106, 32.52577260871391, 27.825725794822567, 21.158546854168748, 12.351220544201007], [56.1153552983324, 56.54614085889351, 56.88847193421463, 57.118676186551994, 57.234430214514155, 57.24819568171139, 57.13486960598256, 56.88689176922985, 56.48388236155512, 55.875690823885236, 55.11457946608731, 54.120532706360514, 52.83798080776407, 51.40506879820534, 49.71289069034984, 47.53841838111082, 45.238036888105455, 42.607289546579345, 39.44595767530411, 35.61297241565233, 32.791801631920244, 28.11279272134676, 21.517244002002037, 12.825470204930234], [56.44571260619354, 56.88585190407235, 57.235276002294036, 57.4698231779512, 57.58880777461862, 57.604608244630725, 57.492527318292744, 57.24560048833438, 56.84326461482807, 56.23571181484135, 55.47485174100861, 54.480028161815646, 53.19545445665351, 51.758485307891206, 50.06010691362103, 47.87533356209075, 45.563856721370506, 42.92091760420226, 39.74952653774105, 35.91398623227481, 33.06320083196932, 28.40147435118626, 21.873341698804005, 13.296321673400033], [56.787381364658415, 57.237145635170414, 57.59384892835734, 57.83284243052428, 57.95511290707621, 57.97298698756138, 57.8621953614794, 57.616398149449985, 57.21487366966778, 56.60817309632603, 55.84783172008271, 54.8525740332081, 53.566389267296344, 52.12577431363671, 50.42158358332803, 48.22680253261818, 45.90420618561222, 43.248561297975165, 40.065817785099675, 36.225386449630065, 33.34197694049918, 28.69362626879901, 22.228400153007527, 13.76457594907584], [57.14170979693435, 57.60146875581703, 57.96570500792039, 58.2092845452696, 58.33491169626829, 58.35489920875514, 58.24543418543017, 58.00083559074024, 57.60025004128552, 56.99460282161466, 56.235030819336096, 55.23965347751225, 53.95221954922333, 52.50829943223789, 50.79858179099257, 48.59392666651317, 46.25998649440933, 43.59084672933158, 40.39505274639075, 36.54678845129731, 33.626991523275805, 28.98706959755938, 22.578937636164902, 14.225476738400207], [57.51074985217835, 57.98100879976403, 58.35312488946627, 58.60148021882854, 58.730556861861736, 58.75270082811696, 58.64459308510375, 58.40125363925134, 58.00172773065151, 57.39732907748652, 56.638768084911426, 55.64356505595872, 54.35520032352954, 52.90824437144025, 51.19317349810983, 48.978593071502246, 46.63284339654257, 43.94907907879598, 40.738028964314694, 36.8782242989472, 33.91729627471285, 29.279508762464207, 22.920964219299442, 14.673340721050392], [57.89355420972403, 58.37462307368484, 58.7548321191094, 59.00808295177789, 59.140676846155685, 59.16503515311052, 59.058361411212715, 58.816416799974306, 58.41818270496746, 57.81538868194917, 57.05828694375538, 56.06384464667058, 54.775284492215846, 53.32609266587368, 51.60655135728628, 49.383041670309666, 47.02624721209208, 44.32824955154, 41.10159214632641, 37.22864945983198, 34.22381778846096, 29.583791216611502, 23.269090409595037, 15.122868518964108], [58.290769252468635, 58.78293792650865, 59.17143971443839, 59.42969955817154, 59.56587814266168, 59.59251615554617, 59.48736866861562, 59.24698074770879, 58.85031169858652, 58.249538805736506, 57.49442091381659, 56.50142991412001, 55.21355204097393, 53.76310036871271, 52.04020491749447, 49.80911251493872, 47.44246345199513, 44.731168851099255, 41.489231993980326, 37.60230711544147, 34.55143334260196, 29.905227519485173, 23.628742028140188, 15.578884795117382], [58.70742954949623, 59.211429566198426, 59.60872713169067, 59.87227198004252, 60.01217154071452, 60.04115690542062, 59.93759093946564, 59.698867348036885, 59.30397149719903, 58.70555198779668, 57.95282917616326, 56.96179715119158, 55.67517661512632, 54.224009621671954, 52.498251216716355, 50.25994503977656, 47.88342786886558, 45.158207799341355, 41.89924620021823, 37.994774081188936, 34.89264708496302, 30.23234677695625, 23.983514884231752, 16.020828697179518], [59.140930916043324, 59.657086388495415, 60.06340437557607, 60.332363819767494, 60.47606516807132, 60.5074846173175, 60.40562792933693, 60.168791730199004, 59.776042081895, 59.180541074396814, 58.43092320888098, 57.44278563819037, 56.15862009806909, 54.708091882800254, 52.981068718596866, 50.73759853775937, 48.35324698246993, 45.61612535826343, 42.341848086869476, 38.42055767896231, 35.266395517764366, 30.58888520354461, 24.36193635048482, 16.47940553563332], [59.59193113289175, 60.12051360150747, 60.53604193332164, 60.8105288660422, 60.95810928666137, 60.992059525759146, 60.8920614615569, 60.657370528959014, 60.26719231332769, 59.67524935514292, 58.92953836259498, 57.94535469257525, 56.66501030366597, 55.21668380366317, 53.49027440646122, 51.24412308571167, 48.85452512026859, 46.10829669759689, 42.82150097862228, 38.88557646035573, 35.68017747036407, 30.98398370107715, 24.774519887009983, 16.965439264906642], [60.06804673338041, 60.609972452602314, 61.03534481925691, 61.31571200475341, 61.46735491519362, 61.50395025514928, 61.40593141380026, 61.173607042661324, 60.78639833027, 60.19862972427003, 59.45758563610486, 58.47831075419436, 57.20292090229752, 55.75796824448478, 54.033426617332154, 51.786035292134784, 49.392440551574055, 46.63811837583165, 43.339215103656954, 39.38770645664377, 36.12837765025722, 31.407351946360038, 25.204799409255756, 17.45642598015262], [60.5649613906821, 61.12053683521009, 61.55597175005519, 61.84235383093693, 61.998157358982, 62.03752797532506, 61.941689902869896, 61.7120760075053, 61.32839811496025, 60.74564063619996, 60.010304256390896, 59.0373033319093, 57.76861914355265, 56.32904288056054, 54.60879430980715, 52.36343996650404, 49.96941609139828, 47.2111495426872, 43.904886712368096, 39.94270483769404, 36.63344008414673, 31.889598050450992, 25.692545377438186, 17.99873509742815], [61.08455970922322, 61.654122303032395, 62.09986331514873, 62.39241287958423, 62.55248947906427, 62.59478236834716, 62.501348087011614, 62.27482137410698, 61.89528552852149, 61.3184451369314, 60.58993612586144, 59.62466735341862, 58.36454516315092, 56.93245530089327, 55.2190474188979, 52.979180566803024, 50.58852410944113, 47.830826549039756, 44.52257977537226, 40.555708548583866, 37.20205233452071, 32.43952984670644, 26.24903460022912, 18.605634190463764], [61.635980985789516, 62.22054653864938, 62.67730890547106, 62.976439930986714, 63.14102837003517, 63.18643837193023, 63.095646761494095, 62.87261893793746, 62.497921038394836, 61.928041286782964, 61.20763088967631, 60.25169305522677, 59.002058946246414, 57.579507587977474, 55.87525242880582, 53.64379178581196, 51.25950943005236, 48.50576889818811, 45.19936504905697, 41.23178420187351, 37.83728395798393, 33.05762006618031, 26.871315905847442, 19.27045905790655], [62.213348432358885, 62.81316055225556, 63.28113751378503, 63.586992198887955, 63.75622422438464, 63.80495372930323, 63.71711206651086, 63.49808339726509, 63.12901145694361, 62.56723711031219, 61.85632072744501, 60.911512899107606, 59.6746406619316, 58.26420326927699, 56.572215204891414, 54.353419041402034, 51.98029757785379, 49.236422812735505, 45.9393718335692, 41.98043257806097, 38.55537368742971, 33.7695867784442, 27.597759834866473, 20.044857373789885], [62.82173944009064, 63.437303561829935, 63.916879839579124, 64.2297170500143, 64.40379369031146, 64.45609256841007, 64.37154747571486, 64.1570738648648, 63.79450337146707, 63.24209933585844, 62.54219953893866, 61.61044744961807, 60.388707807778204, 58.992994279268245, 57.3163414055106, 55.11429723930667, 52.75683950777334, 50.028333354815956, 46.747630393784085, 42.80616878276406, 39.36071494360264, 34.580197511733736, 28.434502740940854, 20.938071149359565], [63.46964087113207, 64.10193306451166, 64.59383688943107, 64.9141245930755, 65.09337227021535, 65.14958073627498, 65.06876067385078, 64.85951856933661, 64.5045169327332, 63.963018659687805, 63.27595946458402, 62.359520108873866, 61.15560326632245, 59.777465035276826, 58.11936383734352, 55.93817774122036, 53.600732518872675, 50.89276174191326, 47.634856215691, 43.718987648576004, 40.262851174941076, 35.49867352158167, 29.39110524454934, 21.961624921014863], [64.1500897676922, 64.79923289111107, 65.30362556297135, 65.63154608032272, 65.81618612288658, 65.87665052510343, 65.80002571468219, 65.5967083690153, 65.2502952423235, 64.72111247560818, 64.04854720997461, 63.14948142492278, 61.965907867158414, 60.60811843793901, 58.97184253796124, 56.81590959339108, 54.50337553558539, 51.8220269838514, 48.59486771459201, 44.71509981527643, 41.261147954642794, 36.52957071014101, 30.480438093885414, 23.140685912329847], [64.87411658322168, 65.54088592787068, 66.05841736877717, 66.39446369338438, 66.58491626870662, 66.65013453810309, 66.57830350716247, 66.38177078324566, 66.04521015740447, 65.53007882394178, 64.87400784230812, 63.99473698474465, 62.8343402761653, 61.499859182097524, 59.88870540222098, 57.76218863473567, 55.47893614667722, 52.82938578169172, 49.639466475964014, 45.80414408769337, 42.36289092956417, 37.67684732868111, 31.702402908493447, 24.47196149609104], [65.64568830983366, 66.33084636894432, 66.86221204806297, 67.20696331785487, 67.4037625033188, 67.47437904923748, 67.4080803714835, 67.21933328897397, 66.8940329423867, 66.39482754143054, 65.75736412293378, 64.9004024209425, 63.76607715847932, 62.45788320693724, 60.87512171371972, 58.782088881745565, 56.53232120506818, 53.91947894869604, 50.772882124228715, 46.98975286280313, 43.5711140565696, 38.942751049076314, 33.05853188697657, 25.957221808967837], [66.45765717916953, 67.16117541212313, 67.70657298778588, 68.06038919566308, 68.26402500991938, 68.34073239501862, 68.28073776884996, 68.1007168445982, 67.78786390267267, 67.30604380790336, 66.6887563917136, 65.85593006859963, 64.74977987141418, 63.470079220021944, 61.91820950413951, 59.86189795698142, 57.64910403611733, 55.07719474898833, 51.97932104272584, 48.255444666005815, 44.86844366739359, 40.30919701443699, 34.53029202263098, 27.578469444307274], [67.3293128858096, 68.05233187112006, 68.61290204581243, 68.97681482050716, 69.18828212267616, 69.27223113678318, 69.21971155381924, 69.04981197347585, 68.75117361641176, 68.28890978267884, 67.69410057165217, 66.88801103642459, 65.81287319453445, 64.5644334291261, 63.04631972554196, 61.0300658930661, 58.85743724180657, 56.32992365411576, 53.28472967612648, 49.624758808260445, 46.275842834666605, 41.79253313504172, 36.12694940609482, 29.334948495828172], [68.25438307069744, 68.99739222057596, 69.57394153853801, 69.94892965359463, 70.16934792647503, 70.26191075151506, 70.21819216789856, 70.05981613367379, 69.77693737065307, 69.33590294600438, 68.7651855361218, 67.98754448368474, 66.94521471250305, 65.72976953845168, 64.24722186117806, 62.273193913059, 60.142874127173144, 57.66216712379371, 54.67249586058494, 51.07986330255844, 47.77405398448237, 43.37192954455833, 37.82579192003446, 31.201641773191376], [69.22661485109784, 69.98962830359733, 70.58274783100677, 70.96979966407079, 71.20043988413184, 71.3032048451359, 71.26973369277708, 71.12422421578654, 70.85832152031165, 70.43954365252809, 69.89367593970981, 69.14511083179211, 68.13612588173305, 66.95415675580149, 65.5076950792146, 63.57660318567632, 61.489393864729834, 59.056518360823034, 56.1237036704511, 52.60014974155594, 49.34045251991908, 45.0225334725949, 39.599297644529855, 33.14775753038264], [70.26964492474347, 71.05445778641271, 71.66637792381263, 72.06784758954922, 72.31118503798598, 72.42695371251929, 72.40619403644546, 72.27586842055698, 72.02915458837683, 71.63466072112608, 71.1152913918306, 70.39728538945047, 69.42293366247603, 68.27547197791675, 66.86595061827781, 64.97857400661027, 62.934948950018644, 60.55015854736345, 57.67410331953784, 54.21902068489303, 51.006706954423365, 46.771896518912115, 41.468248231282786, 35.183344081982696], [71.36151241147671, 72.16894454369928, 72.80137522230562, 73.21950233315005, 73.47814924675725, 73.60994616627791, 73.60440423176944, 73.491261900053, 73.26509150865382, 72.8954306904685, 72.40235901217825, 71.7141367422368, 70.77317124868438, 69.65880989992218, 68.28466952724638, 66.4392021987352, 64.43743253586139, 62.09892164864523, 59.277587876423034, 55.8885994697092, 52.72284704646002, 48.56862654255134, 43.380447237332405, 37.25631344565335], [72.49586944048554, 73.32705793201798, 73.98216385715419, 74.41969896191404, 74.69681363287033, 74.84821173787316, 74.86072928678638, 74.76684666283799, 74.56230655554597, 74.21736753947341, 73.74946975559934, 73.08906567892271, 72.17884421095837, 71.09477899065595, 69.75300926778704, 67.94599552574252, 65.98282940123087, 63.68723391099489, 60.91692599534539, 57.58988097683178, 54.468008575655915, 50.38992062952666, 45.31100476015439, 39.33950751689519], [73.6772543162162, 74.53601252815221, 75.21863847297398, 75.68073051693864, 75.98168476784434, 76.15847217474948, 76.19359345126557, 76.12239776927743, 75.94157979584851, 75.62183329633082, 75.17813539730815, 74.54339002778215, 73.66069906396515, 72.6032852173603, 71.28969363407626, 69.51595693862383, 67.58607867707708, 65.3274263259173, 62.60097783520577, 59.32710153268686, 56.243287239248396, 52.23051457833055, 47.244944883476236, 41.4034970932143], [74.86889882796608, 75.75871365575591, 76.4734387452753, 76.96501007032771, 77.29493370398593, 77.50248502706054, 77.56414547412739, 77.51812925828582, 77.36173436348497, 77.06577111325436, 76.64319076485809, 76.0294843304661, 75.16838935102659, 74.13134550820237, 72.83909232000319, 71.09056170993483, 69.18616179927737, 66.9561415191944, 64.2642325700652, 61.032920553701935, 57.97880030095968, 54.019417216178994, 49.11163025534259, 43.380451343675034], [76.05417398670924, 76.98014592270906, 77.73288594291161, 78.25979089766838, 78.62444167929658, 78.86849491787797, 78.96069310347644, 78.94219803648276, 78.81057678035503, 78.53643227416086, 78.13118751536224, 77.5329784290665, 76.68636743624619, 75.66209971845562, 74.3828265016363, 72.64951524272709, 70.76084423133176, 68.54901265832576, 65.87991526739721, 62.67786202630431, 59.64237765406164, 55.721448754590064, 50.872533832057584, 45.22836967071783], [77.18180284014834, 78.15194037307813, 78.95095719861429, 79.52060577197022, 79.92880260078256, 80.21603909460849, 80.34314133875486, 80.35449302677557, 80.24766208568323, 79.9926796214264, 79.59999913182133, 79.0103329865054, 78.16911986571253, 77.14769030470241, 75.87012775183445, 74.13814008557605, 72.25114661392229, 70.04197258904435, 67.37765959026368, 64.18373096698456, 61.14970352882398, 57.242383595776985, 52.41960920446647, 46.820437954645094], [78.21715416921093, 79.23982850231897, 80.09303126034212, 80.71190771290277, 81.16460154099599, 81.49805672955848, 81.66098430896206, 81.70125208662141, 81.62207347933382, 81.38171310323698, 80.99544228409488, 80.4061692976369, 79.56014665835946, 78.53055052317018, 77.24230048942238, 75.49637975693314, 73.59573589006357, 71.37239331365338, 68.693585166706, 65.48556667399035, 62.43378117799091, 58.5145293101807, 53.68583612232369, 48.0927906601689], [79.15001628445961, 80.23330178967433, 81.14819978686656, 81.82056236063856, 82.32217067434541, 82.70281555231938, 82.90053040504333, 82.96697209052206, 82.89940726146875, 82.666285524605, 82.27828479749337, 81.6797170314444, 80.81742307201867, 79.76760573443667, 78.46278928129325, 76.68609548018857, 74.75484584066197, 72.49867908674271, 69.78399929391067, 66.53731149502221, 63.44593193424461, 59.48653810035833, 54.61713600334296, 48.98904612641747], [79.8386158242032, 80.98631339057658, 81.96585485284687, 82.69745113568979, 83.25718189089527, 83.69473129925863, 83.93592704625269, 84.03601194984563, 83.99125450196021, 83.76801415975343, 83.3770794065576, 82.76428916589961, 81.87693187749912, 80.79569286795056, 79.44527552002674, 77.62027881888919, 75.6401018726555, 73.33046055859249, 70.55577802016805, 67.24220300603066, 64.09101720801628, 60.057796488132965, 55.105420539679145, 49.39127149786022], [80.40873497079103, 81.62130323478928, 82.6633015740412, 83.44778914483729, 84.05139418042586, 84.53654524129806, 84.80826019582005, 84.92773584118935, 84.8905198163368, 84.66143505041615, 84.2530899374575, 83.61117558299703, 82.68300884082998, 81.55499477956495, 80.15021196253991, 78.25695195647926, 76.20793096035328, 73.82290549334708, 70.96297322364735, 67.55321756253507, 64.30741713848442, 60.167467071031815, 55.09051855720104, 49.239778713795545], [80.99125012790353, 82.2585491964361, 83.34645621638995, 84.16319107892568, 84.78812113040354, 85.29383433345637, 85.57244834462315, 85.68756602935501, 85.63445083083548, 85.37725441064566, 84.93259008972825, 84.24351731380071, 83.25682326680706, 82.06574050255267, 80.5899311817474, 78.60907696941217, 76.47240918672546, 73.99165466645616, 71.02337229029611, 67.49100048466423, 64.13143586237483, 59.853095838182185, 54.61267648151843, 48.579874701323085], [81.65270031976375, 82.95242801601881, 84.0563440590492, 84.87406678075959, 85.48305780280357, 85.97552274991199, 86.23233026511957, 86.31483188414362, 86.21846139019706, 85.90776753981912, 85.40584775554983, 84.65032199231635, 83.58683529846223, 82.31643289216144, 80.75339599109725, 78.66640150085763, 76.42626594282169, 73.82943982942326, 70.72978012150071, 67.04849745899587, 63.551549638672256, 59.106236995027416, 53.667822475713656, 47.41225067612056], [82.42333041251666, 83.72303619072767, 84.80417356456562, 85.57539029409122, 86.12076567381399, 86.5701788615906, 86.77536588576922, 86.79593064375426, 86.62806338392792, 86.2380943466292, 85.65831480673523, 84.81816293928999, 83.66548420526092, 82.30094869542533, 80.63619906871062, 78.42663342298775, 76.0630174253566, 73.33504487047462, 70.08669119952465, 66.23638407400874, 62.584543286224196, 57.94795570302887, 52.28065958966174, 45.76502571334136], [83.28586269950776, 84.55083485349506, 85.56407141838397, 86.2461608620072, 86.67969389799268, 87.05766955964263, 87.18541072089103, 87.11844120043496, 86.85906813501724, 86.36750386318683, 85.69257453161221, 84.75329747384765, 83.49118400918584, 82.02427394960404, 80.25017733045789, 77.9094562554929, 75.4159315976042, 72.54627764410752, 69.1368761687683, 65.10291277450497, 61.28403708954525, 56.438731845109295, 50.5196120255103, 43.71472877775686], [84.24234044783445, 85.44070332355467, 86.34909141743339, 86.901038447266, 87.17761137596206, 87.46005007106632, 87.491819468769, 87.31553247845213, 86.93431239429503, 86.32314168665118, 85.54031545391561, 84.49247871273728, 83.11791934768364, 81.54246111593734, 79.6528838463287, 77.17360051902457, 74.54252714563398, 71.52258717899856, 67.94205610737627, 63.7126290542237, 59.716655163268854, 54.648846198777285, 48.460288979484346, 41.344559942183025], [85.21618300547665, 86.32370070829708, 87.09853297130167, 87.49141969560992, 87.57782660176771, 87.74636542731871, 87.65979430215287, 87.35955980251525, 86.84881986187655, 86.1091395430856, 85.21378375310881, 84.05534565279352, 82.56748826960076, 80.88250844008483, 78.87547823581693, 76.25415355928583, 73.4812272000954, 70.30579066464054, 66.5477921753705, 62.11529675651255, 57.93620537072785, 52.63681737716681, 46.1666027995853, 38.724394613552164], [86.11674645174696, 87.11765044322425, 87.74252685558444, 87.95601011322132, 87.83402006624492, 87.8745162123499, 87.6632850454442, 87.23331166062381, 86.59175763992862, 85.72713000296316, 84.72559159638041, 83.46388197174326, 81.86893596811828, 80.07791974313776, 77.9546504710758, 75.1907455816564, 72.27430802051104, 68.941033079879, 65.00253207176223, 60.363152231778514, 55.998539892072266, 50.46277475364035, 43.70362834778108, 35.92514000629051], [86.87093811330483, 87.75677255882206, 88.22269509014461, 88.25297347866936, 87.92014176106109, 87.82264717555248, 87.48282282360024, 86.92581990967845, 86.16345863015233, 85.18978229171799, 84.09827441291023, 82.74772826950954, 81.05604026731078, 79.16445256918934, 76.92749178024043, 74.02202922066544, 70.96222954671316, 67.47098024148036, 63.351602188171114, 58.504612422557116, 53.95497701300577, 48.18151255761302, 41.13021869100203, 33.01110306814846], [87.43573169465114, 88.20270308306681, 88.50977051743045, 88.36022149839174, 87.82543281856073, 87.58410830642762, 87.11745435583512, 86.44428627776144, 85.58105462010916, 84.52345772247932, 83.36368291234106, 81.94087147031209, 80.1626415964188, 78.17531821132468, 75.82710156612697, 72.7818211746185, 69.58011047005985, 65.93246498997976, 61.633904717646324, 56.58094976396312, 51.84896111501008, 45.839092640357634, 38.495514651045035, 30.036811592648345], [87.80422064151534, 88.45187595972217, 88.60357345689738, 88.28259789180518, 87.56156947901404, 87.17505705674007, 86.58887297632823, 85.81714326728533, 84.87930857281695, 83.76604279807374, 82.55866210881587, 81.07667665947126, 79.21843101634097, 77.13808728200854, 74.6803563530011, 71.49736307895171, 68.15610570966382, 64.35482136625257, 59.880148446226215, 54.624417543351804, 49.71408439851412, 43.47080624110282, 35.83688659388079, 27.045871576510358], [87.9893690367978, 88.51920620070693, 88.52123576952633, 88.03978175662373, 87.15167768790153, 86.62381925481996, 85.93104560779992, 85.08358821239446, 84.09972252082864, 82.95625053557441, 81.71603520105757, 80.18177477679744, 78.2457794522175, 76.07338956607954, 73.50761060358026, 70.18952795657549, 66.71184323798023, 62.76050988042911, 58.11369155747127, 52.6593522340761, 47.575492386536986, 41.10287230064381, 33.18190841442377, 24.074703389849258], [88.01614595255498, 88.43085306733677, 88.28999101787568, 87.65999186399512, 86.62513344015643, 85.96483275614307, 85.1831123305135, 84.28529526914863, 83.28164053472797, 82.12602261990071, 80.85983550644355, 79.27427386393612, 77.25982273423102, 74.99559872613173, 72.32337610609095, 68.8732849698094, 65.26271760289775, 61.16530775756628, 56.35068700116149, 50.702314936105566, 45.450014990631615, 38.7525971427163, 30.548582283406724, 21.155619381170567], [87.91191358140165, 88.21536025072652, 87.9393564981615, 87.17339338868031, 86.01236985205993, 85.23323682621891, 84.38341971047733, 83.4599932578317, 82.4566728358179, 81.29782123799784, 80.00571573226523, 78.36627683600312, 76.27181318967243, 73.91637084079845, 71.1399993183907, 67.56169338155728, 63.82232791498374, 59.58329164628566, 54.60569050171658, 48.768380967323594, 43.35315022169041, 36.43606163551004, 27.953740097191513, 18.32988930473161], [87.70348037630102, 87.90104493496719, 87.4989437283174, 86.6103446057094, 85.34353062330644, 84.46291894843262, 83.56678617344686, 82.6386234357429, 81.64754002471764, 80.48630983943353, 79.16440519358343, 77.46776741976485, 75.2927075244649, 72.8479496209673, 69.97090669338584, 66.26930274498775, 62.40613586869045, 58.03080583746229, 52.89597547042575, 46.87582846282125, 41.30411741406518, 34.17356199714684, 25.418897186482074, 15.65827364075412], [87.42031188199473, 87.51676751976775, 86.99638909290132, 85.99666821476839, 84.64168552568691, 83.67715005663932, 82.75431159670936, 81.8364779146273, 80.86204981940892, 79.69416018268214, 78.3370020479268, 76.57992689483206, 74.32404459182676, 71.79185059201137, 68.81719748512627, 64.99643844856433, 61.01360413013545, 56.50636411644493, 51.21902552217077, 45.02105310127996, 39.298143023637365, 31.959233637002058, 22.937176423453405, 13.192021458680966], [87.08349425248421, 87.08412188491438, 86.45343079518673, 85.35360886468288, 83.92634491639411, 82.89540889977089, 81.96239414161737, 81.06392577314686, 80.10484908940833, 78.92369944340754, 77.52628885184447, 75.70686543477368, 73.3711339946014, 70.75410911364821, 67.6853462615517, 63.74988764092635, 59.65173904802775, 55.017176808655904, 49.582268823231594, 43.21172746252749, 37.34310127160679, 29.80122695308482, 20.51708130364842, 11.014226909675306]]}}
\ No newline at end of file
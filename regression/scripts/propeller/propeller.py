@@ -1,6 +1,7 @@
 # propeller.py
 # 
 # Created:  E. Botero, Sep 2014
+# Modified: Oct 2026, SUAVE Team
 
 #----------------------------------------------------------------------
 #   Imports
@@ -79,6 +80,24 @@ def main():
     
     for k,v in list(error.items()):
         assert(np.abs(v)<1e-6)
+        
+    # Each control point is iterated until it converges on its own
+    assert(np.all(conditions.propulsion.propeller_convergence.converged))
+    
+    conditions.freestream.update(atmosphere.compute_values(np.array([[0.],[3000.]])))
+    conditions.frames.inertial.velocity_vector   = np.array([[V,0,0],[10.,0,0]])
+    conditions.propulsion.throttle               = np.array([[1.0],[1.0]])
+    conditions.frames.body.transform_to_inertial = np.array([np.eye(3),np.eye(3)])
+    prop.inputs.omega                            = np.array([[prop_attributes.angular_velocity],[1500.*Units.rpm]])
+    
+    F2, Q2, P2, Cplast2 = prop.spin(conditions)
+    
+    convergence = conditions.propulsion.propeller_convergence
+    print('Newton iterations:',convergence.iterations[:,0])
+    
+    assert(np.all(convergence.converged))
+    assert(np.abs(F2[0,0]-F[0,0])<1e-12)
+    assert(np.abs(P2[0,0]-P[0,0])<1e-12)
      
     return
 
@@ -1,7 +1,7 @@
 # propulsion_surrogate.py
 #
 # Created:  Jun 2017, E. Botero
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
 #----------------------------------------------------------------------
 #   Imports
@@ -56,6 +56,27 @@ def main():
     
     for k,v in list(error.items()):
         assert(np.abs(v)<1e-6)
+        
+    # Several points are evaluated at once, the same as one at a time
+    state.conditions.freestream.mach_number = np.array([[0.4],[0.3],[0.7]])
+    state.conditions.freestream.altitude    = np.array([[2500.],[0.],[6000.]])
+    state.conditions.propulsion.throttle    = np.array([[0.75],[0.6],[0.95]])
+    
+    results = propulsion.evaluate_thrust(state)
+    assert(np.abs(results.thrust_force_vector[0,0]-F_truth[0,0])/F_truth[0,0] < 1e-6)
+    assert(results.vehicle_mass_rate.shape == (3,1))
+    
+    # The interpolant goes through the points of the deck
+    propulsion.surrogate_type = 'linear'
+    propulsion.build_surrogate()
+    
+    state.conditions.freestream.mach_number = np.array([[0.2],[0.3],[0.7]])
+    state.conditions.freestream.altitude    = np.array([[0.],[3000.],[6000.]])
+    state.conditions.propulsion.throttle    = np.array([[0.4],[0.8],[0.95]])
+    
+    results = propulsion.evaluate_thrust(state)
+    F_deck  = np.array([1000.,1000.,1300.])
+    assert(np.all(np.abs(results.thrust_force_vector[:,0]-F_deck) < 1e-6))
      
     return
 
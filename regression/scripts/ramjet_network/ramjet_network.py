@@ -2,7 +2,7 @@
 # 
 # Created:  Sep 2017, P. Goncalves
 # Modified: Jan 2018, W. Maier
-#        
+#           Oct 2026, SUAVE Team
 
 """ create and evaluate a ramjet network
 """
@@ -18,6 +18,9 @@ import numpy as np
 
 from SUAVE.Components.Energy.Networks.Ramjet import Ramjet
 from SUAVE.Methods.Propulsion.ramjet_sizing import ramjet_sizing
+from SUAVE.Methods.Propulsion import fm_id, fm_solver, rayleigh, mach_area
+from SUAVE.Methods.Propulsion.rayleigh_function import rayleigh_function
+from SUAVE.Methods.Propulsion.gas_dynamics_tables import gas_dynamics_table
 
 # ----------------------------------------------------------------------
 #   Main
@@ -26,7 +29,13 @@ from SUAVE.Methods.Propulsion.ramjet_sizing import ramjet_sizing
 def main():
     
     # call the network function
-    energy_network()    
+    ramjet = energy_network()    
+    
+    # evaluate several points at once
+    multi_point(ramjet)
+    
+    # check the compressible flow solvers
+    compressible_flow_solvers()
 
     return
 
@@ -241,6 +250,139 @@ def energy_network():
     for k,v in list(error.items()):
         assert(np.abs(v)<1e-6)    
     
+    return ramjet
+
+# ----------------------------------------------------------------------
+#   Multi Point
+# ----------------------------------------------------------------------
+
+def multi_point(ramjet):
+    """ evaluates the sized ramjet at several Mach numbers at once and
+        compares the results with the ones of each point on its own
+    """
+    
+    mach_numbers = np.array([1.5,2.0,2.5,3.0])
+    
+    results = ramjet(setup_state(mach_numbers,10000.))
+    assert(np.all(ramjet.combustor.outputs.converged))
+    
+    for i, mach_number in enumerate(mach_numbers):
+        results_point = ramjet(setup_state(np.array([mach_number]),10000.))
+        
+        thrust_error  = (results.thrust_force_vector[i,0] - results_point.thrust_force_vector[0,0])/results_point.thrust_force_vector[0,0]
+        Isp_error     = (results.specific_impulse[i,0] - results_point.specific_impulse[0,0])/results_point.specific_impulse[0,0]
+        print('Mach', mach_number, 'thrust error :', thrust_error, 'Isp error :', Isp_error)
+        
+        assert(np.abs(thrust_error)<1e-12)
+        assert(np.abs(Isp_error)<1e-12)
+        
+    # the same points, with the solvers started from the gas dynamics tables
+    ramjet.combustor.gas_dynamics_tables   = True
+    ramjet.core_nozzle.gas_dynamics_tables = True
+    results_tables = ramjet(setup_state(mach_numbers,10000.))
+    ramjet.combustor.gas_dynamics_tables   = False
+    ramjet.core_nozzle.gas_dynamics_tables = False
+    
+    thrust_error = np.max(np.abs(results_tables.thrust_force_vector[:,0] - results.thrust_force_vector[:,0])/results.thrust_force_vector[:,0])
+    print('gas dynamics tables thrust error :', thrust_error)
+    assert(np.all(ramjet.combustor.outputs.converged))
+    assert(thrust_error<1e-10)
+        
+    return
+
+def setup_state(mach_numbers,altitude):
+    """ sets up the freestream conditions of a column of Mach numbers
+    """
+    
+    ones_1col = np.ones([len(mach_numbers),1])
+    
+    conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    conditions.expand_rows(len(mach_numbers))
+    
+    free                             = conditions.freestream
+    free.mach_number                 = mach_numbers[:,None]
+    conditions.M                     = free.mach_number
+    free.altitude                    = ones_1col*altitude
+    
+    atmosphere                       = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    atmo_data                        = atmosphere.compute_values(free.altitude,0,True)
+    planet                           = SUAVE.Attributes.Planets.Earth()
+    working_fluid                    = SUAVE.Attributes.Gases.Air()
+    
+    free.pressure                    = ones_1col*atmo_data.pressure
+    free.temperature                 = ones_1col*atmo_data.temperature
+    free.density                     = ones_1col*atmo_data.density
+    free.dynamic_viscosity           = ones_1col*atmo_data.dynamic_viscosity
+    free.gravity                     = ones_1col*planet.compute_gravity(free.altitude)
+    free.isentropic_expansion_factor = working_fluid.compute_gamma(free.temperature,free.pressure)
+    free.Cp                          = working_fluid.compute_cp(free.temperature,free.pressure)
+    free.R                           = working_fluid.gas_specific_constant
+    free.speed_of_sound              = ones_1col*atmo_data.speed_of_sound
+    free.velocity                    = conditions.M * free.speed_of_sound
+    conditions.velocity              = conditions.M * free.speed_of_sound
+    conditions.q                     = 0.5*free.density*conditions.velocity**2
+    conditions.g0                    = free.gravity
+    
+    conditions.propulsion.throttle   = ones_1col*1.0
+    
+    state            = Data()
+    state.numerics   = Data()
+    state.conditions = conditions
+    
+    return state
+
+# ----------------------------------------------------------------------
+#   Compressible Flow Solvers
+# ----------------------------------------------------------------------
+
+def compressible_flow_solvers():
+    """ checks the residuals, branches and convergence flags of the
+        area-Mach and Rayleigh solvers over many random points
+    """
+    
+    n     = 10000
+    rand  = np.random.RandomState(0)
+    ar    = rand.uniform(1.05,5.,n)
+    M0    = rand.uniform(0.05,3.,n)
+    gamma = rand.uniform(1.15,1.4,n)
+    
+    # area-Mach relation, each point stays on the branch of M0
+    M1, converged = fm_solver(ar,M0,gamma,full_output=True)
+    assert(np.all(converged))
+    assert(np.all((M1 < 1.) == (M0 < 1.)))
+    assert(np.max(np.abs(fm_id(M0,gamma)/fm_id(M1,gamma) - ar)/ar) < 1e-10)
+    
+    # isentropic area ratios to the throat, for a column of points
+    Me, converged = mach_area(ar[:,None],gamma[:,None],False,full_output=True)
+    assert(Me.shape == (n,1) and np.all(converged))
+    assert(np.max(np.abs(1./fm_id(Me,gamma[:,None]) - ar[:,None])/ar[:,None]) < 1e-10)
+    
+    # Rayleigh flow, heated up to at most thermal choking
+    F0, _  = rayleigh_function(M0,gamma)
+    F1, _  = rayleigh_function(1.,gamma)
+    TtR    = 1. + rand.uniform(0.,1.,n)*(F1/F0 - 1.)
+    TtR[0] = F1[0]/F0[0]
+    M1, Ptr, converged = rayleigh(gamma,M0,TtR,full_output=True)
+    assert(np.all(converged))
+    assert(np.all((M1[1:] <= 1.) == (M0[1:] <= 1.)))
+    assert(np.abs(M1[0] - 1.) < 1e-6)
+    assert(np.max(np.abs(rayleigh_function(M1,gamma)[0]/F0 - TtR)/TtR) < 1e-10)
+    
+    # the same solutions from the gas dynamics tables
+    assert(np.max(np.abs(rayleigh(gamma,M0,TtR,tables=True)[0] - M1)) < 1e-8)
+    assert(np.max(np.abs(fm_solver(ar,M0,gamma,tables=True) - fm_solver(ar,M0,gamma))) < 1e-10)
+    
+    # the measured errors of the tables
+    for relation in ['area_ratio','rayleigh']:
+        for subsonic in [True,False]:
+            table = gas_dynamics_table(relation,1.4,subsonic)
+            print(relation, 'subsonic' if subsonic else 'supersonic', 'table errors :', table.error_bound, table.inverse_error_bound)
+            assert(table.error_bound < 1e-6 and table.inverse_error_bound < 1e-5)
+    
+    # heating past thermal choking has no solution
+    M1, Ptr, converged = rayleigh(gamma[:10],M0[:10],1.01*F1[:10]/F0[:10],full_output=True)
+    assert(not np.any(converged))
+    
     return
     
 if __name__ == '__main__':
@@ -2,6 +2,7 @@
 #
 # Created:  Jun 2015, SUAVE Team
 # Modified: Jan 2018, W. Maier
+#           Oct 2026, SUAVE Team
 
 """ setup file for a sizing loop with a 737-aircraft
 """
@@ -28,6 +29,7 @@ from SUAVE.Optimization.Nexus import Nexus
 from SUAVE.Sizing.write_sizing_residuals import write_sizing_residuals
 from SUAVE.Sizing.read_sizing_residuals import read_sizing_residuals
 from SUAVE.Sizing.write_sizing_outputs import write_sizing_outputs
+from SUAVE.Sizing.read_sizing_inputs import read_sizing_inputs
 
 import sys, os
 sys.path.append('../noise_optimization') #import structure from noise_optimization
@@ -72,6 +74,11 @@ def main():
     err_true = 0.0008433474527249522 #for 1E-2 tol
     error    = abs((err-err_true)/err_true)
 
+    #the sizing data kept in memory matches the file
+    surrogate = sizing_loop.surrogate
+    data_inputs, data_outputs, read_success = read_sizing_inputs(sizing_loop, problem.inputs)
+    assert np.all(surrogate.inputs == data_inputs) and np.all(surrogate.outputs == data_outputs), 'sizing surrogate io failed'
+    
     data_inputs, data_outputs, read_success = read_sizing_residuals(sizing_loop, problem.inputs)
     check_read_res = -0.06803060191281879
 
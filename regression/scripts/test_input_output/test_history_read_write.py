@@ -0,0 +1,135 @@
+# test_history_read_write.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import os
+import time
+import numpy as np
+
+from SUAVE.Sizing import Sizing_Loop, write_sizing_outputs, read_sizing_inputs
+from SUAVE.Optimization import read_optimization_outputs
+from SUAVE.Input_Output.SUAVE import append_history, read_history, read_any_history, convert_text_history, is_history
+
+# ----------------------------------------------------------------------
+#   The Test
+# ----------------------------------------------------------------------
+
+def main():
+
+    sizing_history()
+    optimization_history()
+    read_benchmark()
+
+    return
+
+def sizing_history():
+
+    sizing_loop                 = Sizing_Loop()
+    sizing_loop.output_filename = 'sizing_history.txt'
+    sizing_loop.default_y       = np.array([1.,1.])
+    remove(sizing_loop.output_filename)
+
+    points  = np.random.RandomState(0).uniform(0.,10.,(20,4))
+    for point in points[:10]:
+        write_sizing_outputs(sizing_loop, point[2:], [point[0], point[1]])
+    text_inputs, text_outputs, read_success = read_sizing_inputs(sizing_loop, [1.,1.])
+    assert read_success and not is_history(sizing_loop.output_filename)
+
+    # the text values round trip
+    assert np.all(text_inputs == points[:10,:2]) and np.all(text_outputs == points[:10,2:])
+
+    # converted in place, later points are appended in binary
+    convert_text_history(sizing_loop.output_filename)
+    assert is_history(sizing_loop.output_filename)
+    sizing_loop.surrogate.load(sizing_loop, [1.,1.])
+    for point in points[10:]:
+        write_sizing_outputs(sizing_loop, point[2:], [point[0], point[1]])
+
+    data_inputs, data_outputs, read_success = read_sizing_inputs(sizing_loop, [1.,1.])
+    assert np.all(data_inputs == points[:,:2]) and np.all(data_outputs == points[:,2:])
+
+    # the sizing data in memory followed the file
+    assert np.all(sizing_loop.surrogate.outputs == points[:,2:])
+
+    # a partial last row is not read
+    with open(sizing_loop.output_filename,'ab') as file:
+        file.write(b'\0'*12)
+    assert len(read_history(sizing_loop.output_filename)) == len(points)
+
+    remove(sizing_loop.output_filename)
+
+    return
+
+def optimization_history():
+
+    filename = 'optimization_history.txt'
+    remove(filename)
+
+    # legacy text lines, as written by write_optimization_outputs
+    lines = ['iteration = 1 , objective = 2.5, inputs = [1.0, 2.0], constraints = [-0.5]\n',
+             'iteration = 2 , objective = 2.25, inputs = [1.5, 2.0], constraints = [1e-05]\n',
+             'iteration = 3 , objective = 2.125, inputs = [np.float64(1.75), 2.0], constraints = [0.0]\n']
+    with open(filename,'w') as file:
+        file.writelines(lines)
+
+    base_inputs      = np.zeros((2,4))
+    base_constraints = np.zeros((1,4))
+    text_results     = read_optimization_outputs(filename, base_inputs, base_constraints)
+
+    convert_text_history(filename)
+    binary_results   = read_optimization_outputs(filename, base_inputs, base_constraints)
+
+    for text_values, binary_values in zip(text_results, binary_results):
+        assert np.all(text_values == binary_values)
+    assert np.all(binary_results[2][:,0] == [1.,1.5,1.75])
+    assert np.all(binary_results[3][:,0] == [-0.5,1e-5,0.])
+
+    remove(filename)
+
+    return
+
+def read_benchmark():
+
+    rows = np.random.RandomState(1).uniform(0.,1.,(50000,6))
+
+    text_file   = 'history_benchmark.txt'
+    binary_file = 'history_benchmark.hist'
+    remove(text_file)
+    remove(binary_file)
+
+    with open(text_file,'w') as file:
+        for row in rows:
+            file.write(str(row[:4].tolist()) + ' ' + str(row[4:].tolist()) + '\n')
+    append_history(binary_file, rows)
+
+    t0          = time.time()
+    text_rows   = read_any_history(text_file)
+    t1          = time.time()
+    binary_rows = read_any_history(binary_file)
+    t2          = time.time()
+
+    print('text history read time   (50k rows) : ' + str(t1-t0) + ' s')
+    print('binary history read time (50k rows) : ' + str(t2-t1) + ' s')
+
+    assert np.all(text_rows == rows) and np.all(binary_rows == rows)
+
+    remove(text_file)
+    remove(binary_file)
+
+    return
+
+def remove(filename):
+    if os.path.exists(filename):
+        os.remove(filename)
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
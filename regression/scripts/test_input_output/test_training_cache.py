@@ -0,0 +1,196 @@
+# test_training_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified: Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import os
+import sys
+import shutil
+import tempfile
+import subprocess
+import numpy as np
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Input_Output.SUAVE.training_cache import hash_data, file_key
+
+sys.path.append('../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Counted Analysis
+# ----------------------------------------------------------------------
+
+class Counted_Vortex_Lattice(SUAVE.Analyses.Aerodynamics.Vortex_Lattice):
+    """Vortex lattice analysis that counts how often it is trained"""
+
+    trainings = 0
+
+    def sample_training(self):
+        Counted_Vortex_Lattice.trainings += 1
+        SUAVE.Analyses.Aerodynamics.Vortex_Lattice.sample_training(self)
+
+# ----------------------------------------------------------------------
+#   The Test
+# ----------------------------------------------------------------------
+
+def main():
+
+    directory = tempfile.mkdtemp(prefix='training_cache_')
+
+    try:
+        cache_hits_and_misses(directory)
+        unhashable_values(directory)
+        training_files(directory)
+        key_stability()
+    finally:
+        shutil.rmtree(directory)
+
+    return
+
+def cache_hits_and_misses(directory):
+
+    angles = np.linspace(-4.,8.,13)[:,None] * Units.deg
+
+    # a miss trains and writes one entry, without leaving temporary files behind
+    first = initialized_analysis(vehicle_setup(),directory)
+    assert Counted_Vortex_Lattice.trainings == 1
+    assert len(cache_entries(directory)) == 1
+    assert not [ name for name in os.listdir(directory) if name.endswith('.tmp') ]
+
+    # the same geometry, built again, is a hit returning identical data
+    second = initialized_analysis(vehicle_setup(),directory)
+    assert Counted_Vortex_Lattice.trainings == 1
+    assert len(cache_entries(directory)) == 1
+    assert np.all(second.training.lift_coefficient == first.training.lift_coefficient)
+    assert np.all(second.surrogates.lift_coefficient(angles) == first.surrogates.lift_coefficient(angles))
+    for wing in first.geometry.wings.keys():
+        assert np.all(second.surrogates.wing_lift_coefficients[wing](angles) ==
+                      first.surrogates.wing_lift_coefficients[wing](angles))
+
+    # a changed geometry is a miss, with its own entry
+    vehicle = vehicle_setup()
+    vehicle.wings.main_wing.sweeps.quarter_chord += 5. * Units.deg
+    changed = initialized_analysis(vehicle,directory)
+    assert Counted_Vortex_Lattice.trainings == 2
+    assert len(cache_entries(directory)) == 2
+    assert not np.all(changed.training.lift_coefficient == first.training.lift_coefficient)
+
+    # as are changed settings
+    vehicle  = vehicle_setup()
+    analysis = Counted_Vortex_Lattice()
+    analysis.geometry = vehicle
+    analysis.settings.number_panels_spanwise = 10
+    analysis.training_cache_directory = directory
+    analysis.initialize()
+    assert Counted_Vortex_Lattice.trainings == 3
+    assert len(cache_entries(directory)) == 3
+
+    # an unreadable entry is a miss, and is written again in full
+    for name in cache_entries(directory):
+        with open(os.path.join(directory,name),'wb') as file:
+            file.write(b'partial')
+    again = initialized_analysis(vehicle_setup(),directory)
+    assert Counted_Vortex_Lattice.trainings == 4
+    assert np.all(again.training.lift_coefficient == first.training.lift_coefficient)
+    initialized_analysis(vehicle_setup(),directory)
+    assert Counted_Vortex_Lattice.trainings == 4
+
+    # without a directory, nothing is cached
+    analysis = Counted_Vortex_Lattice()
+    analysis.geometry = vehicle_setup()
+    analysis.initialize()
+    assert Counted_Vortex_Lattice.trainings == 5
+
+    return
+
+def unhashable_values(directory):
+
+    # values that can not be hashed are an error, not a key made of their type name
+    for value in [ lambda x: x, object(), {'solver':len} ]:
+        try:
+            hash_data({'a':1.,'b':value})
+        except TypeError:
+            pass
+        else:
+            raise AssertionError('an unhashable value was hashed')
+
+    # and the analysis is trained without being cached
+    entries   = cache_entries(directory)
+    trainings = Counted_Vortex_Lattice.trainings
+    for ii in range(2):
+        analysis = Counted_Vortex_Lattice()
+        analysis.geometry = vehicle_setup()
+        analysis.settings.model_fuselage = lambda x: x
+        analysis.training_cache_directory = directory
+        analysis.initialize()
+    assert Counted_Vortex_Lattice.trainings == trainings + 2
+    assert cache_entries(directory) == entries
+
+    return
+
+def training_files(directory):
+
+    # a training file is identified by its contents, not its name
+    filename = os.path.join(directory,'training.txt')
+    copyname = os.path.join(directory,'copy.txt')
+    with open(filename,'w') as file:
+        file.write('0. 0.3 0.01\n')
+    with open(copyname,'w') as file:
+        file.write('0. 0.3 0.01\n')
+    key = file_key(filename)
+    assert file_key(copyname) == key
+
+    with open(filename,'w') as file:
+        file.write('0. 0.4 0.01\n')
+    assert file_key(filename) != key
+    assert hash_data('AVL_Inviscid',file_key(filename)) != hash_data('AVL_Inviscid',key)
+    assert file_key(None) is None
+
+    return
+
+def key_stability():
+
+    # the same key in a new interpreter, whatever its hash seed
+    key    = vehicle_key()
+    script = 'import sys; sys.path.append("../Vehicles"); import test_training_cache; print(test_training_cache.vehicle_key())'
+    for seed in ['0','1']:
+        environment = dict(os.environ,PYTHONHASHSEED=seed)
+        process = subprocess.run([sys.executable,'-c',script],cwd=os.path.dirname(os.path.abspath(__file__)),
+                                 env=environment,stdout=subprocess.PIPE,stderr=subprocess.PIPE,universal_newlines=True)
+        assert process.returncode == 0, process.stderr
+        assert process.stdout.split()[-1] == key
+
+    # the order the data is built in does not matter
+    assert hash_data({'a':1.,'b':np.ones(3)}) == hash_data({'b':np.ones(3),'a':1.})
+    assert hash_data({'a':1.}) != hash_data({'a':1.+1e-15})
+
+    return
+
+def vehicle_key():
+    """The cache key of the B737 wings, as the vortex lattice analysis builds it"""
+    vehicle  = vehicle_setup()
+    analysis = SUAVE.Analyses.Aerodynamics.Vortex_Lattice()
+    return hash_data(type(analysis).__name__,vehicle.wings,vehicle.reference_area,analysis.settings,
+                     analysis.training.angle_of_attack)
+
+def initialized_analysis(vehicle,directory):
+    analysis = Counted_Vortex_Lattice()
+    analysis.geometry = vehicle
+    analysis.training_cache_directory = directory
+    analysis.initialize()
+    return analysis
+
+def cache_entries(directory):
+    return sorted([ name for name in os.listdir(directory) if name.endswith('.pkl') ])
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
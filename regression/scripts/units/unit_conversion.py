@@ -0,0 +1,149 @@
+# unit_conversion.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import time
+import threading
+import numpy as np
+
+from SUAVE.Core import Units
+from SUAVE.Core.Units import Offset_Unit
+
+# units used across the vehicle and mission setups
+unit_names       = ['ft','inch','mile','nmi','lb','lbs','lbf','slug','deg','knots','hour','hr','min',
+                    'psi','kW','hp','gallon','kelvin','degR','m','kg','s']
+offset_names     = ['degF','degC']
+unit_expressions = ['miles/hour','slug/ft**3','ft**2','lb/hr','ft/s','kohm*cm**2']
+
+# ----------------------------------------------------------------------
+#   The Test
+# ----------------------------------------------------------------------
+
+def main():
+
+    conversions()
+    compound_expressions()
+    threaded_conversions()
+    throughput()
+
+    return
+
+def pint_conversion(value,expression):
+    """Converts in to the base units through the patched pint quantities"""
+    return value * Units.Quantity(1.,expression)
+
+def pint_inverse(value,expression):
+    """Converts out of the base units through the patched pint quantities"""
+    return value / Units.Quantity(1.,expression)
+
+def conversions():
+
+    values = np.array([-40.,0.,1.,3.5,100.,1234.5])
+
+    for name in unit_names + offset_names + unit_expressions:
+        factor = Units[name]
+        if name in offset_names:
+            assert isinstance(factor,Offset_Unit)
+        else:
+            assert isinstance(factor,float)
+
+        for value in values:
+            assert np.isclose(value*factor,pint_conversion(value,name),rtol=1e-13,atol=1e-12)
+            assert np.isclose(value/factor,pint_inverse(value,name),rtol=1e-13,atol=1e-12)
+
+        # arrays convert like their elements
+        assert np.allclose(values*factor,[ pint_conversion(value,name) for value in values ],rtol=1e-13,atol=1e-12)
+        assert np.allclose(values/factor,[ pint_inverse(value,name) for value in values ],rtol=1e-13,atol=1e-12)
+
+    # names resolve once, to the same factors as their expressions
+    for name in unit_names + offset_names:
+        assert getattr(Units,name) is Units[name]
+        assert name in vars(Units)
+
+    # the temperatures, to the degF offset of pint, 255.372222 K
+    assert np.isclose(100.*Units.degC,373.15)
+    assert np.isclose(212.*Units.degF,373.15)
+    assert np.isclose((32.*Units.degF)/Units.degC,0.,atol=1e-6)
+    assert np.isclose(-40.*Units.degF,-40.*Units.degC)
+
+    return
+
+def compound_expressions():
+
+    # built from names, or parsed by pint
+    assert np.isclose(Units.miles/Units.hour,Units['miles/hour'],rtol=1e-15)
+    assert np.isclose(Units.slug/Units.ft**3,Units['slug/ft**3'],rtol=1e-15)
+    assert np.isclose(.1*Units.mA/(Units.cm**2.),Units['0.1*mA/cm**2'],rtol=1e-15)
+
+    # offset units in compound expressions are left to pint, which rejects them
+    try:
+        Units['degF/s']
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('pint accepted an offset unit in a compound expression')
+
+    # explicit pint quantities keep their behavior
+    assert isinstance(Units.Quantity(1.,'ft')*Units.Quantity(1.,'ft'),Units.Quantity)
+
+    return
+
+def threaded_conversions():
+
+    names    = unit_names + offset_names
+    values   = np.linspace(1.,100.,1000)
+    serial   = [ [ value*Units[name] for value in values ] for name in names ]
+    results  = {}
+
+    def convert(index):
+        results[index] = [ [ value*Units[name] for value in values ] for name in names ]
+
+    threads = [ threading.Thread(target=convert,args=(index,)) for index in range(8) ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for index in range(8):
+        assert results[index] == serial
+
+    return
+
+def throughput():
+
+    count  = 20000
+    values = np.random.RandomState(0).uniform(0.,100.,count).tolist()
+
+    t0 = time.time()
+    pint_values = [ pint_conversion(value,'deg') for value in values ]
+    t1 = time.time()
+    factor_values = [ value*Units.deg for value in values ]
+    t2 = time.time()
+    temperatures = [ value*Units.degF for value in values ]
+    t3 = time.time()
+
+    pint_rate   = count/(t1-t0)
+    factor_rate = count/(t2-t1)
+    offset_rate = count/(t3-t2)
+
+    print('pint quantity conversions : ' + str(int(pint_rate)) + ' /s')
+    print('unit factor conversions   : ' + str(int(factor_rate)) + ' /s')
+    print('offset unit conversions   : ' + str(int(offset_rate)) + ' /s')
+
+    assert np.allclose(factor_values,pint_values,rtol=1e-15)
+    assert np.allclose(temperatures[:100],[ pint_conversion(value,'degF') for value in values[:100] ],rtol=1e-13)
+    assert factor_rate > pint_rate
+
+    return
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -7,6 +7,7 @@
 
 import SUAVE
 from SUAVE.Core import Units
+from SUAVE.Methods.Missions import evaluate_warm_started, store_unknowns
 
 from time import time
 
@@ -47,6 +48,20 @@ def main():
     print('landing weight error' , error_weight)
     assert error_weight < 1e-6
     
+    # a warm started re-solve, from a poor guess, comes back to the same answer
+    store_unknowns(mission)
+    mission.state.unknowns.cruise_distance = 0.
+    for segment in mission.segments.values():
+        segment.state.unknowns.throttle = 0. * segment.state.unknowns.throttle + 0.1
+    
+    results = evaluate_warm_started(mission)
+    results = results.merged()
+    
+    distance_warm = results.conditions.frames.inertial.position_vector[-1,0]
+    error_warm    = abs((distance_calc - distance_warm)/distance_calc)
+    print('warm start distance error' , error_warm)
+    assert error_warm < 1e-6
+    
     return
     
     
@@ -4,6 +4,7 @@
 # Created:  Apr 2017, M. Clarke 
 # Modified: Jan 2018, W. Maier
 #           Oct 2018, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -21,17 +22,17 @@ from SUAVE.Methods.Aerodynamics.AVL.write_geometry   import write_geometry
 from SUAVE.Methods.Aerodynamics.AVL.write_run_cases  import write_run_cases
 from SUAVE.Methods.Aerodynamics.AVL.write_input_deck import write_input_deck
 from SUAVE.Methods.Aerodynamics.AVL.run_analysis     import run_analysis
+from SUAVE.Methods.Aerodynamics.AVL.run_training_cases import run_training_cases
 from SUAVE.Methods.Aerodynamics.AVL.translate_data   import translate_conditions_to_cases, translate_results_to_conditions
 from SUAVE.Methods.Aerodynamics.AVL.purge_files      import purge_files
 from SUAVE.Methods.Aerodynamics.AVL.Data.Settings    import Settings
 from SUAVE.Methods.Aerodynamics.AVL.Data.Cases       import Run_Case
+from SUAVE.Input_Output.SUAVE.training_cache         import cached_training, file_key
+from SUAVE.Surrogate.Lookup_Table                    import build_lookup_tables
 
 # Package imports
 import time
-import pylab as plt
 import os
-import sklearn
-from sklearn import gaussian_process
 import numpy as np
 import sys
 from shutil import rmtree
@@ -96,9 +97,19 @@ class AVL_Inviscid(Aerodynamics):
         self.training.span_efficiency_factor = None
         self.training_file                   = None
         
+        # Number of AVL processes run at once for training, None runs them one at a time
+        self.training_processes              = None
+        
+        # Folder for training data reused between identical geometries, None disables it
+        self.training_cache_directory        = None
+        
         # Surrogate model
         self.surrogates                      = Data()
         
+        # Points of a dense [AoA, Mach] table interpolating the surrogates, None evaluates them directly
+        self.lookup_table_size               = None
+        self.lookup_tables                   = None
+        
         # Regression Status
         self.regression_flag                 = False
 
@@ -136,11 +147,15 @@ class AVL_Inviscid(Aerodynamics):
         else:
             self.settings.discretization.defaults.wing.chordwise_vortices = chordwise_vortices     
             
-        # Sample training data
-        self.sample_training()
-    
-        # Build surrogate
-        self.build_surrogate()
+        # Sample training data and build surrogate, or reuse them for an identical geometry
+        cached_training(self, geometry.tag, geometry.wings, geometry.fuselages, geometry.reference_area,
+                        geometry.mass_properties, self.settings.discretization, self.settings.flow_symmetry,
+                        self.settings.number_control_surfaces, self.training.angle_of_attack,
+                        self.training.Mach, file_key(self.training_file))
+        
+        # Tabulate the surrogates for missions
+        if self.lookup_table_size is not None:
+            self.lookup_tables = build_lookup_tables(self.surrogates,self.training.grid_points,self.lookup_table_size)
 
         return
 
@@ -168,10 +183,13 @@ class AVL_Inviscid(Aerodynamics):
           lift_coefficient       [-] CL
           drag_coefficient       [-] CD
           span_efficiency_factor [-] e
+        self.lookup_tables (optional, used instead of the surrogates)
           
         """  
         # Unpack
         surrogates    = self.surrogates        
+        if self.lookup_tables is not None:
+            surrogates = self.lookup_tables
         conditions    = state.conditions
         
         mach          = conditions.freestream.mach_number
@@ -180,16 +198,12 @@ class AVL_Inviscid(Aerodynamics):
         drag_model    = surrogates.drag_coefficient
         e_model       = surrogates.span_efficiency_factor
         
-        # Inviscid lift
+        # Inviscid lift, all the points at once
         data_len        = len(AoA)
-        inviscid_lift   = np.zeros([data_len,1])
-        inviscid_drag   = np.zeros([data_len,1])    
-        span_efficiency = np.zeros([data_len,1]) 
-        
-        for ii,_ in enumerate(AoA):
-            inviscid_lift[ii]   = lift_model.predict([np.array([AoA[ii][0],mach[ii][0]])])  
-            inviscid_drag[ii]   = drag_model.predict([np.array([AoA[ii][0],mach[ii][0]])])
-            span_efficiency[ii] = e_model.predict([np.array([AoA[ii][0],mach[ii][0]])])
+        cond            = np.hstack([AoA,mach])
+        inviscid_lift   = np.reshape(lift_model.predict(cond),[data_len,1])
+        inviscid_drag   = np.reshape(drag_model.predict(cond),[data_len,1])
+        span_efficiency = np.reshape(e_model.predict(cond),[data_len,1])
         
         # Store inviscid lift results     
         conditions.aerodynamics.lift_breakdown.inviscid_wings_lift       = Data()    
@@ -252,6 +266,7 @@ class AVL_Inviscid(Aerodynamics):
         for i,_ in enumerate(mach):
             for j,_ in enumerate(AoA):
                 xy[i*len(mach)+j,:] = np.array([AoA[j],mach[i]])
+        training_conditions = []
         for j,_ in enumerate(mach):
             # Set training conditions
             run_conditions = Aerodynamics()
@@ -260,9 +275,12 @@ class AVL_Inviscid(Aerodynamics):
             run_conditions.freestream.gravity           = 9.81        
             run_conditions.aerodynamics.angle_of_attack = AoA 
             run_conditions.freestream.mach_number       = mach[j]
+            training_conditions.append(run_conditions)
             
-            #Run Analysis at AoA[i] and mach[j]
-            results =  self.evaluate_conditions(run_conditions)
+        #Run Analysis at AoA[i] and mach[j], concurrently if requested
+        training_results = run_training_cases(self,training_conditions,self.training_processes)
+        
+        for results in training_results:
             
             # Obtain CD , CL and e  
             CL[count*len(mach):(count+1)*len(mach),0]   = results.aerodynamics.lift_coefficient[:,0]
@@ -316,6 +334,8 @@ class AVL_Inviscid(Aerodynamics):
         Properties Used:
         No others
         """   
+        from sklearn import gaussian_process
+
         # Unpack data
         training                         = self.training
         AoA_data                         = training.angle_of_attack
@@ -3,6 +3,7 @@
 #
 # Created:  Sep 2016, E. Botero
 # Modified: Jan 2017, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -16,16 +17,11 @@ from SUAVE.Core import Data, Units
 from .Aerodynamics import Aerodynamics
 from SUAVE.Input_Output.SU2.call_SU2_CFD import call_SU2_CFD
 from SUAVE.Input_Output.SU2.write_SU2_cfg import write_SU2_cfg
-from sklearn.gaussian_process.kernels import ExpSineSquared
+from SUAVE.Input_Output.SUAVE.training_cache import cached_training, file_key
 
 # Package imports
 import numpy as np
 import time
-import pylab as plt
-import sklearn
-from sklearn import gaussian_process
-from sklearn import neighbors
-from sklearn import svm
 
 # ----------------------------------------------------------------------
 #  Class
@@ -75,6 +71,9 @@ class SU2_inviscid(Aerodynamics):
         self.training.drag_coefficient = None
         self.training_file             = None
         
+        # Folder for training data reused between identical geometries, None disables it
+        self.training_cache_directory  = None
+        
         # Surrogate model
         self.surrogates = Data()
  
@@ -95,13 +94,17 @@ class SU2_inviscid(Aerodynamics):
         None
 
         Properties Used:
-        None
+        self.geometry
+        self.settings
+        self.training.
+          angle_of_attack  [radians]
+          Mach             [-]
+        self.training_file
+        self.training_cache_directory
         """                     
-        # Sample training data
-        self.sample_training()
-                    
-        # Build surrogate
-        self.build_surrogate()
+        # Sample training data and build surrogate, or reuse them for an identical geometry
+        cached_training(self, self.geometry, self.settings, self.training.angle_of_attack,
+                        self.training.Mach, file_key(self.training_file))
 
 
     def evaluate(self,state,settings,geometry):
@@ -250,6 +253,10 @@ class SU2_inviscid(Aerodynamics):
         Properties Used:
         No others
         """  
+        import pylab as plt
+        from sklearn import gaussian_process
+        from sklearn.gaussian_process.kernels import ExpSineSquared
+
         # Unpack data
         training  = self.training
         AoA_data  = training.angle_of_attack
@@ -20,11 +20,6 @@ from SUAVE.Input_Output.SU2.write_SU2_cfg import write_SU2_cfg
 # Package imports
 import numpy as np
 import time
-import pylab as plt
-import sklearn
-from sklearn import gaussian_process
-from sklearn import neighbors
-from sklearn import svm
 
 # ----------------------------------------------------------------------
 #  Class
@@ -253,6 +248,9 @@ class SU2_inviscid_Super(Aerodynamics):
         Properties Used:
         No others
         """  
+        import pylab as plt
+        from sklearn import gaussian_process
+
         # Unpack data
         training  = self.training
         AoA_data  = training.angle_of_attack
@@ -4,6 +4,7 @@
 # Created:            T. MacDonald
 # Modified: Apr 2017, T. MacDonald
 #           Apr 2019, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
@@ -69,6 +70,8 @@ class Supersonic_OpenVSP_Wave_Drag(Markup):
         settings.maximum_lift_coefficient           = np.inf
         settings.number_slices                      = 20
         settings.number_rotations                   = 10
+        settings.volume_drag_backend                = VSP_Methods.openvsp_volume_drag
+        settings.volume_drag_mach_bin_width         = 0.
         
         # vortex lattice configurations
         settings.number_panels_spanwise = 5
@@ -101,7 +104,7 @@ class Supersonic_OpenVSP_Wave_Drag(Markup):
         compute.drag.miscellaneous                 = Methods.Drag.miscellaneous_drag_aircraft
         compute.drag.untrimmed                     = Common.Drag.untrimmed
         compute.drag.trim                          = Common.Drag.trim
-        compute.drag.total                         = Methods.Drag.total_aircraft
+        compute.drag.total                         = Common.Drag.total_aircraft
         
         
     def initialize(self):
@@ -126,12 +129,38 @@ class Supersonic_OpenVSP_Wave_Drag(Markup):
         import os
         
         # Remove old volume drag data so that new data can be appended without issues
-        try:
-            os.remove('volume_drag_data_' + self.geometry.tag + '.npy')  
-        except:
-            pass
+        filename = VSP_Methods.volume_drag_filename(self.geometry.tag)
+        if os.path.exists(filename):
+            os.remove(filename)
+        VSP_Methods.clear_volume_drag_cache(self.geometry.tag)
         
         self.process.compute.lift.inviscid_wings.geometry = self.geometry
         self.process.compute.lift.inviscid_wings.initialize()
         
-    finalize = initialize        
\ No newline at end of file
+    def finalize(self):
+        """Saves the volume drag computed since the last initialize or finalize in a single
+        append to the volume drag data file, and reinitializes the surrogate needed for lift
+        calculation since the geometry may have changed.
+
+        Assumptions:
+        The volume drag of the geometry is computed again after a finalize
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Outputs:
+        None
+
+        Properties Used:
+        self.geometry.tag (geometry in full is also attached to a process)
+        """
+        super(Supersonic_OpenVSP_Wave_Drag, self).initialize()
+        
+        VSP_Methods.save_volume_drag_data(self.geometry.tag)
+        VSP_Methods.clear_volume_drag_cache(self.geometry.tag)
+        
+        self.process.compute.lift.inviscid_wings.geometry = self.geometry
+        self.process.compute.lift.inviscid_wings.initialize()
@@ -6,6 +6,7 @@
 #           Feb 2016, A. Wendorff
 #           Apr 2017, T. MacDonald
 #           Nov 2017, E. Botero
+#           Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
@@ -19,6 +20,7 @@ from SUAVE.Core import Data
 from SUAVE.Core import Units
 
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift import weissinger_vortex_lattice
+from SUAVE.Input_Output.SUAVE.training_cache import cached_training
 
 # local imports
 from .Aerodynamics import Aerodynamics
@@ -80,6 +82,9 @@ class Vortex_Lattice(Aerodynamics):
         self.training.angle_of_attack  = np.array([-10.,-5.,0.,5.,10.]) * Units.deg
         self.training.lift_coefficient = None
         
+        # folder for training data reused between identical geometries, None disables it
+        self.training_cache_directory  = None
+        
         # surrogoate models
         self.surrogates = Data()
         self.surrogates.lift_coefficient = None
@@ -101,13 +106,17 @@ class Vortex_Lattice(Aerodynamics):
         None
 
         Properties Used:
-        None
+        self.geometry.wings
+        self.geometry.reference_area
+        self.settings
+        self.training.angle_of_attack  [radians]
+        self.training_cache_directory
         """                      
-        # sample training data
-        self.sample_training()
-                    
-        # build surrogate
-        self.build_surrogate()
+        geometry = self.geometry
+        
+        # sample training data and build surrogate, or reuse them for an identical geometry
+        cached_training(self, geometry.wings, geometry.reference_area, self.settings,
+                        self.training.angle_of_attack)
 
 
     def evaluate(self,state,settings,geometry):
@@ -208,26 +217,20 @@ class Vortex_Lattice(Aerodynamics):
         training = self.training
         
         AoA = training.angle_of_attack
-        CL  = np.zeros_like(AoA)
-        
-        wing_CLs = Data() 
-        for wing in geometry.wings.values():
-            wing_CLs[wing.tag] = np.zeros_like(AoA)
 
         # condition input, local, do not keep
         konditions              = Data()
         konditions.aerodynamics = Data()
-
-        # calculate aerodynamics for table
-        for i,_ in enumerate(AoA):
-            
-            # overriding conditions, thus the name mangling
-            konditions.aerodynamics.angle_of_attack = AoA[i]
-            
-            # these functions are inherited from Aerodynamics() or overridden
-            CL[i], wing_lifts = calculate_lift_vortex_lattice(konditions, settings, geometry)
-            for wing in geometry.wings.values():
-                wing_CLs[wing.tag][i] = wing_lifts[wing.tag]
+        
+        # overriding conditions, thus the name mangling
+        konditions.aerodynamics.angle_of_attack = AoA
+        
+        # calculate aerodynamics for the whole table at once
+        CL, wing_lifts = calculate_lift_vortex_lattice(konditions, settings, geometry)
+        
+        wing_CLs = Data() 
+        for wing in geometry.wings.values():
+            wing_CLs[wing.tag] = wing_lifts[wing.tag]
 
         # store training data
         training.lift_coefficient = CL
@@ -307,10 +310,11 @@ def calculate_lift_vortex_lattice(conditions,settings,geometry):
     geometry.wings.*.reference_area (each wing is also passed to the vortex lattice method)
 
     Outputs:
-    
+    total_lift_coeff                [Unitless] (shaped like the angle of attack)
+    wing_lifts.*                    [Unitless] (shaped like the angle of attack)
 
     Properties Used:
-    
+    N/A
     """            
 
     # unpack
@@ -4,6 +4,7 @@
 # Created: 
 # Modified: Feb 2016, Andrew Wendorff
 #           Jan 2018, W. Maier
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -21,9 +22,15 @@ from SUAVE.Attributes.Planets import Earth
 
 from SUAVE.Analyses.Mission.Segments.Conditions import Conditions
 
-from SUAVE.Core import Units
+from SUAVE.Core import Data, Units
 from SUAVE.Core.Arrays import atleast_2d_col
 
+# layer constants and interpolation tables, shared by atmospheres with the same break points
+layer_tables = {}
+
+# properties the model is checked against, built on first use
+reference_properties = Data()
+
 
 # ----------------------------------------------------------------------
 #  Classes
@@ -62,6 +69,9 @@ class US_Standard_1976(Atmospheric):
         
         atmo_data = SUAVE.Attributes.Atmospheres.Earth.US_Standard_1976()
         self.update(atmo_data)        
+        
+        # geopotential altitude step of a cached interpolation table, None evaluates the layers exactly
+        self.table_altitude_step = None
     
     def compute_values(self,altitude,temperature_deviation=0.0,var_gamma=False):
 
@@ -93,21 +103,23 @@ class US_Standard_1976(Atmospheric):
             altitude                             [m]
             temperature                          [K]
             pressure                             [Pa]
+          table_altitude_step                    [m]
         """
 
         # unpack
         zs        = altitude
         gas       = self.fluid_properties
         planet    = self.planet
-        grav      = self.planet.sea_level_gravity        
         Rad       = self.planet.mean_radius
-        R         = gas.gas_specific_constant
         delta_isa = temperature_deviation
         
         # check properties
-        if not gas == Air():
+        if not reference_properties:
+            reference_properties.gas    = Air()
+            reference_properties.planet = Earth()
+        if not gas == reference_properties.gas:
             warn('US Standard Atmosphere not using Air fluid properties')
-        if not planet == Earth():
+        if not planet == reference_properties.planet:
             warn('US Standard Atmosphere not using Earth planet properties')          
         
         # convert input if necessary
@@ -128,36 +140,16 @@ class US_Standard_1976(Atmospheric):
             print("Warning: altitude requested above maximum for this atmospheric model; returning values for h = 86.0 km")   
             zs[zs > zmax] = zmax        
 
-        # initialize return data
-        zeros = np.zeros_like(zs)
-        p     = zeros * 0.0
-        T     = zeros * 0.0
-        rho   = zeros * 0.0
-        a     = zeros * 0.0
-        mu    = zeros * 0.0
-        z0    = zeros * 0.0
-        T0    = zeros * 0.0
-        p0    = zeros * 0.0
-        alpha = zeros * 0.0
-        
-        # populate the altitude breaks
-        # this uses >= and <= to capture both edges and because values should be the same at the edges
-        for i in range( len(self.breaks.altitude)-1 ): 
-            i_inside = (zs >= self.breaks.altitude[i]) & (zs <= self.breaks.altitude[i+1])
-            z0[ i_inside ]    = self.breaks.altitude[i]
-            T0[ i_inside ]    = self.breaks.temperature[i]
-            p0[ i_inside ]    = self.breaks.pressure[i]
-            alpha[ i_inside ] = -(self.breaks.temperature[i+1] - self.breaks.temperature[i])/ \
-                                 (self.breaks.altitude[i+1]    - self.breaks.altitude[i])
-        
-        # interpolate the breaks
-        dz = zs-z0
-        i_isoth = (alpha == 0.)
-        i_adiab = (alpha != 0.)
-        p[i_isoth] = p0[i_isoth] * np.exp(-1.*dz[i_isoth]*grav/(R*T0[i_isoth]))
-        p[i_adiab] = p0[i_adiab] * ( (1.-alpha[i_adiab]*dz[i_adiab]/T0[i_adiab]) **(1.*grav/(alpha[i_adiab]*R)) )
+        # interpolate the breaks, or the cached table
+        if self.table_altitude_step is None:
+            p, T = evaluate_layers(self.layer_constants(),zs)
+        else:
+            table = self.interpolation_table()
+            z     = zs.ravel()
+            T     = np.interp(z,table.altitude,table.temperature).reshape(zs.shape)
+            p     = np.exp(np.interp(z,table.altitude,table.log_pressure)).reshape(zs.shape)
         
-        T   = T0 - dz*alpha + delta_isa
+        T   = T + delta_isa
         rho = gas.compute_density(T,p)
         a   = gas.compute_speed_of_sound(T,p,var_gamma)
         mu  = gas.compute_absolute_viscosity(T)
@@ -171,6 +163,190 @@ class US_Standard_1976(Atmospheric):
         atmo_data.dynamic_viscosity = mu
         
         return atmo_data
+    
+    def layer_constants(self):
+        """Returns the constants of each layer between the altitude breaks, computed once for each set
+        of break points and properties.
+
+        Assumptions:
+        Temperature varies linearly within each layer
+
+        Source:
+        U.S. Standard Atmosphere, 1976, U.S. Government Printing Office, Washington, D.C., 1976
+
+        Inputs:
+        None
+
+        Output:
+        layers.
+          altitude                               [m]
+          temperature                            [K]
+          pressure                               [Pa]
+          lapse_rate                             [K/m]
+          exponent                               [-]
+          gas_temperature                        [J/kg]
+          gas_specific_constant                  [J/(kg*K)]
+          sea_level_gravity                      [m/s^2]
+
+        Properties Used:
+        self.
+          fluid_properties.gas_specific_constant [J/(kg*K)]
+          planet.sea_level_gravity               [m/s^2]
+          breaks.
+            altitude                             [m]
+            temperature                          [K]
+            pressure                             [Pa]
+        """
+        
+        # unpack
+        grav   = self.planet.sea_level_gravity
+        R      = self.fluid_properties.gas_specific_constant
+        breaks = self.breaks
+        z0     = np.array(breaks.altitude,dtype=float)
+        T0     = np.array(breaks.temperature,dtype=float)
+        p0     = np.array(breaks.pressure,dtype=float)
+        
+        key = ('layers',z0.tobytes(),T0.tobytes(),p0.tobytes(),float(grav),float(R))
+        if key in layer_tables:
+            return layer_tables[key]
+        
+        # the last break only closes the last layer
+        alpha = -(T0[1:] - T0[:-1])/(z0[1:] - z0[:-1])
+        alpha = np.append(alpha,0.)
+        
+        layers = Data()
+        layers.altitude              = z0
+        layers.temperature           = T0
+        layers.pressure              = p0
+        layers.lapse_rate            = alpha
+        layers.exponent              = np.zeros_like(alpha)
+        layers.gas_temperature       = R*T0
+        layers.gas_specific_constant = R
+        layers.sea_level_gravity     = grav
+        
+        i_adiab = (alpha != 0.)
+        layers.exponent[i_adiab] = 1.*grav/(alpha[i_adiab]*R)
+        
+        layer_tables[key] = layers
+        
+        return layers
+    
+    def interpolation_table(self):
+        """Returns a table of temperature and log pressure on a fine geopotential altitude grid,
+        computed once for each set of break points, properties and altitude step.
+        
+        The grid includes the altitude breaks, so the temperature, which is linear in each layer, is
+        interpolated exactly, up to round off. The log pressure is linear in the isothermal layers and its relative
+        interpolation error in the other layers is bounded by
+        
+            step^2 * g * max|lapse_rate| / (8 * R * min(T)^2)
+            
+        which is about 1e-7 for a 10 m step. The density has the same relative error as the pressure,
+        the speed of sound and viscosity only depend on the temperature.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Output:
+        table.
+          altitude                               [m]
+          temperature                            [K]
+          log_pressure                           [log(Pa)]
+          pressure_error                         [-]
+
+        Properties Used:
+        self.table_altitude_step                 [m]
+        """
+        
+        step   = float(self.table_altitude_step)
+        layers = self.layer_constants()
+        z0     = layers.altitude
+        
+        R      = layers.gas_specific_constant
+        
+        key = ('table',z0.tobytes(),layers.temperature.tobytes(),layers.pressure.tobytes(),
+               float(layers.sea_level_gravity),float(R),step)
+        if key in layer_tables:
+            return layer_tables[key]
+        
+        # grid points in each layer, from break to break. The tabulated break pressures are rounded, so
+        # each break is listed twice, with the values of the layers below and above it
+        grid  = []
+        index = []
+        for i in range(len(z0)-1):
+            n = max(int(np.ceil((z0[i+1] - z0[i])/step)),1)
+            grid.append(np.linspace(z0[i],z0[i+1],n+1))
+            index.append(np.full(n+1,i))
+        zs = np.concatenate(grid)
+        
+        p, T = evaluate_layers(layers,zs,np.concatenate(index))
+        
+        table = Data()
+        table.altitude       = zs
+        table.temperature    = T
+        table.log_pressure   = np.log(p)
+        table.pressure_error = step**2 * layers.sea_level_gravity * np.max(np.abs(layers.lapse_rate)) \
+                               / (8. * R * np.min(layers.temperature)**2)
+        
+        layer_tables[key] = table
+        
+        return table
+
+# ----------------------------------------------------------------------
+#  Layer Evaluation
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses-Atmospheric
+def evaluate_layers(layers,zs,i=None):
+    """Computes the standard pressure and temperature in the layers between the altitude breaks.
+
+    Assumptions:
+    Altitudes are within the breaks. Points on a break use the layer above it.
+
+    Source:
+    U.S. Standard Atmosphere, 1976, U.S. Government Printing Office, Washington, D.C., 1976
+
+    Inputs:
+    layers   - from US_Standard_1976.layer_constants()
+    zs       - geopotential altitude                  [m]
+    i        - layer of each point, found if None     [-]
+
+    Output:
+    p        - pressure                               [Pa]
+    T        - temperature, without deviation         [K]
+
+    Properties Used:
+    N/A
+    """
+    
+    # find the layer of each point
+    if i is None:
+        i = np.searchsorted(layers.altitude,zs,side='right') - 1
+        i = np.clip(i,0,len(layers.altitude)-2)
+    
+    z0    = layers.altitude[i]
+    T0    = layers.temperature[i]
+    p0    = layers.pressure[i]
+    alpha = layers.lapse_rate[i]
+    grav  = layers.sea_level_gravity
+    
+    # interpolate the breaks
+    dz = zs-z0
+    i_isoth = (alpha == 0.)
+    i_adiab = ~i_isoth
+    p = np.empty_like(dz)
+    p[i_isoth] = p0[i_isoth] * np.exp(-1.*dz[i_isoth]*grav/layers.gas_temperature[i[i_isoth]])
+    p[i_adiab] = p0[i_adiab] * ( (1.-alpha[i_adiab]*dz[i_adiab]/T0[i_adiab]) **layers.exponent[i[i_adiab]] )
+    
+    T = T0 - dz*alpha
+    
+    return p, T
 
 
 # ----------------------------------------------------------------------
@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 """ Mission.py: Top-level mission class """
 
@@ -88,17 +89,20 @@ class Container(ContainerBase):
         None
     """    
     
-    def evaluate(self,state=None):
+    def evaluate(self,state=None,number_of_processes=None):
         """ Go through the missions, run through them, save the results
     
             Assumptions:
-            None
+            If number_of_processes is given, the missions are independent and picklable.
+            Copies of them are evaluated over a process pool, the missions in the container
+            are not evaluated in place.
     
             Source:
             N/A
     
             Inputs:
-            state   [Data()]
+            state                 [Data()]
+            number_of_processes   [int]
     
             Outputs:
             Results [Data()]
@@ -106,6 +110,9 @@ class Container(ContainerBase):
             Properties Used:
             None
         """         
+        if number_of_processes is not None:
+            return SUAVE.Methods.Missions.evaluate_missions(self,number_of_processes,state)
+        
         results = SUAVE.Core.Data()
         
         for key,mission in self.items():
@@ -4,6 +4,7 @@
 # Created:  
 # Modified: Feb 2016, A. Wendorff
 #           Jun 2017, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -13,14 +14,14 @@
 import numpy as np
 
 # SUAVE imports
-from SUAVE.Core                    import Data
+from SUAVE.Core                    import Fast_Data, Pack_Plan
 
 # ----------------------------------------------------------------------
 #  Conditions
 # ----------------------------------------------------------------------
 
 ## @ingroup Analyses-Mission-Segments-Conditions
-class Conditions(Data):
+class Conditions(Fast_Data):
     """ Conditions are the magic Data that contains the information about the vehicle in flight.
         At this point none of the information really exists. What is here are the methods that allow a mission
         to collect the information.
@@ -33,6 +34,7 @@ class Conditions(Data):
     """ 
 
     _size = 1
+    _pack_plan = None
     
     def ones_row(self,cols):
         """ returns a row vector of ones with given number of columns 
@@ -118,6 +120,9 @@ class Conditions(Data):
         # store
         self._size = rows
         
+        # the packed layout changes with the number of rows
+        self._pack_plan = None
+        
         # recursively initialize condition and unknown arrays 
         # to have given row length
         
@@ -151,4 +156,69 @@ class Conditions(Data):
             Properties Used:
             None
         """          
-        self.expand_rows()
\ No newline at end of file
+        self.expand_rows()
+        
+    def pack_array(self,output='vector'):
+        """ Data.pack_array() with a cached layout. The tree is walked once after expand_rows,
+            afterwards packing a vector is a fill of one preallocated buffer.
+        
+            Assumptions:
+            The layout is rebuilt when the keys, branches, or the shapes of the values change.
+            Array output is not cached.
+    
+            Source:
+            N/A
+    
+            Inputs:
+            output - either 'vector' (default), or 'array'
+    
+            Outputs:
+            array  - the packed array
+    
+            Properties Used:
+            None
+        """
+        
+        if output != 'vector':
+            return Fast_Data.pack_array(self,output)
+        
+        plan = self._pack_plan
+        if plan is not None:
+            M = plan.pack()
+            if M is not None:
+                return M
+            
+        plan = self._pack_plan = Pack_Plan(self)
+        
+        return plan.pack()
+    
+    def unpack_array(self,M):
+        """ Data.unpack_array() with the cached layout of pack_array()
+        
+            Assumptions:
+            The layout is rebuilt when the keys, branches, or the shapes of the values change.
+            2D column arrays are not cached.
+    
+            Source:
+            N/A
+    
+            Inputs:
+            M      - either a 1D vector or 2D column array
+    
+            Outputs:
+            a reference to self, updates self in place
+    
+            Properties Used:
+            None
+        """
+        
+        if np.ndim(M) != 1:
+            return Fast_Data.unpack_array(self,M)
+        
+        plan = self._pack_plan
+        if plan is None or plan.unpack(M) is None:
+            plan = self._pack_plan = Pack_Plan(self)
+            if plan.unpack(M) is None:
+                return Fast_Data.unpack_array(self,M)
+        
+        return self
\ No newline at end of file
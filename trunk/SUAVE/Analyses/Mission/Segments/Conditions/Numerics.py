@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -51,6 +52,7 @@ class Numerics(Conditions):
         
         self.number_control_points = 16
         self.discretization_method = chebyshev_data
+        self.factored_integration  = False
         
         self.solver_jacobian                  = "none"
         self.tolerance_solution               = 1e-8
@@ -61,6 +63,7 @@ class Numerics(Conditions):
         self.dimensionless.control_points = np.empty([0,0])
         self.dimensionless.differentiate  = np.empty([0,0])
         self.dimensionless.integrate      = np.empty([0,0]) 
+        self.dimensionless.integration_factors = None
         
         self.time = Conditions()
         self.time.control_points = np.empty([0,0])
@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Sep 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -67,6 +68,10 @@ class Segment(Analysis):
         self.process.finalize.post_process = Process()
         
         self.conditions = self.state.conditions
+
+        # converged unknowns of a previous solve, restored when asked for, see SUAVE.Methods.Missions.warm_start
+        self.warm_start = None
+        self.use_warm_start = False
         
         return
         
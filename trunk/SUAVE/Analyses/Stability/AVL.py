@@ -2,6 +2,7 @@
 # AVL.py
 #
 # Created: Apr 2017, M. Clarke 
+# Modified: Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
@@ -20,22 +21,22 @@ from SUAVE.Methods.Aerodynamics.AVL.write_geometry   import write_geometry
 from SUAVE.Methods.Aerodynamics.AVL.write_run_cases  import write_run_cases
 from SUAVE.Methods.Aerodynamics.AVL.write_input_deck import write_input_deck
 from SUAVE.Methods.Aerodynamics.AVL.run_analysis     import run_analysis
+from SUAVE.Methods.Aerodynamics.AVL.run_training_cases import run_training_cases
 from SUAVE.Methods.Aerodynamics.AVL.translate_data   import translate_conditions_to_cases, translate_results_to_conditions
 from SUAVE.Methods.Aerodynamics.AVL.purge_files      import purge_files
 from SUAVE.Methods.Aerodynamics.AVL.Data.Settings    import Settings
 from SUAVE.Methods.Aerodynamics.AVL.Data.Cases       import Run_Case
+from SUAVE.Input_Output.SUAVE.training_cache         import cached_training, file_key
+from SUAVE.Surrogate.Lookup_Table                    import build_lookup_tables
 
 # local imports 
 from .Stability import Stability
 
 # Package imports
 import time
-import pylab as plt
 import os
 import numpy as np
 import sys
-import sklearn
-from sklearn import gaussian_process
 from shutil import rmtree
 from warnings import warn
 
@@ -98,6 +99,12 @@ class AVL(Stability):
         self.training.Cn_beta_moment_coefficient            = None
         self.training.neutral_point                         = None
         self.training_file                                  = None
+        
+        # Number of AVL processes run at once for training, None runs them one at a time
+        self.training_processes                             = None
+        
+        # Folder for training data reused between identical geometries, None disables it
+        self.training_cache_directory                       = None
 
         # Surrogate model
         self.surrogates                                     = Data()
@@ -106,6 +113,10 @@ class AVL(Stability):
         self.surrogates.Cn_beta_moment_coefficient          = None      
         self.surrogates.neutral_point                       = None
         
+        # Points of a dense [AoA, Mach] table interpolating the surrogates, None evaluates them directly
+        self.lookup_table_size                              = None
+        self.lookup_tables                                  = None
+        
         # Initialize quantities
         self.configuration                                  = Data()    
         self.geometry                                       = Data()
@@ -170,11 +181,16 @@ class AVL(Stability):
                 
         run_folder = self.settings.filenames.run_folder 
    
-        # Sample training data
-        self.sample_training()
-
-        # Build surrogate
-        self.build_surrogate()
+        # Sample training data and build surrogate, or reuse them for an identical geometry
+        cached_training(self, geometry.tag, geometry.wings, geometry.fuselages, geometry.reference_area,
+                        configuration.mass_properties, configuration.fuel.mass_properties,
+                        self.settings.discretization, self.settings.flow_symmetry,
+                        self.settings.number_control_surfaces, self.training.angle_of_attack,
+                        self.training.Mach, file_key(self.training_file))
+        
+        # Tabulate the surrogates for missions
+        if self.lookup_table_size is not None:
+            self.lookup_tables = build_lookup_tables(self.surrogates,self.training.grid_points,self.lookup_table_size)
 
         return
 
@@ -204,11 +220,14 @@ class AVL(Stability):
            cm_alpha                 [-] Cm_alpha
            cn_beta                  [-] Cn_beta
            neutral_point            [-] NP
+        self.lookup_tables (optional, used instead of the surrogates)
 
         """          
         
         # Unpack
         surrogates          = self.surrogates  
+        if self.lookup_tables is not None:
+            surrogates      = self.lookup_tables
         configuration       = self.configuration
         geometry            = self.geometry
         stability_model     = self.stability_model
@@ -235,18 +254,13 @@ class AVL(Stability):
         static_stability    = Data()
         dynamic_stability   = Data()        
 
-        #Run Analysis
+        #Run Analysis, all the points at once
         data_len            = len(AoA)
-        CM                  = np.zeros([data_len,1])
-        Cm_alpha            = np.zeros([data_len,1])
-        Cn_beta             = np.zeros([data_len,1])
-        NP                  = np.zeros([data_len,1]) 
-
-        for ii,_ in enumerate(AoA):           
-            CM[ii]          = moment_model.predict([np.array([AoA[ii][0],mach[ii][0]])])
-            Cm_alpha[ii]    = Cm_alpha_model.predict([np.array([AoA[ii][0],mach[ii][0]])])
-            Cn_beta[ii]     = Cn_beta_model.predict([np.array([AoA[ii][0],mach[ii][0]])])
-            NP[ii]          = neutral_point_model.predict([np.array([AoA[ii][0],mach[ii][0]])])    #sklearn fix        
+        cond                = np.hstack([AoA,mach])
+        CM                  = np.reshape(moment_model.predict(cond),[data_len,1])
+        Cm_alpha            = np.reshape(Cm_alpha_model.predict(cond),[data_len,1])
+        Cn_beta             = np.reshape(Cn_beta_model.predict(cond),[data_len,1])
+        NP                  = np.reshape(neutral_point_model.predict(cond),[data_len,1])
 
         static_stability.CM       = CM
         static_stability.Cm_alpha = Cm_alpha 
@@ -346,6 +360,7 @@ class AVL(Stability):
         for i,_ in enumerate(mach):
             for j,_ in enumerate(AoA):
                 xy[i*len(mach)+j,:] = np.array([AoA[j],mach[i]])
+        training_conditions = []
         for j,_ in enumerate(mach):
             # Set training conditions
             run_conditions = Aerodynamics()
@@ -354,9 +369,12 @@ class AVL(Stability):
             run_conditions.freestream.gravity               = 9.81          
             run_conditions.aerodynamics.angle_of_attack     = AoA
             run_conditions.freestream.mach_number           = mach[j]
+            training_conditions.append(run_conditions)
             
-            #Run Analysis at AoA[i] and mach[j]
-            results =  self.evaluate_conditions(run_conditions)
+        #Run Analysis at AoA[i] and mach[j], concurrently if requested
+        training_results = run_training_cases(self,training_conditions,self.training_processes)
+
+        for results in training_results:
 
             # Obtain CM Cm_alpha, Cn_beta and the Neutral Point # Store other variables here as well 
             CM[count*len(mach):(count+1)*len(mach),0]       = results.aerodynamics.pitch_moment_coefficient[:,0]
@@ -413,6 +431,8 @@ class AVL(Stability):
         Properties Used:
         No others
         """  
+        from sklearn import gaussian_process
+
         # Unpack data
         training                                    = self.training
         AoA_data                                    = training.angle_of_attack
@@ -6,6 +6,7 @@
 #           Sep 2017, P. Goncalves
 #           Jan 2018, W. Maier
 #           Aug 2018, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -14,7 +15,6 @@
 import SUAVE
 
 import numpy as np
-from scipy.optimize import fsolve
 
 from SUAVE.Core import Data
 from SUAVE.Components.Energy.Energy_Component import Energy_Component
@@ -78,6 +78,7 @@ class Combustor(Energy_Component):
         self.absolute_sensible_enthalpy      = 0.0
         self.fuel_equivalency_ratio          = 1.0        
         self.inputs.nondim_mass_ratio        = 1.0 # allows fuel already burned to be added to the flow
+        self.gas_dynamics_tables             = False # start the Rayleigh flow solvers from the gas dynamics tables
     
     def compute(self,conditions):
         """ This computes the output values from the input values according to
@@ -184,6 +185,8 @@ class Combustor(Energy_Component):
           stagnation_pressure                 [Pa]
           stagnation_enthalpy                 [J/kg]
           fuel_to_air_ratio                   [-]
+          mach_number                         [-]
+          converged                           [-]    True where the Mach numbers were found
 
         Properties Used:
         self.
@@ -192,6 +195,7 @@ class Combustor(Energy_Component):
           efficiency                          [-]
           area_ratio                          [-]
           fuel_data.specific_energy           [J/kg]
+          gas_dynamics_tables                 [-]
         """         
         # unpack the values
 
@@ -212,15 +216,12 @@ class Combustor(Energy_Component):
         # unpacking values from self
         htf    = self.fuel_data.specific_energy
         ar     = self.area_ratio
+        tables = self.gas_dynamics_tables
         
         # Rayleigh flow analysis, constant pressure burner
             
-        # Initialize arrays
-        M_out  = 1*Pt_in/Pt_in
-        Ptr    = 1*Pt_in/Pt_in
-
         # Isentropic decceleration through divergent nozzle
-        Mach   = fm_solver(ar,Mach[:,0],gamma[:,0])  
+        Mach, fm_converged = fm_solver(ar,Mach,gamma,full_output=True,tables=tables)
         
         # Determine max stagnation temperature to thermally choke flow                                     
         Tt4_ray = Tt_in*(1.+gamma*Mach*Mach)**2./((2.*(1.+gamma)*Mach*Mach)*(1.+(gamma-1.)/2.*Mach*Mach))
@@ -230,7 +231,7 @@ class Combustor(Energy_Component):
         Tt4[Tt4_ray <= Tt4] = Tt4_ray[Tt4_ray <= Tt4]
         
         #Rayleigh calculations
-        M_out[:,0], Ptr[:,0] = rayleigh(gamma[:,0],Mach,Tt4[:,0]/Tt_in[:,0]) 
+        M_out, Ptr, rayleigh_converged = rayleigh(gamma,Mach,Tt4/Tt_in,full_output=True,tables=tables)
         Pt_out     = Ptr*Pt_in
             
         # method to compute combustor properties
@@ -251,6 +252,7 @@ class Combustor(Energy_Component):
         self.outputs.stagnation_enthalpy     = ht_out
         self.outputs.fuel_to_air_ratio       = f    
         self.outputs.mach_number             = M_out
+        self.outputs.converged               = np.logical_and(fm_converged,rayleigh_converged)
         
         
     def compute_supersonic_combustion(self,conditions): 
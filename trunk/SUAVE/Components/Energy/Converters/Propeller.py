@@ -4,6 +4,7 @@
 # Created:  Jun 2014, E. Botero
 # Modified: Jan 2016, T. MacDonald
 #           Feb 2019, M. Vegh            
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -63,6 +64,8 @@ class Propeller(Energy_Component):
         self.prop_attributes.cd_coefficients                = [.108, -.2612, .181, -.0139, .0278]  #coefficients for a 4th degree polynomial fit of Cd(Cl) for the airfoil
         self.prop_attributes.drag_reference_reynolds_number = 50000.     #drag scaling is  (Re_ref/Re) **Re_exp
         self.prop_attributes.reynolds_scaling_exponent      = .2
+        self.newton_tolerance                               = 1e-5 # convergence tolerance on the inflow angles of each control point
+        self.newton_max_iterations                          = 200  # iterations of each control point before it is given up
         self.thrust_angle                                   = 0.0
         self.origin                                         = [[0.0,0.0,0.0]] # [X,Y,Z]
         self.rotation                                       = [[0.0,0.0,0.0]] # [X,Y,Z] rotation of axis relative to
@@ -106,6 +109,10 @@ class Propeller(Energy_Component):
           power                      [W]
           mid_chord_aligment         [m] (distance from the mid chord to the line axis out of the center of the blade)
         conditions.propulsion.etap   [-]
+        conditions.propulsion.propeller_convergence.
+          iterations                 [-]
+          converged                  [-]
+          residual                   [radians] (last change of the inflow angles)
         thrust                       [N]
         torque                       [Nm]
         power                        [W]
@@ -124,6 +131,8 @@ class Propeller(Energy_Component):
          drag_reference_reynolds_number [-]
          reynolds_scaling_exponent      [-]
         self.thrust_angle               [radians]
+        self.newton_tolerance           [radians]
+        self.newton_max_iterations      [-]
         """         
            
         #Unpack    
@@ -147,9 +156,6 @@ class Propeller(Energy_Component):
         a      = conditions.freestream.speed_of_sound[:,0,None]
         T      = conditions.freestream.temperature[:,0,None]
         theta  = self.thrust_angle
-        
-        BB     = B*B
-        BBB    = BB*B
             
         # Velocity in the Body frame
         T_body2inertial = conditions.frames.body.transform_to_inertial
@@ -164,8 +170,9 @@ class Propeller(Energy_Component):
         # Now just use the aligned velocity
         V = V_thrust[:,0,None]
         
-        nu    = mu/rho
-        tol   = 1e-5 # Convergence tolerance
+        nu       = mu/rho
+        tol      = self.newton_tolerance      # Convergence tolerance
+        max_iter = self.newton_max_iterations # Iterations of each control point
         
         omega = omega1*1.0
         omega = np.abs(omega)
@@ -182,7 +189,6 @@ class Propeller(Energy_Component):
         lamda   = V/(omega*R)              # Speed ratio
         r       = chi*R                    # Radial coordinate
         pi      = np.pi
-        pi2     = pi*pi
         x       = r*np.multiply(omega,1/V) # Nondimensional distance
         n       = omega/(2.*pi)            # Cycles per second
         J       = V/(2.*R*n)    
@@ -200,85 +206,60 @@ class Propeller(Energy_Component):
         
         #Things that will change with iteration
         size = (len(a),N)
+        
+        # The values at the last iterate of each control point
+        Wa      = np.zeros(size)
+        Wt      = np.zeros(size)
+        W       = np.zeros(size)
+        Ma      = np.zeros(size)
+        alpha   = np.zeros(size)
+        Cl      = np.zeros(size)
+        Gamma   = np.zeros(size)
+        diff    = np.zeros(len(a))
+        iters   = np.zeros(len(a),dtype=int)
+        conv    = np.zeros(len(a),dtype=bool)
     
-        #Setup a Newton iteration
-        psi    = np.ones(size)
-        psiold = np.zeros(size)
-        diff   = 1.
+        #Setup a Newton iteration, only the control points that have not converged are updated
+        ones    = np.ones(size)
+        active  = np.arange(len(a))
+        psi     = np.ones(size)
+        psiold  = np.zeros(size)
+        args    = [Ua,Ut,U,ones*r,ones*beta,ones*c,ones*a]
         
         ii = 0
-        while (diff>tol):
-            sin_psi = np.sin(psi)
-            cos_psi = np.cos(psi)
-            Wa      = 0.5*Ua + 0.5*U*sin_psi
-            Wt      = 0.5*Ut + 0.5*U*cos_psi   
-            #va     = Wa - Ua
-            vt      = Ut - Wt
-            alpha   = beta - np.arctan2(Wa,Wt)
-            W       = (Wa*Wa + Wt*Wt)**0.5
-            Ma      = (W)/a #a is the speed of sound
-            
-            #if np.any(Ma> 1.0):
-                #warn('Propeller blade tips are supersonic.', Warning)
-            
-            lamdaw = r*Wa/(R*Wt)
-            
-            # Limiter to keep from Nan-ing
-            lamdaw[lamdaw<0.] = 0.
-            
-            f            = (B/2.)*(1.-r/R)/lamdaw
-            piece        = np.exp(-f)
-            arccos_piece = np.arccos(piece)
-            F            = 2.*arccos_piece/pi
-            Gamma        = vt*(4.*pi*r/B)*F*(1.+(4.*lamdaw*R/(pi*B*r))*(4.*lamdaw*R/(pi*B*r)))**0.5
-            
-            # Ok, from the airfoil data, given Re, Ma, alpha we need to find Cl
-            Cl = cl_a*alpha
-            
-            # By 90 deg, it's totally stalled.
-            Cl[alpha>=pi/2] = 0.
-            
-            # Scale for Mach, this is Karmen_Tsien
-            Cl[Ma[:,:]<1.] = Cl[Ma[:,:]<1.]/((1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])**0.5+((Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])/(1+(1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])**0.5))*Cl[Ma<1.]/2)
-            
-            # If the blade segments are supersonic, don't scale
-            Cl[Ma[:,:]>=1.] = Cl[Ma[:,:]>=1.] 
-            
-            Rsquiggly = Gamma - 0.5*W*c*Cl
-            
-            #An analytical derivative for dR_dpsi, this is derived by taking a derivative of the above equations
-            #This was solved symbolically in Matlab and exported        
-            f_wt_2 = 4*Wt*Wt
-            f_wa_2 = 4*Wa*Wa
-            Ucospsi  = U*cos_psi
-            Usinpsi  = U*sin_psi
-            Utcospsi = Ut*cos_psi
-            Uasinpsi = Ua*sin_psi
+        while len(active):
+            ii += 1
             
-            UapUsinpsi = (Ua + Usinpsi)
-            utpUcospsi = (Ut + Ucospsi)
-            
-            utpUcospsi2 = utpUcospsi*utpUcospsi
-            UapUsinpsi2 = UapUsinpsi*UapUsinpsi
-            
-            dR_dpsi = ((4.*U*r*arccos_piece*sin_psi*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5))/B - 
-                       (pi*U*(Ua*cos_psi - Ut*sin_psi)*(beta - np.arctan((Wa+Wa)/(Wt+Wt))))/(2.*(f_wt_2 + f_wa_2)**(0.5))
-                       + (pi*U*(f_wt_2 +f_wa_2)**(0.5)*(U + Utcospsi  +  Uasinpsi))/(2.*(f_wa_2/(f_wt_2) + 1.)*utpUcospsi2)
-                       - (4.*U*piece*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5)*(R - r)*(Ut/2. - 
-                      (Ucospsi)/2.)*(U + Utcospsi + Uasinpsi ))/(f_wa_2*(1. - np.exp(-(B*(Wt+Wt)*(R - 
-                       r))/(r*(Wa+Wa))))**(0.5)) + (128.*U*r*arccos_piece*(Wa+Wa)*(Ut/2. - (Ucospsi)/2.)*(U + 
-                       Utcospsi  + Uasinpsi ))/(BBB*pi2*utpUcospsi*utpUcospsi2*((16.*f_wa_2)/(BB*pi2*f_wt_2) + 1.)**(0.5))) 
-            
-            dR_dpsi[np.isnan(dR_dpsi)] = 0.1
+            Rsquiggly, dR_dpsi, outputs = blade_residual(psi,B,R,cl_a,*args)
                       
             dpsi   = -Rsquiggly/dR_dpsi
             psi    = psi + dpsi
-            diff   = np.max(abs(psiold-psi))
+            change = np.max(abs(psiold-psi),axis=1)
             psiold = psi
             
-            # If its really not going to converge
-            if np.any(psi>(pi*85.0/180.)) and np.any(dpsi>0.0):
-                break
+            # If its really not going to converge, or has run out of iterations
+            converged = change<=tol
+            diverging = np.any(psi>(pi*85.0/180.),axis=1) & np.any(dpsi>0.0,axis=1)
+            done      = converged | diverging | np.isnan(change) | (ii>=max_iter)
+            
+            if np.any(done):
+                points         = active[done]
+                Wa[points]     = outputs[0][done]
+                Wt[points]     = outputs[1][done]
+                W[points]      = outputs[2][done]
+                Ma[points]     = outputs[3][done]
+                alpha[points]  = outputs[4][done]
+                Cl[points]     = outputs[5][done]
+                Gamma[points]  = outputs[6][done]
+                diff[points]   = change[done]
+                iters[points]  = ii
+                conv[points]   = converged[done]
+                
+                keep   = ~done
+                active = active[keep]
+                psi    = psi[keep]
+                psiold = psiold[keep]
+                args   = [ arg[keep] for arg in args ]
 
         Re      = (W*c)/nu
         
@@ -313,6 +294,13 @@ class Propeller(Energy_Component):
         
         conditions.propulsion.etap = etap
         
+        # convergence of the Newton iteration at each control point
+        conditions.propulsion.propeller_convergence = Data(
+            iterations = iters[:,None],
+            converged  = conv[:,None],
+            residual   = diff[:,None]
+        )
+        
         # store data
         results_conditions = Data      
         conditions.propulsion.acoustic_outputs = results_conditions(
@@ -332,4 +320,107 @@ class Propeller(Energy_Component):
         
         
         return thrust, torque, power, Cp
-    
\ No newline at end of file
+    
+# ----------------------------------------------------------------------
+#  Blade Residual
+# ----------------------------------------------------------------------
+## @ingroup Components-Energy-Converters
+def blade_residual(psi,B,R,cl_a,Ua,Ut,U,r,beta,c,a):
+    """Computes the circulation residual of the blade stations and its derivative with respect to the
+    inflow angle psi, for the Newton iteration of Propeller.spin.
+
+    Assumptions:
+    per source
+
+    Source:
+    Qprop theory document
+
+    Inputs:
+    psi                          [radians]
+    B                            [-]        (number of blades)
+    R                            [m]        (tip radius)
+    cl_a                         [1/radians]
+    Ua, Ut, U                    [m/s]      (axial, tangential and total velocity of each station)
+    r                            [m]
+    beta                         [radians]
+    c                            [m]
+    a                            [m/s]      (speed of sound)
+
+    Outputs:
+    Rsquiggly                    [m^2/s]
+    dR_dpsi                      [m^2/s]
+    outputs                      (Wa, Wt, W, Ma, alpha, Cl, Gamma) at psi
+
+    Properties Used:
+    N/A
+    """
+    
+    pi      = np.pi
+    pi2     = pi*pi
+    BB      = B*B
+    BBB     = BB*B
+    
+    sin_psi = np.sin(psi)
+    cos_psi = np.cos(psi)
+    Wa      = 0.5*Ua + 0.5*U*sin_psi
+    Wt      = 0.5*Ut + 0.5*U*cos_psi   
+    #va     = Wa - Ua
+    vt      = Ut - Wt
+    alpha   = beta - np.arctan2(Wa,Wt)
+    W       = (Wa*Wa + Wt*Wt)**0.5
+    Ma      = (W)/a #a is the speed of sound
+    
+    #if np.any(Ma> 1.0):
+        #warn('Propeller blade tips are supersonic.', Warning)
+    
+    lamdaw = r*Wa/(R*Wt)
+    
+    # Limiter to keep from Nan-ing
+    lamdaw[lamdaw<0.] = 0.
+    
+    f            = (B/2.)*(1.-r/R)/lamdaw
+    piece        = np.exp(-f)
+    arccos_piece = np.arccos(piece)
+    F            = 2.*arccos_piece/pi
+    Gamma        = vt*(4.*pi*r/B)*F*(1.+(4.*lamdaw*R/(pi*B*r))*(4.*lamdaw*R/(pi*B*r)))**0.5
+    
+    # Ok, from the airfoil data, given Re, Ma, alpha we need to find Cl
+    Cl = cl_a*alpha
+    
+    # By 90 deg, it's totally stalled.
+    Cl[alpha>=pi/2] = 0.
+    
+    # Scale for Mach, this is Karmen_Tsien
+    Cl[Ma<1.] = Cl[Ma<1.]/((1-Ma[Ma<1.]*Ma[Ma<1.])**0.5+((Ma[Ma<1.]*Ma[Ma<1.])/(1+(1-Ma[Ma<1.]*Ma[Ma<1.])**0.5))*Cl[Ma<1.]/2)
+    
+    # If the blade segments are supersonic, don't scale
+    Cl[Ma>=1.] = Cl[Ma>=1.] 
+    
+    Rsquiggly = Gamma - 0.5*W*c*Cl
+    
+    #An analytical derivative for dR_dpsi, this is derived by taking a derivative of the above equations
+    #This was solved symbolically in Matlab and exported        
+    f_wt_2 = 4*Wt*Wt
+    f_wa_2 = 4*Wa*Wa
+    Ucospsi  = U*cos_psi
+    Usinpsi  = U*sin_psi
+    Utcospsi = Ut*cos_psi
+    Uasinpsi = Ua*sin_psi
+    
+    UapUsinpsi = (Ua + Usinpsi)
+    utpUcospsi = (Ut + Ucospsi)
+    
+    utpUcospsi2 = utpUcospsi*utpUcospsi
+    UapUsinpsi2 = UapUsinpsi*UapUsinpsi
+    
+    dR_dpsi = ((4.*U*r*arccos_piece*sin_psi*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5))/B - 
+               (pi*U*(Ua*cos_psi - Ut*sin_psi)*(beta - np.arctan((Wa+Wa)/(Wt+Wt))))/(2.*(f_wt_2 + f_wa_2)**(0.5))
+               + (pi*U*(f_wt_2 +f_wa_2)**(0.5)*(U + Utcospsi  +  Uasinpsi))/(2.*(f_wa_2/(f_wt_2) + 1.)*utpUcospsi2)
+               - (4.*U*piece*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5)*(R - r)*(Ut/2. - 
+              (Ucospsi)/2.)*(U + Utcospsi + Uasinpsi ))/(f_wa_2*(1. - np.exp(-(B*(Wt+Wt)*(R - 
+               r))/(r*(Wa+Wa))))**(0.5)) + (128.*U*r*arccos_piece*(Wa+Wa)*(Ut/2. - (Ucospsi)/2.)*(U + 
+               Utcospsi  + Uasinpsi ))/(BBB*pi2*utpUcospsi*utpUcospsi2*((16.*f_wa_2)/(BB*pi2*f_wt_2) + 1.)**(0.5))) 
+    
+    dR_dpsi[np.isnan(dR_dpsi)] = 0.1
+    
+    return Rsquiggly, dR_dpsi, (Wa, Wt, W, Ma, alpha, Cl, Gamma)
@@ -7,6 +7,7 @@
 #           Sep 2017, E. Botero
 #           Jan 2018, W. Maier
 #           Aug 2018, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -72,6 +73,7 @@ class Supersonic_Nozzle(Energy_Component):
         self.outputs.stagnation_enthalpy     = 0.
         self.max_area_ratio                  = 1000.
         self.min_area_ratio                  = 0.    
+        self.gas_dynamics_tables             = False # start the area-Mach solvers from the gas dynamics tables
     
     
     
@@ -222,6 +224,7 @@ class Supersonic_Nozzle(Energy_Component):
           polytropic_efficiency               [-]
           max_area_ratio                      [-]
           min_area_ratio                      [-]
+          gas_dynamics_tables                 [-]
         """           
         
         #unpack the values
@@ -245,6 +248,7 @@ class Supersonic_Nozzle(Energy_Component):
         etapold         = self.polytropic_efficiency
         max_area_ratio  = self.max_area_ratio
         min_area_ratio  = self.min_area_ratio
+        tables          = self.gas_dynamics_tables
         
         
         # Method for computing the nozzle properties
@@ -258,11 +262,11 @@ class Supersonic_Nozzle(Energy_Component):
         area_ratio = (max_area_ratio + min_area_ratio)/2.
         
         #-- Compute limits of each possible flow condition       
-        subsonic_pressure_ratio     = pressure_ratio_isentropic(area_ratio, gamma, True)
-        nozzle_shock_pressure_ratio = pressure_ratio_shock_in_nozzle(area_ratio, gamma)
-        supersonic_pressure_ratio   = pressure_ratio_isentropic(area_ratio, gamma, False) 
-        supersonic_max_Area         = pressure_ratio_isentropic(max_area_ratio, gamma, False)
-        supersonic_min_Area         = pressure_ratio_isentropic(min_area_ratio, gamma, False)
+        subsonic_pressure_ratio     = pressure_ratio_isentropic(area_ratio, gamma, True, tables)
+        nozzle_shock_pressure_ratio = pressure_ratio_shock_in_nozzle(area_ratio, gamma, tables)
+        supersonic_pressure_ratio   = pressure_ratio_isentropic(area_ratio, gamma, False, tables) 
+        supersonic_max_Area         = pressure_ratio_isentropic(max_area_ratio, gamma, False, tables)
+        supersonic_min_Area         = pressure_ratio_isentropic(min_area_ratio, gamma, False, tables)
 
         #-- Compute the output Mach number guess with freestream pressure
         #-- Initializing arrays
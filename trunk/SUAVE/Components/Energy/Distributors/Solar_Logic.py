@@ -3,6 +3,7 @@
 #
 # Created:  Jun 2014, E. Botero
 # Modified: Jan 2016, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -14,6 +15,7 @@ import SUAVE
 # package imports
 import numpy as np
 from SUAVE.Components.Energy.Energy_Component import Energy_Component
+from SUAVE.Methods.Missions.Segments.Common.Numerics import integrate
 
 # ----------------------------------------------------------------------
 #  Solar Logic Class
@@ -115,7 +117,6 @@ class Solar_Logic(Energy_Component):
         volts_motor = self.inputs.volts_motor
         esccurrent  = self.inputs.currentesc
         volts       = self.voltage()
-        I           = numerics.time.integrate
         
         pavail = pin*self.MPPT_efficiency
         
@@ -123,7 +124,7 @@ class Solar_Logic(Energy_Component):
         
         # Integrate the plevel over time to assess the energy consumption
         # or energy storage
-        e = np.dot(I,plevel)
+        e = integrate(numerics,plevel)
         
         # Send or take power out of the battery, Pack up
         self.outputs.current         = (plevel/volts)
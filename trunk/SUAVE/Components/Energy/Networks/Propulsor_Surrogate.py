@@ -2,7 +2,7 @@
 # Propulsor_Surrogate.py
 #
 # Created:  Mar 2017, E. Botero
-# Modified:
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -16,11 +16,7 @@ import numpy as np
 from SUAVE.Components.Propulsors.Propulsor import Propulsor
 
 from SUAVE.Core import Data
-import sklearn
-from sklearn import gaussian_process
-from sklearn.gaussian_process.kernels import RationalQuadratic 
-from sklearn import neighbors
-from sklearn import svm
+from SUAVE.Surrogate.Interpolant_Surrogate import Interpolant_Surrogate
 
 # ----------------------------------------------------------------------
 #  Network
@@ -101,14 +97,10 @@ class Propulsor_Surrogate(Propulsor):
         
         cond = np.hstack([altitude,mach,throttle])
         
-        # Run the surrogate for a range of altitudes
+        # Run the surrogate for all the points at once
         data_len = len(altitude)
-        sfc = np.zeros([data_len,1])  
-        thr = np.zeros([data_len,1]) 
-        for ii,_ in enumerate(altitude):            
-            sfc[ii] = sfc_surrogate.predict([np.array([altitude[ii][0],mach[ii][0],throttle[ii][0]])])    
-            thr[ii] = thr_surrogate.predict([np.array([altitude[ii][0],mach[ii][0],throttle[ii][0]])])   #This is the fix when sklearn is update.
-
+        sfc = np.reshape(sfc_surrogate.predict(cond),[data_len,1])
+        thr = np.reshape(thr_surrogate.predict(cond),[data_len,1])
         
         F    = thr
         mdot = thr*sfc*self.number_of_engines
@@ -125,6 +117,7 @@ class Propulsor_Surrogate(Propulsor):
             -Gaussian Processes
             -KNN
             -SVR
+            -Linear interpolation, the fastest to evaluate
     
             Assumptions:
             None
@@ -142,6 +135,10 @@ class Propulsor_Surrogate(Propulsor):
             Properties Used:
             Defaulted values
         """          
+        from sklearn import gaussian_process
+        from sklearn.gaussian_process.kernels import RationalQuadratic
+        from sklearn import neighbors
+        from sklearn import svm
         
         # file name to look for
         file_name = self.input_file
@@ -183,8 +180,15 @@ class Propulsor_Surrogate(Propulsor):
             regr_sfc = svm.SVR(C=500.)
             sfc_surrogate  = regr_sfc.fit(xy, sfc)
             thr_surrogate  = regr_thr.fit(xy, thr)           
+            
+        elif self.surrogate_type  == 'linear':
+            sfc_surrogate = Interpolant_Surrogate().fit(xy, sfc)
+            thr_surrogate = Interpolant_Surrogate().fit(xy, thr)
+            
+        else:
+            raise ValueError('Unknown surrogate_type ' + str(self.surrogate_type))
         
         
         # Save the output
         self.sfc_surrogate    = sfc_surrogate
-        self.thrust_surrogate = thr_surrogate     
\ No newline at end of file
+        self.thrust_surrogate = thr_surrogate
@@ -11,6 +11,9 @@ from .Physical_Component import Physical_Component
 from .Lofted_Body import Lofted_Body
 from .Envelope import Envelope
 
+# the methods use the packages below, they are imported first as in SUAVE/__init__
+from SUAVE import Methods
+
 # packages
 from . import Wings
 from . import Fuselages
@@ -0,0 +1,223 @@
+## @ingroup Core
+# Fast_Data.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from .Data import Data
+
+dictsetitem  = dict.__setitem__
+dictdelitem  = dict.__delitem__
+dictpop      = dict.pop
+dictclear    = dict.clear
+objsetattrib = object.__setattr__
+objdelattrib = object.__delattr__
+
+# ----------------------------------------------------------------------
+#   Fast_Data
+# ----------------------------------------------------------------------
+
+## @ingroup Core
+class Fast_Data(Data):
+    """ A Data() whose attribute style access does not go through Python level hooks.
+        Every string key is mirrored in the instance __dict__, so reading data.key and calling
+        methods use the interpreter's own attribute lookup. Writes keep both copies in sync.
+        This is meant for trees that are read many times per mission iteration, like the conditions.
+
+        Assumptions:
+        Keys are only changed through item or attribute assignment, deletion, update, pop,
+        setdefault, popitem and clear.
+
+        Source:
+        N/A
+    """
+
+    # the plain object lookup finds keys in the instance __dict__
+    __getattribute__ = object.__getattribute__
+
+    def __setattr__(self, k, v):
+        """ An override of the standard __setattr_ in Python.
+
+            Assumptions:
+            Same rules as Data(), attributes of the class which are not keys are set as attributes,
+            everything else is a key.
+
+            Source:
+            N/A
+
+            Inputs:
+            k        [key]
+            v        [value]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        if k in self or not (hasattr(type(self),k) or k in self.__dict__):
+            self[k] = v
+        else:
+            objsetattrib(self, k, v)
+
+    def __delattr__(self, k):
+        """ An override of the standard __delattr_ in Python. This deletes whatever is called by k
+
+            Assumptions:
+            Keys are deleted before attributes
+
+            Source:
+            N/A
+
+            Inputs:
+            k        [key]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        if k in self:
+            del self[k]
+        else:
+            objdelattrib(self, k)
+
+    def __setitem__(self, k, v):
+        """ Sets a key and its attribute mirror
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            k        [key]
+            v        [value]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        dictsetitem(self, k, v)
+        if isinstance(k, str):
+            self.__dict__[k] = v
+
+    def __delitem__(self, k):
+        """ Deletes a key and its attribute mirror
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            k        [key]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        dictdelitem(self, k)
+        self.__dict__.pop(k, None)
+
+    def pop(self, k, *default):
+        """ Removes a key and returns its value, like dict.pop()
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            k        [key]
+            default  (optional)
+
+            Outputs:
+            value
+
+            Properties Used:
+            N/A
+        """
+        if k in self:
+            self.__dict__.pop(k, None)
+        return dictpop(self, k, *default)
+
+    def popitem(self):
+        """ Removes the last key and returns it with its value, like dict.popitem()
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            (key, value)
+
+            Properties Used:
+            N/A
+        """
+        k, v = dict.popitem(self)
+        self.__dict__.pop(k, None)
+        return k, v
+
+    def setdefault(self, k, default=None):
+        """ Returns the value of a key, setting it to default if it is missing, like dict.setdefault()
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            k        [key]
+            default
+
+            Outputs:
+            value
+
+            Properties Used:
+            N/A
+        """
+        if not k in self:
+            self[k] = default
+        return dict.__getitem__(self, k)
+
+    def clear(self):
+        """ Removes all keys, attributes that are not keys are kept
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        mirror = self.__dict__
+        for k in dict.keys(self):
+            mirror.pop(k, None)
+        dictclear(self)
@@ -0,0 +1,250 @@
+## @ingroup Core
+# Pack_Plan.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified: Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from .Arrays import array_type, matrix_type
+
+# same types as Data.pack_array()
+valid_types = ( int, float,
+                array_type,
+                matrix_type )
+
+# ----------------------------------------------------------------------
+#   Pack_Plan
+# ----------------------------------------------------------------------
+
+## @ingroup Core
+class Pack_Plan(object):
+    """ A precompiled layout of Data.pack_array(output='vector') for one data tree.
+        The tree is walked once to find the slice and shape of every packed value, afterwards packing
+        fills one preallocated buffer and unpacking copies reshaped views of the vector in place,
+        without recursion or type checks.
+
+        Assumptions:
+        The plan is only used while the tree keeps its layout. pack() and unpack() return None when
+        a key was added, removed, replaced or reordered, a branch was replaced, or a value changed type
+        or shape, the caller then builds a new plan.
+
+        Source:
+        N/A
+    """
+
+    def __init__(self, data):
+        """ Walks the tree in the same order as Data.pack_array()
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            data     [Data]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+
+        branches = []
+        leaves   = []
+        index    = [0]
+
+        def do_plan(parent, key, D):
+            branches.append((parent, key, D, tuple(D.keys())))
+            for k,v in D.items():
+                if isinstance(v, dict):
+                    do_plan(D, k, v) # recursion!
+                    continue
+                elif not isinstance(v, valid_types): continue
+                shape = np.shape(v)
+                if len(shape) > 2: continue
+                size  = int(np.prod(shape))
+                leaves.append((D, k, shape, index[0], index[0] + size))
+                index[0] += size
+
+        do_plan(None, None, data)
+
+        self.branches = branches
+        self.leaves   = leaves
+        self.size     = index[0]
+
+        self.allocate()
+
+    def allocate(self):
+        """ Allocates the packing buffer and a view of it for each packed value
+
+            Assumptions:
+            Values are laid out in column major order, like Data.pack_array()
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            self.leaves
+            self.size
+        """
+
+        self.buffer = np.empty(self.size)
+        self.views  = [ self.buffer[start:stop].reshape(shape, order='F') for _, _, shape, start, stop in self.leaves ]
+
+    def is_valid(self):
+        """ Checks that the branches of the tree and their keys, in packing order, have not changed
+            since the plan was built
+
+            Assumptions:
+            Values are checked when they are packed or unpacked
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            valid    [bool]
+
+            Properties Used:
+            self.branches
+        """
+
+        for parent, key, D, keys in self.branches:
+            if len(D) != len(keys) or tuple(D.keys()) != keys:
+                return False
+            if parent is not None and dict.get(parent, key) is not D:
+                return False
+
+        return True
+
+    def pack(self):
+        """ Packs the tree into a new 1D vector
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            vector   [array] - or None if the plan is out of date
+
+            Properties Used:
+            self.leaves
+            self.views
+            self.buffer
+        """
+
+        if not self.is_valid():
+            return None
+
+        for (D, k, shape, _, _), view in zip(self.leaves, self.views):
+            v = dict.__getitem__(D, k)
+            if not isinstance(v, valid_types) or np.shape(v) != shape:
+                return None
+            view[...] = v
+
+        return self.buffer.copy()
+
+    def unpack(self, M):
+        """ Unpacks a 1D vector into the tree in place
+
+            Assumptions:
+            Scalars are replaced, arrays are overwritten in place like Data.unpack_array()
+
+            Source:
+            N/A
+
+            Inputs:
+            M        [array]
+
+            Outputs:
+            success  [bool] - or None if the plan is out of date
+
+            Properties Used:
+            self.leaves
+            self.size
+        """
+
+        if len(M) != self.size or not self.is_valid():
+            return None
+
+        values = []
+        for D, k, shape, start, stop in self.leaves:
+            v = dict.__getitem__(D, k)
+            if not isinstance(v, valid_types) or np.shape(v) != shape:
+                return None
+            values.append(v)
+
+        for (D, k, shape, start, stop), v in zip(self.leaves, values):
+            if shape == ():
+                D[k] = M[start]
+            else:
+                v[...] = M[start:stop].reshape(shape, order='F')
+
+        return True
+
+    def __getstate__(self):
+        """ The buffer views are not copied, they are rebuilt from the layout
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            state    [dict]
+
+            Properties Used:
+            N/A
+        """
+
+        state = self.__dict__.copy()
+        del state['buffer']
+        del state['views']
+
+        return state
+
+    def __setstate__(self, state):
+        """ Restores the layout and allocates a new buffer
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            state    [dict]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+
+        self.__dict__.update(state)
+        self.allocate()
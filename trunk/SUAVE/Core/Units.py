@@ -3,6 +3,7 @@
 #
 # Created:  Feb 2014, T. Lukacyzk
 # Modified: Feb 2016, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 """ Implements base unit conversion style programming
     by monkey patching Pint
@@ -18,6 +19,9 @@ from SUAVE.Plugins.pint.quantity import _Quantity
 
 Units = UnitRegistry()
 
+# the conversion of each unit name or expression, resolved once
+conversion_factors = {}
+
 
 # ------------------------------------------------------------
 #   Monkey Patching
@@ -79,7 +83,193 @@ def __rdiv__(self,other):
         self.ito(units)
         return self.magnitude
 
+# ------------------------------------------------------------
+#   Conversion Factors
+# ------------------------------------------------------------
+
+## @ingroup Core
+class Offset_Unit(object):
+    """ The conversion of a unit with an offset to its base unit, like
+        the temperatures in degF or degC, base = value * scale + offset
+
+        Assumptions:
+        Offset units are not combined with other units, pint rejects
+        them in compound expressions like Units['degF/s']
+
+        Source:
+        N/A
+    """
+    __slots__ = ['scale','offset']
+    
+    # numpy arrays leave the operations to the unit
+    __array_ufunc__ = None
+    
+    def __init__(self,scale,offset):
+        """ Stores the scale and offset of the unit
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            scale  [base unit/unit]
+            offset [base unit]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """          
+        self.scale  = scale
+        self.offset = offset
+        
+    def __rmul__(self,other):
+        """ Converts in to the base unit
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            Other
+
+            Outputs:
+            Converted into Base Units!
+
+            Properties Used:
+            N/A
+        """             
+        return other * self.scale + self.offset
+    
+    def __rtruediv__(self,other):
+        """ Converts out of the base unit
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            Other
+
+            Outputs:
+            Converted from Base Units!
+
+            Properties Used:
+            N/A
+        """          
+        return (other - self.offset) / self.scale
+    
+    __mul__     = __rmul__
+    __truediv__ = __rtruediv__
+    
+    def __repr__(self):
+        return 'Offset_Unit(scale=' + repr(self.scale) + ', offset=' + repr(self.offset) + ')'
+
+## @ingroup Core
+def conversion_factor(registry,expression):
+    """ Resolves a unit name or expression to its conversion to the base 
+        units, a float, or an Offset_Unit for the units with an offset. 
+        Each expression is resolved by pint once and cached afterwards.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        registry   <UnitRegistry>
+        expression <string> like 'ft' or 'slug/ft**3'
+
+        Outputs:
+        factor     [base unit/unit] float or Offset_Unit
+
+        Properties Used:
+        N/A
+    """        
+    try:
+        return conversion_factors[expression]
+    except KeyError:
+        pass
+    
+    quantity = registry.parse_expression(expression)
+    
+    # expressions with numbers have already been converted by the patched multiplication
+    if not isinstance(quantity,_Quantity):
+        factor = float(quantity)
+    else:
+        magnitude = float(quantity.magnitude)
+        zero      = float(registry.Quantity(0.,quantity._units).to_base_units().magnitude)
+        if zero == 0.:
+            factor = float(registry.Quantity(magnitude,quantity._units).to_base_units().magnitude)
+        else:
+            # the scale over a span wide enough that the offset does not round it
+            span   = 1e6 * magnitude
+            factor = Offset_Unit((registry.Quantity(span,quantity._units).to_base_units().magnitude - zero) / span, zero)
+        
+    conversion_factors[expression] = factor
+    
+    return factor
+
+# unit names resolve to their conversion factors
+## @ingroup Core
+def registry_getattr(self,item):
+    """ Retrieves the conversion factor of a unit name, stored on the 
+        registry so later retrievals are plain attribute lookups
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        item   <string> unit name
+
+        Outputs:
+        factor [base unit/unit] float or Offset_Unit
+
+        Properties Used:
+        N/A
+    """       
+    if item.startswith('__'):
+        raise AttributeError(item)
+    factor = conversion_factor(self,item)
+    setattr(self,item,factor)
+    return factor
+
+# unit expressions too
+## @ingroup Core
+def registry_getitem(self,item):
+    """ Retrieves the conversion factor of a unit expression
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        item   <string> unit expression
+
+        Outputs:
+        factor [base unit/unit] float or Offset_Unit
+
+        Properties Used:
+        N/A
+    """      
+    return conversion_factor(self,item)
+
 # yay monkey patching!
+UnitRegistry.__getattr__    = registry_getattr
+UnitRegistry.__getitem__    = registry_getitem
 Units.Quantity.__mul__      = __rmul__
 Units.Quantity.__rmul__     = __rmul__
 Units.Quantity.__div__      = __rdiv__
@@ -112,6 +302,11 @@ Units.__doc__ = \
       to meters.  Thus the * (multiplication) operation converts 
       from the current units to the base units and / (division) 
       operation converts from the base units to the desired units.
+      
+      Each unit name or expression is resolved by pint once, to a
+      float, or an Offset_Unit for temperatures like degF. 
+      Temperatures are not combined with other units, pint rejects
+      them in compound expressions like Units['degF/s'].
      
     Base Units:
       mass        : kilogram
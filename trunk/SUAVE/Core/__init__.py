@@ -4,6 +4,8 @@
 from .Arrays import *
 
 from .Data             import Data
+from .Fast_Data        import Fast_Data
+from .Pack_Plan        import Pack_Plan
 from .DataOrdered      import DataOrdered
 from .Diffed_Data      import Diffed_Data
 from .Container        import Container
@@ -2,4 +2,6 @@
 # Functions needed to save SUAVE data structures in JSON form
 # @ingroup Input_Output
 from .load import load
-from .archive import archive
\ No newline at end of file
+from .archive import archive
+from .training_cache import hash_data, file_key, load_training_cache, save_training_cache, cached_training
+from .history import append_history, read_history, read_any_history, convert_text_history, is_history
@@ -0,0 +1,386 @@
+## @ingroup Input_Output-SUAVE
+# history.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+import re
+import struct
+import numpy as np
+
+# the header of a binary history: magic, version, number of columns, padded to header_size
+history_magic   = b'SUAVEHST'
+history_version = 1
+header_format   = '<8sII'
+header_size     = 32
+
+# the rows are little endian doubles
+row_dtype = np.dtype('<f8')
+
+# separators and labels of the legacy text histories
+text_separators = str.maketrans('[],','   ')
+text_labels     = ['iteration =','objective =','inputs =','constraints =']
+
+# numbers in any other text history, names around them (np.float64) are skipped
+number_pattern = re.compile(r'(?<![\w.])[-+]?(?:(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?|nan|inf)(?![\w.])')
+
+# ----------------------------------------------------------------------
+#  Append History
+# ----------------------------------------------------------------------
+
+## @ingroup Input_Output-SUAVE
+def append_history(filename,rows):
+    """Appends rows of numbers to a binary history file, creating it if needed.
+
+    Assumptions:
+    The file is only ever appended to. Each row is written in a single write, so a reader
+    never sees more than a partial last row, which it ignores.
+
+    Source:
+    N/A
+
+    Inputs:
+    filename   <string>
+    rows       one row or an array of rows, all with the same number of columns
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+
+    rows    = np.atleast_2d(np.asarray(rows,dtype=row_dtype))
+    columns = rows.shape[1]
+
+    if history_size(filename):
+        existing = read_header(filename)
+        if existing != columns:
+            raise ValueError('history ' + filename + ' has ' + str(existing) + ' columns, got ' + str(columns))
+        header = b''
+    else:
+        header = struct.pack(header_format,history_magic,history_version,columns)
+        header = header + b'\0'*(header_size - len(header))
+
+    with open(filename,'ab') as file:
+        file.write(header + rows.tobytes())
+
+    return
+
+# ----------------------------------------------------------------------
+#  Read History
+# ----------------------------------------------------------------------
+
+## @ingroup Input_Output-SUAVE
+def read_history(filename,mmap_mode=None):
+    """Reads all the complete rows of a binary history file.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    filename   <string>
+    mmap_mode  <string> - 'r' maps the rows instead of reading them, None reads them
+
+    Outputs:
+    rows       [array]  - one row per line, empty if there are none
+
+    Properties Used:
+    N/A
+    """
+
+    columns = read_header(filename)
+    count   = (os.path.getsize(filename) - header_size) // (columns*row_dtype.itemsize)
+
+    if count == 0:
+        return np.zeros((0,columns))
+
+    if mmap_mode is not None:
+        return np.memmap(filename,dtype=row_dtype,mode=mmap_mode,offset=header_size,shape=(count,columns))
+
+    rows = np.fromfile(filename,dtype=row_dtype,count=count*columns,offset=header_size)
+
+    return rows.reshape((count,columns))
+
+## @ingroup Input_Output-SUAVE
+def read_header(filename):
+    """Checks the header of a binary history file and returns its number of columns.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    filename   <string>
+
+    Outputs:
+    columns    <int>
+
+    Properties Used:
+    N/A
+    """
+
+    with open(filename,'rb') as file:
+        header = file.read(header_size)
+
+    if len(header) < header_size or header[:len(history_magic)] != history_magic:
+        raise ValueError(filename + ' is not a SUAVE history file')
+
+    magic, version, columns = struct.unpack(header_format,header[:struct.calcsize(header_format)])
+    if version != history_version:
+        raise ValueError('unsupported history version ' + str(version) + ' in ' + filename)
+
+    return columns
+
+## @ingroup Input_Output-SUAVE
+def is_history(filename):
+    """Checks whether a file is a binary history, as opposed to a legacy text one.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    filename   <string>
+
+    Outputs:
+    is_history <bool>
+
+    Properties Used:
+    N/A
+    """
+
+    try:
+        with open(filename,'rb') as file:
+            return file.read(len(history_magic)) == history_magic
+    except (IOError,OSError,TypeError):
+        return False
+
+## @ingroup Input_Output-SUAVE
+def history_size(filename):
+    """Returns the size of a history file, of either format, None if it does not exist.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    filename   <string>
+
+    Outputs:
+    size       <int>
+
+    Properties Used:
+    N/A
+    """
+
+    try:
+        return os.path.getsize(filename)
+    except (OSError,TypeError):
+        return None
+
+## @ingroup Input_Output-SUAVE
+def history_format(filename,new_format='text'):
+    """Returns the format rows should be appended to a history file in. Existing files keep
+    their format, new or empty ones get new_format.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    filename   <string>
+    new_format <string> - 'text' or 'binary'
+
+    Outputs:
+    format     <string> - 'text' or 'binary'
+
+    Properties Used:
+    N/A
+    """
+
+    if not history_size(filename):
+        if new_format not in ('text','binary'):
+            raise ValueError("history format should be 'text' or 'binary', got " + str(new_format))
+        return new_format
+
+    if is_history(filename):
+        return 'binary'
+
+    return 'text'
+
+# ----------------------------------------------------------------------
+#  Legacy Text Histories
+# ----------------------------------------------------------------------
+
+## @ingroup Input_Output-SUAVE
+def parse_text_history(lines):
+    """Extracts the numbers of the lines of a legacy text history, like the sizing outputs
+    '[x1, x2] [y1, y2]' or the optimization outputs 'iteration = 1 , objective = ...'.
+
+    Assumptions:
+    All the lines have the same count of numbers. Blank lines are skipped.
+
+    Source:
+    N/A
+
+    Inputs:
+    lines      <list of strings>
+
+    Outputs:
+    rows       [array]
+
+    Properties Used:
+    N/A
+    """
+
+    lines = [ line for line in lines if line.strip() ]
+    count = len(lines)
+    if count == 0:
+        return np.zeros((0,0))
+
+    # the known formats are split in one pass over the whole text
+    numbers = split_text(' '.join(lines))
+    columns = len(numbers) // count
+    first   = len(split_text(lines[0]))
+    last    = len(split_text(lines[-1]))
+    if len(numbers) == columns*count and first == columns and last == columns:
+        try:
+            return np.array(numbers,dtype=float).reshape((count,columns))
+        except ValueError:
+            pass
+
+    rows = [ number_pattern.findall(line) for line in lines ]
+
+    return np.array(rows,dtype=float)
+
+## @ingroup Input_Output-SUAVE
+def split_text(text):
+    """Splits the text of a legacy history into numbers, removing its labels and separators.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    text       <string>
+
+    Outputs:
+    numbers    <list of strings>
+
+    Properties Used:
+    N/A
+    """
+
+    for label in text_labels:
+        text = text.replace(label,' ')
+
+    return text.translate(text_separators).split()
+
+## @ingroup Input_Output-SUAVE
+def read_text_history(filename):
+    """Reads a legacy text history file.
+
+    Assumptions:
+    See parse_text_history
+
+    Source:
+    N/A
+
+    Inputs:
+    filename   <string>
+
+    Outputs:
+    rows       [array]
+
+    Properties Used:
+    N/A
+    """
+
+    with open(filename) as file:
+        lines = file.readlines()
+
+    return parse_text_history(lines)
+
+## @ingroup Input_Output-SUAVE
+def read_any_history(filename):
+    """Reads a history file in either format.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    filename   <string>
+
+    Outputs:
+    rows       [array]
+
+    Properties Used:
+    N/A
+    """
+
+    if is_history(filename):
+        return read_history(filename)
+
+    return read_text_history(filename)
+
+## @ingroup Input_Output-SUAVE
+def convert_text_history(text_filename,history_filename=None):
+    """Converts a legacy text history to the binary format. Given the same name, or none, the
+    file is replaced once the conversion is complete.
+
+    Assumptions:
+    See parse_text_history
+
+    Source:
+    N/A
+
+    Inputs:
+    text_filename      <string>
+    history_filename   <string>
+
+    Outputs:
+    history_filename   <string>
+
+    Properties Used:
+    N/A
+    """
+
+    if history_filename is None:
+        history_filename = text_filename
+
+    rows = read_text_history(text_filename)
+
+    temporary = history_filename + '.tmp'
+    if history_size(temporary) is not None:
+        os.remove(temporary)
+
+    if len(rows):
+        append_history(temporary,rows)
+    else:
+        open(temporary,'wb').close()
+
+    os.replace(temporary,history_filename)
+
+    return history_filename
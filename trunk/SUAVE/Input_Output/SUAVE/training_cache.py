@@ -0,0 +1,282 @@
+## @ingroup Input_Output-SUAVE
+# training_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified: Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+import pickle
+import hashlib
+import tempfile
+import numpy as np
+
+from SUAVE.Core import Data
+
+# version of the cache contents, changing it invalidates old entries
+cache_version = 1
+
+# ----------------------------------------------------------------------
+#  Hash Data
+# ----------------------------------------------------------------------
+
+## @ingroup Input_Output-SUAVE
+def hash_data(*items):
+    """Builds a content hash of SUAVE data structures, used as a key for cached training data.
+
+    Assumptions:
+    Only numbers, strings, booleans, None, numpy arrays, lists and dictionaries can be hashed.
+    Any other object (functions, solvers) raises a TypeError, files are hashed with file_key.
+
+    Source:
+    N/A
+
+    Inputs:
+    items      SUAVE data structures, arrays or values
+
+    Outputs:
+    key        <string> - hexadecimal sha1 digest
+
+    Properties Used:
+    N/A
+    """
+
+    sha = hashlib.sha1()
+    sha.update(str(cache_version).encode())
+
+    for item in items:
+        update_hash(sha,item,set())
+
+    return sha.hexdigest()
+
+## @ingroup Input_Output-SUAVE
+def update_hash(sha,value,visited):
+    """Recursively adds a value to a hash in a deterministic order.
+
+    Assumptions:
+    Dictionaries are hashed in sorted key order, so insertion order does not matter.
+
+    Source:
+    N/A
+
+    Inputs:
+    sha        hashlib object
+    value      value to add
+    visited    <set> - ids of containers already hashed, protects against cycles
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+
+    if isinstance(value,dict):
+        if id(value) in visited:
+            sha.update(b'<cycle>')
+            return
+        visited.add(id(value))
+        sha.update(b'{')
+        for key in sorted(value.keys(),key=str):
+            sha.update(str(key).encode())
+            sha.update(b':')
+            update_hash(sha,value[key],visited)
+        sha.update(b'}')
+        visited.discard(id(value))
+
+    elif isinstance(value,(list,tuple)):
+        sha.update(b'[')
+        for v in value:
+            update_hash(sha,v,visited)
+        sha.update(b']')
+
+    elif isinstance(value,np.ndarray):
+        if value.dtype == object:
+            update_hash(sha,value.tolist(),visited)
+        else:
+            sha.update(str(value.dtype).encode())
+            sha.update(str(value.shape).encode())
+            sha.update(np.ascontiguousarray(value).tobytes())
+
+    elif isinstance(value,(bool,int,float,complex,str,np.number,np.bool_)) or value is None:
+        sha.update(type(value).__name__.encode())
+        sha.update(repr(value).encode())
+
+    else:
+        raise TypeError('can not hash a value of type ' + type(value).__name__)
+
+    sha.update(b';')
+
+    return
+
+## @ingroup Input_Output-SUAVE
+def file_key(filename):
+    """Identifies a file by its contents, so that an edited file with the same name is a new key.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    filename   <string> - path to the file, or None
+
+    Outputs:
+    key        <string> - hexadecimal sha1 digest of the contents, None if no file is given
+
+    Properties Used:
+    N/A
+    """
+
+    if not filename:
+        return None
+
+    sha = hashlib.sha1()
+    with open(filename,'rb') as f:
+        for block in iter(lambda: f.read(1 << 20),b''):
+            sha.update(block)
+
+    return sha.hexdigest()
+
+# ----------------------------------------------------------------------
+#  Load and Save
+# ----------------------------------------------------------------------
+
+## @ingroup Input_Output-SUAVE
+def load_training_cache(directory,key):
+    """Loads previously cached training data and surrogates.
+
+    Assumptions:
+    A missing or unreadable entry is treated as a cache miss.
+
+    Source:
+    N/A
+
+    Inputs:
+    directory  <string> - folder holding the cache
+    key        <string> - key from hash_data
+
+    Outputs:
+    data       SUAVE data structure, or None if there is no entry
+
+    Properties Used:
+    N/A
+    """
+
+    filename = os.path.join(directory,key + '.pkl')
+
+    if not os.path.isfile(filename):
+        return None
+
+    try:
+        with open(filename,'rb') as f:
+            data = pickle.load(f)
+    except Exception:
+        return None
+
+    return data
+
+## @ingroup Input_Output-SUAVE
+def save_training_cache(directory,key,data):
+    """Saves training data and surrogates so that identical analyses can reuse them.
+
+    Assumptions:
+    The data is picklable. The file is written to a temporary name first and then moved in
+    place, so that concurrent processes never read a partial entry.
+
+    Source:
+    N/A
+
+    Inputs:
+    directory  <string> - folder holding the cache, created if needed
+    key        <string> - key from hash_data
+    data       SUAVE data structure
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+
+    if not os.path.isdir(directory):
+        os.makedirs(directory,exist_ok=True)
+
+    filename = os.path.join(directory,key + '.pkl')
+
+    handle, temporary = tempfile.mkstemp(dir=directory,suffix='.tmp')
+    try:
+        with os.fdopen(handle,'wb') as f:
+            pickle.dump(data,f,protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary,filename)
+    except Exception:
+        if os.path.isfile(temporary):
+            os.remove(temporary)
+        raise
+
+    return
+
+# ----------------------------------------------------------------------
+#  Cached Training
+# ----------------------------------------------------------------------
+
+## @ingroup Input_Output-SUAVE
+def cached_training(analysis,*key_items):
+    """Restores the training data and surrogates of an analysis from the cache, or samples and
+    builds them and stores the result for the next identical analysis.
+
+    Assumptions:
+    key_items contain everything sample_training and build_surrogate depend on, files are given
+    by their file_key. Caching is skipped when analysis.training_cache_directory is None or when
+    the key items can not be hashed.
+
+    Source:
+    N/A
+
+    Inputs:
+    analysis                           SUAVE analysis with sample_training and build_surrogate
+    analysis.training_cache_directory  <string>
+    key_items                          data hashed into the cache key
+
+    Outputs:
+    analysis.training                  SUAVE data structure
+    analysis.surrogates                SUAVE data structure
+
+    Properties Used:
+    N/A
+    """
+
+    directory = analysis.training_cache_directory
+
+    if not directory:
+        analysis.sample_training()
+        analysis.build_surrogate()
+        return
+
+    try:
+        key = hash_data(type(analysis).__name__,*key_items)
+    except TypeError as error:
+        print('Training data is not cached, ' + str(error))
+        analysis.sample_training()
+        analysis.build_surrogate()
+        return
+
+    cached = load_training_cache(directory,key)
+
+    if cached is None:
+        analysis.sample_training()
+        analysis.build_surrogate()
+
+        cached = Data()
+        cached.training   = analysis.training
+        cached.surrogates = analysis.surrogates
+        save_training_cache(directory,key,cached)
+    else:
+        analysis.training   = cached.training
+        analysis.surrogates = cached.surrogates
+
+    return
@@ -11,6 +11,7 @@ from .purge_files          import purge_files
 from .purge_directory      import purge_directory
 from .read_results         import read_results
 from .run_analysis         import run_analysis
+from .run_training_cases   import run_training_cases
 from .translate_data       import translate_conditions_to_cases, translate_results_to_conditions
 from .write_geometry       import write_geometry
 from .write_input_deck     import write_input_deck
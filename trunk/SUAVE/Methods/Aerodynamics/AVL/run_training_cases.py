@@ -0,0 +1,178 @@
+## @ingroup Methods-Aerodynamics-AVL
+# run_training_cases.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+import multiprocessing
+from copy import deepcopy
+from shutil import rmtree
+
+# ----------------------------------------------------------------------
+#  Run Training Cases
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-AVL
+def run_training_cases(avl_object,run_conditions,number_of_processes=None):
+    """ Runs AVL for a list of training conditions, optionally as concurrent AVL processes.
+        Each concurrent run gets its own scratch folder inside the run folder, with the same batch
+        index, and therefore the same input files, as the serial run would have.
+
+    Assumptions:
+        The runs are independent of each other. With the regression flag set, AVL is not called and
+        existing results are read from the run folder, so the runs are done one at a time.
+        Log and error streams are not passed to the worker processes, they print to their own output.
+
+    Source:
+        None
+
+    Inputs:
+        avl_object            - AVL_Inviscid or Stability.AVL analysis
+        run_conditions        - one set of aerodynamic conditions per run      [list]
+        number_of_processes   - number of concurrent runs, None runs serially  [int]
+
+    Outputs:
+        results               - the results of each run, in the input order    [list]
+
+    Properties Used:
+        avl_object.settings.filenames.run_folder
+        avl_object.current_status.batch_index
+        avl_object.keep_files
+        avl_object.regression_flag
+    """
+
+    if number_of_processes is None or avl_object.regression_flag:
+        number_of_processes = 1
+    number_of_processes = max(1,min(number_of_processes,len(run_conditions)))
+
+    if number_of_processes == 1:
+        return [ avl_object.evaluate_conditions(conditions) for conditions in run_conditions ]
+
+    run_folder = os.path.abspath(avl_object.settings.filenames.run_folder)
+    start      = avl_object.current_status.batch_index
+
+    # the runs of the serial path, with their own folders
+    cases = []
+    for ii,conditions in enumerate(run_conditions):
+        batch_index = start + ii
+        folder      = os.path.join(run_folder,'training_{0:03d}'.format(batch_index + 1))
+        cases.append((batch_index,folder,conditions))
+
+    pool = multiprocessing.Pool(number_of_processes,initializer=_initialize_worker,
+                                initargs=(worker_copy(avl_object),))
+    try:
+        # map keeps the results in the order of the cases
+        outputs = pool.map(_run_case,cases,chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+
+    results = [ output[0] for output in outputs ]
+
+    # leave the analysis as the serial path would
+    avl_object.settings.filenames.features = avl_object.geometry._base.tag + '.avl'
+    avl_object.current_status              = outputs[-1][1]
+
+    if not avl_object.keep_files and os.path.isdir(run_folder):
+        rmtree(run_folder)
+
+    return results
+
+## @ingroup Methods-Aerodynamics-AVL
+def worker_copy(avl_object):
+    """ Copies an AVL analysis for the worker processes, without its log and error streams
+
+    Assumptions:
+        Log and error files given by name are kept
+
+    Source:
+        None
+
+    Inputs:
+        avl_object
+
+    Outputs:
+        avl_copy
+
+    Properties Used:
+        avl_object.settings.filenames.log_filename
+        avl_object.settings.filenames.err_filename
+    """
+
+    filenames = avl_object.settings.filenames
+    log_file  = filenames.log_filename
+    err_file  = filenames.err_filename
+
+    # open streams can not be copied to another process
+    try:
+        if not isinstance(log_file,str): filenames.log_filename = None
+        if not isinstance(err_file,str): filenames.err_filename = None
+        avl_copy = deepcopy(avl_object)
+    finally:
+        filenames.log_filename = log_file
+        filenames.err_filename = err_file
+
+    return avl_copy
+
+# ----------------------------------------------------------------------
+#  Workers
+# ----------------------------------------------------------------------
+
+# the copy of the analysis held by each worker process
+_worker_avl = None
+
+def _initialize_worker(avl_object):
+    """ Stores the copy of the analysis a worker process runs AVL with
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Inputs:
+        avl_object
+
+    Outputs:
+        None
+
+    Properties Used:
+        N/A
+    """
+    global _worker_avl
+    _worker_avl = avl_object
+
+def _run_case(case):
+    """ Runs one set of training conditions in its own folder
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Inputs:
+        case   - (batch index before the run, run folder, conditions)
+
+    Outputs:
+        results
+        current_status
+
+    Properties Used:
+        N/A
+    """
+
+    batch_index, folder, conditions = case
+
+    avl_object = _worker_avl
+    avl_object.current_status.batch_index    = batch_index
+    avl_object.settings.filenames.run_folder = folder
+
+    results = avl_object.evaluate_conditions(conditions)
+
+    return results, avl_object.current_status
@@ -5,6 +5,7 @@
 # Modified: Apr 2017, T. MacDonald
 #           Oct 2017, E. Botero
 #           Jun 2018, M. Clarke
+#           Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
@@ -23,7 +24,8 @@ def weissinger_vortex_lattice(conditions,configuration,wing):
     """Uses the vortex lattice method to compute the lift coefficient and induced drag component
 
     Assumptions:
-    None
+    The influence matrix does not depend on angle of attack, so an array of angles is
+    solved with a single factorization and one back substitution per angle
 
     Source:
     An Introduction to Theoretical and Computational Aerodynamics by Jack Moran
@@ -43,11 +45,11 @@ def weissinger_vortex_lattice(conditions,configuration,wing):
       vertical                              [Boolean]
     configuration.number_panels_spanwise    [Unitless]
     configuration.number_panels_chordwise   [Unitless]
-    conditions.aerodynamics.angle_of_attack [radians]
+    conditions.aerodynamics.angle_of_attack [radians] (scalar or array)
 
     Outputs:
-    Cl                                      [Unitless]
-    Cd                                      [Unitless]
+    Cl                                      [Unitless] (shaped like angle_of_attack)
+    Cd                                      [Unitless] (shaped like angle_of_attack)
 
     Properties Used:
     N/A
@@ -67,8 +69,9 @@ def weissinger_vortex_lattice(conditions,configuration,wing):
     
     n  = configuration.number_panels_spanwise
     
-    # conditions
-    aoa = conditions.aerodynamics.angle_of_attack
+    # conditions, one row per angle of attack
+    aoa_in = conditions.aerodynamics.angle_of_attack
+    aoa    = np.atleast_2d(np.ravel(aoa_in)).T
     
     # chord difference
     dchord = (root_chord-tip_chord)
@@ -145,8 +148,6 @@ def weissinger_vortex_lattice(conditions,configuration,wing):
             xa = np.atleast_2d(xa)  # x coordinate of horseshoe vortex on panel
             x  = np.atleast_2d(x)   # x coordinate of control points on panel
             y  = np.atleast_2d(y)   # y coordinate of control points on panel
-            
-            RHS  = np.atleast_2d(np.sin(twist_distri+aoa))  
    
         else:   # no segments defined on wing 
             # discretizing the wing sections into panels 
@@ -159,19 +160,18 @@ def weissinger_vortex_lattice(conditions,configuration,wing):
             xa   = np.atleast_2d(((i+1)*deltax-deltax/2)*np.tan(sweep) + 0.25*section_length) # x coordinate of horseshoe vortex on panel
             x    = np.atleast_2d(((i+1)*deltax-deltax/2)*np.tan(sweep) + 0.75*section_length) # x coordinate of control points on panel
             y    = np.atleast_2d(((i+1)*deltax-deltax/2))                                     # y coordinate of control points on panel 
-                    
-            RHS  = np.atleast_2d(np.sin(twist_distri+aoa))                                  
                 
+        # one right hand side per angle of attack
+        RHS = np.sin(np.atleast_2d(twist_distri) + aoa)
         
         A = (whav(x,y,xa.T,ya.T)-whav(x,y,xa.T,yb.T)\
             -whav(x,y,xa.T,-ya.T)+whav(x,y,xa.T,-yb.T))*0.25/np.pi
     
-        # Vortex strength computation by matrix inversion
+        # Vortex strength computation, A is factored once for all the right hand sides
         T = np.linalg.solve(A.T,RHS.T).T
         
         # Calculating the effective velocty         
-        A_v = A*0.25/np.pi*T
-        v   = np.sum(A_v,axis=1)
+        v   = np.dot(T,A.T)*0.25/np.pi
         
         Lfi = -T * (sin_aoa-v)
         Lfk =  T * cos_aoa 
@@ -182,16 +182,24 @@ def weissinger_vortex_lattice(conditions,configuration,wing):
         D  = deltax * Dg
         
         # Total lift
-        LT = np.sum(L)
-        DT = np.sum(D)
+        LT = np.sum(L,axis=1)
+        DT = np.sum(D,axis=1)
     
         CL = 2*LT/(0.5*Sref)
         CD = 2*DT/(0.5*Sref)     
         
     else:
         
-        CL = 0.0
-        CD = 0.0    
+        CL = np.zeros(len(aoa))
+        CD = np.zeros(len(aoa))
+        
+    # match the shape of the angles given
+    if np.ndim(aoa_in) == 0:
+        CL = CL[0]
+        CD = CD[0]
+    else:
+        CL = np.reshape(CL,np.shape(aoa_in))
+        CD = np.reshape(CD,np.shape(aoa_in))
 
         
     return CL, CD 
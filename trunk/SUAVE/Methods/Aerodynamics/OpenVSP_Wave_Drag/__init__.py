@@ -2,5 +2,6 @@
 # Functions to perform wave drag calculations using OpenVSP
 # @ingroup Methods-Aerodynamics
 
-from .wave_drag_volume import wave_drag_volume
-from .compressibility_drag_total import compressibility_drag_total
\ No newline at end of file
+from .wave_drag_volume import wave_drag_volume, openvsp_volume_drag
+from .compressibility_drag_total import compressibility_drag_total
+from .volume_drag_cache import cached_volume_drag, save_volume_drag_data, clear_volume_drag_cache, volume_drag_filename
@@ -0,0 +1,285 @@
+## @ingroup Methods-Aerodynamics-OpenVSP_Wave_Drag
+# volume_drag_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from SUAVE.Core import Data
+from SUAVE.Input_Output.SUAVE.history import append_history
+
+# the volume wave drag computed for each geometry, by tag
+volume_drag_caches = {}
+
+# decimals the Mach bins and their edges are rounded to
+edge_decimals = 9
+
+# ----------------------------------------------------------------------
+#  Cached Volume Drag
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-OpenVSP_Wave_Drag
+def cached_volume_drag(geometry, mach, backend, mach_bin_width = 0., bin_origin = 0., **options):
+    """Returns the volume wave drag of a geometry at Mach numbers, from the values computed
+    before for the same geometry. The Mach numbers not computed yet are passed to the backend
+    in a single call.
+
+    With a Mach bin width, the drag is computed at the edges of the bins holding the Mach
+    numbers, bin_origin + k*mach_bin_width, and interpolated linearly in between, so nearby
+    Mach numbers share the same computations. Without, each Mach number is computed exactly.
+
+    Assumptions:
+    The geometry and the backend options do not change between calls with the same tag,
+    clear_volume_drag_cache is called when they may have
+
+    Source:
+    N/A
+
+    Inputs:
+    geometry.
+      tag                   <string>
+    mach                    [-]        Mach numbers, any shape
+    backend                 <function> backend(geometry,mach_numbers,**options) returns the
+                                       volume wave drag coefficients of a 1-D array of Mach numbers
+    mach_bin_width          [-]        width of the Mach bins, 0 to compute each Mach number
+    bin_origin              [-]        Mach number of a bin edge
+    options                            passed to the backend
+
+    Outputs:
+    cd_w                    [-]        volume wave drag coefficients, same shape as mach
+
+    Properties Used:
+    N/A
+    """
+
+    mach  = np.asarray(mach,dtype=float)
+    cache = volume_drag_cache(geometry.tag)
+
+    # the Mach numbers the drag is computed at
+    if mach_bin_width > 0.:
+        # rounded so that Mach numbers on an edge and the edges themselves are found again
+        bins   = np.floor(np.round((mach - bin_origin)/mach_bin_width,edge_decimals))
+        lower  = np.round(bin_origin + bins*mach_bin_width,edge_decimals)
+        upper  = np.round(bin_origin + (bins + 1.)*mach_bin_width,edge_decimals)
+        needed = np.unique(np.concatenate([lower.ravel(),upper.ravel()]))
+    else:
+        needed = np.unique(mach.ravel())
+
+    # compute the missing ones in one pass
+    missing = needed[~cached_mach(cache,needed)]
+    if len(missing):
+        cd_missing = np.asarray(backend(geometry,missing,**options),dtype=float).reshape(missing.shape)
+        add_volume_drag(cache,missing,cd_missing)
+
+    if mach_bin_width > 0.:
+        weight = (mach - lower)/mach_bin_width
+        cd_w   = (1. - weight)*lookup_volume_drag(cache,lower) + weight*lookup_volume_drag(cache,upper)
+    else:
+        cd_w   = lookup_volume_drag(cache,mach)
+
+    return cd_w
+
+## @ingroup Methods-Aerodynamics-OpenVSP_Wave_Drag
+def volume_drag_cache(tag):
+    """Returns the volume wave drag computed for a geometry, creating it if needed.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    tag                     <string>
+
+    Outputs:
+    cache.
+      mach                  [-]        sorted Mach numbers
+      cd_w                  [-]        volume wave drag coefficients
+      pending               <list>     rows (Mach, cd_w) not saved yet
+
+    Properties Used:
+    N/A
+    """
+
+    if tag not in volume_drag_caches:
+        cache = Data()
+        cache.mach    = np.zeros(0)
+        cache.cd_w    = np.zeros(0)
+        cache.pending = []
+        volume_drag_caches[tag] = cache
+
+    return volume_drag_caches[tag]
+
+## @ingroup Methods-Aerodynamics-OpenVSP_Wave_Drag
+def cached_mach(cache, mach):
+    """Checks which Mach numbers have a volume wave drag in a cache.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    cache                   <Data>     from volume_drag_cache
+    mach                    [-]
+
+    Outputs:
+    found                   <boolean array>
+
+    Properties Used:
+    N/A
+    """
+
+    if not len(cache.mach):
+        return np.zeros(np.shape(mach),dtype=bool)
+
+    index = np.minimum(np.searchsorted(cache.mach,mach),len(cache.mach)-1)
+
+    return cache.mach[index] == mach
+
+## @ingroup Methods-Aerodynamics-OpenVSP_Wave_Drag
+def lookup_volume_drag(cache, mach):
+    """Returns the volume wave drag of Mach numbers that are all in a cache.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    cache                   <Data>     from volume_drag_cache
+    mach                    [-]
+
+    Outputs:
+    cd_w                    [-]
+
+    Properties Used:
+    N/A
+    """
+
+    return cache.cd_w[np.searchsorted(cache.mach,mach)]
+
+## @ingroup Methods-Aerodynamics-OpenVSP_Wave_Drag
+def add_volume_drag(cache, mach, cd_w):
+    """Adds new Mach numbers and their volume wave drag to a cache, keeping it sorted.
+
+    Assumptions:
+    The Mach numbers are not in the cache yet
+
+    Source:
+    N/A
+
+    Inputs:
+    cache                   <Data>     from volume_drag_cache
+    mach                    [-]        1-D array
+    cd_w                    [-]        1-D array
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+
+    all_mach = np.concatenate([cache.mach,mach])
+    all_cd_w = np.concatenate([cache.cd_w,cd_w])
+    order    = np.argsort(all_mach,kind='stable')
+
+    cache.mach = all_mach[order]
+    cache.cd_w = all_cd_w[order]
+    cache.pending.append(np.column_stack([mach,cd_w]))
+
+    return
+
+# ----------------------------------------------------------------------
+#  Save and Clear
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-OpenVSP_Wave_Drag
+def save_volume_drag_data(tag, filename = None):
+    """Appends the volume wave drag computed since the last save to a binary history file,
+    in a single write. Each row holds a Mach number and its volume wave drag coefficient.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    tag                     <string>
+    filename                <string>   'volume_drag_data_<tag>.hist' if None
+
+    Outputs:
+    count                   [-]        number of rows written
+
+    Properties Used:
+    N/A
+    """
+
+    if filename is None:
+        filename = volume_drag_filename(tag)
+
+    cache = volume_drag_caches.get(tag)
+    if cache is None or not cache.pending:
+        return 0
+
+    rows = np.vstack(cache.pending)
+    append_history(filename,rows)
+    cache.pending = []
+
+    return len(rows)
+
+## @ingroup Methods-Aerodynamics-OpenVSP_Wave_Drag
+def clear_volume_drag_cache(tag):
+    """Forgets the volume wave drag computed for a geometry, for when it may have changed.
+
+    Assumptions:
+    Values not saved are lost
+
+    Source:
+    N/A
+
+    Inputs:
+    tag                     <string>
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+
+    volume_drag_caches.pop(tag,None)
+
+    return
+
+## @ingroup Methods-Aerodynamics-OpenVSP_Wave_Drag
+def volume_drag_filename(tag):
+    """Returns the name of the file the volume wave drag of a geometry is saved to.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    tag                     <string>
+
+    Outputs:
+    filename                <string>
+
+    Properties Used:
+    N/A
+    """
+
+    return 'volume_drag_data_' + tag + '.hist'
@@ -3,24 +3,27 @@
 # 
 # Created:  Jun 2014, T. Macdonald
 # Modified: Apr 2017, T. Macdonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
-import copy
 import numpy as np
 
+from .volume_drag_cache import cached_volume_drag
+
 # ----------------------------------------------------------------------
 #   Wave Drag Volume
 # ----------------------------------------------------------------------
 
 ## @ingroup Methods-Aerodynamics-OpenVSP_Wave_Drag
-def wave_drag_volume(conditions,geometry,flag105,num_slices=20,num_rots=10):
+def wave_drag_volume(conditions,geometry,flag105,num_slices=20,num_rots=10,backend=None,mach_bin_width=0.):
     """Determine volume wave drag for supersonic speeds using OpenVSP
 
     Assumptions:
-    None
+    The drag of each Mach number is computed once per geometry, see cached_volume_drag.
+    Mach numbers below 1.05 have no volume wave drag.
 
     Source:
     adg.stanford.edu (Stanford AA241 A/B Course Notes)
@@ -34,6 +37,8 @@ def wave_drag_volume(conditions,geometry,flag105,num_slices=20,num_rots=10):
     flag105                  <boolean> determines is Mach = 1.05 is used
     num_slices               [-] Slices used by OpenVSP (optional - defaults to 20)
     num_rots                 [-] Rotations used by OpenVSP (optional - defaults to 10)
+    backend                  <function> computes the volume wave drag of Mach numbers (optional - defaults to openvsp_volume_drag)
+    mach_bin_width           [-] Mach bins interpolated in (optional - defaults to 0, every Mach number is computed)
 
     Outputs:
     cd_w_all
@@ -41,43 +46,66 @@ def wave_drag_volume(conditions,geometry,flag105,num_slices=20,num_rots=10):
     Properties Used:
     N/A
     """        
-    
-    import vsp
 
-    # unpack inputs
-    freestream   = conditions.freestream
-    ref_area     = geometry.reference_area
-    tag          = geometry.tag
+    if backend is None:
+        backend = openvsp_volume_drag
+    
+    if flag105 is True:
+        cd_w = cached_volume_drag(geometry,np.array([1.05]),backend,num_slices=num_slices,num_rots=num_rots)
+        return float(cd_w[0])
     
     # conditions
-    Mc  = copy.copy(freestream.mach_number)
-    cd_w_all = np.zeros(np.shape(Mc))
+    Mc          = conditions.freestream.mach_number
+    cd_w_all    = np.zeros(np.shape(Mc))
+    supersonic  = Mc >= 1.05
+    
+    # all the Mach numbers not computed yet are computed together
+    if np.any(supersonic):
+        cd_w_all[supersonic] = cached_volume_drag(geometry,Mc[supersonic],backend,mach_bin_width,1.05,
+                                                  num_slices=num_slices,num_rots=num_rots)
+    
+    return cd_w_all
+
+## @ingroup Methods-Aerodynamics-OpenVSP_Wave_Drag
+def openvsp_volume_drag(geometry,mach_numbers,num_slices=20,num_rots=10):
+    """Computes the volume wave drag of a geometry at Mach numbers with the OpenVSP wave drag
+    analysis, reading the geometry once for all of them.
+
+    Assumptions:
+    The geometry has been written to <tag>.vsp3
+
+    Source:
+    adg.stanford.edu (Stanford AA241 A/B Course Notes)
+
+    Inputs:
+    geometry.
+      reference_area         [m^2]
+      tag                    <string>
+    mach_numbers             [-] 1-D array
+    num_slices               [-] Slices used by OpenVSP
+    num_rots                 [-] Rotations used by OpenVSP
+
+    Outputs:
+    cd_w                     [-] 1-D array
+
+    Properties Used:
+    N/A
+    """
+
+    import vsp
+    
+    ref_area = geometry.reference_area
+    
     vsp.ClearVSPModel()
-    vsp.ReadVSPFile(tag+'.vsp3')
+    vsp.ReadVSPFile(geometry.tag+'.vsp3')
     vsp.SetIntAnalysisInput('WaveDrag', 'NumSlices', [num_slices])
     vsp.SetIntAnalysisInput('WaveDrag', 'NumRotSects', [num_rots]) 
     
-    if flag105 is True:
-        vsp.SetDoubleAnalysisInput('WaveDrag', 'Mach', [1.05])    
-        ridwd = vsp.ExecAnalysis('WaveDrag')        
-        cd_w = vsp.GetDoubleResults(ridwd,'CDWave')
-        cd_w = cd_w[0]*100./ref_area # default ref area in VSP doesn't seem to have an easy change
-        return cd_w
-    
-    # Read data from file if possible, otherwise calculate new value
-    for ii,mach in enumerate(Mc):
-        if mach[0] >= 1.05:
-            old_array = np.load('volume_drag_data_' + geometry.tag + '.npy')
-            if np.any(old_array[:,0]==mach[0]):
-                cd_w = np.array([[float(old_array[old_array[:,0]==mach[0],1])]])
-            else:
-                vsp.SetDoubleAnalysisInput('WaveDrag', 'Mach', [float(mach)])
-                ridwd        = vsp.ExecAnalysis('WaveDrag') 
-                cd_w         = vsp.GetDoubleResults(ridwd,'CDWave')
-                cd_w         = cd_w[0]*100./ref_area
-                new_save_row = np.array([[mach[0],cd_w]])
-                comb_array   = np.append(old_array,new_save_row,axis=0)
-                np.save('volume_drag_data_' + geometry.tag + '.npy', comb_array)
-            cd_w_all[ii] = cd_w
+    cd_w = np.zeros(len(mach_numbers))
+    for ii,mach in enumerate(mach_numbers):
+        vsp.SetDoubleAnalysisInput('WaveDrag', 'Mach', [float(mach)])
+        ridwd    = vsp.ExecAnalysis('WaveDrag')
+        cd_w[ii] = vsp.GetDoubleResults(ridwd,'CDWave')[0]
     
-    return cd_w_all
+    # default ref area in VSP doesn't seem to have an easy change
+    return cd_w*100./ref_area
@@ -11,7 +11,6 @@ from SUAVE.Core import Data
 
 import numpy as np
 from math import pi, cos, factorial
-import matplotlib.pylab as plt
 
 # ------------------------------------------------------------
 #  creates airfoil points from a CST file
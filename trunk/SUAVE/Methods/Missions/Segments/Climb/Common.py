@@ -4,6 +4,7 @@
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
 #           Jul 2017, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -11,6 +12,8 @@
 
 import numpy as np
 
+from SUAVE.Methods.Missions.Segments.Common.Numerics import integrate
+
 # ----------------------------------------------------------------------
 #  Unpack Unknowns
 # ----------------------------------------------------------------------
@@ -101,9 +104,8 @@ def update_differentials_altitude(segment):
     """
 
     # unpack
-    t = segment.state.numerics.dimensionless.control_points
-    D = segment.state.numerics.dimensionless.differentiate
-    I = segment.state.numerics.dimensionless.integrate
+    numerics = segment.state.numerics
+    t = numerics.dimensionless.control_points
     r = segment.state.conditions.frames.inertial.position_vector
     v = segment.state.conditions.frames.inertial.velocity_vector
 
@@ -111,7 +113,7 @@ def update_differentials_altitude(segment):
     vz = v[:,2,None] # maintain column array
 
     # get overall time step
-    dt = np.dot( I[-1,:] * dz , 1/ vz[:,0] )
+    dt = integrate(numerics, dz / vz, dimensionless=True)[-1,0]
 
     # rescale operators
     t = t * dt
@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -10,6 +11,8 @@
 
 import numpy as np
 
+from SUAVE.Methods.Missions.Segments.Common.Numerics import integrate
+
 # ----------------------------------------------------------------------
 #  Unpack Unknowns
 # ----------------------------------------------------------------------
@@ -114,10 +117,8 @@ def update_differentials_altitude(segment):
     """   
 
     # unpack
-    t = segment.state.numerics.dimensionless.control_points
-    D = segment.state.numerics.dimensionless.differentiate
-    I = segment.state.numerics.dimensionless.integrate
-
+    numerics = segment.state.numerics
+    t        = numerics.dimensionless.control_points
     
     # Unpack segment initials
     alt0       = segment.altitude_start 
@@ -133,10 +134,11 @@ def update_differentials_altitude(segment):
     # get overall time step
     vz = -v[:,2,None] # Inertial velocity is z down
     dz = altf- alt0    
-    dt = dz / np.dot(I[-1,:],vz)[-1] # maintain column array
+    z  = integrate(numerics,vz,dimensionless=True) # maintain column array
+    dt = dz / z[-1,0]
     
     # Integrate vz to get altitudes
-    alt = alt0 + np.dot(I*dt,vz)
+    alt = alt0 + z*dt
 
     # rescale operators
     t = t * dt
@@ -2,7 +2,7 @@
 # Optimized.py
 # 
 # Created:  Dec 2016, E. Botero
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -10,6 +10,7 @@
 import numpy as np
 from SUAVE.Core import Units
 import SUAVE
+from SUAVE.Methods.Missions.Segments.Common.Numerics import integrate
 
 # ----------------------------------------------------------------------
 #  Unpack Unknowns
@@ -112,15 +113,17 @@ def update_differentials(segment):
     vz = -v[:,2,None] # maintain column array
 
     # get overall time step
-    dt = (dz/np.dot(I,vz))[-1]
+    z  = integrate(numerics,vz,dimensionless=True)
+    dt = (dz/z)[-1]
 
     # rescale operators
     x = x * dt
     D = D / dt
-    I = I * dt
+    if I is not None:
+        I = I * dt
     
     # Calculate the altitudes
-    alt = np.dot(I,vz) + segment.altitude_start
+    alt = z * dt + segment.altitude_start
     
     # pack
     t_initial                                       = segment.state.conditions.frames.inertial.time[0,0]
@@ -5,6 +5,7 @@
 # Modified: Jul 2016, E. Botero
 #           Jul 2017, E. Botero
 #           May 2019, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -15,6 +16,7 @@ from SUAVE.Core import Units
 
 from SUAVE.Methods.Geometry.Three_Dimensional \
      import angles_to_dcms, orientation_product, orientation_transpose
+from SUAVE.Methods.Missions.Segments.Common.Numerics import integrate
 
 # ----------------------------------------------------------------------
 #  Initialize Inertial Position
@@ -187,7 +189,7 @@ def update_planet_position(segment):
     theta      = conditions.frames.body.inertial_rotations[:,1]
     psi        = conditions.frames.body.inertial_rotations[:,2]
     alpha      = conditions.aerodynamics.angle_of_attack[:,0]
-    I          = segment.state.numerics.time.integrate
+    numerics   = segment.state.numerics
     Re         = segment.analyses.planet.features.mean_radius
 
     # The flight path and radius
@@ -196,9 +198,9 @@ def update_planet_position(segment):
 
     # Find the velocities and integrate the positions
     lamdadot  = (V/R)*np.cos(gamma)*np.cos(psi)
-    lamda     = np.dot(I,lamdadot) / Units.deg # Latitude
+    lamda     = integrate(numerics,lamdadot) / Units.deg # Latitude
     mudot     = (V/R)*np.cos(gamma)*np.sin(psi)/np.cos(lamda)
-    mu        = np.dot(I,mudot) / Units.deg # Longitude
+    mu        = integrate(numerics,mudot) / Units.deg # Longitude
 
     # Reshape the size of the vectorss
     shape     = np.shape(conditions.freestream.velocity)
@@ -402,10 +404,10 @@ def integrate_inertial_horizontal_position(segment):
     conditions = segment.state.conditions
     x0 = conditions.frames.inertial.position_vector[0,None,0:1+1]
     vx = conditions.frames.inertial.velocity_vector[:,0:1+1]
-    I  = segment.state.numerics.time.integrate
+    numerics = segment.state.numerics
     
     # integrate
-    x = np.dot(I,vx) + x0
+    x = integrate(numerics,vx) + x0
     
     # pack
     conditions.frames.inertial.position_vector[:,0:1+1] = x[:,:]
@@ -0,0 +1,135 @@
+## @ingroup Methods-Missions-Segments-Common
+# Jacobian.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified: Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from SUAVE.Core.Arrays import array_type
+
+# ----------------------------------------------------------------------
+#  Pointwise Finite Difference
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def pointwise_finite_difference(unknowns, segment):
+    """ Builds a block diagonal approximation of the segment Jacobian with grouped (colored) finite differences.
+
+        Assumptions:
+        Each residual at a control point depends only on the unknowns at the same control point.
+        All the control points of an unknown are perturbed together, so the cost is one segment
+        iteration per unknown plus one.
+
+        The Chebyshev differentiation and integration operators couple the control points of a
+        segment, so the assumption does not hold there and the result is not the true Jacobian: the
+        entry of a residual at a control point for an unknown holds the sum of its derivatives with
+        respect to that unknown at every control point. The root finder's quasi-Newton updates correct
+        the approximation, and when the solve still does not converge converge_root solves the segment
+        again with full finite differences, so the approximation only changes the cost of a solve.
+
+        This is used by setting segment.settings.jacobian = pointwise_finite_difference
+
+        Source:
+        Curtis, A. R., Powell, M. J. D., and Reid, J. K., "On the Estimation of Sparse Jacobian Matrices",
+        IMA Journal of Applied Mathematics, 1974
+
+        Inputs:
+            unknowns                         [array]
+            segment.state.unknowns           [Data]
+            segment.state.residuals          [Data]
+            segment.process.iterate          [Data]
+
+        Outputs:
+            jacobian                         [array]
+
+        Properties Used:
+        N/A
+
+    """
+
+    from SUAVE.Methods.Missions.Segments.converge_root import iterate
+
+    unknowns = np.array(unknowns,dtype=float)
+
+    # map each packed unknown to a perturbation group and a control point
+    groups, points_x = control_point_map(segment.state.unknowns)
+
+    # step sizes, the same scaling as MINPACK's forward differences
+    h = np.sqrt(np.finfo(float).eps) * np.maximum(np.abs(unknowns),1.)
+
+    # perturb each group
+    responses = []
+    for group in range(np.max(groups)+1):
+        x = unknowns.copy()
+        x[groups==group] += h[groups==group]
+        responses.append(iterate(x,segment))
+
+    # the base point last, this leaves the segment at the unperturbed state
+    residuals = iterate(unknowns,segment)
+    _, points_r = control_point_map(segment.state.residuals)
+
+    # assemble
+    jacobian = np.zeros([len(residuals),len(unknowns)])
+    for group, response in enumerate(responses):
+        for j in np.where(groups==group)[0]:
+            rows = points_r == points_x[j]
+            jacobian[rows,j] = (response[rows] - residuals[rows]) / h[j]
+
+    return jacobian
+
+# ----------------------------------------------------------------------
+#  Control Point Map
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def control_point_map(data):
+    """ Finds the perturbation group and control point of every entry of data.pack_array()
+
+        Assumptions:
+        Each column of each array in data is one group. Packing order follows Data.pack_array
+
+        Inputs:
+            data                         [Data]
+
+        Outputs:
+            groups                       [array]
+            points                       [array]
+
+        Properties Used:
+        N/A
+
+    """
+
+    groups = []
+    points = []
+    count  = [0]
+
+    def do_map(D):
+        for v in D.values():
+            if isinstance(v,dict):
+                do_map(v)
+                continue
+            elif isinstance(v,(int,float)):
+                groups.append(np.array([count[0]]))
+                points.append(np.array([0]))
+                count[0] += 1
+            elif isinstance(v,array_type) and np.ndim(v) <= 2:
+                v = np.atleast_1d(v)
+                n = v.shape[0]
+                m = 1 if np.ndim(v) == 1 else v.shape[1]
+                for c in range(m):
+                    groups.append(np.full(n,count[0]))
+                    points.append(np.arange(n))
+                    count[0] += 1
+
+    do_map(data)
+
+    if not groups:
+        return np.array([],dtype=int), np.array([],dtype=int)
+
+    return np.hstack(groups), np.hstack(points)
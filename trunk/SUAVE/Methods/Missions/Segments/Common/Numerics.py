@@ -3,12 +3,17 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
+import numpy as np
+
 from SUAVE.Core.Arrays import atleast_2d_col 
+from SUAVE.Methods.Utilities.Chebyshev.cached_discretization import cached_discretization, \
+     integration_factors, factored_integrate
 
 # ----------------------------------------------------------------------
 #  Initialize Differentials
@@ -19,18 +24,22 @@ def initialize_differentials_dimensionless(segment):
     """ Discretizes the differential operators
     
         Assumptions:
-        N/A
+        The operators are computed once for each discretization and shared by the segments, they
+        are read only. With factored_integration the integration operator is not computed, the
+        integrals are solved with the factors of the differentiation operator instead
         
         Inputs:
             state.numerics:
                 number_control_points [int]
                 discretization_method [function]
+                factored_integration  [bool]
             
         Outputs:
             numerics.dimensionless:           
                 control_points        [array]
                 differentiate         [array]
                 integrate             [array]
+                integration_factors   [tuple]
 
         Properties Used:
         N/A
@@ -44,13 +53,19 @@ def initialize_differentials_dimensionless(segment):
     discretization_method = numerics.discretization_method
     
     # get operators
-    x,D,I = discretization_method(N,**numerics)
+    if getattr(numerics,'factored_integration',False):
+        x,D,I   = cached_discretization(discretization_method,N,**dict(numerics,integration=False))
+        factors = integration_factors(discretization_method,N,**numerics)
+    else:
+        x,D,I   = cached_discretization(discretization_method,N,**numerics)
+        factors = None
     x = atleast_2d_col(x)
     
     # pack
-    numerics.dimensionless.control_points = x
-    numerics.dimensionless.differentiate  = D
-    numerics.dimensionless.integrate      = I    
+    numerics.dimensionless.control_points      = x
+    numerics.dimensionless.differentiate       = D
+    numerics.dimensionless.integrate           = I    
+    numerics.dimensionless.integration_factors = factors
     
     return
 
@@ -96,7 +111,8 @@ def update_differentials_time(segment):
     
     # rescale operators
     D = D / T
-    I = I * T
+    if I is not None:
+        I = I * T
     
     # pack
     numerics.time.control_points = t
@@ -104,4 +120,46 @@ def update_differentials_time(segment):
     numerics.time.integrate      = I
 
     return
-    
\ No newline at end of file
+
+# ----------------------------------------------------------------------
+#  Integrate
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def integrate(numerics, f, dimensionless = False):
+    """ Integrates f over the segment from its first control point, with the integration operator
+        or, with factored_integration, by a solve with the factors of the differentiation operator
+    
+        Assumptions:
+        The time control points start at the beginning of the segment
+        
+        Inputs:
+            f                                     [array]
+            dimensionless                         [bool]
+            numerics.factored_integration         [bool]
+            numerics.dimensionless:
+                integrate                         [array]
+                integration_factors               [tuple]
+            numerics.time:
+                control_points                    [seconds]
+                integrate                         [array]
+            
+        Outputs:
+            integral of f, same shape as f        [array]
+
+        Properties Used:
+        N/A
+                                
+    """     
+    
+    if getattr(numerics,'factored_integration',False):
+        factors = numerics.dimensionless.integration_factors
+        if dimensionless:
+            return factored_integrate(factors,f)
+        t = numerics.time.control_points
+        return factored_integrate(factors,f,t[-1,0] - t[0,0])
+    
+    if dimensionless:
+        return np.dot(numerics.dimensionless.integrate,f)
+    
+    return np.dot(numerics.time.integrate,f)
@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -10,6 +11,8 @@
 
 import numpy as np
 
+from SUAVE.Methods.Missions.Segments.Common.Numerics import integrate
+
 # ----------------------------------------------------------------------
 #  Initialize Weights
 # ----------------------------------------------------------------------
@@ -119,10 +122,10 @@ def update_weights(segment):
     m0         = conditions.weights.total_mass[0,0]
     mdot_fuel  = conditions.weights.vehicle_mass_rate
     g          = conditions.freestream.gravity
-    I          = segment.state.numerics.time.integrate
+    numerics   = segment.state.numerics
 
     # calculate
-    m = m0 + np.dot(I, -mdot_fuel )
+    m = m0 + integrate(numerics, -mdot_fuel )
 
     # weight
     W = m*g
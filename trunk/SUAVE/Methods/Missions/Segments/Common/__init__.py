@@ -8,3 +8,4 @@ from . import Energy
 from . import Frames
 from . import Numerics
 from . import Weights
+from . import Jacobian
@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -12,6 +13,7 @@ import scipy.optimize
 import numpy as np
 
 from SUAVE.Core.Arrays import array_type
+from SUAVE.Methods.Missions.warm_start import restore_unknowns
 
 # ----------------------------------------------------------------------
 #  Converge Root
@@ -22,7 +24,8 @@ def converge_root(segment):
     """Interfaces the mission to a numerical solver. The solver may be changed by using root_finder.
 
     Assumptions:
-    N/A
+    A jacobian provider is an approximation, if the root finder does not converge with it the
+    segment is solved again from the same unknowns with the differences of the root finder
 
     Source:
     N/A
@@ -30,6 +33,8 @@ def converge_root(segment):
     Inputs:
     segment                            [Data]
     segment.settings.root_finder       [Data]
+    segment.settings.jacobian          [function] (optional)
+    segment.use_warm_start             [bool] (optional)
     state.numerics.tolerance_solution  [Unitless]
 
     Outputs:
@@ -40,18 +45,42 @@ def converge_root(segment):
     N/A
     """       
     
+    # start from the unknowns of a previous solve, if they were stored and asked for
+    if getattr(segment,'use_warm_start',False):
+        restore_unknowns(segment)
+
     unknowns = segment.state.unknowns.pack_array()
     
     try:
         root_finder = segment.settings.root_finder
     except AttributeError:
         root_finder = scipy.optimize.fsolve 
+        
+    # an optional jacobian provider, otherwise the root finder differences every unknown
+    try:
+        jacobian = segment.settings.jacobian
+    except AttributeError:
+        jacobian = None
+    
+    if jacobian is not None:
+        initial_unknowns = np.array(unknowns)
+        unknowns,infodict,ier,msg = root_finder( iterate,
+                                             unknowns,
+                                             args = segment,
+                                             fprime = jacobian,
+                                             xtol = segment.state.numerics.tolerance_solution,
+                                             full_output=1)
+        
+        # fall back to differencing every unknown
+        if ier!=1:
+            unknowns = initial_unknowns
     
-    unknowns,infodict,ier,msg = root_finder( iterate,
-                                         unknowns,
-                                         args = segment,
-                                         xtol = segment.state.numerics.tolerance_solution,
-                                         full_output=1)
+    if jacobian is None or ier!=1:
+        unknowns,infodict,ier,msg = root_finder( iterate,
+                                             unknowns,
+                                             args = segment,
+                                             xtol = segment.state.numerics.tolerance_solution,
+                                             full_output=1)
 
     if ier!=1:
         print("Segment did not converge. Segment Tag: " + segment.tag)
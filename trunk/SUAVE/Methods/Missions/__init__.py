@@ -2,4 +2,7 @@
 # Mission methods contain the functions for setting up and solving a mission.
 # @ingroup Methods
 
-from . import Segments
\ No newline at end of file
+from . import Segments
+
+from .evaluate_missions import evaluate_missions
+from .warm_start import evaluate_warm_started, store_unknowns, clear_unknowns, restore_unknowns
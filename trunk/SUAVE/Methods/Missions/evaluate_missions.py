@@ -0,0 +1,96 @@
+## @ingroup Methods-Missions
+# evaluate_missions.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import copy
+import multiprocessing
+
+from SUAVE.Core import Data
+
+# ----------------------------------------------------------------------
+#  Evaluate Missions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions
+def evaluate_missions(missions,number_of_processes=None,state=None):
+    """ Evaluates a batch of independent missions over a pool of worker processes.
+
+        Assumptions:
+        The missions do not depend on each other. Each mission, with its vehicle and analyses,
+        must be picklable. Copies of the missions are evaluated, also when they are run in this
+        process, so the missions passed in are never evaluated in place.
+
+        Source:
+        N/A
+
+        Inputs:
+        missions             - a list of missions or a Mission.Container    [list or Data]
+        number_of_processes  - size of the pool, defaults to the cpu count  [int]
+        state                - passed to each mission's evaluate            [Data]
+
+        Outputs:
+        results              - the evaluated missions, in the input order   [list or Data]
+
+        Properties Used:
+        N/A
+    """
+
+    if isinstance(missions,dict):
+        keys     = list(missions.keys())
+        missions = list(missions.values())
+    else:
+        keys     = None
+        missions = list(missions)
+
+    if number_of_processes is None:
+        number_of_processes = multiprocessing.cpu_count()
+    number_of_processes = max(1,min(number_of_processes,len(missions)))
+
+    # run copies in this process if there is nothing to gain from a pool
+    if number_of_processes == 1:
+        evaluated = [evaluate_mission(copy.deepcopy(mission),state) for mission in missions]
+    else:
+        pool = multiprocessing.Pool(number_of_processes)
+        try:
+            # starmap keeps the results in the order of the inputs
+            evaluated = pool.starmap(evaluate_mission,[(mission,state) for mission in missions],chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+
+    if keys is None:
+        return evaluated
+
+    results = Data()
+    for key,result in zip(keys,evaluated):
+        results[key] = result
+
+    return results
+
+## @ingroup Methods-Missions
+def evaluate_mission(mission,state=None):
+    """ Evaluates a single mission, this is the function run by each worker of evaluate_missions
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        mission   [Mission()]
+        state     [Data()]
+
+        Outputs:
+        results   [Mission()]
+
+        Properties Used:
+        N/A
+    """
+    return mission.evaluate(state)
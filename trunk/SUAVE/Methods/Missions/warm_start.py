@@ -0,0 +1,207 @@
+## @ingroup Methods-Missions
+# warm_start.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from copy import deepcopy
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Evaluate Warm Started
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions
+def evaluate_warm_started(mission):
+    """ Evaluates a mission with each segment starting from the unknowns it converged to in the
+        last warm started evaluation, then stores the new converged unknowns for the next one.
+        This is meant for outer loops that solve the same mission many times with small changes,
+        like a cruise distance or a takeoff weight. The stored unknowns are only used here, a plain
+        mission.evaluate() starts from the defaults. Loops should clear_unknowns when they are done.
+
+        Assumptions:
+        Segments whose unknowns changed size since they were stored start from their defaults
+
+        Source:
+        N/A
+
+        Inputs:
+        mission     [Mission()]
+
+        Outputs:
+        results     [Mission()]
+
+        Properties Used:
+        N/A
+    """
+
+    segments = all_segments(mission)
+
+    # only this evaluation restores the stored unknowns
+    for segment in segments:
+        segment.use_warm_start = True
+    try:
+        results = mission.evaluate()
+    finally:
+        for segment in segments:
+            segment.use_warm_start = False
+
+    store_unknowns(mission)
+
+    return results
+
+## @ingroup Methods-Missions
+def store_unknowns(mission):
+    """ Keeps a copy of the unknowns of the mission and of every one of its segments, the next
+        solve of each segment starts from them. Segments that did not converge keep the unknowns
+        they had stored before.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        mission                            [Mission()]
+        segment.state.unknowns             [Data]
+        segment.state.numerics.converged   [bool]
+
+        Outputs:
+        segment.warm_start                 [Data]
+
+        Properties Used:
+        N/A
+    """
+
+    for segment in all_segments(mission):
+        unknowns = segment.state.unknowns
+        if segment.state.numerics.converged is False or not unknown_keys(unknowns):
+            continue
+        segment.warm_start = deepcopy(unknowns)
+
+    return
+
+## @ingroup Methods-Missions
+def clear_unknowns(mission):
+    """ Removes the stored unknowns of a mission and of every one of its segments
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        mission                  [Mission()]
+
+        Outputs:
+        segment.warm_start       [None]
+
+        Properties Used:
+        N/A
+    """
+
+    for segment in all_segments(mission):
+        segment.warm_start = None
+
+    return
+
+## @ingroup Methods-Missions
+def restore_unknowns(segment):
+    """ Replaces the unknowns of a segment with the ones it stored, if they still have the same
+        keys and shapes. This is called by the solver after the segment is initialized, so it
+        also overrides the first guesses some initialize steps make, during evaluate_warm_started.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        segment.warm_start         [Data]
+        segment.state.unknowns     [Data]
+
+        Outputs:
+        restored                   [bool]
+        segment.state.unknowns     [Data]
+
+        Properties Used:
+        N/A
+    """
+
+    stored = getattr(segment,'warm_start',None)
+    if stored is None:
+        return False
+
+    unknowns = segment.state.unknowns
+
+    keys = unknown_keys(unknowns)
+    if keys != unknown_keys(stored):
+        return False
+    for key in keys:
+        if np.shape(unknowns[key]) != np.shape(stored[key]):
+            return False
+
+    for key in keys:
+        unknowns[key] = deepcopy(stored[key])
+
+    return True
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions
+def all_segments(segment):
+    """ Lists a segment and all of its sub segments, depth first
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        segment       [Segment()]
+
+        Outputs:
+        segments      [list]
+
+        Properties Used:
+        N/A
+    """
+
+    segments = [segment]
+    for sub_segment in getattr(segment,'segments',{}).values():
+        segments.extend(all_segments(sub_segment))
+
+    return segments
+
+## @ingroup Methods-Missions
+def unknown_keys(unknowns):
+    """ Lists the keys of the values being solved for in a set of unknowns
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        unknowns      [Data]
+
+        Outputs:
+        keys          [list]
+
+        Properties Used:
+        N/A
+    """
+
+    return sorted( key for key in unknowns.keys() if key != 'tag' )
@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -26,8 +27,6 @@ def jet_installation_effect (Xe,Ye,Ce,theta_s,Diameter_mixed):
     INST_s=0.5*((Ce-Xe)**2/(Ce*Diameter_mixed))*(np.exp(-Ye/Diameter_mixed)*((1.8*theta_s/np.pi))-0.6)**2
 
     #The magnitude of the installation effect is between 0 to 2.5 dB.
-    for i in range (0,24):
-        if INST_s[i]>2.5:
-            INST_s[i]=2.5
+    INST_s = np.where(INST_s>2.5,2.5,INST_s)
 
     return (INST_s)
\ No newline at end of file
@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -16,103 +17,79 @@ import numpy as np
 
 ## @ingroupMethods-Noise-Fidelity_One-Engine
 def noise_source_location (B,Xo,zk,Diameter_primary,theta_p,Area_primary,Area_secondary,distance_microphone,Diameter_secondary,theta,theta_s,theta_m,Diameter_mixed,Velocity_primary,Velocity_secondary,Velocity_mixed,Velocity_aircraft,sound_ambient,Str_m,Str_s):
+    """This function calculates the directivity angles of the primary, secondary and mixed jet noise
+    sources, corrected for the location of the sources downstream of the nozzle. The angles are
+    updated in place, each frequency band iterating from the angles it is given until its own source
+    location converges, all the bands at once."""
     
     #Primary jet source location
-    XJ = np.zeros(24)
+    def primary_location(theta_j,bands):
+        return (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_j/np.pi)-9.)+(Area_secondary/Area_primary))
     
-    for i in range(24):
-        residual = Diameter_primary
-        XJ[i]    = (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_p[i]/np.pi)-9.)+(Area_secondary/Area_primary))
-        B[i]     = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-        
-        if (B[i]>=0.):
-            theta_p[i]=np.arcsin(((B[i])**2.+1.)**(-0.5))
-        else:
-            theta_p[i]=np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-
-        XJ[i] = (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_p[i]/np.pi)-9.)+(Area_secondary/Area_primary))
-        
-        while residual>(Diameter_primary/200.):
-            XJ_old = XJ[i]
-            theta1 = theta_p[i]
-            B[i]   = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-            
-            if B[i]>=0.:
-                theta_p[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-            else:
-                theta_p[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-
-            theta2     = theta_p[i]
-            theta_p[i] = (theta1+theta2)/2.
-            XJ[i]      = (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_p[i]/np.pi)-9.)+(Area_secondary/Area_primary))
-            residual   = np.abs(XJ_old-XJ[i])
-
-        #Secondary jet source location
-        residual = Diameter_secondary
-        XJ_old   = 0.0
-        XJ[i]    = (zk*Diameter_secondary)*(2.+1.6*np.arctan((4.5*theta_s[i]/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[i])) \
-            *  np.sqrt(1.+(0.7*Velocity_secondary/sound_ambient))*(Velocity_secondary/(Velocity_secondary-Velocity_aircraft))
-        
-        B[i]     = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-        
-        if B[i]>=0.:
-            theta_s[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-        else:
-            theta_s[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-            
-        XJ[i] = (zk*Diameter_mixed)*(2.+1.6*np.arctan((4.5*theta_s[i]/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[i]))* \
-            np.sqrt(1.+(0.7*Velocity_secondary/sound_ambient))*(Velocity_secondary/(Velocity_secondary-Velocity_aircraft))
-        
-        while residual>(Diameter_mixed/200.):
-            XJ_old = XJ[i]
-            theta1 = theta_s[i]
-            B[i]   = (1/np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-            
-            if B[i]>=0.:
-                theta_s[i] = np.arcsin((B[i]**2.+1.)**(-0.5))
-            else:
-                theta_s[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-
-            theta2     = theta_s[i]
-            theta_s[i] = (theta1+theta2)/2.
-            XJ[i]      = (zk*Diameter_mixed)*(2.+1.6*np.arctan((4.5*theta_s[i]/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[i]))* \
-                np.sqrt(1.+(0.7*Velocity_secondary/sound_ambient))*(Velocity_secondary/(Velocity_secondary-Velocity_aircraft))
-            
-            residual = np.abs(XJ_old-XJ[i])
-
-        #Mixed jet source location
-        residual = Diameter_mixed
-        XJ_old   = 0.
-        XJ[i] = (zk*Diameter_mixed)*(3.+np.exp(-Str_m[i])+(2.+1.1*np.arctan((18.*theta_m[i]/np.pi)-13.))+ \
-            (1.+0.5/np.sqrt(Str_m[i])))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) * \
+    source_angle(B,theta_p,theta,Xo,distance_microphone,primary_location,primary_location,Diameter_primary,Diameter_primary/200.)
+    
+    #Secondary jet source location
+    def secondary_location(Diameter):
+        def location(theta_j,bands):
+            return (zk*Diameter)*(2.+1.6*np.arctan((4.5*theta_j/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[bands])) \
+                *  np.sqrt(1.+(0.7*Velocity_secondary/sound_ambient))*(Velocity_secondary/(Velocity_secondary-Velocity_aircraft))
+        return location
+    
+    source_angle(B,theta_s,theta,Xo,distance_microphone,secondary_location(Diameter_secondary),secondary_location(Diameter_mixed),Diameter_secondary,Diameter_mixed/200.)
+    
+    #Mixed jet source location
+    def mixed_location(theta_j,bands):
+        return (zk*Diameter_mixed)*(3.+np.exp(-Str_m[bands])+(2.+1.1*np.arctan((18.*theta_j/np.pi)-13.))+ \
+            (1.+0.5/np.sqrt(Str_m[bands])))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) * \
             (Velocity_mixed/(Velocity_mixed-Velocity_aircraft))
-        
-        B[i] = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-        if B[i]>=0.:
-            theta_m[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-        else:
-            theta_m[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
+    
+    source_angle(B,theta_m,theta,Xo,distance_microphone,mixed_location,mixed_location,Diameter_mixed,Diameter_mixed/200.)
+    
+    return(theta_p,theta_s,theta_m)
 
-        XJ[i]=(zk*Diameter_mixed)*(3.+np.exp(-Str_m[i])+(2.+1.1*np.arctan((18.*theta_m[i]/np.pi)-13.))+\
-            (1.+0.5/np.sqrt(Str_m[i])))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) \
-            *(Velocity_mixed/(Velocity_mixed-Velocity_aircraft))
+## @ingroupMethods-Noise-Fidelity_One-Engine
+def source_angle (B,theta_j,theta,Xo,distance_microphone,first_location,location,residual,tolerance):
+    """This function iterates the directivity angle of one jet component in place, averaging the
+    angle with the one seen from the current source location until the location of each band
+    changes by less than the tolerance."""
+    
+    bands = np.arange(len(theta_j))
+    
+    XJ           = first_location(theta_j,bands)
+    B[:]         = directivity_factor(theta,Xo,XJ,distance_microphone)
+    theta_j[:]   = directivity_angle(B)
+    XJ           = location(theta_j,bands)
+    
+    # the bands that converged are left out of the following iterations
+    if not residual>tolerance:
+        return theta_j
+    
+    while len(bands):
+        XJ_old          = XJ
+        theta1          = theta_j[bands]
+        B[bands]        = directivity_factor(theta,Xo,XJ,distance_microphone)
+        theta2          = directivity_angle(B[bands])
+        theta_j[bands]  = (theta1+theta2)/2.
+        XJ              = location(theta_j[bands],bands)
+        residual        = np.abs(XJ_old-XJ)
         
-        while residual>(Diameter_mixed/200.):
-            XJ_old = XJ[i]
-            theta1 = theta_m[i]
-            B[i]   = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-            
-            if B[i]>=0.:
-                theta_m[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-            else:
-                theta_m[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-                
-            theta2     = theta_m[i]
-            theta_m[i] = (theta1+theta2)/2.
-            XJ[i]      = (zk*Diameter_mixed)*(3.+np.exp(-Str_m[i])+(2.+1.1*np.arctan((18.*theta_m[i]/np.pi)-13.))+\
-                (1.+0.5/np.sqrt(Str_m[i])))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) \
-                *(Velocity_mixed/(Velocity_mixed-Velocity_aircraft))
-            
-            residual   = abs(XJ_old-XJ[i])
+        active = residual>tolerance
+        bands  = bands[active]
+        XJ     = XJ[active]
+    
+    return theta_j
+
+## @ingroupMethods-Noise-Fidelity_One-Engine
+def directivity_factor (theta,Xo,XJ,distance_microphone):
+    """This function calculates the factor B giving the directivity angle seen from a source
+    located XJ downstream of the nozzle."""
+    
+    return (1./np.sin(theta))*(((Xo+XJ)/distance_microphone)+np.cos(theta))
 
-    return(theta_p,theta_s,theta_m)
\ No newline at end of file
+## @ingroupMethods-Noise-Fidelity_One-Engine
+def directivity_angle (B):
+    """This function calculates the directivity angle from the factor B."""
+    
+    angle = np.arcsin(((B)**2.+1.)**(-0.5))
+    
+    return np.where(B>=0.,angle,np.pi-angle)
@@ -19,8 +19,6 @@ from SUAVE.Methods.Flight_Dynamics.Static_Stability.Approximations import datcom
 
 # package imports
 import numpy as np
-import matplotlib
-import matplotlib.pyplot as plt
 
 # ----------------------------------------------------------------------
 #  Compute a V-n diagram
@@ -867,6 +865,7 @@ def post_processing(category_tag, Uref_rough, Uref_cruise, Uref_dive, V_n_data,
 
     Description:
     """
+    import matplotlib.pyplot as plt
 
     # Unpack
     load_factors_pos        = V_n_data.load_factors.positive
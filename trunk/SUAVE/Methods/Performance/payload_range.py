@@ -3,12 +3,14 @@
 #
 # Created:  Apr 2014, T. Orra
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 from SUAVE.Core import Units
+from SUAVE.Methods.Missions.warm_start import evaluate_warm_started, clear_unknowns
 import time
 import numpy as np
 
@@ -108,62 +110,66 @@ def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.):
         print('\n\n\n .......... PAYLOAD RANGE DIAGRAM CALCULATION ..........\n')
 
     # loop for each point of Payload Range Diagram
-    for i in range(len(TOW)):
-##    for i in [2]:
-        if iprint:
-            print(('   EVALUATING POINT : ' + str(i+1)))
-
-        # Define takeoff weight
-        mission.segments[0].analyses.weights.vehicle.mass_properties.takeoff = TOW[i]
-
-        # Evaluate mission with current TOW
-        results = mission.evaluate()
-        segment = results.segments[cruise_segment_tag]
-
-        # Distance convergency in order to have total fuel equal to target fuel
-        #
-        # User don't have the option of run a mission for a given fuel. So, we
-        # have to iterate distance in order to have total fuel equal to target fuel
-        #
-
-        maxIter = 10 # maximum iteration limit
-        tol = 1.     # fuel convergency tolerance
-        err = 9999.  # error to be minimized
-        iter = 0     # iteration count
-
-        while abs(err) > tol and iter < maxIter:
-            iter = iter + 1
-
-            # Current total fuel burned in mission
-            TotalFuel  = TOW[i] - results.segments[-1].conditions.weights.total_mass[-1,0]
-
-            # Difference between burned fuel and target fuel
-            missingFuel = FUEL[i] - TotalFuel - reserves
-
-            # Current distance and fuel consuption in the cruise segment
-            CruiseDist = np.diff( segment.conditions.frames.inertial.position_vector[[0,-1],0] )[0]        # Distance [m]
-            CruiseFuel = segment.conditions.weights.total_mass[0,0] - segment.conditions.weights.total_mass[-1,0]    # [kg]
-            # Current specific range (m/kg)
-            CruiseSR    = CruiseDist / CruiseFuel        # [m/kg]
-
-            # Estimated distance that will result in total fuel burn = target fuel
-            DeltaDist  =  CruiseSR *  missingFuel
-            mission.segments[cruise_segment_tag].distance = (CruiseDist + DeltaDist)
-
-            # running mission with new distance
-            results = mission.evaluate()
-            segment = results.segments[cruise_segment_tag]
+    try:
+        for i in range(len(TOW)):
+    ##    for i in [2]:
+            if iprint:
+                print(('   EVALUATING POINT : ' + str(i+1)))
 
-            # Difference between burned fuel and target fuel
-            err = ( TOW[i] - results.segments[-1].conditions.weights.total_mass[-1,0] ) - FUEL[i] + reserves
+            # Define takeoff weight
+            mission.segments[0].analyses.weights.vehicle.mass_properties.takeoff = TOW[i]
 
-            if iprint:
-                print(('     iter: ' +str('%2g' % iter) + ' | Target Fuel: '   \
-                  + str('%8.0F' % FUEL[i]) + ' (kg) | Current Fuel: ' \
-                  + str('%8.0F' % (err+FUEL[i]))+' (kg) | Residual : '+str('%8.0F' % err)))
+            # Evaluate mission with current TOW
+            results = evaluate_warm_started(mission)
+            segment = results.segments[cruise_segment_tag]
 
-        # Allocating resulting range in ouput array.
-        R[i] = ( results.segments[-1].conditions.frames.inertial.position_vector[-1,0] ) * Units.m / Units.nautical_mile      #Distance [nm]
+            # Distance convergency in order to have total fuel equal to target fuel
+            #
+            # User don't have the option of run a mission for a given fuel. So, we
+            # have to iterate distance in order to have total fuel equal to target fuel
+            #
+
+            maxIter = 10 # maximum iteration limit
+            tol = 1.     # fuel convergency tolerance
+            err = 9999.  # error to be minimized
+            iter = 0     # iteration count
+
+            while abs(err) > tol and iter < maxIter:
+                iter = iter + 1
+
+                # Current total fuel burned in mission
+                TotalFuel  = TOW[i] - results.segments[-1].conditions.weights.total_mass[-1,0]
+
+                # Difference between burned fuel and target fuel
+                missingFuel = FUEL[i] - TotalFuel - reserves
+
+                # Current distance and fuel consuption in the cruise segment
+                CruiseDist = np.diff( segment.conditions.frames.inertial.position_vector[[0,-1],0] )[0]        # Distance [m]
+                CruiseFuel = segment.conditions.weights.total_mass[0,0] - segment.conditions.weights.total_mass[-1,0]    # [kg]
+                # Current specific range (m/kg)
+                CruiseSR    = CruiseDist / CruiseFuel        # [m/kg]
+
+                # Estimated distance that will result in total fuel burn = target fuel
+                DeltaDist  =  CruiseSR *  missingFuel
+                mission.segments[cruise_segment_tag].distance = (CruiseDist + DeltaDist)
+
+                # running mission with new distance
+                results = evaluate_warm_started(mission)
+                segment = results.segments[cruise_segment_tag]
+
+                # Difference between burned fuel and target fuel
+                err = ( TOW[i] - results.segments[-1].conditions.weights.total_mass[-1,0] ) - FUEL[i] + reserves
+
+                if iprint:
+                    print(('     iter: ' +str('%2g' % iter) + ' | Target Fuel: '   \
+                      + str('%8.0F' % FUEL[i]) + ' (kg) | Current Fuel: ' \
+                      + str('%8.0F' % (err+FUEL[i]))+' (kg) | Residual : '+str('%8.0F' % err)))
+
+            # Allocating resulting range in ouput array.
+            R[i] = ( results.segments[-1].conditions.frames.inertial.position_vector[-1,0] ) * Units.m / Units.nautical_mile      #Distance [nm]
+    finally:
+        # the stored unknowns are not left on the mission
+        clear_unknowns(mission)
 
     # Inserting point (0,0) in output arrays
     R.insert(0,0)
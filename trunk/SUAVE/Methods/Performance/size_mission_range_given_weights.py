@@ -3,6 +3,7 @@
 #
 # Created:  Sep 2014, T. Orra
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -10,6 +11,8 @@
 
 import numpy as np
 
+from SUAVE.Methods.Missions.warm_start import evaluate_warm_started, clear_unknowns
+
 # ----------------------------------------------------------------------
 #  Calculate the range of  Payload Range Diagram
 # ----------------------------------------------------------------------
@@ -82,57 +85,61 @@ def size_mission_range_given_weights(vehicle,mission,cruise_segment_tag,mission_
     TOW_ref = mission.segments[0].analyses.weights.mass_properties.takeoff 
     
     # Loop for range calculation of each input case
-    for id,TOW in enumerate(takeoff_weight):
-        PLD     =  mission_payload[id]
-        FUEL    =  TOW - OEW - PLD - reserve_fuel[id]
+    try:
+        for id,TOW in enumerate(takeoff_weight):
+            PLD     =  mission_payload[id]
+            FUEL    =  TOW - OEW - PLD - reserve_fuel[id]
 
-        # Update mission takeoff weight
-        vehicle.mass_properties.takeoff = TOW
-        mission.segments[0].analyses.weights.mass_properties.takeoff = TOW
+            # Update mission takeoff weight
+            vehicle.mass_properties.takeoff = TOW
+            mission.segments[0].analyses.weights.mass_properties.takeoff = TOW
 
-        # Evaluate mission with current TOW
-        results = mission.evaluate()
-        segment = results.segments[segmentNum]
+            # Evaluate mission with current TOW
+            results = evaluate_warm_started(mission)
+            segment = results.segments[segmentNum]
 
-        # Distance convergency in order to have total fuel equal to target fuel
+            # Distance convergency in order to have total fuel equal to target fuel
 
-        # User don't have the option of run a mission for a given fuel. So, we
-        # have to iterate distance in order to have total fuel equal to target fuel
+            # User don't have the option of run a mission for a given fuel. So, we
+            # have to iterate distance in order to have total fuel equal to target fuel
 
-        maxIter  = 10    # maximum iteration limit
-        tol      = 1.    # fuel convergency tolerance
-        residual = 9999. # residual to be minimized
-        iter     = 0     # iteration count
+            maxIter  = 10    # maximum iteration limit
+            tol      = 1.    # fuel convergency tolerance
+            residual = 9999. # residual to be minimized
+            iter     = 0     # iteration count
 
-        while abs(residual) > tol and iter < maxIter:
-            iter = iter + 1
+            while abs(residual) > tol and iter < maxIter:
+                iter = iter + 1
 
-            # Current total fuel burned in mission
-            TotalFuel  = TOW - results.segments[-1].conditions.weights.total_mass[-1]
+                # Current total fuel burned in mission
+                TotalFuel  = TOW - results.segments[-1].conditions.weights.total_mass[-1]
 
-            # Difference between burned fuel and target fuel
-            missingFuel = FUEL - TotalFuel
+                # Difference between burned fuel and target fuel
+                missingFuel = FUEL - TotalFuel
 
-            # Current distance and fuel consuption in the cruise segment
-            CruiseDist = segment.conditions.frames.inertial.position_vector[-1,0] - segment.conditions.frames.inertial.position_vector[0,0]                # Distance [m]
-            CruiseFuel = segment.conditions.weights.total_mass[0] - segment.conditions.weights.total_mass[-1]    # [kg]
-            # Current specific range (m/kg)
-            CruiseSR    = CruiseDist / CruiseFuel        # [m/kg]
+                # Current distance and fuel consuption in the cruise segment
+                CruiseDist = segment.conditions.frames.inertial.position_vector[-1,0] - segment.conditions.frames.inertial.position_vector[0,0]                # Distance [m]
+                CruiseFuel = segment.conditions.weights.total_mass[0] - segment.conditions.weights.total_mass[-1]    # [kg]
+                # Current specific range (m/kg)
+                CruiseSR    = CruiseDist / CruiseFuel        # [m/kg]
 
-            # Estimated distance that will result in total fuel burn = target fuel
-            DeltaDist  =  CruiseSR *  missingFuel
-            mission.segments[segmentNum].distance = (CruiseDist + DeltaDist)
+                # Estimated distance that will result in total fuel burn = target fuel
+                DeltaDist  =  CruiseSR *  missingFuel
+                mission.segments[segmentNum].distance = (CruiseDist + DeltaDist)
 
-            # running mission with new distance
-            results = mission.evaluate()
-            segment = results.segments[segmentNum]
+                # running mission with new distance
+                results = evaluate_warm_started(mission)
+                segment = results.segments[segmentNum]
 
-            # Difference between burned fuel and target fuel
-            residual = ( TOW- results.segments[-1].conditions.weights.total_mass[-1] ) - FUEL
+                # Difference between burned fuel and target fuel
+                residual = ( TOW- results.segments[-1].conditions.weights.total_mass[-1] ) - FUEL
 
-        # Allocating resulting range in ouput array.
-        distance[id] = ( results.segments[-1].conditions.frames.inertial.position_vector[-1,0] ) #Distance [m]
-        fuel[id] = FUEL
+            # Allocating resulting range in ouput array.
+            distance[id] = ( results.segments[-1].conditions.frames.inertial.position_vector[-1,0] ) #Distance [m]
+            fuel[id] = FUEL
+    finally:
+        # the stored unknowns are not left on the mission
+        clear_unknowns(mission)
 
     mission.segments[0].analyses.weights.mass_properties.takeoff = TOW_ref
 
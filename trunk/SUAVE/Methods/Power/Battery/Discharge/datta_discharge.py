@@ -3,6 +3,7 @@
 # 
 # Created:  ### ####, M. Vegh
 # Modified: Feb 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -10,6 +11,8 @@
 
 import numpy as np
 
+from SUAVE.Methods.Missions.Segments.Common.Numerics import integrate
+
 # ----------------------------------------------------------------------
 #  Datta Discharge
 # ----------------------------------------------------------------------
@@ -51,14 +54,13 @@ def datta_discharge(battery,numerics):
     pbat  = battery.inputs.power_in
     Rbat  = battery.resistance
     v_max = battery.max_voltage
-    I     = numerics.time.integrate
     D     = numerics.time.differentiate
 
     # Maximum energy
     max_energy = battery.max_energy
     
     #state of charge of the battery
-    initial_discharge_state = np.dot(I,pbat) + battery.current_energy[0]
+    initial_discharge_state = integrate(numerics,pbat) + battery.current_energy[0]
     x = np.divide(initial_discharge_state,battery.max_energy)
 
     # C rate
@@ -83,7 +85,7 @@ def datta_discharge(battery,numerics):
     P = pbat - np.abs(Ploss)
     
     # Possible Energy going into the battery:
-    energy_unmodified = np.dot(I,P)
+    energy_unmodified = integrate(numerics,P)
     
     # Available capacity
     capacity_available = max_energy - battery.current_energy[0]
@@ -97,7 +99,7 @@ def datta_discharge(battery,numerics):
     
     # Power actually going into the battery
     P[P>0.] = P[P>0.] - ddelta[P>0.]
-    ebat = np.dot(I,P)
+    ebat = integrate(numerics,P)
     ebat = np.reshape(ebat,np.shape(battery.current_energy)) #make sure it's consistent
     
     # Add this to the current state
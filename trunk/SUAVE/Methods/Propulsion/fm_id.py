@@ -4,6 +4,13 @@
 # Created:  ### ####, SUAVE Team
 # Modified: Feb 2016, E. Botero
 #           Dec 2017, W. Maier
+#           Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
 
 # ----------------------------------------------------------------------
 #  fm_id
@@ -33,3 +40,29 @@ def fm_id(M,gamma):
     fm = m1*M/m2
 
     return fm
+
+## @ingroup Methods-Propulsion
+def log_fm_id(M,gamma):
+    """Function that takes in the Mach number and isentropic expansion factor,
+    and outputs the logarithm of f(M) from fm_id and its derivative with
+    respect to the Mach number. The logarithm is better conditioned than f(M)
+    to solve for M, f(M) is nearly a power of M at high Mach numbers.
+
+    Inputs:
+    M          [-]
+    gamma      [-]
+
+    Outputs:
+    log_fm     [-]
+    dlog_fm_dM [-]
+
+    Source:
+    https://web.stanford.edu/~cantwell/AA210A_Course_Material/AA210A_Course_Notes/
+    """
+
+    m0         = (gamma+1.)/(2.*(gamma-1.))
+    m3         = 1.+(gamma-1.)/2.*M*M
+    log_fm     = m0*np.log((gamma+1.)/2.) + np.log(M) - m0*np.log(m3)
+    dlog_fm_dM = (1.-M*M)/(M*m3)
+
+    return log_fm, dlog_fm_dM
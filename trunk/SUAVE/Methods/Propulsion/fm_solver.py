@@ -3,13 +3,16 @@
 #
 # Created:  Sep 2017, P Goncalves
 # Modified: Jan 2018, W. Maier
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 import numpy as np
-from scipy.optimize import fsolve
+from SUAVE.Methods.Propulsion.fm_id import log_fm_id
+from SUAVE.Methods.Utilities.safeguarded_newton import safeguarded_newton
+from SUAVE.Methods.Propulsion.gas_dynamics_tables import table_lookup
 
 # ----------------------------------------------------------------------
 #  fm_solver
@@ -18,38 +21,72 @@ from scipy.optimize import fsolve
 ## @ingroup Methods-Propulsion
 
 
-def fm_solver(area_ratio, M0, gamma):
+def fm_solver(area_ratio, M0, gamma, full_output = False, tables = False):
     """Function that takes in an area ratio and a Mach number associated to
     one of the areas and outputs the missing Mach number.
 
+    Each point is solved on its own branch, subsonic if M0 < 1 and supersonic
+    otherwise, with a safeguarded Newton method and the analytic derivative
+    of the logarithm of the area-Mach function. The initial guesses come from
+    the gas dynamics tables if tables is True.
+
     Inputs:
     M           [-]
     gamma       [-]
     area_ratio  [-]
+    full_output [Boolean] also return the convergence flags
+    tables      [Boolean] start from the Mach numbers of the tables
 
     Outputs:
-    M1          [-]
+    M1          [-]       with the broadcast shape of the inputs
+    converged   [Boolean] True where the Mach number was found, if full_output
 
     Source:
     https://web.stanford.edu/~cantwell/AA210A_Course_Material/AA210A_Course_Notes/
     """
-    # Area-Mach Function
-    func = lambda M1: ((M0/M1*((1.+(gamma-1.)/2.*M1*M1)/(1.+(gamma-1.)/2.*M0*M0))**((gamma+1.)/(2.*(gamma-1.))))-area_ratio)
+    M0    = np.atleast_1d(np.asarray(M0,dtype=float))
+    gamma = np.asarray(gamma,dtype=float)
 
-    # Initializing the array
-    M1_guess = np.ones_like(M0)
+    # Area-Mach Function, fm(M1) = fm(M0)/area_ratio, in logarithms
+    log_fm_target = log_fm_id(M0,gamma)[0] - np.log(area_ratio)
 
     # Separating supersonic and subsonic solutions
-    i_low = M0 < 1.0
-    i_high = M0 >= 1.0
-
-    # Subsonic solution initialization
-    M1_guess[i_low]= 0.1
+    i_low  = M0 < 1.0
 
-    # Supersonic solution initialization
-    M1_guess[i_high]= 1.1
+    # Brackets and initial guesses of each branch
+    lower    = np.where(i_low,0.,1.)
+    upper    = np.where(i_low,1.,100.)
+    if tables:
+        M1_guess = table_lookup('area_ratio',log_fm_target,gamma,i_low)
+    else:
+        M1_guess = np.where(i_low,0.1,1.1)
 
     # Solving
-    M1 = fsolve(func,M1_guess, factor=0.1)
+    M1, converged = safeguarded_newton(area_mach_residual,lower,upper,M1_guess,(gamma,log_fm_target))
+
+    if full_output:
+        return M1, converged
 
     return M1
+
+## @ingroup Methods-Propulsion
+def area_mach_residual(M, gamma, log_fm_target):
+    """Function that takes in a Mach number and outputs the residual of the
+    area-Mach relation log(fm(M)) = log_fm_target and its derivative.
+
+    Inputs:
+    M              [-]
+    gamma          [-]
+    log_fm_target  [-]
+
+    Outputs:
+    residual       [-]
+    dresidual_dM   [-]
+
+    Source:
+    https://web.stanford.edu/~cantwell/AA210A_Course_Material/AA210A_Course_Notes/
+    """
+
+    log_fm, dlog_fm_dM = log_fm_id(M,gamma)
+
+    return log_fm - log_fm_target, dlog_fm_dM
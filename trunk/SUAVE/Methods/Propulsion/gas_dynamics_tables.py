@@ -0,0 +1,185 @@
+## @ingroup Methods-Propulsion
+# gas_dynamics_tables.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified: Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from scipy.interpolate import PchipInterpolator
+
+from SUAVE.Core import Data
+from SUAVE.Methods.Propulsion.fm_id import log_fm_id
+from SUAVE.Methods.Propulsion.rayleigh_function import rayleigh_function
+
+# the tables of each relation, branch and gamma, shared by all the components
+tables = {}
+
+# gamma is rounded to this resolution to find its table
+gamma_resolution = 1e-3
+
+# Mach numbers of the tables of each branch
+table_points     = 2001
+subsonic_range   = (1e-3, 1.)
+supersonic_range = (1., 20.)
+
+# the tabulated relations, as logarithms of monotone functions of Mach on each branch
+relations = Data()
+relations.area_ratio = lambda M, gamma: log_fm_id(M,gamma)[0]
+relations.rayleigh   = lambda M, gamma: np.log(rayleigh_function(M,gamma)[0])
+
+# ----------------------------------------------------------------------
+#  Gas Dynamics Table
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Propulsion
+def gas_dynamics_table(relation, gamma, subsonic):
+    """Returns the table of a compressible flow relation on one branch for one
+    value of gamma, built once and shared afterwards. The relation and its
+    inverse are monotone cubic splines of the exact relation at table_points
+    Mach numbers, clustered at the ends of the branch.
+
+    The error bounds are measured when the table is built, against the exact
+    relation halfway between each pair of tabulated points.
+
+    Assumptions:
+    gamma is rounded to gamma_resolution
+
+    Source:
+    Fritsch and Carlson, Monotone Piecewise Cubic Interpolation, 1980
+
+    Inputs:
+    relation                    <string>  'area_ratio' or 'rayleigh'
+    gamma                       [-]
+    subsonic                    [Boolean]
+
+    Outputs:
+    table.
+      gamma                     [-]       gamma of the table
+      mach_number               [-]       tabulated Mach numbers
+      values                    [-]       logarithm of the relation at the Mach numbers
+      forward                   <PchipInterpolator> Mach number to logarithm of the relation
+      inverse                   <PchipInterpolator> logarithm of the relation to Mach number
+      error_bound               [-]       largest error of forward
+      inverse_error_bound       [-]       largest error of inverse, in Mach number
+
+    Properties Used:
+    N/A
+    """
+
+    key = (relation, int(np.round(gamma/gamma_resolution)), bool(subsonic))
+
+    if key not in tables:
+        tables[key] = build_table(relation, key[1]*gamma_resolution, key[2])
+
+    return tables[key]
+
+## @ingroup Methods-Propulsion
+def build_table(relation, gamma, subsonic):
+    """Builds the table of a compressible flow relation, see gas_dynamics_table.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    relation                    <string>
+    gamma                       [-]
+    subsonic                    [Boolean]
+
+    Outputs:
+    table                       <Data>
+
+    Properties Used:
+    N/A
+    """
+
+    function = relations[relation]
+    if subsonic:
+        low, high = subsonic_range
+    else:
+        low, high = supersonic_range
+
+    # Chebyshev-Lobatto points, dense at the ends where the relations or their inverses are singular
+    M = low + (high - low)*(1. - np.cos(np.linspace(0.,np.pi,table_points)))/2.
+
+    values  = function(M,gamma)
+    forward = PchipInterpolator(M,values,extrapolate=False)
+
+    # the inverse needs increasing values
+    order   = np.argsort(values)
+    inverse = PchipInterpolator(values[order],M[order],extrapolate=False)
+
+    M_half  = (M[1:] + M[:-1])/2.
+    v_half  = function(M_half,gamma)
+
+    table = Data()
+    table.gamma               = gamma
+    table.mach_number         = M
+    table.values              = values
+    table.forward             = forward
+    table.inverse             = inverse
+    table.error_bound         = np.max(np.abs(forward(M_half) - v_half))
+    table.inverse_error_bound = np.max(np.abs(inverse(v_half) - M_half))
+
+    return table
+
+# ----------------------------------------------------------------------
+#  Table Lookup
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Propulsion
+def table_lookup(relation, values, gamma, subsonic):
+    """Finds the Mach numbers of the logarithms of a compressible flow relation
+    in the tables of their gamma and branch. Points are grouped by table, so a
+    lookup costs one spline evaluation per point.
+
+    Assumptions:
+    Values outside a table get the Mach number of its closest end. The Mach
+    numbers are those of gamma rounded to gamma_resolution, they are meant as
+    initial guesses for the exact solvers.
+
+    Source:
+    N/A
+
+    Inputs:
+    relation                    <string>  'area_ratio' or 'rayleigh'
+    values                      [-]       logarithm of the relation
+    gamma                       [-]
+    subsonic                    [Boolean] scalar or one per point
+
+    Outputs:
+    M                           [-]       with the broadcast shape of the inputs
+
+    Properties Used:
+    N/A
+    """
+
+    values, gamma, subsonic = np.broadcast_arrays(np.asarray(values,dtype=float),np.asarray(gamma,dtype=float),np.asarray(subsonic,dtype=bool))
+    shape = values.shape
+
+    values   = values.ravel()
+    keys     = 2*np.round(gamma.ravel()/gamma_resolution).astype(int) + subsonic.ravel()
+    M        = np.empty_like(values)
+
+    # one lookup per table
+    if np.all(keys == keys[0]):
+        unique_keys = keys[:1]
+        groups      = [slice(None)]
+    else:
+        order    = np.argsort(keys,kind='stable')
+        unique_keys, starts = np.unique(keys[order],return_index=True)
+        groups   = np.split(order,starts[1:])
+
+    for key, group in zip(unique_keys,groups):
+        table    = gas_dynamics_table(relation,(key//2)*gamma_resolution,key%2)
+        low      = table.inverse.x[0]
+        high     = table.inverse.x[-1]
+        M[group] = table.inverse(np.clip(values[group],low,high))
+
+    return M.reshape(shape)
@@ -2,10 +2,12 @@
 # nozzle_calculations.py
 # 
 # Created:  Sep 2017, P. Goncalves
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
 import numpy as np
-from scipy.optimize import fsolve
+from SUAVE.Methods.Propulsion.fm_solver import area_mach_residual
+from SUAVE.Methods.Utilities.safeguarded_newton import safeguarded_newton
+from SUAVE.Methods.Propulsion.gas_dynamics_tables import table_lookup
 
 # ----------------------------------------------------------------------
 #  nozzle calculations
@@ -33,20 +35,17 @@ def exit_Mach_shock(area_ratio, gamma, Pt_out, P0):
     Me            [dimensionless]      
     
     """
-    func = lambda Me : (Pt_out/P0)*(1./area_ratio)-(((gamma+1.)/2.)**((gamma+1.)/(2.*(gamma-1.))))*Me*((1.+(gamma-1.)/2.*Me**2.)**0.5)
-
-    #Initializing the array
-    Me_initial_guess = np.ones_like(Pt_out) 
-    i_sol = Me_initial_guess < 10.0
-    Me_initial_guess[i_sol] = 0.1
-
-    # Solving for Me
-    Me = fsolve(func,Me_initial_guess)
+    # the exit condition (Pt_out/P0)/area_ratio = K*Me*sqrt(1+(gamma-1)/2*Me^2)
+    # is a quadratic in Me^2, solved in closed form for its positive root
+    K  = ((gamma+1.)/2.)**((gamma+1.)/(2.*(gamma-1.)))
+    c2 = ((Pt_out/P0)*(1./area_ratio)/K)**2.
+    
+    Me = np.sqrt(2.*c2/(1.+np.sqrt(1.+2.*(gamma-1.)*c2)))
         
     return Me
         
 ## @ingroup Methods-Propulsion
-def mach_area(area_ratio, gamma, subsonic):
+def mach_area(area_ratio, gamma, subsonic, full_output = False, tables = False):
     """ Returns the Mach number given an area ratio and isentropic conditions
     
     Assumptions:
@@ -59,18 +58,31 @@ def mach_area(area_ratio, gamma, subsonic):
     area_ratio    [dimensionless]
     gamma         [dimensionless]
     subsonic      [Boolean]
+    full_output   [Boolean] also return the convergence flags
+    tables        [Boolean] start from the Mach numbers of the gas dynamics tables
     
     Outputs:
-    Me            [dimensionless]  
+    Me            [dimensionless] with the broadcast shape of the inputs
+    converged     [Boolean] True where the Mach number was found, if full_output
     
     """
-    func = lambda Me : (area_ratio**2. - ((1./Me)**2.)*(((2./(gamma+1.))*(1.+((gamma-1.)/2.)*Me**2.))**((gamma+1.)/((gamma-1.)))))[:,0]
+    # the area ratio to the throat is the inverse of fm, solved in logarithms
+    log_fm_target = -np.log(area_ratio)
+    
     if subsonic:
         Me_initial_guess = 0.01
+        lower, upper     = 0., 1.
     else:
-        Me_initial_guess = 2.0         
+        Me_initial_guess = 2.0
+        lower, upper     = 1., 100.
+        
+    if tables:
+        Me_initial_guess = table_lookup('area_ratio',log_fm_target,gamma,subsonic)
         
-    Me = fsolve(func,Me_initial_guess, factor = 0.1)
+    Me, converged = safeguarded_newton(area_mach_residual,lower,upper,Me_initial_guess,(gamma,log_fm_target))
+
+    if full_output:
+        return Me, converged
 
     return Me
 
@@ -98,7 +110,7 @@ def normal_shock(M1, gamma):
     return M2
 
 ## @ingroup Methods-Propulsion
-def pressure_ratio_isentropic(area_ratio, gamma, subsonic):
+def pressure_ratio_isentropic(area_ratio, gamma, subsonic, tables = False):
     """ Determines the pressure ratio for isentropic flow throughout the entire
     nozzle
     
@@ -112,20 +124,21 @@ def pressure_ratio_isentropic(area_ratio, gamma, subsonic):
     area_ratio    [dimensionless]
     gamma         [dimensionless]
     subsonic      [Boolean]
+    tables        [Boolean] start from the Mach numbers of the gas dynamics tables
     
     Outputs:
     pr_isentropic [dimensionless]      
         
     """
     #yields pressure ratio for isentropic conditions given area ratio
-    Me = mach_area(area_ratio,gamma, subsonic)
+    Me = mach_area(area_ratio,gamma, subsonic, tables = tables)
     
     pr_isentropic = (1.+((gamma-1.)/2.)*Me**2.)**(-gamma/(gamma-1.))
     
     return pr_isentropic
 
 ## @ingroup Methods-Propulsion
-def pressure_ratio_shock_in_nozzle(area_ratio, gamma):
+def pressure_ratio_shock_in_nozzle(area_ratio, gamma, tables = False):
     """ Determines the lower value of pressure ratio responsible for a 
     normal shock taking place inside the nozzle
     
@@ -138,13 +151,14 @@ def pressure_ratio_shock_in_nozzle(area_ratio, gamma):
     Inputs:
     area_ratio         [dimensionless]
     gamma              [dimensionless]
+    tables             [Boolean] start from the Mach numbers of the gas dynamics tables
     
     Outputs:
     pr_shock_in_nozzle [dimensionless]    
     
     """
     
-    Me = mach_area(area_ratio, gamma, False)
+    Me = mach_area(area_ratio, gamma, False, tables = tables)
     M2 = normal_shock(Me, gamma)
     
     pr_shock_in_nozzle = ((area_ratio)*(((gamma+1.)/2.)**((gamma+1.)/(2.*(gamma-1))))*M2*((1.+((gamma-1.)/2.)*M2**2.)**0.5))**(-1.)
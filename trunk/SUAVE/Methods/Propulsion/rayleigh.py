@@ -3,53 +3,92 @@
 # 
 # Created:  Aug 2017, P. Goncalves
 # Modified: Jan 2018, W. Maier
+#           Oct 2026, SUAVE Team
 
 import numpy as np
 
-from scipy.optimize import fsolve
+from SUAVE.Methods.Utilities.safeguarded_newton import safeguarded_newton
+from SUAVE.Methods.Propulsion.rayleigh_function import rayleigh_function
+from SUAVE.Methods.Propulsion.gas_dynamics_tables import table_lookup
 
 # ----------------------------------------------------------------------
 #  rayleigh
 # ----------------------------------------------------------------------
 
 ## @ingroup Methods-Propulsion
-def rayleigh(gamma, M0, TtR):
+def rayleigh(gamma, M0, TtR, full_output = False, tables = False):
     """
     Function that takes in a input (output) Mach number and a stagnation 
     temperature ratio and yields an output (input) Mach number, according
     to the Rayleigh flow equation. The function also outputs the stagnation
     pressure ratio
+
+    Each point stays on the branch of M0, subsonic if M0 <= 1, and is solved
+    with a safeguarded Newton method and the analytic derivative of the
+    logarithm of the Rayleigh stagnation temperature function. A thermally
+    choked point, whose temperature ratio is the largest of its branch, gets
+    M1 = 1. The initial guesses come from the gas dynamics tables if tables
+    is True.
     
     Inputs:
-    M       [dimensionless]
-    gamma   [dimensionless]
-    Ttr     [dimensionless]
+    M           [dimensionless]
+    gamma       [dimensionless]
+    Ttr         [dimensionless]
+    full_output [Boolean] also return the convergence flags
+    tables      [Boolean] start from the Mach numbers of the tables
     
     Outputs:
-    M1      [dimensionless]
-    Ptr     [dimensionless]
+    M1          [dimensionless]
+    Ptr         [dimensionless]
+    converged   [Boolean] True where the Mach number was found, if full_output
     
     """
 
-    func = lambda M1: (((1.+gamma*M0*M0)**2.*M1*M1*(1.+(gamma-1.)/2.*M1*M1))/((1.+gamma*M1*M1)**2.*M0*M0*(1.+(gamma-1.)/2.*M0*M0))-TtR)
+    M0    = np.atleast_1d(np.asarray(M0,dtype=float))
+    gamma = np.asarray(gamma,dtype=float)
 
-    #Initializing the array
-    M1_guess = np.ones_like(M0)
+    # Rayleigh stagnation temperature ratio, F(M1)/F(M0) = TtR, in logarithms
+    log_F_target = np.log(rayleigh_function(M0,gamma)[0]*TtR)
     
     # Separating supersonic and subsonic solutions
     i_low = M0 <= 1.0
-    i_high = M0 > 1.0
 
-    #--Subsonic solution Guess
-    M1_guess[i_low]= .01
-    
-    #--Supersonic solution Guess
-    M1_guess[i_high]= 1.1
+    # Brackets and initial guesses of each branch
+    lower    = np.where(i_low,0.,1.)
+    upper    = np.where(i_low,1.,100.)
+    if tables:
+        M1_guess = table_lookup('rayleigh',log_F_target,gamma,i_low)
+    else:
+        M1_guess = np.where(i_low,.01,1.1)
 
     # Find Mach number
-    M1 = fsolve(func,M1_guess, factor=0.1)
+    M1, converged = safeguarded_newton(rayleigh_residual,lower,upper,M1_guess,(gamma,log_F_target))
     
     #Calculate stagnation pressure ratio
     Ptr = ((1.+gamma*M0*M0)/(1.+gamma*M1*M1)*((1.+(gamma-1.)/2.*M1*M1)/(1.+(gamma-1.)/2.*M0*M0))**(gamma/(gamma-1.)))
 
-    return M1, Ptr
\ No newline at end of file
+    if full_output:
+        return M1, Ptr, converged
+
+    return M1, Ptr
+
+## @ingroup Methods-Propulsion
+def rayleigh_residual(M, gamma, log_F_target):
+    """
+    Function that takes in a Mach number and yields the residual of the
+    Rayleigh flow relation log(F(M)) = log_F_target and its derivative.
+    
+    Inputs:
+    M             [dimensionless]
+    gamma         [dimensionless]
+    log_F_target  [dimensionless]
+    
+    Outputs:
+    residual      [dimensionless]
+    dresidual_dM  [dimensionless]
+    
+    """
+
+    F, dF_dM = rayleigh_function(M,gamma)
+
+    return np.log(F) - log_F_target, dF_dM/F
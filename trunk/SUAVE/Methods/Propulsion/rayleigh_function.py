@@ -0,0 +1,31 @@
+## @ingroup Methods-Propulsion
+# rayleigh_function.py
+# 
+# Created:  Oct 2026, SUAVE Team
+# Modified: 
+
+# ----------------------------------------------------------------------
+#  rayleigh_function
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Propulsion
+def rayleigh_function(M, gamma):
+    """
+    Function that takes in a Mach number and yields the Rayleigh flow
+    stagnation temperature function F(M), proportional to the stagnation
+    temperature of the flow, and its derivative. F is largest at M = 1.
+    
+    Inputs:
+    M       [dimensionless]
+    gamma   [dimensionless]
+    
+    Outputs:
+    F       [dimensionless]
+    dF_dM   [dimensionless]
+    
+    """
+
+    F     = M*M*(1.+(gamma-1.)/2.*M*M)/(1.+gamma*M*M)**2.
+    dF_dM = 2.*M*(1.-M*M)/(1.+gamma*M*M)**3.
+
+    return F, dF_dM
@@ -4,6 +4,7 @@
 # Created:  Sep 2015, M. Vegh
 # Modified: Feb 2016, E. Botero
 #           Oct 2017, E. Botero (major change/rename from turbofan_nox_emission_index.py, which was removed)
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #   Imports
@@ -11,6 +12,7 @@
 
 import numpy as np
 from SUAVE.Core import Data, Units
+from SUAVE.Methods.Missions.Segments.Common.Numerics import integrate
 
 # ----------------------------------------------------------------------
 #   turbofan_emission_index
@@ -55,7 +57,7 @@ def turbofan_emission_index(turbofan, state):
     T3      = turbofan.combustor.inputs.stagnation_temperature/Units.degR 
     T4      = turbofan.combustor.outputs.stagnation_temperature/Units.degR
     mdot    = state.conditions.weights.vehicle_mass_rate
-    I       = state.numerics.time.integrate
+    numerics = state.numerics
     
     NOx = .004194*T4*((p3/439.)**.37)*np.exp((T3-1471.)/345.)
     CO2 = 3.155  # This is in kg/kg
@@ -66,10 +68,10 @@ def turbofan_emission_index(turbofan, state):
     NOx = NOx * (Units.g/Units.kg) 
     
     # Integrate them over the entire segment
-    NOx_total = np.dot(I,mdot*NOx)
-    CO2_total = np.dot(I,mdot*CO2)
-    SO2_total = np.dot(I,mdot*SO2)
-    H2O_total = np.dot(I,mdot*H2O)
+    NOx_total = integrate(numerics,mdot*NOx)
+    CO2_total = integrate(numerics,mdot*CO2)
+    SO2_total = integrate(numerics,mdot*SO2)
+    H2O_total = integrate(numerics,mdot*H2O)
 
     emission = Data()
     emission.total = Data()
@@ -2,4 +2,5 @@
 # These functions provide methods for discrete derivative and integral calculations.
 # @ingroup Methods-Utilities
 from .chebyshev_data import chebyshev_data
-from .linear_data import linear_data
\ No newline at end of file
+from .linear_data import linear_data
+from .cached_discretization import cached_discretization, integration_factors, factored_integrate
\ No newline at end of file
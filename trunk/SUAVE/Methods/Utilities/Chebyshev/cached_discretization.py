@@ -0,0 +1,177 @@
+## @ingroup Methods-Utilities-Chebyshev
+# cached_discretization.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import inspect
+import numpy as np
+from scipy.linalg import lu_factor, lu_solve
+
+# the operators of each discretization, shared by all the segments of the process
+discretizations = {}
+
+# the options each discretization method takes by name
+method_options = {}
+
+# ----------------------------------------------------------------------
+#  Method
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities-Chebyshev
+def cached_discretization(method, N = 16, **options):
+    """Returns the control points, differentiation and integration operators of a discretization
+    method, computed once for each method, number of points and options and shared afterwards.
+
+    The arrays are read only, they are shared by every segment using the same discretization.
+    Scaled operators (numerics.time) are new arrays and can be changed.
+
+    Assumptions:
+    The method only depends on N and the options it names in its signature, other options are
+    passed on but not used as part of the key
+
+    Source:
+    N/A
+
+    Inputs:
+    method                 <function> like chebyshev_data(N,integration=True,**options)
+    N                      [-]        Number of points
+    options                           passed to the method
+
+    Outputs:
+    x                      [-]        Control points
+    D                      [-]        Differentiation operation matrix
+    I                      [-]        Integration operation matrix
+
+    Properties Used:
+    N/A
+    """
+
+    key = discretization_key(method,N,options)
+
+    # options that can not be hashed are not cached
+    if key is None:
+        return method(N,**options)
+
+    if key not in discretizations:
+        operators = method(N,**options)
+        for operator in operators:
+            if isinstance(operator,np.ndarray):
+                operator.setflags(write=False)
+        discretizations[key] = tuple(operators)
+
+    return discretizations[key]
+
+## @ingroup Methods-Utilities-Chebyshev
+def integration_factors(method, N = 16, **options):
+    """Returns the LU factors of the differentiation operator without its first row and column,
+    computed once for each discretization and stored next to its operators. Integrals can then
+    be computed by a solve instead of a product with the explicit inverse, see factored_integrate.
+
+    Assumptions:
+    The method returns D as its second operator
+
+    Source:
+    N/A
+
+    Inputs:
+    method                 <function> like chebyshev_data(N,integration=True,**options)
+    N                      [-]        Number of points
+    options                           passed to the method, integration is not used
+
+    Outputs:
+    factors                           LU factors from scipy.linalg.lu_factor
+
+    Properties Used:
+    N/A
+    """
+
+    # the factors replace the inverse, it is not computed
+    options = dict(options,integration=False)
+    key     = discretization_key(method,N,options)
+
+    if key is None or ('factors',key) not in discretizations:
+        x, D, I = cached_discretization(method,N,**options)
+        factors = lu_factor(D[1:,1:])
+        for factor in factors:
+            factor.setflags(write=False)
+        if key is None:
+            return factors
+        discretizations[('factors',key)] = factors
+
+    return discretizations[('factors',key)]
+
+## @ingroup Methods-Utilities-Chebyshev
+def factored_integrate(factors, f, scale = 1.):
+    """Integrates f from the first control point, the same as np.dot(I,f)*scale without the
+    explicit inverse of the differentiation operator.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    factors                           from integration_factors
+    f                                 1-d vector or 2-d column array
+    scale                  [-]        length of the interval, like the segment time
+
+    Outputs:
+    int_f                             same shape as f
+
+    Properties Used:
+    N/A
+    """
+
+    f     = np.asarray(f,dtype=float)
+    int_f = np.zeros_like(f)
+
+    int_f[1:] = lu_solve(factors,f[1:]) * scale
+
+    return int_f
+
+## @ingroup Methods-Utilities-Chebyshev
+def discretization_key(method, N, options):
+    """Builds the cache key of a discretization, None if it can not be cached.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    method                 <function>
+    N                      [-]
+    options                [dict]
+
+    Outputs:
+    key                    [tuple]
+
+    Properties Used:
+    N/A
+    """
+
+    if method not in method_options:
+        try:
+            parameters = inspect.signature(method).parameters
+        except (TypeError,ValueError):
+            return None
+        named = [ name for name, parameter in parameters.items() \
+                  if parameter.kind in (parameter.POSITIONAL_OR_KEYWORD,parameter.KEYWORD_ONLY) ]
+        method_options[method] = named[1:]
+
+    values = tuple( (name,options[name]) for name in method_options[method] if name in options )
+    key    = (method,int(N),values)
+
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
@@ -4,5 +4,6 @@
 # @ingroup Methods
 from . import Chebyshev
 from . import soft_max
+from . import safeguarded_newton
 #import Utilities
 from . import latin_hypercube_sampling
\ No newline at end of file
@@ -0,0 +1,130 @@
+## @ingroup Methods-Utilities
+# safeguarded_newton.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Safeguarded Newton
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities
+def safeguarded_newton(function, lower, upper, x0 = None, args = (), tolerance = 1e-12, residual_tolerance = 1e-14, max_iterations = 100):
+    """Solves many independent scalar equations function(x, *args) = 0 at once, each in its own
+    bracket [lower, upper]. Every element takes Newton steps with the derivative given by the
+    function, falling back to a bisection of its bracket when a Newton step would leave the
+    bracket or does not shrink fast enough, so each element converges even where the derivative
+    vanishes.
+
+    The arguments are broadcast with the brackets, and each iteration only evaluates the function
+    for the elements not converged yet. A solve costs the total count of iterations of the
+    elements, unlike a solver for the coupled system whose Jacobian grows with the square of the
+    number of elements.
+
+    Assumptions:
+    Each equation has a single root in its bracket. Elements converge once their step or their
+    residual is below its tolerance, the residuals should be scaled to be of order one. Elements
+    whose residuals have the same sign at both ends of the bracket return the end with the
+    smallest residual, and are only flagged as converged if that residual is below
+    residual_tolerance.
+
+    Source:
+    Press et al., Numerical Recipes, rtsafe
+
+    Inputs:
+    function            <function> returns the residuals and their derivatives, f(x, *args), dfdx(x, *args)
+    lower               [-]        lower end of the brackets
+    upper               [-]        upper end of the brackets
+    x0                  [-]        initial guesses, the middle of the brackets if None
+    args                <tuple>    parameters of the equations, arrays or scalars
+    tolerance           [-]        convergence tolerance on the steps, relative to max(1,|x|)
+    residual_tolerance  [-]        convergence tolerance on the residuals
+    max_iterations      [-]        iterations before the elements left are given up
+
+    Outputs:
+    x                   [-]        roots, with the broadcast shape of the inputs
+    converged           [-]        boolean array, True where the root was found
+
+    Properties Used:
+    N/A
+    """
+
+    lower = np.asarray(lower,dtype=float)
+    upper = np.asarray(upper,dtype=float)
+    if x0 is None:
+        x0 = (lower + upper)/2.
+
+    # every element gets its own copy of the brackets, guesses and parameters
+    arrays = np.broadcast_arrays(lower,upper,np.asarray(x0,dtype=float),*[np.asarray(arg) for arg in args])
+    shape  = arrays[0].shape
+    lower, upper, x0 = [ array.ravel() for array in arrays[:3] ]
+    args   = [ array.ravel() for array in arrays[3:] ]
+
+    with np.errstate(divide='ignore',invalid='ignore'):
+        f_lower = function(lower,*args)[0]*np.ones_like(lower)
+        f_upper = function(upper,*args)[0]*np.ones_like(upper)
+
+    # ends that are roots are kept, as are the best ends of unbracketed elements
+    end_lower = np.abs(f_lower) <= np.abs(f_upper)
+    x         = np.where(end_lower,lower,upper)
+    converged = np.minimum(np.abs(f_lower),np.abs(f_upper)) <= residual_tolerance
+    active    = ~converged & (np.sign(f_lower) != np.sign(f_upper))
+
+    # the elements left, with brackets oriented so that f(a) < 0 < f(b)
+    index  = np.flatnonzero(active)
+    args   = [ arg[index] for arg in args ]
+    a      = np.where(f_lower[index] < 0.,lower[index],upper[index])
+    b      = np.where(f_lower[index] < 0.,upper[index],lower[index])
+    xi     = np.clip(x0[index],np.minimum(a,b),np.maximum(a,b))
+    dx     = np.abs(b - a)
+    dx_old = dx.copy()
+
+    for iteration in range(max_iterations):
+        if not index.size:
+            break
+
+        with np.errstate(divide='ignore',invalid='ignore'):
+            f, dfdx  = function(xi,*args)
+            x_newton = xi - f/dfdx
+
+        # shrink the brackets
+        a = np.where(f < 0.,xi,a)
+        b = np.where(f > 0.,xi,b)
+
+        # Newton steps, bisections where they leave the bracket or slow down
+        out_of_bracket = ~((x_newton - a)*(x_newton - b) < 0.)
+        too_slow       = np.abs(2.*f) > np.abs(dx_old*dfdx)
+        bisect         = out_of_bracket | too_slow | ~np.isfinite(x_newton)
+        x_new          = np.where(bisect,(a + b)/2.,x_newton)
+
+        # the residual is small enough, or the step or the bracket are
+        scale  = tolerance*np.maximum(1.,np.abs(x_new))
+        small  = np.abs(f) <= residual_tolerance
+        x_new  = np.where(small,xi,x_new)
+        dx_old = dx
+        dx     = np.abs(x_new - xi)
+        xi     = x_new
+        done   = small | (dx <= scale) | (np.abs(b - a) <= scale)
+
+        x[index[done]]         = xi[done]
+        converged[index[done]] = True
+
+        left   = ~done
+        index  = index[left]
+        args   = [ arg[left] for arg in args ]
+        xi     = xi[left]
+        a      = a[left]
+        b      = b[left]
+        dx     = dx[left]
+        dx_old = dx_old[left]
+
+    # the elements given up keep their last iterate
+    x[index] = xi
+
+    return x.reshape(shape), converged.reshape(shape)
@@ -0,0 +1,314 @@
+## @ingroup Optimization
+# Evaluation_Cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified: Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from collections import OrderedDict
+from copy import deepcopy
+
+from SUAVE.Core import Data
+from SUAVE.Input_Output.SUAVE.training_cache import hash_data, load_training_cache, save_training_cache
+
+# ----------------------------------------------------------------------
+#  Evaluation_Cache Class
+# ----------------------------------------------------------------------
+
+## @ingroup Optimization
+class Evaluation_Cache(Data):
+    """A least recently used cache of Nexus evaluations. Each entry maps the inputs and fidelity level
+        of an evaluation to the state of the nexus it produced, so that optimizers revisiting a point
+        (line searches, restarts, finite differences) do not run the procedure again.
+
+        Assumptions:
+        The outputs of the procedure are in the nexus entries listed in state_keys, by default the
+        results and summary, and in the entries the objective and constraint aliases point to. A hit
+        restores all of them together, so the objectives and constraints see the cached point. The
+        vehicle configurations, analyses and missions are not copied unless an alias reads them,
+        post processing reading other entries adds them to state_keys.
+
+        Source:
+        N/A
+    """
+
+    def __defaults__(self):
+        """This sets the default values.
+
+            Assumptions:
+            The cache is off until size is positive or a directory is given
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+        self.size       = 0
+        self.directory  = None
+        self.state_keys = ['results','summary']
+        self.hits       = 0
+        self.misses     = 0
+        self.entries    = OrderedDict()
+
+    def enabled(self):
+        """Checks whether evaluations are cached.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            enabled  [bool]
+
+            Properties Used:
+            self.size
+            self.directory
+        """
+        return self.size > 0 or bool(self.directory)
+
+    def key(self,nexus):
+        """Builds the key of the current point of a nexus.
+
+            Assumptions:
+            The procedure is the same for all the entries, only the problem definition, the input
+            values and the fidelity level are hashed. Problems holding values that can not be
+            hashed are not cached.
+
+            Source:
+            N/A
+
+            Inputs:
+            nexus.optimization_problem  [Data]
+            nexus.fidelity_level        [int]
+
+            Outputs:
+            key                         [string], None if the problem can not be hashed
+
+            Properties Used:
+            None
+        """
+        problem = nexus.optimization_problem
+
+        try:
+            return hash_data(problem.inputs,problem.objective,problem.constraints,problem.aliases,
+                             nexus.fidelity_level)
+        except TypeError:
+            return None
+
+    def load(self,key,nexus):
+        """Restores the state of a cached evaluation into a nexus.
+
+            Assumptions:
+            Entries missing from memory are looked for in the directory, if one is given.
+            Entries without a state, saved by earlier versions, are misses.
+
+            Source:
+            N/A
+
+            Inputs:
+            key            [string]
+            nexus          [Nexus()]
+
+            Outputs:
+            found          [bool]
+            nexus[state_keys]
+
+            Properties Used:
+            self.entries
+            self.directory
+        """
+
+        entry = self.entries.get(key)
+
+        if entry is None and self.directory:
+            entry = load_training_cache(self.directory,key)
+            if entry is not None and 'state' in entry:
+                self.remember(key,entry)
+            else:
+                entry = None
+
+        if entry is None:
+            self.misses += 1
+            return False
+
+        # most recently used last
+        if key in self.entries:
+            self.entries.move_to_end(key)
+
+        self.hits += 1
+
+        # copied together, so references between the entries are kept
+        state = deepcopy(entry.state)
+        for state_key, value in state.items():
+            nexus[state_key] = value
+
+        return True
+
+    def store(self,key,nexus):
+        """Adds the state of the nexus after an evaluation to the cache.
+
+            Assumptions:
+            The entries of the state are picklable if a directory is given
+
+            Source:
+            N/A
+
+            Inputs:
+            key            [string]
+            nexus[state_keys]
+
+            Outputs:
+            None
+
+            Properties Used:
+            self.directory
+        """
+
+        state = Data()
+        for state_key in self.nexus_keys(nexus):
+            if state_key in nexus:
+                state[state_key] = nexus[state_key]
+
+        entry = Data()
+        entry.state = deepcopy(state)
+
+        self.remember(key,entry)
+
+        if self.directory:
+            save_training_cache(self.directory,key,entry)
+
+    def nexus_keys(self,nexus):
+        """Finds the entries of a nexus stored with an evaluation.
+
+            Assumptions:
+            The objective and constraint values are read through the aliases, the first key of each
+            of their paths is stored
+
+            Source:
+            N/A
+
+            Inputs:
+            nexus.optimization_problem  [Data]
+
+            Outputs:
+            keys                        [list of strings]
+
+            Properties Used:
+            self.state_keys
+        """
+
+        problem = nexus.optimization_problem
+        keys    = list(self.state_keys)
+
+        tags = [ row[0] for row in problem.objective ] + [ row[0] for row in problem.constraints ]
+
+        for alias in problem.aliases:
+            if alias[0] not in tags:
+                continue
+            paths = alias[1]
+            if isinstance(paths,str):
+                paths = [paths]
+            for path in paths:
+                key = path.split('.')[0]
+                if key not in keys:
+                    keys.append(key)
+
+        return keys
+
+    def remember(self,key,entry):
+        """Keeps an entry in memory, dropping the least recently used ones beyond the cache size.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            key            [string]
+            entry          [Data]
+
+            Outputs:
+            None
+
+            Properties Used:
+            self.size
+            self.entries
+        """
+
+        if self.size <= 0:
+            return
+
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+    def reset(self):
+        """Empties the in memory cache and resets the statistics, the directory is kept.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+        self.entries = OrderedDict()
+        self.hits    = 0
+        self.misses  = 0
+
+    def statistics(self):
+        """Returns the hit and miss counts of the cache.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            stats.hits      [int]
+            stats.misses    [int]
+            stats.hit_rate  [float]
+            stats.entries   [int]
+
+            Properties Used:
+            self.hits
+            self.misses
+            self.entries
+        """
+        stats = Data()
+        stats.hits     = self.hits
+        stats.misses   = self.misses
+        stats.hit_rate = self.hits / float(max(self.hits + self.misses,1))
+        stats.entries  = len(self.entries)
+
+        return stats
@@ -4,6 +4,7 @@
 # Created:  Jul 2015, E. Botero 
 # Modified: Feb 2016, M. Vegh
 #           Apr 2017, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -15,7 +16,9 @@ from SUAVE.Core import Data, DataOrdered
 from SUAVE.Analyses import Process
 from copy import deepcopy
 from . import helper_functions as help_fun
+from .Evaluation_Cache import Evaluation_Cache
 import numpy as np
+import multiprocessing
 
 # ----------------------------------------------------------------------
 #  Nexus Class
@@ -68,13 +71,27 @@ class Nexus(Data):
         self.last_fidelity          = None
         self.evaluation_count       = 0
         self.force_evaluate         = False
+        self.evaluation_cache       = Evaluation_Cache()
+        
+        self.procedure_dependencies = Data()
+        self.procedure_inputs       = None
+        self.procedure_fidelity     = None
+        self.last_evaluated_steps   = []
+        
+        self.finite_difference_settings                     = Data()
+        self.finite_difference_settings.step_size           = 1e-8
+        self.finite_difference_settings.method              = 'forward'
+        self.finite_difference_settings.step_type           = 'absolute'
+        self.finite_difference_settings.number_of_processes = None
     
     def evaluate(self,x = None):
         """This function runs the problem you setup in SUAVE.
             If the last time you ran this the inputs were the same, a cache is used.
+            Earlier points are looked up in the evaluation cache, if it is enabled.
     
             Assumptions:
-            None
+            A cache hit restores the entries of the nexus listed in evaluation_cache.state_keys and
+            the entries the objective and constraint aliases point to
     
             Source:
             N/A
@@ -96,16 +113,32 @@ class Nexus(Data):
            and self.last_fidelity == self.fidelity_level \
            and self.force_evaluate == False:
             pass
-        else:
+        elif self.force_evaluate or not self.evaluation_cache.enabled():
             self._really_evaluate()
+        else:
+            cache = self.evaluation_cache
+            key   = cache.key(self)
+            if key is None:
+                self._really_evaluate()
+            elif cache.load(key,self):
+                self.last_inputs      = deepcopy(self.optimization_problem.inputs)
+                self.last_fidelity    = self.fidelity_level
+                # the outputs no longer match the last run of the procedure
+                self.procedure_inputs = None
+            else:
+                self._really_evaluate()
+                cache.store(key,self)
         
     
     def _really_evaluate(self):
         """Tricky little function you're not supposed to use. Doesn't check if the last inputs were already run.
             This steps through like a process through the nexus, and stores the results.
+            Steps that declare their dependencies in self.procedure_dependencies are skipped when
+            nothing they read has changed since the procedure last ran.
     
             Assumptions:
             Doesn't set values!
+            Steps without declared dependencies always run, and everything after them runs too.
     
             Source:
             N/A
@@ -124,17 +157,78 @@ class Nexus(Data):
         
         self.evaluation_count += 1
         
+        # paths changed since the last run, None if everything must run
+        dirty     = self.changed_paths()
+        evaluated = []
+        
         for key,step in nexus.procedure.items():
+            dependencies = nexus.procedure_dependencies.get(key,None)
+            if dependencies is None:
+                dirty = None
+            elif dirty is not None and not paths_overlap(dependencies.reads,dirty):
+                continue
+            
             if hasattr(step,'evaluate'):
                 self = step.evaluate(nexus)
             else:
                 nexus = step(nexus)
             self = nexus
+            evaluated.append(key)
+            
+            if dirty is not None:
+                dirty = dirty + list(dependencies.writes)
                 
         # Store to cache
-        self.last_inputs   = deepcopy(self.optimization_problem.inputs)
-        self.last_fidelity = self.fidelity_level
-          
+        self.last_inputs          = deepcopy(self.optimization_problem.inputs)
+        self.last_fidelity        = self.fidelity_level
+        self.procedure_inputs     = deepcopy(self.optimization_problem.inputs)
+        self.procedure_fidelity   = self.fidelity_level
+        self.last_evaluated_steps = evaluated
+        
+    def changed_paths(self):
+        """Finds the alias paths of the inputs that changed since the procedure last ran.
+    
+            Assumptions:
+            Everything has changed if the procedure has not run yet, the fidelity level changed,
+            the problem changed, or an evaluation is forced.
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            paths              [list of strings] - or None if everything changed
+    
+            Properties Used:
+            self.procedure_inputs
+            self.procedure_fidelity
+        """         
+        
+        inputs  = self.optimization_problem.inputs
+        last    = self.procedure_inputs
+        
+        if last is None or self.force_evaluate or self.procedure_fidelity != self.fidelity_level \
+           or len(last) != len(inputs):
+            return None
+        
+        aliases = dict()
+        for alias in self.optimization_problem.aliases:
+            aliases[alias[0]] = alias[1]
+        
+        paths = []
+        for row, last_row in zip(inputs,last):
+            if row[0] != last_row[0] or not row[0] in aliases:
+                return None
+            if row[1] == last_row[1] and row[-1] == last_row[-1]:
+                continue
+            pointers = aliases[row[0]]
+            if isinstance(pointers,str):
+                pointers = [pointers]
+            paths.extend(pointers)
+            
+        return paths
     
     def objective(self,x = None):
         """Retrieve the objective value for your function
@@ -334,57 +428,130 @@ class Nexus(Data):
         """           
         pass     
 
-    def finite_difference(self,x,diff_interval=1e-8):
+    def finite_difference(self,x,diff_interval=None,method=None,step_type=None,number_of_processes=None):
         """Finite difference gradients and jacobians of the problem.
+            The perturbed points can be evaluated concurrently by a pool of worker processes, each
+            holding its own copy of the nexus.
     
             Assumptions:
-            N/A
+            Arguments that are not given are taken from self.finite_difference_settings.
+            In parallel the procedure must give the same answer regardless of the points evaluated before.
     
             Source:
             N/A
     
             Inputs:
-            x                  [vector]
-            diff_interval      [float]
+            x                    [vector]
+            diff_interval        [float or vector] - step size, relative to max(|x|,1) for relative steps
+            method               [string]          - 'forward' or 'central'
+            step_type            [string]          - 'absolute' or 'relative'
+            number_of_processes  [int]             - size of the pool, None or 1 evaluates in this process
     
             Outputs:
-            grad_obj           [vector]
-            jac_con            [array]
+            grad_obj             [vector]
+            jac_con              [array]
     
             Properties Used:
-            None
+            self.finite_difference_settings
         """           
         
-        obj = self.objective(x)
-        con = self.all_constraints(x)
-        
-        inpu  = self.optimization_problem.inputs
-        const = self.optimization_problem.constraints
+        settings = self.finite_difference_settings
+        if diff_interval is None:       diff_interval       = settings.step_size
+        if method is None:              method              = settings.method
+        if step_type is None:           step_type           = settings.step_type
+        if number_of_processes is None: number_of_processes = settings.number_of_processes
         
-        inplen = len(inpu)
-        conlen = len(const)
+        if not method in ('forward','central'): raise Exception('method must be "forward" or "central"')
+        if not step_type in ('absolute','relative'): raise Exception('step_type must be "absolute" or "relative"')
         
-        grad_obj = np.zeros(inplen)
-        jac_con  = np.zeros((inplen,conlen))
+        x      = np.asarray(x)*1.0
+        inplen = len(self.optimization_problem.inputs)
+        conlen = len(self.optimization_problem.constraints)
         
-        con2 = (con*np.ones_like(jac_con))
+        # step sizes
+        h = np.ones(inplen)*diff_interval
+        if step_type == 'relative':
+            h = h*np.maximum(np.abs(x),1.)
         
+        # the perturbed points
+        points = []
         for ii in range(0,inplen):
-            newx     = np.asarray(x)*1.0
-            newx[ii] = newx[ii] + diff_interval
-            
-            grad_obj[ii]  = self.objective(newx)
-            jac_con[ii,:] = self.all_constraints(newx)
+            newx     = x*1.0
+            newx[ii] = newx[ii] + h[ii]
+            points.append(newx)
+        if method == 'central':
+            for ii in range(0,inplen):
+                newx     = x*1.0
+                newx[ii] = newx[ii] - h[ii]
+                points.append(newx)
+        else:
+            # the base point first, like a serial evaluation
+            points.insert(0,x)
         
-        grad_obj = (grad_obj - obj)/diff_interval
+        objectives, constraints = self.evaluate_points(points,number_of_processes)
         
-        jac_con = (jac_con - con2).T/diff_interval
+        grad_obj = np.array(objectives,dtype=object).reshape(len(points))
+        jac_con  = np.array(constraints,dtype=object).reshape(len(points),conlen)
+        
+        if method == 'central':
+            grad_obj = (grad_obj[:inplen] - grad_obj[inplen:])/(2.*h)
+            jac_con  = (jac_con[:inplen] - jac_con[inplen:]).T/(2.*h)
+        else:
+            grad_obj = (grad_obj[1:] - grad_obj[0])/h
+            jac_con  = (jac_con[1:] - jac_con[0]).T/h
         
         grad_obj = grad_obj.astype(float)
         jac_con  = jac_con.astype(float)
         
         return grad_obj, jac_con
     
+    def evaluate_points(self,points,number_of_processes=None):
+        """Evaluates the objective and all the constraints at a list of points.
+    
+            Assumptions:
+            The workers of the pool get a copy of the nexus once, then only receive the points.
+            Their evaluations are added to self.evaluation_count.
+    
+            Source:
+            N/A
+    
+            Inputs:
+            points               [list of vectors]
+            number_of_processes  [int]
+    
+            Outputs:
+            objectives           [list]
+            constraints          [list]
+    
+            Properties Used:
+            None
+        """         
+        
+        if number_of_processes is None:
+            number_of_processes = 1
+        number_of_processes = max(1,min(number_of_processes,len(points)))
+        
+        if number_of_processes == 1:
+            objectives  = []
+            constraints = []
+            for x in points:
+                objectives.append(self.objective(x))
+                constraints.append(self.all_constraints(x))
+            return objectives, constraints
+        
+        pool = multiprocessing.Pool(number_of_processes,initializer=_initialize_worker,initargs=(self,))
+        try:
+            # map keeps the results in the order of the points
+            evaluated = pool.map(_evaluate_point,points,chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+        
+        objectives  = [ e[0] for e in evaluated ]
+        constraints = [ e[1] for e in evaluated ]
+        self.evaluation_count += sum([ e[2] for e in evaluated ])
+        
+        return objectives, constraints
     
     def translate(self,x = None):
         """Make a pretty table view of the problem with objective and constraints at the current inputs
@@ -431,3 +598,102 @@ class Nexus(Data):
         
     
  
+
+# ----------------------------------------------------------------------
+#  Dependency Paths
+# ----------------------------------------------------------------------
+
+## @ingroup Optimization
+def paths_overlap(paths,other_paths):
+    """Checks whether any of two lists of alias paths point into the same data.
+        Two paths overlap when one is a parent of the other, '*' matches any key.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        paths          [list of strings]
+        other_paths    [list of strings]
+
+        Outputs:
+        overlap        [bool]
+
+        Properties Used:
+        None
+    """
+
+    if isinstance(paths,str):
+        paths = [paths]
+    if isinstance(other_paths,str):
+        other_paths = [other_paths]
+
+    for path in paths:
+        keys = path.split('.')
+        for other_path in other_paths:
+            other_keys = other_path.split('.')
+            for key, other_key in zip(keys,other_keys):
+                if key != other_key and key != '*' and other_key != '*':
+                    break
+            else:
+                return True
+
+    return False
+
+# ----------------------------------------------------------------------
+#  Finite Difference Workers
+# ----------------------------------------------------------------------
+
+# the copy of the nexus held by each worker process
+_worker_nexus = None
+
+def _initialize_worker(nexus):
+    """Stores the copy of the nexus a worker process evaluates points with.
+
+        Assumptions:
+        The nexus is picklable
+
+        Source:
+        N/A
+
+        Inputs:
+        nexus          [Nexus()]
+
+        Outputs:
+        None
+
+        Properties Used:
+        None
+    """
+    global _worker_nexus
+    _worker_nexus = nexus
+
+def _evaluate_point(x):
+    """Evaluates the objective and all the constraints at one point in a worker process.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        x              [vector]
+
+        Outputs:
+        objective      [float]
+        constraints    [vector]
+        count          [int] - number of procedure evaluations
+
+        Properties Used:
+        None
+    """
+    nexus = _worker_nexus
+    count = nexus.evaluation_count
+
+    objective   = nexus.objective(x)
+    constraints = nexus.all_constraints(x)
+
+    return objective, constraints, nexus.evaluation_count - count
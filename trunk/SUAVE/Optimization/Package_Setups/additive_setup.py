@@ -14,8 +14,6 @@ try:
     import pyOpt
 except:
     pass
-import sklearn
-from sklearn import gaussian_process
 from SUAVE.Optimization import helper_functions as help_fun
 from SUAVE.Methods.Utilities.latin_hypercube_sampling import latin_hypercube_sampling
 from scipy.stats import norm
@@ -53,6 +51,7 @@ def Additive_Solve(problem,num_fidelity_levels=2,num_samples=10,max_iterations=1
     Properties Used:
     N/A
     """        
+    from sklearn import gaussian_process
     
     if print_output == False:
         devnull = open(os.devnull,'w')
@@ -2,7 +2,7 @@
 # surrogate_setup.py
 #
 # Created:  May 2016, M. Vegh
-# Modified:
+# Modified: Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
@@ -46,8 +46,8 @@ def pyopt_surrogate_setup(surrogate_function, inputs, constraints):
     bnd              = inputs[:,2] # Bounds
     scl              = inputs[:,3] # Scaling
     input_units      = inputs[:,-1] *1.0
-    constraint_scale = constraints[:,3]
-    constraint_units = constraints[:,-1]*1.0
+    constraint_scale = np.asarray(constraints[:,3],dtype = float)
+    constraint_units = np.asarray(constraints[:,-1],dtype = float)
     
     import pyOpt #use pyOpt to set up the problem
     opt_problem      = pyOpt.Optimization('surrogate', surrogate_function)
@@ -2,6 +2,7 @@
 # The files that help you setup an optimization problem.
 
 from .Nexus import Nexus
+from .Evaluation_Cache import Evaluation_Cache
 from . import helper_functions
 from . import Package_Setups
 from .read_optimization_outputs import read_optimization_outputs
@@ -3,6 +3,7 @@
 #
 # Created : Feb 2016, M. Vegh 
 # Modified : Feb 2017, M. Vegh
+#            Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -10,7 +11,6 @@
  
 from SUAVE.Core import Data
 import numpy as np
-import matplotlib.pyplot as plt
 
 # ----------------------------------------------------------------------
 #  carpet_plot
@@ -45,6 +45,7 @@ def carpet_plot(problem, number_of_points,  plot_obj=1, plot_const=0, sweep_inde
         Properties Used:
         N/A
     """         
+    import matplotlib.pyplot as plt
 
     #unpack
     idx0            = sweep_index_0 # local name
@@ -56,10 +57,10 @@ def carpet_plot(problem, number_of_points,  plot_obj=1, plot_const=0, sweep_inde
     scl             = base_inputs[:,3] # Scaling
     base_objective  = opt_prob.objective
     obj_name        = base_objective[0][0] #objective function name (used for scaling)
-    obj_scaling     = base_objective[0][1]
+    obj_scaling     = float(base_objective[0][1])
     base_constraints= opt_prob.constraints
     constraint_names= base_constraints[:,0]
-    constraint_scale= base_constraints[:,3]
+    constraint_scale= np.asarray(base_constraints[:,3],dtype = float)
    
     #define inputs, output, and constraints for sweep
     inputs          = np.zeros([2,number_of_points])
@@ -3,11 +3,13 @@
 # 
 # Created:  May 2015, E. Botero
 # Modified: Feb 2015, M. Vegh
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
 # ----------------------------------------------------------------------    
 
+import re
 import numpy as np
 from SUAVE.Core import Data
 
@@ -24,7 +26,7 @@ def set_values(dictionary,input_dictionary,converted_values,aliases):
         the names link to
 
     Assumptions:
-    N/A
+    The alias paths are compiled once and reused, see compile_aliases
 
     Source:
     N/A
@@ -44,41 +46,12 @@ def set_values(dictionary,input_dictionary,converted_values,aliases):
     
     provided_names = input_dictionary[:,0]
         
-    # Correspond aliases to inputs
-    pointer = []
-    for ii in range(0,len(provided_names)):
-        for jj in range(0,len(aliases)):
-            if provided_names[ii] == aliases[jj][0]:
-                pointer.append(aliases[jj][1])
+    # Correspond aliases to inputs, compiled once per problem
+    pointer = compile_aliases(provided_names,aliases)
 
     for ii in range(0,len(pointer)):
-        pointers = pointer[ii][:]
-        if isinstance(pointers,str):
-            length = 0
-            if '*' in pointers:
-                newstrings = find_a_star(dictionary,pointer[ii])
-                for jj in range(0,len(newstrings)):
-                    localstrs = newstrings[jj].split('.')
-                    correctname = '.'.join(localstrs[0:])
-                    dictionary.deep_set(correctname,converted_values[ii])
-                    
-            elif '*' not in pointers:
-                localstrs = pointers.split('.')
-                correctname = '.'.join(localstrs[0:])
-                dictionary.deep_set(correctname,converted_values[ii])              
-        else:
-            for zz in range(1,len(pointers)+1):
-                if '*' in pointers[zz-1]:
-                    newstrings = find_a_star(dictionary,pointer[ii][zz-1])
-                    for jj in range(0,len(newstrings)):
-                        localstrs = newstrings[jj].split('.')
-                        correctname = '.'.join(localstrs[0:])
-                        dictionary.deep_set(correctname,converted_values[ii])
-                        
-                elif '*' not in pointers[zz-1]:
-                    localstrs = pointers[zz-1].split('.')
-                    correctname = '.'.join(localstrs[0:])
-                    dictionary.deep_set(correctname,converted_values[ii])            
+        for path in pointer[ii]:
+            set_path(dictionary,path,converted_values[ii])
             
     return dictionary
         
@@ -141,7 +114,7 @@ def scale_input_values(inputs,x):
     N/A
     """    
     
-    provided_scale = inputs[:,3]
+    provided_scale = np.asarray(inputs[:,3],dtype = float)
     inputs[:,1] =  x*provided_scale
     
     return inputs
@@ -166,10 +139,10 @@ def convert_values(inputs):
     N/A
     """    
     
-    provided_values  = inputs[:,1] 
+    provided_values  = np.asarray(inputs[:,1],dtype = float)
     
     # Most important 2 lines of these functions
-    provided_units   = inputs[:,-1]*1.0
+    provided_units   = np.asarray(inputs[:,-1],dtype = float)
     inputs[:,-1]     = provided_units
     
     converted_values = provided_values*provided_units
@@ -206,17 +179,12 @@ def get_values(dictionary,outputs,aliases):
     npoutputs   = np.array(outputs)
     output_names = npoutputs[:,0]
         
-    # Correspond aliases to outputs
-    pointer = []
-    for ii in range(0,len(output_names)):
-        for jj in range(0,len(aliases)):
-            if output_names[ii] == aliases[jj][0]:
-                pointer.append(aliases[jj][1])    
+    # Correspond aliases to outputs, compiled once per problem
+    pointer = compile_aliases(output_names,aliases)
                 
     values = np.zeros(len(outputs))
     for ii in range(0,len(outputs)):
-        splitstring = pointer[ii].split('.')
-        values[ii]  = eval('dictionary.'+'.'.join(splitstring[0:]))
+        values[ii]  = get_path(dictionary,pointer[ii][0])
     
     return values
 
@@ -241,8 +209,8 @@ def scale_obj_values(inputs,x):
     N/A
     """     
     
-    provided_scale = inputs[:,1]
-    provided_units = inputs[:,-1]*1.0
+    provided_scale = np.asarray(inputs[:,1],dtype = float)
+    provided_units = np.asarray(inputs[:,-1],dtype = float)
     inputs[:,-1]   = provided_units
     
     scaled =  x/(provided_scale*provided_units)
@@ -270,7 +238,7 @@ def scale_const_values(inputs,x):
     N/A
     """        
     
-    provided_scale = np.array(inputs[:,3],dtype = float)
+    provided_scale = np.asarray(inputs[:,3],dtype = float)
     scaled =  x/provided_scale
     
     return scaled
@@ -295,10 +263,10 @@ def scale_const_bnds(inputs):
     N/A
     """     
     
-    provided_bounds = np.array(inputs[:,2],dtype = float)
+    provided_bounds = np.asarray(inputs[:,2],dtype = float)
     
     # Most important 2 lines of these functions
-    provided_units  = inputs[:,-1]*1.0
+    provided_units  = np.asarray(inputs[:,-1],dtype = float)
     inputs[:,-1]    = provided_units
     
     converted_values = provided_bounds*provided_units
@@ -326,8 +294,185 @@ def unscale_const_values(inputs,x):
     N/A
     """     
     
-    provided_units   = inputs[:,-1]*1.0
-    provided_scale = np.array(inputs[:,3],dtype = float)
+    provided_units   = np.asarray(inputs[:,-1],dtype = float)
+    provided_scale = np.asarray(inputs[:,3],dtype = float)
     scaled =  x*provided_scale/provided_units
     
     return scaled
+
+# ----------------------------------------------------------------------        
+#   Compiled Aliases
+# ----------------------------------------------------------------------  
+
+# compiled aliases of the problems seen so far
+compiled_aliases = dict()
+
+# paths made of plain keys are walked directly, anything else is evaluated
+plain_key = re.compile(r'^[A-Za-z_]\w*$|^\*$')
+
+## @ingroup Optimization
+def compile_aliases(names,aliases):
+    """ Finds the alias paths of each name and splits them into keys. The result is cached,
+        so the string processing is done once per problem instead of once per evaluation.
+
+    Assumptions:
+    Each name is matched against every alias in order, a name may match several aliases.
+    Wildcards are expanded when the paths are used, so configurations added later are found.
+
+    Source:
+    N/A
+
+    Inputs:
+    names            [list of str]
+    aliases          [list of str]
+
+    Outputs:
+    pointer          [list of lists of compiled paths]
+
+    Properties Used:
+    N/A
+    """    
+    
+    key = (tuple(names),tuple([ (alias[0], alias[1] if isinstance(alias[1],str) else tuple(alias[1])) for alias in aliases ]))
+    
+    pointer = compiled_aliases.get(key)
+    if pointer is not None:
+        return pointer
+    
+    pointer = []
+    for ii in range(0,len(names)):
+        for jj in range(0,len(aliases)):
+            if names[ii] == aliases[jj][0]:
+                paths = aliases[jj][1]
+                if isinstance(paths,str):
+                    paths = [paths]
+                pointer.append([ compile_path(path) for path in paths ])
+                
+    # keep the cache from growing without bound
+    if len(compiled_aliases) > 256:
+        compiled_aliases.clear()
+    compiled_aliases[key] = pointer
+    
+    return pointer
+
+## @ingroup Optimization
+def compile_path(path):
+    """ Splits an alias path into keys and finds its wildcard
+
+    Assumptions:
+    Like find_a_star, only the last key with an asterisk is a wildcard
+
+    Source:
+    N/A
+
+    Inputs:
+    path             [str]
+
+    Outputs:
+    compiled         [Data()]
+        path         [str]
+        names        [tuple of str] - the keys of the path
+        star         [int or None]  - index of the wildcard key
+        plain        [bool]         - all keys are plain names
+        code         [code]         - the path as an expression, compiled when first needed
+
+    Properties Used:
+    N/A
+    """    
+    
+    keys = tuple(path.split('.'))
+    
+    star = None
+    for ii in range(0,len(keys)):
+        if '*' in keys[ii]:
+            star = ii
+    
+    compiled = Data()
+    compiled.path  = path
+    compiled.names = keys
+    compiled.star  = star
+    compiled.plain = all([ plain_key.match(k) for k in keys ])
+    compiled.code  = None
+    
+    return compiled
+
+## @ingroup Optimization
+def set_path(dictionary,compiled,value):
+    """ Sets a value at a compiled alias path, the same way as deep_set
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    dictionary       [Data()]
+    compiled         [Data()] - from compile_path
+    value            [float]
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """    
+    
+    keys = compiled.names
+    star = compiled.star
+    
+    if star is None:
+        data = dictionary
+        for k in keys[:-1]:
+            data = data[k]
+        data[keys[-1]] = value
+        return
+    
+    # expand the wildcard
+    if star == 0:
+        container = dictionary
+    elif compiled.plain:
+        container = dictionary
+        for k in keys[:star]:
+            container = getattr(container,k)
+    else:
+        container = eval('dictionary.'+'.'.join(keys[:star]))
+        
+    for new_key in list(container.keys()):
+        full = keys[:star] + (new_key,) + keys[star+1:]
+        data = dictionary
+        for k in full[:-1]:
+            data = data[k]
+        data[full[-1]] = value
+
+## @ingroup Optimization
+def get_path(dictionary,compiled):
+    """ Gets the value at a compiled alias path
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    dictionary       [Data()]
+    compiled         [Data()] - from compile_path
+
+    Outputs:
+    value            [float]
+
+    Properties Used:
+    N/A
+    """    
+    
+    if compiled.plain and compiled.star is None:
+        value = dictionary
+        for k in compiled.names:
+            value = getattr(value,k)
+        return value
+    
+    if compiled.code is None:
+        compiled.code = compile('dictionary.'+compiled.path,'<alias>','eval')
+    
+    return eval(compiled.code,globals(),{'dictionary':dictionary})
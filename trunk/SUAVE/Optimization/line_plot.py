@@ -3,6 +3,7 @@
 #
 # Created  : Oct 2017, M. Vegh 
 # Modified : Nov 2017, M. Vegh
+#            Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -10,7 +11,6 @@
  
 from SUAVE.Core import Data
 import numpy as np
-import matplotlib.pyplot as plt
 
 # ----------------------------------------------------------------------
 #  line_plot
@@ -46,6 +46,7 @@ def line_plot(problem, number_of_points,  plot_obj=1, plot_const=1, sweep_index=
         Properties Used:
         N/A
     """         
+    import matplotlib.pyplot as plt
     
     
     
@@ -59,10 +60,10 @@ def line_plot(problem, number_of_points,  plot_obj=1, plot_const=1, sweep_index=
     scl             = base_inputs[:,3] # Scaling
     base_objective  = opt_prob.objective
     obj_name        = base_objective[0][0] #objective function name (used for scaling)
-    obj_scaling     = base_objective[0][1]
+    obj_scaling     = float(base_objective[0][1])
     base_constraints= opt_prob.constraints
     constraint_names= base_constraints[:,0]
-    constraint_scale= base_constraints[:,3]
+    constraint_scale= np.asarray(base_constraints[:,3],dtype = float)
    
     #define inputs, output, and constraints for sweep
     inputs          = np.zeros([2,number_of_points])
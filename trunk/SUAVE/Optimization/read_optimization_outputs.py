@@ -2,13 +2,15 @@
 # read_optimization_outputs.py
 #
 # Created:  May 2016, M. Vegh
-# Modified:
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 import numpy as np
 
+from SUAVE.Input_Output.SUAVE.history import read_any_history, parse_text_history
+
 # ----------------------------------------------------------------------
 #  read_optimization_outputs_inputs
 # ----------------------------------------------------------------------
@@ -33,33 +35,13 @@ def format_input_data(data):
         None
     """      
 
-    data_out=[]
-  
-    for line in data:
-       
-        line = line.replace('[','')
-        line = line.replace(']','')
-        line = line.replace(',','')
-        line = line.replace('iteration = ' , '')
-        line = line.replace(' objective = ' , '')
-        line = line.replace('inputs = ' , '')
-        line = line.replace('constraints = ' , '')
-        numbers = line.split(' ')
-        
-        numbers_out=[]
-        for number in numbers:
-            if number != ' ' or number != '\t':
-                
-                numbers_out.append(float(number))
-            
-        data_out.append(numbers_out)
-    data_out=np.array(data_out)  #change into numpy array to work with later
+    data_out = parse_text_history(data)  #numpy array to work with later
     
     return data_out
     
 ## @ingroup Optimization
 def read_optimization_outputs(filename, base_inputs, constraint_inputs):
-    """Reads in the outputs of an optimization problem
+    """Reads in the outputs of an optimization problem, from a binary or text file
 
         Assumptions:
         None
@@ -84,10 +66,7 @@ def read_optimization_outputs(filename, base_inputs, constraint_inputs):
     """      
     #need vector of initial inputs to determine where to separate 
     #inputs from constraints in text file
-    file_in = open(filename)
-    data = file_in.readlines()
-    file_in.close()
-    data = format_input_data(data)
+    data = read_any_history(filename)
     
     #unpack data
     iterations    = data[:,0]
@@ -2,13 +2,16 @@
 # write_optimization_outputs.py
 #
 # Created:  May 2016, M. Vegh
-# Modified:
+# Modified: Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
+import numpy as np
+
+from SUAVE.Input_Output.SUAVE.history import append_history, history_format
 from .helper_functions import get_values, scale_obj_values, scale_const_values
 
 # ----------------------------------------------------------------------
@@ -17,11 +20,12 @@ from .helper_functions import get_values, scale_obj_values, scale_const_values
 
 
 ## @ingroup Optimization
-def write_optimization_outputs(nexus, filename):
+def write_optimization_outputs(nexus, filename, file_format='text'):
     """ Writes the optimization outputs to a file
 
     Assumptions:
-    N/A
+    An existing file is appended to in its own format, file_format only applies to new files.
+    A binary row holds the iteration, the objective, the inputs and the constraints.
 
     Source:
     N/A
@@ -29,6 +33,7 @@ def write_optimization_outputs(nexus, filename):
     Inputs:
     nexus            [nexus()]
     filename         [str]
+    file_format      [str]  'text' or 'binary'
 
     Outputs:
     N/A
@@ -63,6 +68,11 @@ def write_optimization_outputs(nexus, filename):
         problem_constraints.append(value)
     
     
+    if history_format(filename, file_format) == 'binary':
+        row = np.hstack(([nexus.total_number_of_iterations, scaled_objective[0]], problem_inputs, problem_constraints))
+        append_history(filename, row)
+        return
+    
     file=open(filename, 'a')
     file.write('iteration = ')
     file.write(str(nexus.total_number_of_iterations))
@@ -13,28 +13,41 @@
 """
 from __future__ import with_statement
 import os
-import subprocess
-import pkg_resources
 from .unit import UnitRegistry, DimensionalityError, UndefinedUnitError
 from .util import formatter, pi_theorem, logger
 from .measurement import Measurement
 from .context import Context
 
-_DEFAULT_REGISTRY = UnitRegistry()
+# built on first use, only unpickled quantities need it
+_DEFAULT_REGISTRY = None
+
+
+def _get_version():
+    import subprocess
+    try:  # try to grab the commit version of our package
+        return (subprocess.check_output(["git", "describe"],
+                                        stderr=subprocess.STDOUT,
+                                        cwd=os.path.dirname(os.path.abspath(__file__)))).strip()
+    except:  # on any error just try to grab the version that is installed on the system
+        try:
+            import pkg_resources
+            return pkg_resources.get_distribution('pint').version
+        except:
+            return "unknown"  # we seem to have a local copy without any repository control or installed without setuptools
+                              # so the reported version will be __unknown__
+
+
+def __getattr__(name):
+    # the version is looked up on first use
+    if name == '__version__':
+        return _get_version()
+    raise AttributeError("module " + repr(__name__) + " has no attribute " + repr(name))
 
-__version__ = "unknown"
-try:  # try to grab the commit version of our package
-    __version__ = (subprocess.check_output(["git", "describe"],
-                                           stderr=subprocess.STDOUT,
-                                           cwd=os.path.dirname(os.path.abspath(__file__)))).strip()
-except:  # on any error just try to grab the version that is installed on the system
-    try:
-        __version__ = pkg_resources.get_distribution('pint').version
-    except:
-        pass  # we seem to have a local copy without any repository control or installed without setuptools
-              # so the reported version will be __unknown__  
 
 def _build_quantity(value, units):
+    global _DEFAULT_REGISTRY
+    if _DEFAULT_REGISTRY is None:
+        _DEFAULT_REGISTRY = UnitRegistry()
     return _DEFAULT_REGISTRY.Quantity(value, units)
 
 
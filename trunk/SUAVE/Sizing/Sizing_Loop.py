@@ -2,24 +2,19 @@
 #Sizing_Loop.py
 #Created:  Jun 2016, M. Vegh
 #Modified: May 2018, M. Vegh
+#          Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 from SUAVE.Core import Data
-from SUAVE.Surrogate.svr_surrogate_functions import check_svr_accuracy
 import scipy.interpolate as interpolate
 
-import sklearn.svm as svm
-import sklearn.ensemble as ensemble
-import sklearn.gaussian_process as gaussian_process
-from sklearn.gaussian_process.kernels import RationalQuadratic 
-import sklearn.linear_model as linear_model
-import sklearn.neighbors as neighbors
 from .write_sizing_outputs import write_sizing_outputs
 from .read_sizing_inputs import read_sizing_inputs
 from .write_sizing_residuals import write_sizing_residuals
+from .Sizing_Surrogate import Sizing_Surrogate
 
 
 import numpy as np
@@ -54,6 +49,8 @@ class Sizing_Loop(Data):
         self.write_threshhold      = 3     #number of iterations before it writes,
         self.write_residuals       = False  #set to True to write the residuals at every iteration
         self.residual_filename     = 'y_err_values.txt'
+        self.history_format        = 'text' #'text' or 'binary', format of new output and residual files; existing files keep theirs
+        self.surrogate             = Sizing_Surrogate() #sizing data in memory, used for the initial step
         
         #parameters that may only apply to certain methods
         self.iteration_options     = Data()
@@ -71,6 +68,8 @@ class Sizing_Loop(Data):
         self.iteration_options.number_of_surrogate_calls         = 0
         self.iteration_options.newton_raphson_damping_threshhold = 5E-5
         self.iteration_options.n_neighbors                       = 5
+        self.iteration_options.neighbors_weighted_distance       = False            #weight the neighbors by the inverse of their distance for 'Neighbors'
+        self.iteration_options.surrogate_refit_fraction          = .1               #the regressors are refit once the sizing data grew by more than this fraction
         self.iteration_options.err_save                          = 0.
         
         #backtracking 
@@ -111,80 +110,30 @@ class Sizing_Loop(Data):
         i         = 0  #function evals
         
         #determine the initial step
-        min_norm = 1000.
+        min_norm  = 1000.
+        surrogate = self.surrogate
         if self.initial_step != 'Default':
-            data_inputs, data_outputs, read_success = read_sizing_inputs(self, scaled_inputs)
+            read_success = surrogate.load(self, scaled_inputs)
             
             if read_success:
-                min_norm, i_min_dist = find_min_norm(scaled_inputs, data_inputs)
+                min_norm, i_min_dist = surrogate.nearest(scaled_inputs)
+                data_outputs         = surrogate.outputs
                 
                 if min_norm<iteration_options.max_initial_step: #make sure data is close to current guess
                     if self.initial_step == 'Table' or min_norm<iteration_options.min_surrogate_step or len(data_outputs[:,0])< iteration_options.min_surrogate_length:
-                        regr    = neighbors.KNeighborsRegressor( n_neighbors = 1)
+                        y = surrogate.neighbors_predict(scaled_inputs, 1)
                       
                     else:
                         print('running surrogate method')
-                        if self.initial_step == 'SVR':
-                            #for SVR, can optimize parameters C and eps for closest point
-                            print('optimizing svr parameters')
-                            x = [2.,-1.] #initial guess for 10**C, 10**eps
-                        
-                            out = sp.optimize.minimize(check_svr_accuracy, x, method='Nelder-Mead', args=(data_inputs, data_outputs, imin_dist))
-                            t2=time.time()
-                            c_out = 10**out.x[0]
-                            eps_out = 10**out.x[1]
-                            if c_out > 1E10:
-                                c_out = 1E10
-                            if eps_out<1E-8:
-                                eps_out = 1E-8
-            
-                            regr        = svm.SVR(C=c_out,  epsilon = eps_out)
-                            
-                        elif self.initial_step == 'GradientBoosting':
-                            regr        = ensemble.GradientBoostingRegressor()
-                            
-                        elif self.initial_step == 'ExtraTrees':
-                            regr        = ensemble.ExtraTreesRegressor()
-                        
-                        elif self.initial_step == 'RandomForest':
-                            regr        = ensemble.RandomForestRegressor()
-                        
-                        elif self.initial_step == 'Bagging':
-                            regr        = ensemble.BaggingRegressor()
-                            
-                        elif self.initial_step == 'GPR':
-                            gp_kernel_RQ = RationalQuadratic(length_scale=1.0, alpha=1.0)
-                            regr        = gaussian_process.GaussianProcessRegressor(kernel=gp_kernel_RQ,normalize_y=True)
-                            
-                        elif self.initial_step == 'RANSAC':
-                            regr        = linear_model.RANSACRegressor()
-                        
-                        elif self.initial_step == 'Neighbors':
-                            n_neighbors = min(iteration_options.n_neighbors, len(data_outputs))
-                            if iteration_options.neighbors_weighted_distance  == True:
-                                regr    = neighbors.KNeighborsRegressor( n_neighbors = n_neighbors ,weights = 'distance')
-                            
-                            else:  
-                                regr    = neighbors.KNeighborsRegressor( n_neighbors = n_neighbors)
-                        
-                        #now run the fits/guesses  
-                    
+                        y = surrogate.predict(self, scaled_inputs, i_min_dist)
                         iteration_options.number_of_surrogate_calls += 1
-                    y = []    
-                    input_for_regr = scaled_inputs.reshape(1,-1)
-                    for j in range(len(data_outputs[0,:])):
-                        y_surrogate = regr.fit(data_inputs, data_outputs[:,j])
-                        y.append(y_surrogate.predict(input_for_regr)[0])    
+                        
+                    for j in range(len(y)):
                         if y[j] > self.max_y[j] or y[j]< self.min_y[j]: 
                             print('sizing variable range violated, val = ', y[j], ' j = ', j)
                             n_neighbors = min(iteration_options.n_neighbors, len(data_outputs))
-                            regr_backup = neighbors.KNeighborsRegressor( n_neighbors = n_neighbors)
-                            y = []
-                            for j in range(len(data_outputs[0,:])):
-                                y_surrogate = regr_backup.fit(data_inputs, data_outputs[:,j])
-                                y.append(y_surrogate.predict(input_for_regr)[0])
+                            y = surrogate.neighbors_predict(scaled_inputs, n_neighbors)
                             break
-                    y = np.array(y)
                    
         # initialize previous sizing values
         y_save   = 1*y  #save values to detect oscillation
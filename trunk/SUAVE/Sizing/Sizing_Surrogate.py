@@ -0,0 +1,295 @@
+## @ingroup Sizing
+#Sizing_Surrogate.py
+#Created:  Oct 2026, SUAVE Team
+#Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+from SUAVE.Surrogate.svr_surrogate_functions import check_svr_accuracy
+from SUAVE.Input_Output.SUAVE.history import history_size
+from .read_sizing_inputs import read_sizing_inputs
+
+from scipy.spatial import cKDTree
+
+import numpy as np
+import scipy as sp
+
+
+## @ingroup Sizing
+class Sizing_Surrogate(Data):
+    def __defaults__(self):
+        """
+        Data class that keeps the sizing history of a Sizing_Loop in memory, to find an initial guess
+        for the sizing variables. The history is read once, then kept up to date as write_sizing_outputs
+        appends points. Nearest points are found with a KD-tree, rebuilt only once enough points were
+        appended, and the regressors are only refit when a surrogate guess is needed and the history
+        grew by more than surrogate_refit_fraction since they were fit.
+        """
+
+        self.inputs          = None  #design variables of the points in the history
+        self.outputs         = None  #closed sizing variables of the points in the history
+        self.filename        = None  #history file the points were read from
+        self.file_size       = None  #size of that file when it was last read or appended to
+        self.tree            = None  #KD-tree of the first tree_length inputs
+        self.tree_length     = 0     #number of inputs in the tree, later points are searched directly
+        self.models          = None  #fitted regressors, one per sizing variable
+        self.model_type      = None  #initial_step the regressors were fit for
+        self.fitted_length   = 0     #number of points the regressors were fit with
+
+    def load(self, sizing_loop, opt_inputs):
+        """
+        Makes sure the history in memory is the one in the sizing loop's output file, reading it
+        again only if the file was changed by something other than write_sizing_outputs
+
+        Inputs:
+        sizing_loop.
+            output_filename
+        opt_inputs      [array]
+
+        Outputs:
+        read_success    [int]
+        """
+
+        filename  = sizing_loop.output_filename
+        file_size = history_size(filename)
+
+        if self.inputs is not None and filename == self.filename and file_size == self.file_size:
+            return 1
+
+        self.reset()
+        data_inputs, data_outputs, read_success = read_sizing_inputs(sizing_loop, opt_inputs)
+
+        if read_success:
+            self.inputs    = np.array(data_inputs, dtype=float)
+            self.outputs   = np.array(data_outputs, dtype=float)
+            self.filename  = filename
+            self.file_size = file_size
+
+        return read_success
+
+    def add_point(self, sizing_loop, opt_inputs, y, previous_size):
+        """
+        Adds a point just written to the output file. If the file was changed in between, the
+        history is read again at the next load instead
+
+        Inputs:
+        sizing_loop.
+            output_filename
+        opt_inputs      [list]
+        y               [array]
+        previous_size   [int]   size of the file before the point was written
+
+        Outputs:
+        None
+        """
+
+        filename = sizing_loop.output_filename
+        if self.inputs is None or filename != self.filename:
+            return
+        if previous_size != self.file_size or len(opt_inputs) != self.inputs.shape[1]:
+            self.reset()
+            return
+
+        self.inputs    = np.vstack((self.inputs,  np.array(opt_inputs, dtype=float)))
+        self.outputs   = np.vstack((self.outputs, np.array(y, dtype=float)))
+        self.file_size = history_size(filename)
+
+        return
+
+    def reset(self):
+        """
+        Forgets the history, it is read again at the next load
+        """
+
+        self.inputs        = None
+        self.outputs       = None
+        self.filename      = None
+        self.file_size     = None
+        self.tree          = None
+        self.tree_length   = 0
+        self.models        = None
+        self.model_type    = None
+        self.fitted_length = 0
+
+    def query(self, x, n_neighbors = 1):
+        """
+        Finds the closest points of the history, in the L2 norm
+
+        Inputs:
+        x               [array]
+        n_neighbors     [int]
+
+        Outputs:
+        distances       [array]  sorted
+        indices         [array]
+        """
+
+        inputs = self.inputs
+        n      = len(inputs)
+        k      = min(n_neighbors, n)
+
+        #rebuild the tree once the points searched directly are a sizable part of the history
+        if self.tree is None or n - self.tree_length > max(16, self.tree_length//10):
+            self.tree        = cKDTree(inputs)
+            self.tree_length = n
+
+        distances, indices = self.tree.query(x, k=k)
+        distances          = np.atleast_1d(distances)
+        indices            = np.atleast_1d(indices)
+
+        if n > self.tree_length:
+            tail_distances = np.linalg.norm(inputs[self.tree_length:] - x, axis=1)
+            distances      = np.hstack((distances, tail_distances))
+            indices        = np.hstack((indices, np.arange(self.tree_length, n)))
+            order          = np.argsort(distances, kind='stable')[:k]
+            distances      = distances[order]
+            indices        = indices[order]
+
+        return distances, indices
+
+    def nearest(self, x):
+        """
+        Finds the closest point of the history
+
+        Inputs:
+        x               [array]
+
+        Outputs:
+        min_norm        [float]
+        i_min_dist      [int]
+        """
+
+        distances, indices = self.query(x, 1)
+
+        return distances[0], int(indices[0])
+
+    def neighbors_predict(self, x, n_neighbors, weighted = False):
+        """
+        Averages the sizing variables of the closest points, the same as a KNeighborsRegressor
+        fit on the history
+
+        Inputs:
+        x               [array]
+        n_neighbors     [int]
+        weighted        [bool]   weight the points by the inverse of their distance
+
+        Outputs:
+        y               [array]
+        """
+
+        distances, indices = self.query(x, n_neighbors)
+        outputs            = self.outputs[indices]
+
+        if not weighted:
+            return np.mean(outputs, axis=0)
+
+        #points on top of x take all of the weight
+        exact = distances == 0.
+        if np.any(exact):
+            weights = 1.*exact
+        else:
+            weights = 1./distances
+
+        return np.dot(weights, outputs)/np.sum(weights)
+
+    def predict(self, sizing_loop, x, i_min_dist):
+        """
+        Predicts the sizing variables with the regressor chosen by the sizing loop's initial_step,
+        refitting the regressors first if they are out of date
+
+        Inputs:
+        sizing_loop.
+            initial_step
+            iteration_options.
+                surrogate_refit_fraction
+                n_neighbors
+                neighbors_weighted_distance
+        x               [array]
+        i_min_dist      [int]    closest point of the history, left out to tune the SVR
+
+        Outputs:
+        y               [array]
+        """
+
+        iteration_options = sizing_loop.iteration_options
+        initial_step      = sizing_loop.initial_step
+        n                 = len(self.outputs)
+
+        if initial_step == 'Neighbors':
+            n_neighbors = min(iteration_options.n_neighbors, n)
+            return self.neighbors_predict(x, n_neighbors, iteration_options.neighbors_weighted_distance)
+
+        grown = n - self.fitted_length > iteration_options.surrogate_refit_fraction*self.fitted_length
+        if self.models is None or initial_step != self.model_type or grown:
+            self.fit(sizing_loop, i_min_dist)
+
+        input_for_regr = x.reshape(1,-1)
+        y = [ model.predict(input_for_regr)[0] for model in self.models ]
+
+        return np.array(y)
+
+    def fit(self, sizing_loop, i_min_dist):
+        """
+        Fits one regressor per sizing variable on the whole history
+
+        Inputs:
+        sizing_loop.
+            initial_step
+        i_min_dist      [int]
+
+        Outputs:
+        None
+        """
+        import sklearn.svm as svm
+        import sklearn.ensemble as ensemble
+        import sklearn.gaussian_process as gaussian_process
+        from sklearn.gaussian_process.kernels import RationalQuadratic
+        import sklearn.linear_model as linear_model
+        import sklearn.neighbors as neighbors
+
+        initial_step = sizing_loop.initial_step
+        models       = []
+
+        for j in range(self.outputs.shape[1]):
+            if initial_step == 'SVR':
+                if j == 0:
+                    #for SVR, can optimize parameters C and eps for closest point
+                    print('optimizing svr parameters')
+                    x   = [2.,-1.] #initial guess for 10**C, 10**eps
+                    out = sp.optimize.minimize(check_svr_accuracy, x, method='Nelder-Mead', args=(self.inputs, self.outputs, i_min_dist))
+                    c_out   = min(10**out.x[0], 1E10)
+                    eps_out = max(10**out.x[1], 1E-8)
+                regr = svm.SVR(C=c_out,  epsilon = eps_out)
+
+            elif initial_step == 'GradientBoosting':
+                regr = ensemble.GradientBoostingRegressor()
+
+            elif initial_step == 'ExtraTrees':
+                regr = ensemble.ExtraTreesRegressor()
+
+            elif initial_step == 'RandomForest':
+                regr = ensemble.RandomForestRegressor()
+
+            elif initial_step == 'Bagging':
+                regr = ensemble.BaggingRegressor()
+
+            elif initial_step == 'GPR':
+                gp_kernel_RQ = RationalQuadratic(length_scale=1.0, alpha=1.0)
+                regr         = gaussian_process.GaussianProcessRegressor(kernel=gp_kernel_RQ,normalize_y=True)
+
+            elif initial_step == 'RANSAC':
+                regr = linear_model.RANSACRegressor()
+
+            else:
+                regr = neighbors.KNeighborsRegressor( n_neighbors = 1)
+
+            models.append(regr.fit(self.inputs, self.outputs[:,j]))
+
+        self.models        = models
+        self.model_type    = initial_step
+        self.fitted_length = len(self.outputs)
+
+        return
@@ -3,12 +3,15 @@
 
 # Created : Jun 2016, M. Vegh
 # Modified: May 2018, M. Vegh
+#           Oct 2026, SUAVE Team
 # ----------------------------------------------------------------------
 #  Imports
 # ---------------
 
 import numpy as np
 
+from SUAVE.Input_Output.SUAVE.history import read_any_history, parse_text_history
+
 
 # ----------------------------------------------------------------------
 #  read_sizing_inputs
@@ -17,9 +20,9 @@ import numpy as np
 ## @ingroup Sizing
 def read_sizing_inputs(sizing_loop, opt_inputs):
     """
-    This function reads a sizing loop outputs file and returns an array 
-    of design variables, an array of sizing variables, and an output 
-    flag to indicate whether the file was successfully read.
+    This function reads a sizing loop outputs file, binary or text, and 
+    returns an array of design variables, an array of sizing variables, 
+    and an output flag to indicate whether the file was successfully read.
     
     Inputs:
     sizing_loop.
@@ -35,7 +38,7 @@ def read_sizing_inputs(sizing_loop, opt_inputs):
     
     
     try:
-        file_in        = open(sizing_loop.output_filename)
+        data           = read_any_history(sizing_loop.output_filename)
         read_success   = 1
     
     except IOError:
@@ -45,10 +48,6 @@ def read_sizing_inputs(sizing_loop, opt_inputs):
         
     #read data from previous iterations
     if  read_success==1:
-        data=file_in.readlines()
-        file_in.close()
-        data=format_input_data(data) #format data so we can work with it
-        file_in.close()
         
         if len(data)>0:
             data_inputs = data[:, 0:len(opt_inputs)]  #values from optimization problem
@@ -84,20 +83,7 @@ def format_input_data(data):
     
     
     
-    data_out=[]
-    for line in data:
-        line=line.replace('[','')
-        line=line.replace(']','')
-        line=line.replace(',',' ')
-        line=line.replace('  ',' ')
-        numbers = line.split(' ')
-        numbers_out=[]
-        for number in numbers:
-            if number != ' ' or number != '\t':
-                numbers_out.append(float(number))
-        
-        data_out.append(numbers_out)
-    data_out=np.array(data_out)  #change into numpy array to work with later
+    data_out = parse_text_history(data)  #numpy array to work with later
 
     return data_out
     
\ No newline at end of file
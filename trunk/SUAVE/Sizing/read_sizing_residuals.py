@@ -1,12 +1,13 @@
 ## @ingroup Sizing
 #read_sizing_residuals.py
 # Created : May 2018, M. Vegh
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ---------------
 
-from .read_sizing_inputs import format_input_data
+from SUAVE.Input_Output.SUAVE.history import read_any_history
 
 # ----------------------------------------------------------------------
 #  read_sizing_residuals
@@ -15,7 +16,7 @@ from .read_sizing_inputs import format_input_data
 ## @ingroup Sizing
 def read_sizing_residuals(sizing_loop, opt_inputs):
     """
-    This function reads a sizing loop residuals file and returns an array 
+    This function reads a sizing loop residuals file, binary or text, and returns an array 
     of design variables, an array of sizing variables, and an output 
     flag to indicate whether the file was successfully read.
     
@@ -32,7 +33,7 @@ def read_sizing_residuals(sizing_loop, opt_inputs):
     """
     
     try:
-        file_in        = open(sizing_loop.residual_filename)
+        data           = read_any_history(sizing_loop.residual_filename)
         read_success   = 1
     
     except IOError:
@@ -41,10 +42,6 @@ def read_sizing_residuals(sizing_loop, opt_inputs):
         
     #read data from previous iterations
     if  read_success==1:
-        data=file_in.readlines()
-        file_in.close()
-        data=format_input_data(data) #format data so we can work with it
-        file_in.close()
         
         if len(data)>0:
             default_y    = sizing_loop.default_y
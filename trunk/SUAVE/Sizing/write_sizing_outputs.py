@@ -2,6 +2,15 @@
 #write_sizing_inputs.py
 # Created : Jun 2016, M. Vegh
 # Modified: May 2017, M. Vegh
+#           Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from SUAVE.Input_Output.SUAVE.history import append_history, history_format, history_size
 
 # ----------------------------------------------------------------------
 #  write_sizing_outputs
@@ -11,11 +20,14 @@
 def write_sizing_outputs(sizing_loop, y_save, opt_inputs):
     """
     This function writes out the optimization input variables and the 
-    solved sizing inputs at that point
+    solved sizing inputs at that point, in the format of the file if it 
+    exists, history_format otherwise
     
     Inputs:
     sizing_loop.
         output_filename
+        history_format
+        surrogate
     
     y_save
     opt_inputs
@@ -24,7 +36,37 @@ def write_sizing_outputs(sizing_loop, y_save, opt_inputs):
     None
     
     """
-    file=open(sizing_loop.output_filename, 'a')
+    filename      = sizing_loop.output_filename
+    previous_size = history_size(filename)
+    
+    if history_format(filename, sizing_loop.get('history_format','text')) == 'binary':
+        append_history(filename, np.hstack((np.array(opt_inputs, dtype=float), y_save)))
+        
+    else:
+        write_text_outputs(filename, y_save, opt_inputs)
+    
+    #keep the sizing data in memory up to date
+    surrogate = sizing_loop.get('surrogate')
+    if surrogate is not None:
+        surrogate.add_point(sizing_loop, opt_inputs, y_save, previous_size)
+                
+    return
+
+## @ingroup Sizing
+def write_text_outputs(filename, y_save, opt_inputs):
+    """
+    This function appends a line of a legacy text sizing outputs file
+    
+    Inputs:
+    filename
+    y_save
+    opt_inputs
+
+    Outputs:
+    None
+    
+    """
+    file=open(filename, 'a')
     if len(opt_inputs) == 1:
         #weird python formatting issue when writing a 1 entry array
         file.write('[')
@@ -36,5 +78,5 @@ def write_sizing_outputs(sizing_loop, y_save, opt_inputs):
     file.write(str(y_save.tolist()))
     file.write('\n') 
     file.close()
-                
+    
     return
\ No newline at end of file
@@ -1,6 +1,15 @@
 ## @ingroup Sizing
 #write_sizing_residuals.py
 # Created : May 2018, M. Vegh
+# Modified: Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from SUAVE.Input_Output.SUAVE.history import append_history, history_format
 
 # ----------------------------------------------------------------------
 #  write_sizing_residuals
@@ -9,12 +18,13 @@
 #write_sizing_residuals.py
 def write_sizing_residuals(sizing_loop, y_save, opt_inputs, residuals):
     """
-    This function writes out the residual values at each sizing iteration
+    This function writes out the residual values at each sizing iteration,
+    in the format of the file if it exists, history_format otherwise
     
     Inputs:
     sizing_loop.
         residual_filename
-    
+        history_format
     
     y_save     [array]
     opt_inputs [array]
@@ -25,7 +35,13 @@ def write_sizing_residuals(sizing_loop, y_save, opt_inputs, residuals):
     
     """
     
-    file=open(sizing_loop.residual_filename, 'a')
+    filename = sizing_loop.residual_filename
+    
+    if history_format(filename, sizing_loop.get('history_format','text')) == 'binary':
+        append_history(filename, np.hstack((y_save, opt_inputs, residuals)))
+        return
+    
+    file=open(filename, 'a')
     file.write(str(y_save.tolist()+opt_inputs.tolist()))
     file.write(' ')
     file.write(str(residuals.tolist()))
@@ -0,0 +1,136 @@
+## @ingroup Surrogate
+# Interpolant_Surrogate.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+import numpy as np
+from scipy.interpolate import LinearNDInterpolator, NearestNDInterpolator, RegularGridInterpolator
+
+# ----------------------------------------------------------------------
+#  Interpolant_Surrogate
+# ----------------------------------------------------------------------
+
+## @ingroup Surrogate
+class Interpolant_Surrogate(Data):
+    """ A piecewise linear interpolant with the fit/predict interface of the scikit-learn
+        regressors, used for engine decks and for lookup tables of other surrogates. Data on a full
+        tensor product grid uses a grid interpolant, scattered data uses a Delaunay triangulation.
+    
+        Assumptions:
+        Grid data is extrapolated linearly. Scattered data outside of the convex hull of the points
+        takes the value of the nearest point.
+        
+        Source:
+        None
+    """
+    
+    def __defaults__(self):
+        """ This sets the default values.
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            N/A
+        """
+        self.grid         = None
+        self.interpolant  = None
+        self.nearest      = None
+        self.lower_bounds = None
+        self.scales       = None
+        
+    def fit(self,xy,y):
+        """ Builds the interpolant
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            xy    [array] - points, one row per point
+            y     [array] - values at the points
+    
+            Outputs:
+            self
+    
+            Properties Used:
+            N/A
+        """
+        
+        xy = np.asarray(xy,dtype=float)
+        y  = np.ravel(y)
+        
+        # check for a tensor product grid
+        axes  = [ np.unique(xy[:,ii]) for ii in range(xy.shape[1]) ]
+        shape = [ len(axis) for axis in axes ]
+        
+        is_grid = np.prod(shape) == len(y) and np.all(np.array(shape) > 1)
+        if is_grid:
+            index  = tuple([ np.searchsorted(axis,xy[:,ii]) for ii,axis in enumerate(axes) ])
+            values = np.full(shape,np.nan)
+            values[index] = y
+            is_grid = not np.any(np.isnan(values))
+            
+        if is_grid:
+            self.grid        = True
+            self.interpolant = RegularGridInterpolator(axes,values,bounds_error=False,fill_value=None)
+        else:
+            # scale the inputs to the unit cube so the triangulation is not skewed
+            self.grid         = False
+            self.lower_bounds = np.min(xy,axis=0)
+            self.scales       = np.ptp(xy,axis=0)
+            self.scales[self.scales==0.] = 1.
+            points            = (xy - self.lower_bounds)/self.scales
+            self.interpolant  = LinearNDInterpolator(points,y)
+            self.nearest      = NearestNDInterpolator(points,y)
+            
+        return self
+    
+    def predict(self,xy):
+        """ Evaluates the interpolant
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            xy    [array] - points, one row per point
+    
+            Outputs:
+            y     [array] - values at the points
+    
+            Properties Used:
+            N/A
+        """
+        
+        xy = np.atleast_2d(np.asarray(xy,dtype=float))
+        
+        if self.grid:
+            return self.interpolant(xy)
+        
+        points = (xy - self.lower_bounds)/self.scales
+        y      = self.interpolant(points)
+        
+        outside    = np.isnan(y)
+        y[outside] = self.nearest(points[outside])
+        
+        return y
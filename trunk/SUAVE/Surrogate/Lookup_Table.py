@@ -0,0 +1,151 @@
+## @ingroup Surrogate
+# Lookup_Table.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified: Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+from .Interpolant_Surrogate import Interpolant_Surrogate
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Lookup_Table
+# ----------------------------------------------------------------------
+
+## @ingroup Surrogate
+class Lookup_Table(Data):
+    """ A dense table of the predictions of a fitted surrogate on a tensor product grid, interpolated
+        linearly afterwards. This replaces the evaluation of an expensive model (a Gaussian process)
+        during a mission with a table lookup, with the same predict interface.
+
+        Assumptions:
+        The model is smooth enough to be represented linearly between the grid points. Outside of
+        the grid the table is extrapolated linearly. The difference to the model is only sampled at
+        the centers of the cells, center_error is an estimate of the interpolation error, not a bound.
+
+        Source:
+        None
+    """
+
+    def __defaults__(self):
+        """ This sets the default values.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            N/A
+        """
+        self.axes         = None
+        self.values       = None
+        self.interpolant  = None
+        self.center_error = None
+
+    def fit(self,model,axes):
+        """ Tabulates a model on the tensor product of the axes, in one batched prediction.
+            The interpolation error is sampled at the centers of the cells.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            model   - anything with a predict method taking one row per point
+            axes    - list of increasing grid values, one per input       [list of arrays]
+
+            Outputs:
+            self
+            self.center_error  - largest difference to the model at the cell centers  [float]
+
+            Properties Used:
+            N/A
+        """
+
+        axes   = [ np.asarray(axis,dtype=float) for axis in axes ]
+        grids  = np.meshgrid(*axes,indexing='ij')
+        points = np.vstack([ grid.ravel() for grid in grids ]).T
+        values = np.reshape(model.predict(points),grids[0].shape)
+
+        self.axes        = axes
+        self.values      = values
+        self.interpolant = Interpolant_Surrogate().fit(points,values)
+
+        # error estimate
+        centers = [ 0.5*(axis[1:] + axis[:-1]) for axis in axes ]
+        grids   = np.meshgrid(*centers,indexing='ij')
+        points  = np.vstack([ grid.ravel() for grid in grids ]).T
+        if len(points):
+            self.center_error = np.max(np.abs(np.ravel(model.predict(points)) - self.predict(points)))
+
+        return self
+
+    def predict(self,points):
+        """ Interpolates the table
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            points  - one row per point   [array]
+
+            Outputs:
+            values  - one value per point [array]
+
+            Properties Used:
+            N/A
+        """
+        return self.interpolant.predict(points)
+
+## @ingroup Surrogate
+def build_lookup_tables(surrogates,grid_points,size):
+    """ Builds a Lookup_Table for each surrogate, spanning the range of the training points
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        surrogates   - fitted models                        [Data]
+        grid_points  - training points, one row per point   [array]
+        size         - number of table points per input     [list of ints]
+
+        Outputs:
+        tables       - a Lookup_Table for each surrogate    [Data]
+
+        Properties Used:
+        N/A
+    """
+
+    grid_points = np.asarray(grid_points,dtype=float)
+    lower       = np.min(grid_points,axis=0)
+    upper       = np.max(grid_points,axis=0)
+    axes        = [ np.linspace(lower[ii],upper[ii],size[ii]) for ii in range(grid_points.shape[1]) ]
+
+    tables = Data()
+    for key,model in surrogates.items():
+        if model is None:
+            tables[key] = None
+        else:
+            tables[key] = Lookup_Table().fit(model,axes)
+
+    return tables
@@ -6,3 +6,5 @@ from . import scikit_surrogate_functions
 from . import svr_surrogate_functions
 from . import Surrogate_Problem
 
+from .Interpolant_Surrogate import Interpolant_Surrogate
+from .Lookup_Table import Lookup_Table, build_lookup_tables
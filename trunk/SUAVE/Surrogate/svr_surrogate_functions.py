@@ -11,7 +11,6 @@
 
 
 from SUAVE.Core import Data
-from sklearn import svm
 from .Surrogate_Problem import Surrogate_Problem
 
 import numpy as np
@@ -43,6 +42,7 @@ def build_svr_models(obj_values, inputs, constraints, kernel = 'rbf', C = 1E5, e
     surrogate_function       callable function(inputs): returns the objective, constraints, and whether it succeeded as an int 
     
     """
+    from sklearn import svm
     
     
     
@@ -84,6 +84,7 @@ def check_svr_accuracy(x, data_inputs, data_outputs, imin = -1): #set up so you
     Outputs:
     output       [float]
     """
+    from sklearn import svm
     
 
    # x is the set of inputs that you have option to optimize over
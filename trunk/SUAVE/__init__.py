@@ -1,5 +1,6 @@
 # SUAVE/__init__.py
 #
+# Modified: Oct 2026, SUAVE Team
 
 """ SUAVE Package Setup
 """
@@ -8,17 +9,50 @@
 #  IMPORT!!
 # ----------------------------------------------------------------------
 
-# packages
-from . import Plugins
-from . import Core
-from . import Analyses
-from . import Methods
-from . import Attributes
-from . import Components
-from . import Optimization
-from . import Input_Output
-
-# the vehicle class
+import importlib
+
+# packages, imported the first time they are used
+packages = ['Plugins',
+            'Core',
+            'Analyses',
+            'Methods',
+            'Attributes',
+            'Components',
+            'Optimization',
+            'Input_Output',
+            'Sizing',
+            'Surrogate']
+
+def __getattr__(name):
+    """ Imports the packages of SUAVE on first use, so that importing SUAVE
+        only costs what is used
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        name   <string>
+
+        Outputs:
+        the package
+
+        Properties Used:
+        N/A
+    """
+    if name in packages:
+        return importlib.import_module('.' + name, __name__)
+
+    raise AttributeError("module 'SUAVE' has no attribute '" + name + "'")
+
+def __dir__():
+    return sorted(list(globals().keys()) + packages)
+
+# the vehicle class is imported with the package, if it were imported on first use
+# an import of the SUAVE.Vehicle module, like unpickling a vehicle, would bind
+# SUAVE.Vehicle to the module instead of the class
 from .Vehicle import Vehicle
 
 from warnings import simplefilter